@@ -38,6 +38,7 @@ from idaes.apps.caprese.nmpc_var import (
         MeasuredVar,
         )
 from idaes.core.util.model_statistics import degrees_of_freedom
+from idaes.core.util.dyn_utils import TimeShiftPlan
 
 from pyomo.environ import (
         Block,
@@ -174,6 +175,10 @@ class _DynamicBlockData(_BlockData):
         self.sample_points = [time.first(), time.last()]
         self.sample_point_indices = [1, len(time)]
 
+        # Maps tuples of ctypes to the `TimeShiftPlan` of their variables.
+        # These are built when first needed to shift values in time.
+        self._time_shift_plans = {}
+
     _var_name = 'var'
     _block_suffix = '_BLOCK'
     _set_suffix = '_SET'
@@ -582,20 +587,27 @@ class _DynamicBlockData(_BlockData):
         """ Set values for the variables of the specified ctypes
         to their values `t_shift` in the future.
         """
-        time = self.time
-        # The outer loop is over time so we don't have to call
-        # `find_nearest_index` for every variable.
-        # I am assuming that `find_nearest_index` is slower than
-        # accessing `component_objects`
-        for t in time:
-            ts = t + t_shift
-            idx = time.find_nearest_index(ts, tolerance)
-            if idx is None:
-                # t + sample_time is outside the model's "horizon"
-                continue
-            ts = time.at(idx)
-            for var in self.component_objects(ctype):
-                var[t].set_value(var[ts].value)
+        # Time points where t + t_shift is outside the model's "horizon"
+        # are not changed.
+        plan = self.get_time_shift_plan(ctype)
+        plan.shift_values(t_shift, tolerance=tolerance)
+
+    def get_time_shift_plan(self,
+            ctype=(DiffVar, DerivVar, AlgVar, InputVar, FixedVar),
+            ):
+        """ Get the `TimeShiftPlan` for the variables of the specified
+        ctypes. The plan is built the first time it is requested and
+        reused to shift values at every sample after that.
+        """
+        key = ctype if type(ctype) is tuple else (ctype,)
+        plan = self._time_shift_plans.get(key)
+        if plan is None:
+            plan = TimeShiftPlan(
+                    self.time,
+                    list(self.component_objects(ctype)),
+                    )
+            self._time_shift_plans[key] = plan
+        return plan
 
     def advance_one_sample(self,
             ctype=(DiffVar, DerivVar, AlgVar, InputVar, FixedVar),
@@ -700,25 +712,17 @@ class _DynamicBlockData(_BlockData):
         """ Set the values of bound multipliers to the corresponding
         values a time `t_shift` in the future.
         """
-        zL = self.ipopt_zL_in
-        zU = self.ipopt_zU_in
-        time = self.time
-        # The outer loop is over time so we don't have to call
-        # `find_nearest_index` for every variable.
-        # I am assuming that `find_nearest_index` is slower than
-        # accessing `component_objects`
-        for t in time:
-            ts = t + t_shift
-            idx = time.find_nearest_index(ts, tolerance)
-            if idx is None:
-                # t + sample_time is outside the model's "horizon"
-                continue
-            ts = time.at(idx)
-            for var in self.component_objects(ctype):
-                if var[t] in zL and var[ts] in zL:
-                    zL[var[t]] = zL[var[ts]]
-                if var[t] in zU and var[ts] in zU:
-                    zU[var[t]] = zU[var[ts]]
+        plan = self.get_time_shift_plan(ctype)
+        dst, src = plan.get_shift_indices(t_shift, tolerance)
+        data = plan.target_data
+        for z in (self.ipopt_zL_in, self.ipopt_zU_in):
+            # Read all the multipliers before writing, so each is taken
+            # from its time point before the shift.
+            updates = [(vt, z[vs]) for vt, vs in
+                    zip(data[:, dst].flat, data[:, src].flat)
+                    if vt in z and vs in z]
+            for vt, val in updates:
+                z[vt] = val
 
     def advance_ipopt_multipliers_one_sample(self,
             ctype=(
@@ -928,6 +928,41 @@ class TestDynamicBlock(object):
                 for v in blk.component_objects(ctypes_to_not_shift):
                     assert v[t].value == t
 
+    @pytest.mark.unit
+    def test_time_shift_plan(self):
+        blk = self.make_block()
+        time = blk.time
+        t0 = time.first()
+        tl = time.last()
+
+        ctypes = (DiffVar, AlgVar)
+        plan = blk.get_time_shift_plan(ctypes)
+        assert blk.get_time_shift_plan(ctypes) is plan
+        assert blk.get_time_shift_plan(DiffVar) is not plan
+        n_vars = len(list(blk.component_objects(ctypes)))
+        assert plan.target_data.shape == (n_vars, len(time))
+
+        blk.add_ipopt_suffixes()
+        for t in time:
+            blk.vectors.differential[:,t].set_value(t)
+            for v in blk.component_objects(ctypes):
+                blk.ipopt_zL_in[v[t]] = t
+                if t != tl:
+                    blk.ipopt_zU_in[v[t]] = -t
+
+        blk.advance_one_sample(ctype=ctypes)
+        blk.advance_ipopt_multipliers_one_sample(ctype=ctypes)
+        t1 = time.at(time.find_nearest_index(t0 + blk.sample_time))
+        for v in blk.component_objects(DiffVar):
+            assert v[t0].value == t1
+            assert v[tl].value == tl
+        for v in blk.component_objects(ctypes):
+            assert blk.ipopt_zL_in[v[t0]] == t1
+            assert blk.ipopt_zL_in[v[tl]] == tl
+            assert blk.ipopt_zU_in[v[t0]] == -t1
+            # t + sample_time has no multiplier
+            assert blk.ipopt_zU_in[v[t1]] == -t1
+
     @pytest.mark.unit
     def test_generate_time_in_sample(self):
         blk = self.make_block()
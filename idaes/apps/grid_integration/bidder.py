@@ -16,6 +16,7 @@ from pyomo.opt.base.solvers import OptSolver
 import os
 from itertools import combinations
 from abc import ABC, abstractmethod
+from idaes.apps.grid_integration.persistent import PersistentSolveManager
 
 from pyomo.common.dependencies import attempt_import
 
@@ -226,6 +227,7 @@ class SelfScheduler(AbstractBidder):
         self._save_power_outputs()
 
         self.formulate_bidding_problem()
+        self.solve_manager = PersistentSolveManager(self.solver, self.model)
 
         # declare a list to store results
         self.bids_result_list = []
@@ -327,7 +329,7 @@ class SelfScheduler(AbstractBidder):
 
         # update the price forecasts
         self._pass_price_forecasts(price_forecasts)
-        self.solver.solve(self.model, tee=True)
+        self.solve_manager.solve(tee=True)
         bids = self._assemble_bids()
         self.record_bids(bids, date=date, hour=hour)
 
@@ -436,6 +438,11 @@ class SelfScheduler(AbstractBidder):
                 result_dict["Bid Power [MW]"] = bids[t][g].get("p_max")
                 result_dict["Bid Min Power [MW]"] = bids[t][g].get("p_min")
 
+                result_dict[
+                    "Model Update Time [s]"
+                ] = self.solve_manager.last_update_time
+                result_dict["Solve Time [s]"] = self.solve_manager.last_solve_time
+
                 result_df = pd.DataFrame.from_dict(result_dict, orient="index")
                 df_list.append(result_df.T)
 
@@ -534,7 +541,9 @@ class Bidder(AbstractBidder):
 
             n_scenario: number of LMP scenarios
 
-            solver: a Pyomo mathematical programming solver object
+            solver: a Pyomo mathematical programming solver object. If it is a
+            Pyomo persistent solver, the model is loaded into it once and only
+            the changes are pushed to it before each solve.
 
             forecaster: an initialized LMP forecaster object
 
@@ -569,6 +578,7 @@ class Bidder(AbstractBidder):
         self._save_power_outputs()
 
         self.formulate_bidding_problem()
+        self.solve_manager = PersistentSolveManager(self.solver, self.model)
 
         # declare a list to store results
         self.bids_result_list = []
@@ -719,7 +729,7 @@ class Bidder(AbstractBidder):
 
         # update the price forecasts
         self._pass_price_forecasts(price_forecasts)
-        self.solver.solve(self.model, tee=True)
+        self.solve_manager.solve(tee=True)
         bids = self._assemble_bids()
         self.record_bids(bids, date=date, hour=hour)
 
@@ -914,6 +924,11 @@ class Bidder(AbstractBidder):
 
                     pair_cnt += 1
 
+                result_dict[
+                    "Model Update Time [s]"
+                ] = self.solve_manager.last_update_time
+                result_dict["Solve Time [s]"] = self.solve_manager.last_solve_time
+
                 result_df = pd.DataFrame.from_dict(result_dict, orient="index")
                 df_list.append(result_df.T)
 
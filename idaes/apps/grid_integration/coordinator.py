@@ -12,6 +12,8 @@
 #################################################################################
 from itertools import zip_longest
 
+import numpy as np
+
 from pyomo.common.dependencies import attempt_import
 from pyomo.common.config import ConfigDict, ConfigValue
 import pyomo.environ as pyo
@@ -325,6 +327,10 @@ class DoubleLoopCoordinator:
         Clone the model in tracker and replace that of projection tracker. In this
         way, tracker and projection tracker have the same states before projection.
 
+        The pairing between the component data of the two models is built on the
+        first call (see _pair_tracking_models) and reused afterwards, so each call
+        only compares the values and copies the ones that differ.
+
         Arguments:
             None
 
@@ -332,9 +338,68 @@ class DoubleLoopCoordinator:
             None
         """
 
-        # iterate all the variables and params and clone the values
+        pairing = self._get_tracking_model_pairing()
+        for obj, sources, destinations in pairing:
+            if not sources:
+                continue
+            src_values = np.array(
+                [np.nan if v.value is None else v.value for v in sources],
+                dtype=float,
+            )
+            dst_values = np.array(
+                [np.nan if v.value is None else v.value for v in destinations],
+                dtype=float,
+            )
+            changed = np.flatnonzero(
+                (src_values != dst_values) & ~np.isnan(src_values)
+            )
+            if obj is pyo.Var:
+                # values come from the same variables in the tracker, so they
+                # don't need to be validated again
+                for i in changed.tolist():
+                    destinations[i].set_value(
+                        round(float(src_values[i]), 4), skip_validation=True
+                    )
+            else:
+                for i in changed.tolist():
+                    destinations[i].set_value(round(float(src_values[i]), 4))
+
+        return
+
+    def _get_tracking_model_pairing(self):
+        """
+        Return the pairing of the tracker and projection tracker model data,
+        building it if needed.
+        """
+        key = (id(self.tracker.model), id(self.projection_tracker.model))
+        pairing = getattr(self, "_tracking_model_pairing", None)
+        if pairing is None or self._tracking_model_pairing_key != key:
+            pairing = self._pair_tracking_models()
+            self._tracking_model_pairing = pairing
+            self._tracking_model_pairing_key = key
+        return pairing
+
+    def _pair_tracking_models(self):
+        """
+        Pair the Var and mutable Param data of the tracker model with the
+        corresponding data in the projection tracker model. Components are
+        matched by name, so the two tracking problems must have the same
+        structure. Immutable Params are constants of the models and are not
+        paired.
+
+        Arguments:
+            None
+
+        Returns:
+            list of (component type, tracker data list, projection tracker data
+            list) tuples, one for Vars and one for Params
+        """
+
+        pairing = []
         objects_list = [pyo.Var, pyo.Param]
         for obj in objects_list:
+            sources = []
+            destinations = []
             for tracker_obj, proj_tracker_obj in zip_longest(
                 self.tracker.model.component_objects(
                     obj, sort=pyo.SortComponents.alphabetizeComponentAndIndex
@@ -343,15 +408,22 @@ class DoubleLoopCoordinator:
                     obj, sort=pyo.SortComponents.alphabetizeComponentAndIndex
                 ),
             ):
-                if tracker_obj.name != proj_tracker_obj.name:
+                if (
+                    tracker_obj is None
+                    or proj_tracker_obj is None
+                    or tracker_obj.name != proj_tracker_obj.name
+                ):
                     raise ValueError(
                         f"Trying to copy the value of {tracker_obj} to {proj_tracker_obj}, but they do not have the same name and possibly not the corresponding objects. Please make sure tracker and projection tracker do not diverge. "
                     )
+                if obj is pyo.Param and not tracker_obj.mutable:
+                    continue
                 for idx in tracker_obj.index_set():
-                    if pyo.value(proj_tracker_obj[idx]) != pyo.value(tracker_obj[idx]):
-                        proj_tracker_obj[idx] = round(pyo.value(tracker_obj[idx]), 4)
+                    sources.append(tracker_obj[idx])
+                    destinations.append(proj_tracker_obj[idx])
+            pairing.append((obj, sources, destinations))
 
-        return
+        return pairing
 
     def bid_into_DAM(self, options, simulator, ruc_instance, ruc_date, ruc_hour):
 
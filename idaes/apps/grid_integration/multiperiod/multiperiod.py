@@ -10,6 +10,8 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
+import time
+
 import pyomo.environ as pyo
 
 class MultiPeriodModel:
@@ -24,21 +26,44 @@ class MultiPeriodModel:
                                    pairs to link between time steps
             periodic_variable_func: a function that returns a tuple of variable
                                     pairs to link between last and first time steps
+            update_process_model_func: function that takes an existing process
+                                       model and the same keyword arguments as
+                                       `process_model_func`, and updates the
+                                       model data for a new time period.
+                                       Required if `recycle_blocks` is True.
+            recycle_blocks: if True, `advance_time` reuses the process block of
+                            the oldest time period for the new time period
+                            (a ring buffer), instead of deactivating it and
+                            building a new block. The model then has a
+                            constant size in a rolling horizon simulation.
     """
     def __init__(self, n_time_points, process_model_func, linking_variable_func,
-                 periodic_variable_func=None):#, state_variable_func=None):
+                 periodic_variable_func=None, update_process_model_func=None,
+                 recycle_blocks=False):#, state_variable_func=None):
         self.n_time_points = n_time_points
 
         #user provided functions
         self.create_process_model = process_model_func
         self.get_linking_variable_pairs = linking_variable_func
         self.get_periodic_variable_pairs = periodic_variable_func
+        self.update_process_model = update_process_model_func
         #self.get_state_variable_pairs = state_variable_func
 
+        if recycle_blocks and update_process_model_func is None:
+            raise ValueError(
+                "An update_process_model_func is required to recycle blocks "
+                "in a MultiPeriodModel."
+            )
+        self.recycle_blocks = recycle_blocks
+
         #populated on 'build_multi_period_model'
         self._pyomo_model = None
         self._first_active_time = None
 
+        #construction and solve times (seconds) for each step of the horizon
+        self.timings = []
+        self._slot_vars = {}
+
         #optional initialzation features
         #self.initialization_points = None   #library of possible initial points
         #self.initialize_func = None         #function to perform the initialize
@@ -58,6 +83,7 @@ class MultiPeriodModel:
             model_data_kwargs = {t:{} for t in range(self.n_time_points)}
         assert(list(range(len(model_data_kwargs)))==sorted(model_data_kwargs))
 
+        start = time.perf_counter()
         m = pyo.ConcreteModel()
         m.TIME = pyo.Set(initialize=range(self.n_time_points))
 
@@ -86,6 +112,10 @@ class MultiPeriodModel:
 
         self._pyomo_model = m
         self._first_active_time = m.TIME.first()
+        self._slot_vars = {}
+        self.timings = [{"time": self._first_active_time,
+                         "construction": time.perf_counter() - start,
+                         "solve": None}]
         return m
 
     def advance_time(self, **model_data_kwargs):
@@ -96,6 +126,20 @@ class MultiPeriodModel:
                 model_data_kwargs: keyword arguments passed to user provided
                                    `create_process_model` function
         """
+        start = time.perf_counter()
+        if self.recycle_blocks:
+            self._advance_time_recycle(**model_data_kwargs)
+        else:
+            self._advance_time_new_block(**model_data_kwargs)
+        self.timings.append({"time": self._first_active_time,
+                             "construction": time.perf_counter() - start,
+                             "solve": None})
+
+    def _advance_time_new_block(self, **model_data_kwargs):
+        """
+            Advance time by deactivating the oldest time period and building a
+            new process block at the end of the horizon
+        """
         m = self._pyomo_model
         previous_time = self._first_active_time
         current_time = m.TIME.next(previous_time)
@@ -142,6 +186,106 @@ class MultiPeriodModel:
         #                       m.blocks[current_time].process,
         #                       state_variable_pairs)
 
+    def _advance_time_recycle(self, **model_data_kwargs):
+        """
+            Advance time by reusing the process block of the oldest time period
+            for the new time period at the end of the horizon. Values are
+            shifted forward from the previous last time period as a warm start,
+            and the model data is reset with `update_process_model`.
+        """
+        previous_time = self._first_active_time
+        current_time = previous_time + 1
+        last_time = previous_time + self.n_time_points - 1
+        new_time = last_time + 1
+
+        new_block = self.get_process_block(previous_time)
+        last_block = self.get_process_block(last_time)
+
+        #remove the coupling of the oldest time period
+        self._delete_constraints(new_block, "link_constraints")
+        self._delete_constraints(new_block, "periodic_constraints")
+
+        #shift values forward, fixed variables are model data and are left
+        #for the user update function
+        slot_new = self._slot(new_time)
+        slot_last = self._slot(last_time)
+        for v_new, v_last in zip(self._get_slot_vars(slot_new),
+                                 self._get_slot_vars(slot_last)):
+            if not v_new.fixed:
+                v_new.set_value(v_last.value, skip_validation=True)
+
+        self._first_active_time = current_time
+        self.update_process_model(new_block, **model_data_kwargs)
+
+        #sequential time coupling
+        link_variable_pairs = self.get_linking_variable_pairs(
+                                    last_block,
+                                    new_block)
+        self._create_linking_constraints(
+                                    last_block,
+                                    link_variable_pairs)
+
+        #periodic time coupling
+        if self.get_periodic_variable_pairs is not None:
+            self._delete_constraints(last_block, "periodic_constraints")
+            periodic_variable_pairs = self.get_periodic_variable_pairs(
+                                    new_block,
+                                    self.get_process_block(current_time))
+            self._create_periodic_constraints(
+                                    new_block,
+                                    periodic_variable_pairs)
+
+    def _delete_constraints(self, b1, name):
+        """
+            Delete the coupling constraints `name` (and their implicit index
+            set) from `b1`, if present
+        """
+        for n in (name, name + "_index"):
+            if b1.component(n) is not None:
+                b1.del_component(n)
+
+    def _slot(self, t):
+        """
+            Index of the block in the pyomo model that holds time `t`
+        """
+        if self.recycle_blocks:
+            return t % self.n_time_points
+        return t
+
+    def _get_slot_vars(self, slot):
+        """
+            Flat list of the variables in the process block of a slot, in the
+            same order for every slot
+        """
+        try:
+            return self._slot_vars[slot]
+        except KeyError:
+            process = self._pyomo_model.blocks[slot].process
+            varlist = list(process.component_data_objects(pyo.Var,
+                                                          descend_into=True))
+            self._slot_vars[slot] = varlist
+            return varlist
+
+    def get_process_block(self, t):
+        """
+            Retrieve the process block for time `t` of the horizon
+        """
+        return self._pyomo_model.blocks[self._slot(t)].process
+
+    def solve(self, solver, **kwargs):
+        """
+            Solve the multiperiod model and record the solve time of the
+            current step in `timings`
+
+            Arguments:
+                solver: a pyomo solver object
+                kwargs: keyword arguments passed to the solver
+        """
+        start = time.perf_counter()
+        results = solver.solve(self._pyomo_model, **kwargs)
+        self.timings[-1]["solve"] = time.perf_counter() - start
+        return results
+
 
     @property
     def pyomo_model(self):
@@ -161,6 +305,10 @@ class MultiPeriodModel:
         """
             Retrieve the active time blocks of the pyomo model
         """
+        if self.recycle_blocks:
+            return [self.get_process_block(t) for t in range(
+                self._first_active_time,
+                self._first_active_time + self.n_time_points)]
         return [b.process for b in self._pyomo_model.blocks.values() if b.process.active]
 
     def _create_linking_constraints(self,b1,variable_pairs):
@@ -0,0 +1,303 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Repeated solves of the tracking and bidding models.
+
+The tracker and the bidders re-solve the same model every market hour and only
+change parameter values (prices, dispatch signals) and fixed initial states in
+between. With a Pyomo persistent solver the model is loaded once and only the
+constraints, variables and objective touched by those changes are pushed to the
+solver before each solve.
+"""
+from time import perf_counter
+
+import numpy as np
+import pyomo.environ as pyo
+from pyomo.core.expr.visitor import identify_mutable_parameters, identify_variables
+
+_PERSISTENT_METHODS = (
+    "set_instance",
+    "add_constraint",
+    "remove_constraint",
+    "set_objective",
+    "update_var",
+)
+
+
+def is_persistent_solver(solver):
+    """
+    Check whether a solver implements the Pyomo persistent solver interface.
+
+    Arguments:
+        solver: a Pyomo solver object
+
+    Returns:
+        bool
+    """
+    return all(callable(getattr(solver, m, None)) for m in _PERSISTENT_METHODS)
+
+
+class PersistentSolveManager:
+
+    """
+    Solve a model repeatedly, pushing only the changes since the last solve to
+    persistent solvers.
+
+    For solvers without the persistent interface every solve is a full solve.
+    The time spent updating the solver instance and the total solve time of the
+    last solve are kept in ``last_update_time`` and ``last_solve_time``.
+    """
+
+    def __init__(self, solver, model):
+
+        """
+        Initializes the solve manager.
+
+        Arguments:
+            solver: a Pyomo mathematical programming solver object
+
+            model: the Pyomo model to solve
+
+        Returns:
+            None
+        """
+
+        self.solver = solver
+        self.model = model
+        self.persistent = is_persistent_solver(solver)
+
+        self.last_update_time = None
+        self.last_solve_time = None
+        self.last_update_counts = None
+
+        self._instance_loaded = False
+
+    def reset(self):
+
+        """
+        Reload the model into the persistent solver at the next solve. This must
+        be called after components are added to or removed from the model.
+        Activating or deactivating constraints is picked up without a reset.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+        """
+
+        self._instance_loaded = False
+
+    def solve(self, **kwargs):
+
+        """
+        Solve the model.
+
+        Arguments:
+            kwargs: keyword arguments passed to the solver's solve method
+
+        Returns:
+            the solver results
+        """
+
+        start = perf_counter()
+        if not self.persistent:
+            results = self.solver.solve(self.model, **kwargs)
+            self.last_update_time = 0.0
+            self.last_solve_time = perf_counter() - start
+            return results
+
+        if self._instance_loaded:
+            self._update_instance()
+        else:
+            self._load_instance()
+        self.last_update_time = perf_counter() - start
+
+        results = self.solver.solve(**kwargs)
+        self.last_solve_time = perf_counter() - start
+
+        return results
+
+    def _load_instance(self):
+
+        """
+        Load the model into the persistent solver and record which constraints
+        and objective each mutable parameter and variable appears in.
+        """
+
+        self.solver.set_instance(self.model)
+
+        objectives = list(
+            self.model.component_data_objects(
+                pyo.Objective, active=True, descend_into=True
+            )
+        )
+        self._objective = objectives[0] if len(objectives) == 1 else None
+
+        self._param_pos = {}
+        self._var_pos = {}
+        self._params = []
+        self._vars = []
+        self._param_cons = []
+        self._var_cons = []
+        self._constraints = []
+        self._con_pos = {}
+
+        # the objective is recorded as constraint index -1
+        if self._objective is not None:
+            self._register_expr(self._objective.expr, -1)
+        for c in self._active_constraints():
+            self._register_constraint(c)
+        self._con_active = np.ones(len(self._constraints), dtype=bool)
+
+        self._param_values = self._get_param_values()
+        self._var_state = self._get_var_state()
+        self._instance_loaded = True
+        self.last_update_counts = {
+            "constraints": len(self._constraints),
+            "variables": len(self._vars),
+            "objective": self._objective is not None,
+        }
+
+    def _active_constraints(self):
+        return self.model.component_data_objects(
+            pyo.Constraint, active=True, descend_into=True
+        )
+
+    def _register(self, obj, pos, objs, obj_cons):
+        k = pos.get(id(obj))
+        if k is None:
+            k = pos[id(obj)] = len(objs)
+            objs.append(obj)
+            obj_cons.append([])
+        return k
+
+    def _register_expr(self, expr, n):
+        for p in identify_mutable_parameters(expr):
+            k = self._register(p, self._param_pos, self._params, self._param_cons)
+            self._param_cons[k].append(n)
+        for v in identify_variables(expr, include_fixed=True):
+            k = self._register(v, self._var_pos, self._vars, self._var_cons)
+            self._var_cons[k].append(n)
+
+    def _register_constraint(self, c):
+        n = self._con_pos[id(c)] = len(self._constraints)
+        self._constraints.append(c)
+        self._register_expr(c.body, n)
+        # mutable parameters in the bounds are folded into the constraint too
+        for bound in (c.lower, c.upper):
+            if bound is None:
+                continue
+            for p in identify_mutable_parameters(bound):
+                k = self._register(p, self._param_pos, self._params, self._param_cons)
+                self._param_cons[k].append(n)
+        return n
+
+    def _get_param_values(self):
+        return np.array([pyo.value(p) for p in self._params], dtype=float)
+
+    def _get_var_state(self):
+        n = len(self._vars)
+        fixed = np.fromiter((v.fixed for v in self._vars), dtype=bool, count=n)
+        values = np.array(
+            [v.value if v.fixed else np.nan for v in self._vars], dtype=float
+        )
+        # unbounded variables have None bounds, which become NaN
+        lb = np.array([v.lb for v in self._vars], dtype=float)
+        ub = np.array([v.ub for v in self._vars], dtype=float)
+        lb[np.isnan(lb)] = -np.inf
+        ub[np.isnan(ub)] = np.inf
+        return fixed, values, lb, ub
+
+    def _update_instance(self):
+
+        """
+        Push the constraints that were activated or deactivated, and the
+        parameters, fixed variables and bounds that changed since the last
+        solve to the persistent solver.
+        """
+
+        # constraints activated for the first time since the model was loaded
+        # are registered here, their variables must already be in the solver
+        n_params = len(self._params)
+        n_vars = len(self._vars)
+        active = []
+        for c in self._active_constraints():
+            n = self._con_pos.get(id(c))
+            if n is None:
+                n = self._register_constraint(c)
+            active.append(n)
+        con_active = np.zeros(len(self._constraints), dtype=bool)
+        con_active[active] = True
+        was_active = np.zeros(len(self._constraints), dtype=bool)
+        was_active[: len(self._con_active)] = self._con_active
+        deactivated = np.flatnonzero(was_active & ~con_active)
+        activated = np.flatnonzero(~was_active & con_active)
+
+        # parameters and variables first seen in an activated constraint are
+        # compared to their current state, the constraint is added with it
+        param_values = self._get_param_values()
+        old_param_values = np.concatenate(
+            (self._param_values, param_values[n_params:])
+        )
+        changed_params = np.flatnonzero(_differs(param_values, old_param_values))
+
+        fixed, values, lb, ub = self._get_var_state()
+        old_fixed, old_values, old_lb, old_ub = self._var_state
+        new = slice(n_vars, None)
+        old_fixed = np.concatenate((old_fixed, fixed[new]))
+        old_values = np.concatenate((old_values, values[new]))
+        old_lb = np.concatenate((old_lb, lb[new]))
+        old_ub = np.concatenate((old_ub, ub[new]))
+        # constraints fold in the values of fixed variables
+        refold = (fixed != old_fixed) | (fixed & _differs(values, old_values))
+        changed_vars = np.flatnonzero(refold | (lb != old_lb) | (ub != old_ub))
+
+        affected = set()
+        for k in changed_params:
+            affected.update(self._param_cons[k])
+        for k in np.flatnonzero(refold):
+            affected.update(self._var_cons[k])
+
+        for k in changed_vars:
+            self.solver.update_var(self._vars[k])
+
+        for n in deactivated:
+            self.solver.remove_constraint(self._constraints[n])
+        n_readded = 0
+        for n in sorted(affected):
+            if n < 0 or not con_active[n] or not was_active[n]:
+                continue
+            c = self._constraints[n]
+            self.solver.remove_constraint(c)
+            self.solver.add_constraint(c)
+            n_readded += 1
+        for n in activated:
+            self.solver.add_constraint(self._constraints[n])
+
+        update_objective = -1 in affected
+        if update_objective:
+            self.solver.set_objective(self._objective)
+
+        self._con_active = con_active
+        self._param_values = param_values
+        self._var_state = (fixed, values, lb, ub)
+        self.last_update_counts = {
+            "constraints": n_readded + len(deactivated) + len(activated),
+            "variables": len(changed_vars),
+            "objective": update_objective,
+        }
+
+
+def _differs(new, old):
+    return (new != old) & ~(np.isnan(new) & np.isnan(old))
@@ -135,3 +135,40 @@ def test_assemble_sced_tracking_market_signals(coordinator_object):
         next_ruc_dispatch_dicts=next_ruc_dispatch_dicts,
     )
     pyo_unittest.assertStructuredAlmostEqual(first=signal, second=expected_signal)
+
+
+@pytest.mark.unit
+def test_clone_tracking_model(coordinator_object):
+
+    tracker_model = coordinator_object.tracker.model
+    proj_model = coordinator_object.projection_tracker.model
+
+    tracker_model.fs.P_T[1].value = 25.123456
+    tracker_model.fs.pre_P_T = 15.0
+    for t in tracker_model.fs.P_T:
+        proj_model.fs.P_T[t].value = None
+
+    coordinator_object._clone_tracking_model()
+
+    assert proj_model.fs.P_T[1].value == 25.1235
+    assert pyo.value(proj_model.fs.pre_P_T) == 15.0
+    for tracker_var, proj_var in zip(
+        tracker_model.component_data_objects(pyo.Var, sort=True),
+        proj_model.component_data_objects(pyo.Var, sort=True),
+    ):
+        assert proj_var.value == round(tracker_var.value, 4)
+
+    # the pairing is built once and reused
+    pairing = coordinator_object._tracking_model_pairing
+    tracker_model.fs.P_T[2].value = 30
+    coordinator_object._clone_tracking_model()
+    assert coordinator_object._tracking_model_pairing is pairing
+    assert proj_model.fs.P_T[2].value == 30
+
+
+@pytest.mark.unit
+def test_clone_tracking_model_diverged(coordinator_object):
+
+    coordinator_object.projection_tracker.model.fs.extra = pyo.Var()
+    with pytest.raises(ValueError, match="do not diverge"):
+        coordinator_object._clone_tracking_model()
@@ -0,0 +1,157 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+import pytest
+import pyomo.environ as pyo
+from pyomo.core.expr.visitor import identify_variables
+from idaes.apps.grid_integration.multiperiod.multiperiod import MultiPeriodModel
+
+
+def create_storage_model(lmp=0.0, demand=1.0):
+    m = pyo.ConcreteModel()
+    m.lmp = pyo.Param(initialize=lmp, mutable=True)
+    m.demand = pyo.Var(initialize=demand)
+    m.demand.fix()
+    m.soc0 = pyo.Var(initialize=0.0)
+    m.soc = pyo.Var(initialize=0.0)
+    m.charge = pyo.Var(initialize=0.0)
+    m.balance = pyo.Constraint(expr=m.soc == m.soc0 + m.charge - m.demand)
+    m.cost = pyo.Expression(expr=m.lmp * m.charge)
+    return m
+
+
+def update_storage_model(m, lmp=0.0, demand=1.0):
+    m.lmp = lmp
+    m.demand.fix(demand)
+
+
+def linking_pairs(m1, m2):
+    return [(m1.soc, m2.soc0)]
+
+
+def periodic_pairs(m1, m2):
+    return [(m1.soc, m2.soc0)]
+
+
+def build(recycle_blocks, n_time_points=4):
+    mp = MultiPeriodModel(
+        n_time_points,
+        create_storage_model,
+        linking_pairs,
+        periodic_variable_func=periodic_pairs,
+        update_process_model_func=update_storage_model if recycle_blocks else None,
+        recycle_blocks=recycle_blocks,
+    )
+    mp.build_multi_period_model({t: {"lmp": 10.0 * t} for t in range(n_time_points)})
+    return mp
+
+
+def _var_ids(c):
+    return set(id(v) for v in identify_variables(c.body))
+
+
+def _check_coupling(blocks):
+    for b1, b2 in zip(blocks[:-1], blocks[1:]):
+        assert len(b1.link_constraints) == 1
+        assert b1.link_constraints[0].active
+        assert _var_ids(b1.link_constraints[0]) == {id(b1.soc), id(b2.soc0)}
+        assert b1.component("periodic_constraints") is None or (
+            not b1.periodic_constraints.active
+        )
+    last = blocks[-1]
+    assert last.component("link_constraints") is None
+    assert _var_ids(last.periodic_constraints[0]) == {
+        id(last.soc),
+        id(blocks[0].soc0),
+    }
+
+
+@pytest.mark.unit
+def test_recycle_requires_update_func():
+    with pytest.raises(ValueError):
+        MultiPeriodModel(
+            3, create_storage_model, linking_pairs, recycle_blocks=True
+        )
+
+
+@pytest.mark.unit
+def test_advance_time_new_blocks():
+    mp = build(recycle_blocks=False)
+    for t in range(4, 10):
+        mp.advance_time(lmp=10.0 * t)
+
+    assert mp.current_time == 6
+    assert len(mp.pyomo_model.blocks) == 10
+    blocks = mp.get_active_process_blocks()
+    assert [pyo.value(b.lmp) for b in blocks] == [60.0, 70.0, 80.0, 90.0]
+    assert mp.get_process_block(6) is blocks[0]
+    assert len(mp.timings) == 7
+
+
+@pytest.mark.unit
+def test_advance_time_recycle_blocks():
+    mp = build(recycle_blocks=True)
+    m = mp.pyomo_model
+    n_vars = len(list(m.component_data_objects(pyo.Var)))
+    n_cons = len(list(m.component_data_objects(pyo.Constraint)))
+    _check_coupling(mp.get_active_process_blocks())
+
+    mp.get_process_block(3).charge.value = 5.0
+    mp.advance_time(lmp=40.0, demand=2.0)
+
+    assert mp.current_time == 1
+    blocks = mp.get_active_process_blocks()
+    # the block of time 0 is reused for time 4
+    assert blocks[-1] is m.blocks[0].process
+    assert pyo.value(blocks[-1].lmp) == 40.0
+    assert blocks[-1].demand.value == 2.0
+    assert blocks[-1].demand.fixed
+    # unfixed values are shifted forward from the previous last time period
+    assert blocks[-1].charge.value == 5.0
+    _check_coupling(blocks)
+
+    for t in range(5, 10):
+        mp.advance_time(lmp=10.0 * t)
+
+    assert mp.current_time == 6
+    blocks = mp.get_active_process_blocks()
+    assert [pyo.value(b.lmp) for b in blocks] == [60.0, 70.0, 80.0, 90.0]
+    assert all(b.active for b in blocks)
+    _check_coupling(blocks)
+
+    # model size is constant
+    assert len(m.blocks) == 4
+    assert len(list(m.component_data_objects(pyo.Var))) == n_vars
+    assert len(list(m.component_data_objects(pyo.Constraint))) == n_cons
+
+    assert len(mp.timings) == 7
+    assert [r["time"] for r in mp.timings] == list(range(7))
+    assert all(r["construction"] >= 0 for r in mp.timings)
+
+
+@pytest.mark.unit
+def test_solve_timing():
+    class DummySolver:
+        def solve(self, model, **kwargs):
+            self.model = model
+            self.kwargs = kwargs
+            return "results"
+
+    mp = build(recycle_blocks=True)
+    solver = DummySolver()
+    assert mp.solve(solver, tee=True) == "results"
+    assert solver.model is mp.pyomo_model
+    assert solver.kwargs == {"tee": True}
+    assert mp.timings[-1]["solve"] >= 0
+
+    mp.advance_time(lmp=1.0)
+    assert mp.timings[-1]["solve"] is None
@@ -0,0 +1,232 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+import pytest
+import pyomo.environ as pyo
+from idaes.apps.grid_integration.persistent import (
+    PersistentSolveManager,
+    is_persistent_solver,
+)
+from idaes.apps.grid_integration.tracker import Tracker
+from idaes.apps.grid_integration.tests.util import TestingModel
+
+
+class RecordingPersistentSolver:
+
+    """
+    Stand-in for a Pyomo persistent solver that records the calls made to it.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def set_instance(self, model):
+        self.calls.append(("set_instance", model))
+
+    def add_constraint(self, con):
+        self.calls.append(("add_constraint", con))
+
+    def remove_constraint(self, con):
+        self.calls.append(("remove_constraint", con))
+
+    def set_objective(self, obj):
+        self.calls.append(("set_objective", obj))
+
+    def update_var(self, var):
+        self.calls.append(("update_var", var))
+
+    def solve(self, **kwargs):
+        self.calls.append(("solve", kwargs))
+        return "results"
+
+    def pop_calls(self):
+        # components are identified by name, as Var objects cannot be compared
+        calls, self.calls = self.calls, []
+        return [
+            (method, arg.name if hasattr(arg, "ctype") else arg)
+            for method, arg in calls
+        ]
+
+
+class RecordingSolver:
+    def solve(self, model, **kwargs):
+        self.model = model
+        return "results"
+
+
+def _model():
+    m = pyo.ConcreteModel()
+    m.T = pyo.Set(initialize=range(3))
+    m.price = pyo.Param(m.T, initialize=1, mutable=True)
+    m.target = pyo.Param(m.T, initialize=0, mutable=True)
+    m.p0 = pyo.Var(initialize=0)
+    m.p0.fix()
+    m.p = pyo.Var(m.T, bounds=(0, 10))
+    m.dev = pyo.Var(m.T, within=pyo.NonNegativeReals)
+    m.track = pyo.Constraint(m.T, rule=lambda m, t: m.p[t] - m.target[t] <= m.dev[t])
+    m.ramp = pyo.Constraint(
+        m.T,
+        rule=lambda m, t: m.p[t] - (m.p0 if t == 0 else m.p[t - 1]) <= 5,
+    )
+    m.obj = pyo.Objective(expr=sum(m.dev[t] - m.price[t] * m.p[t] for t in m.T))
+    return m
+
+
+@pytest.mark.unit
+def test_is_persistent_solver():
+    assert is_persistent_solver(RecordingPersistentSolver())
+    assert not is_persistent_solver(RecordingSolver())
+    assert not is_persistent_solver(pyo.SolverFactory("cbc"))
+
+
+@pytest.mark.unit
+def test_non_persistent_solve():
+    m = _model()
+    solver = RecordingSolver()
+    manager = PersistentSolveManager(solver, m)
+    assert not manager.persistent
+    assert manager.solve(tee=True) == "results"
+    assert solver.model is m
+    assert manager.last_update_time == 0
+    assert manager.last_solve_time >= 0
+
+
+@pytest.mark.unit
+def test_persistent_updates():
+    m = _model()
+    solver = RecordingPersistentSolver()
+    manager = PersistentSolveManager(solver, m)
+    assert manager.persistent
+
+    assert manager.solve(tee=True) == "results"
+    assert solver.pop_calls() == [
+        ("set_instance", "unknown"),
+        ("solve", {"tee": True}),
+    ]
+    assert manager.last_update_counts["constraints"] == 6
+
+    # nothing changed, nothing is pushed
+    manager.solve()
+    assert solver.pop_calls() == [("solve", {})]
+    assert manager.last_update_counts == {
+        "constraints": 0,
+        "variables": 0,
+        "objective": False,
+    }
+
+    # a new target only touches its own tracking constraint
+    m.target[1] = 4
+    m.target[2] = 0
+    manager.solve()
+    assert solver.pop_calls() == [
+        ("remove_constraint", "track[1]"),
+        ("add_constraint", "track[1]"),
+        ("solve", {}),
+    ]
+
+    # prices only appear in the objective
+    m.price[0] = 3
+    manager.solve()
+    assert solver.pop_calls() == [("set_objective", "obj"), ("solve", {})]
+
+    # a new initial state is folded into the first ramping constraint
+    m.p0.fix(2)
+    m.p[2].setub(8)
+    manager.solve()
+    assert solver.pop_calls() == [
+        ("update_var", "p[2]"),
+        ("update_var", "p0"),
+        ("remove_constraint", "ramp[0]"),
+        ("add_constraint", "ramp[0]"),
+        ("solve", {}),
+    ]
+    assert manager.last_update_counts == {
+        "constraints": 1,
+        "variables": 2,
+        "objective": False,
+    }
+    assert manager.last_update_time <= manager.last_solve_time
+
+    # deactivated constraints are removed and reactivated ones added back
+    m.ramp[1].deactivate()
+    manager.solve()
+    assert solver.pop_calls() == [("remove_constraint", "ramp[1]"), ("solve", {})]
+    m.target[1] = 5
+    m.ramp[1].activate()
+    m.track[1].deactivate()
+    manager.solve()
+    assert solver.pop_calls() == [
+        ("remove_constraint", "track[1]"),
+        ("add_constraint", "ramp[1]"),
+        ("solve", {}),
+    ]
+    m.target[1] = 6
+    m.track[1].activate()
+    manager.solve()
+    assert solver.pop_calls() == [("add_constraint", "track[1]"), ("solve", {})]
+    assert manager.last_update_counts["constraints"] == 1
+
+    # a constraint that was inactive when the model was loaded
+    m.extra = pyo.Constraint(expr=m.p[0] <= m.target[0])
+    m.extra.deactivate()
+    manager.reset()
+    manager.solve()
+    solver.pop_calls()
+    m.extra.activate()
+    manager.solve()
+    assert solver.pop_calls() == [("add_constraint", "extra"), ("solve", {})]
+    m.target[0] = 2
+    manager.solve()
+    assert solver.pop_calls() == [
+        ("remove_constraint", "track[0]"),
+        ("add_constraint", "track[0]"),
+        ("remove_constraint", "extra"),
+        ("add_constraint", "extra"),
+        ("solve", {}),
+    ]
+    m.del_component(m.extra)
+
+    # structural changes require the model to be reloaded
+    m.extra = pyo.Constraint(expr=m.p[0] <= 9)
+    manager.reset()
+    manager.solve()
+    assert solver.pop_calls() == [("set_instance", "unknown"), ("solve", {})]
+    assert manager.last_update_counts["constraints"] == 7
+
+
+@pytest.mark.unit
+def test_tracker_persistent_solve():
+    tracker_object = Tracker(
+        tracking_model_object=TestingModel(horizon=4),
+        n_tracking_hour=1,
+        solver=pyo.SolverFactory("cbc"),
+    )
+    solver = RecordingPersistentSolver()
+    tracker_object.solve_manager = PersistentSolveManager(solver, tracker_object.model)
+
+    tracker_object.track_market_dispatch(
+        market_dispatch=[30, 40, 50, 70], date="2021-07-26", hour="17:00"
+    )
+    assert [c[0] for c in solver.pop_calls()] == ["set_instance", "solve"]
+
+    tracker_object.track_market_dispatch(
+        market_dispatch=[30, 40, 55, 70], date="2021-07-26", hour="18:00"
+    )
+    calls = solver.pop_calls()
+    readded = [c[1] for c in calls if c[0] == "add_constraint"]
+    assert "tracking_dispatch_constraints[3]" in readded
+    assert "tracking_dispatch_constraints[1]" not in readded
+    assert calls[-1][0] == "solve"
+
+    assert len(tracker_object.result_list) == 2
+    df = tracker_object.result_list[-1]
+    assert (df["Solve Time [s]"] >= df["Model Update Time [s]"]).all()
@@ -14,6 +14,7 @@ import pandas as pd
 import pyomo.environ as pyo
 from pyomo.opt.base.solvers import OptSolver
 import os
+from idaes.apps.grid_integration.persistent import PersistentSolveManager
 
 
 class Tracker:
@@ -31,7 +32,9 @@ class Tracker:
         Arguments:
             tracking_model_class: the model object class for tracking
             n_tracking_hour: number of implemented hours after each solve
-            solver: a Pyomo mathematical programming solver object
+            solver: a Pyomo mathematical programming solver object. If it is a
+            Pyomo persistent solver, the model is loaded into it once and only
+            the changes are pushed to it before each solve.
 
         Returns:
             None
@@ -56,6 +59,7 @@ class Tracker:
         self.time_set = self.power_output.index_set()
 
         self.formulate_tracking_problem()
+        self.solve_manager = PersistentSolveManager(self.solver, self.model)
 
         self.daily_stats = None
         self.projection = None
@@ -293,7 +297,7 @@ class Tracker:
         self._pass_market_dispatch(market_dispatch)
 
         # solve the model
-        self.solver.solve(self.model, tee=True)
+        self.solve_manager.solve(tee=True)
 
         self.record_results(date=date, hour=hour)
 
@@ -395,6 +399,9 @@ class Tracker:
                 pyo.value(self.model.power_overdelivered[t]), 2
             )
 
+            result_dict["Model Update Time [s]"] = self.solve_manager.last_update_time
+            result_dict["Solve Time [s]"] = self.solve_manager.last_solve_time
+
             result_df = pd.DataFrame.from_dict(result_dict, orient="index")
             df_list.append(result_df.T)
 
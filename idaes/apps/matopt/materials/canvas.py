@@ -12,8 +12,10 @@
 #################################################################################
 import numpy as np
 from copy import deepcopy
+from itertools import product
+from math import floor
 
-from ..util.util import myArrayEq, myPointsEq, ListHasPoint
+from ..util.util import myArrayEq, myPointsEq
 from .parsers.PDB import readPointsAndAtomsFromPDB
 from .parsers.XYZ import readPointsAndAtomsFromXYZ
 from .parsers.CFG import readPointsAndAtomsFromCFG
@@ -28,9 +30,16 @@ class Canvas(object):
     materials as graphs to the geometry of the material lattice. The list of points and neighbor
     connections necessary to create a ``Canvas`` object can be obtained from the combination of
     ``Lattice``, ``Shape``, and ``Tiling`` objects.
+
+    Point lookups use a spatial hash that buckets Points in cubic cells of
+    side HASH_CELL_SIZE. Only the cells within DBL_TOL of a query point are
+    searched, so lookups take constant time instead of scanning all Points.
     """
 
     DBL_TOL = 1e-5
+    # NOTE: The cells must be wider than 2*DBL_TOL, so that the tolerance
+    #       region around a point overlaps at most two cells per axis.
+    HASH_CELL_SIZE = 4 * DBL_TOL
 
     # === STANDARD CONSTRUCTOR
     def __init__(self, Points=None, NeighborhoodIndexes=None, DefaultNN=0):
@@ -44,6 +53,7 @@ class Canvas(object):
         self._Points = Points
         self._NeighborhoodIndexes = NeighborhoodIndexes
         self.__DefaultNN = DefaultNN
+        self.updatePointHash()
         assert self.isConsistentWithDesign()
 
     # === CONSTRUCTOR - From PDB File
@@ -253,6 +263,7 @@ class Canvas(object):
         """
         assert not self.hasPoint(P)
         self._Points.append(P)
+        self._hashPoint(len(self._Points) - 1)
         self._NeighborhoodIndexes.append([None] * (NNeighbors or self.__DefaultNN))
         assert self.isConsistentWithDesign()
 
@@ -318,8 +329,9 @@ class Canvas(object):
         """
         assert i < len(self._NeighborhoodIndexes)
         assert l < len(self._NeighborhoodIndexes[i])
-        if self.hasPoint(PN):
-            self._NeighborhoodIndexes[i][l] = self.getPointIndex(PN)
+        j = self.getPointIndex(PN)
+        if j is not None:
+            self._NeighborhoodIndexes[i][l] = j
         elif blnSetNoneOtherwise:
             self._NeighborhoodIndexes[i][l] = None
         assert self.isConsistentWithDesign()
@@ -373,8 +385,7 @@ class Canvas(object):
             PNs = NeighborsFunc(P, layer)
             result[i] = [None] * len(PNs)
             for j, PN in enumerate(PNs):
-                if self.hasPoint(PN):
-                    result[i][j] = self.getPointIndex(PN)
+                result[i][j] = self.getPointIndex(PN)
         return result
 
     def getNeighborsFromFuncAndTiling(self, NeighborsFunc, argTiling, layer=1):
@@ -395,13 +406,12 @@ class Canvas(object):
             PNs = NeighborsFunc(P, layer)
             result[i] = [None] * len(PNs)
             for j, PN in enumerate(PNs):
-                if self.hasPoint(PN):
-                    result[i][j] = self.getPointIndex(PN)
-                else:
+                result[i][j] = self.getPointIndex(PN)
+                if result[i][j] is None:
                     for TilingDirection in argTiling.TilingDirections:
-                        PtoTry = PN + TilingDirection
-                        if self.hasPoint(PtoTry):
-                            result[i][j] = self.getPointIndex(PtoTry)
+                        k = self.getPointIndex(PN + TilingDirection)
+                        if k is not None:
+                            result[i][j] = k
         return result
 
     def makePeriodic(self, argTiling, NeighborsFunc):
@@ -424,9 +434,9 @@ class Canvas(object):
                         LatNeighbors[l]
                     )  # else, Canvas constructed incorrectly
                     for TilingDirection in argTiling.TilingDirections:
-                        PtoTry = LatNeighbors[l] + TilingDirection
-                        if self.hasPoint(PtoTry):
-                            self._NeighborhoodIndexes[i][l] = self.getPointIndex(PtoTry)
+                        j = self.getPointIndex(LatNeighbors[l] + TilingDirection)
+                        if j is not None:
+                            self._NeighborhoodIndexes[i][l] = j
                             break
 
     def addShells(self, n, NeighborsFunc):
@@ -472,6 +482,7 @@ class Canvas(object):
         """
         for P in self._Points:
             TransF.transform(P)
+        self.updatePointHash()
 
     def getTransformed(self, TransF):
         """Copy and transform this Canvas.
@@ -527,12 +538,7 @@ class Canvas(object):
             bool) True if Points has P.
 
         """
-        for Q in self.Points:
-            # NOTE: There are several ways to test point membership.
-            #       This is optimized for speed.
-            if myArrayEq(P, Q, Canvas.DBL_TOL):
-                return True
-        return False
+        return self.getPointIndex(P) is not None
 
     def getPointIndex(self, P):
         """Identify the index of a point in the Canvas.
@@ -541,15 +547,21 @@ class Canvas(object):
             P(numpy.ndarray): Point in the Canvas.
 
         Returns:
-            int) Index of P in Points.
+            int) Index of P in Points. If several Points match P, the
+            lowest index is returned. None if P is not in Points.
 
         """
-        for i, Q in enumerate(self.Points):
-            # NOTE: There are several ways to test point membership.
-            #       This is optimized for speed.
-            if myArrayEq(P, Q, Canvas.DBL_TOL):
-                return i
-        return None
+        if self._NHashedPoints != len(self._Points):
+            self.updatePointHash()
+        tol = Canvas.DBL_TOL
+        result = None
+        for Key in product(*(_getCellRange(x, tol) for x in P[:3])):
+            for i in self._PointHash.get(Key, ()):
+                if (result is None or i < result) and myArrayEq(
+                    P, self._Points[i], tol
+                ):
+                    result = i
+        return result
 
     def getNeighbors(self, P):
         """Identify set of neighbors to a point in Canvas.
@@ -590,15 +602,13 @@ class Canvas(object):
             neighboring shell.
 
         """
-        result = []
-        for i, P in enumerate(self.Points):
+        Shell = Canvas()
+        for P in self.Points:
             Neighs = NeighborsFunc(P)
             for Neigh in Neighs:
-                if not self.hasPoint(Neigh) and not ListHasPoint(
-                    result, Neigh, Canvas.DBL_TOL
-                ):
-                    result.append(Neigh)
-        return result
+                if not self.hasPoint(Neigh) and not Shell.hasPoint(Neigh):
+                    Shell.addLocation(Neigh)
+        return Shell.Points
 
     def getNeighborhoodIndexes(self, Lat, layer=1, T=None):
         """Wrapper of functions that returns neighbors across the Canvas
@@ -618,6 +628,31 @@ class Canvas(object):
         else:
             return self.getNeighborsFromFuncAndTiling(Lat.getNeighbors, T, layer)
 
+    # === SPATIAL HASH METHODS
+    def updatePointHash(self):
+        """Rebuild the spatial hash used to look up Points.
+
+        The hash is kept up to date by the methods of Canvas. This only
+        needs to be called after the Points are modified in place by
+        other means.
+
+        Returns:
+            None.
+
+        """
+        self._PointHash = {}
+        self._NHashedPoints = 0
+        for i in range(len(self._Points)):
+            self._hashPoint(i)
+
+    def _hashPoint(self, i):
+        """Add the Point at index i to the spatial hash."""
+        P = self._Points[i]
+        self._NHashedPoints += 1
+        if P is not None:
+            Key = tuple(floor(x / Canvas.HASH_CELL_SIZE) for x in P[:3])
+            self._PointHash.setdefault(Key, []).append(i)
+
     # === BASIC QUERY METHODS
     @property
     def Points(self):
@@ -639,3 +674,10 @@ class Canvas(object):
         """Pretty-print NeighborhoodIndexes."""
         for i, Neighborhood in enumerate(self.getNeighborhoodIndexes(layer)):
             print("{}: {}".format(i, Neighborhood))
+
+
+def _getCellRange(x, tol):
+    """Get the hash cells along one axis that are within tol of x."""
+    lo = floor((x - tol) / Canvas.HASH_CELL_SIZE)
+    hi = floor((x + tol) / Canvas.HASH_CELL_SIZE)
+    return (lo,) if lo == hi else (lo, hi)
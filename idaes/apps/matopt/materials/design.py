@@ -229,12 +229,9 @@ class Design(object):
         if blnPreserveIndexing:
             return self == other
         for i, P in enumerate(self.Canvas.Points):
-            if not other.Canvas.hasPoint(P):
+            j = other.Canvas.getPointIndex(P)
+            if j is None or self.Contents[i] != other.Contents[j]:
                 return False
-            else:
-                j = other.Canvas.getPointIndex(P)
-                if self.Contents[i] != other.Contents[j]:
-                    return False
         return True
 
     @property
@@ -12,8 +12,12 @@
 #################################################################################
 from abc import abstractmethod
 from itertools import product
+from operator import itemgetter
+from time import perf_counter
 
+import numpy as np
 from pyomo.core.base.param import SimpleParam
+from pyomo.core.expr.numeric_expr import LinearExpression
 from pyomo.opt.results import SolutionStatus
 
 from .pyomo_modeling import *
@@ -189,6 +193,57 @@ class IndexedElem(object):
             result = [None]
         return tuple(result)
 
+    def _mask_func(self, Comb):
+        """Method to create a function equivalent to mask for a fixed Comb.
+
+        The positions of the relevant parts of the index are found only
+        once, which is much faster when masking many indexes.
+
+        Args:
+            Comb (IndexedElem): object from which the indexes are generated
+
+        Returns:
+            (function) function taking an index and returning the index with
+            the indices relevant to this object remaining
+        """
+        n = 0
+        pos = {}
+        if Comb.sites is not None:
+            pos["i"] = n
+            n += 1
+        if Comb.bonds is not None:
+            pos["i"], pos["j"] = n, n + 1
+            n += 2
+        if Comb.site_types is not None:
+            pos["k"] = n
+            n += 1
+        if Comb.bond_types is not None:
+            pos["k"], pos["l"] = n, n + 1
+            n += 2
+        if Comb.confs is not None:
+            pos["c"] = n
+        needed = []
+        if self.sites is not None:
+            needed.append("i")
+        if self.bonds is not None:
+            needed.extend(("i", "j"))
+        if self.site_types is not None:
+            needed.append("k")
+        if self.bond_types is not None:
+            needed.extend(("k", "l"))
+        if self.confs is not None:
+            needed.append("c")
+        if not needed:
+            return lambda index: (None,)
+        if not all(name in pos for name in needed):
+            # NOTE: Let mask report the inconsistent indexes
+            return lambda index: self.mask(index, Comb)
+        positions = [pos[name] for name in needed]
+        if len(positions) == 1:
+            p = positions[0]
+            return lambda index: (index[p],)
+        return itemgetter(*positions)
+
     @property
     def dims(self):
         """Relevant dimensions of indices.
@@ -331,6 +386,131 @@ class Coef(IndexedElem):
         return self.vals[k]
 
 
+def _isScalarCoef(coefs):
+    """Determine if coefficients are a single value for all terms."""
+    return type(coefs) is float or type(coefs) is int or type(coefs) is SimpleParam
+
+
+def _flatIndexes(Comb):
+    """Generate the indexes of Comb as flat tuples, as Pyomo passes them to rules.
+
+    Args:
+        Comb (IndexedElem): object to generate indexes for.
+
+    Returns:
+        (generator<tuple<int/BBlock>>) flat indexes.
+    """
+    blnSingleSet = len(Comb.index_sets) == 1
+    for key in Comb.keys():
+        if blnSingleSet:
+            key = (key,)
+        index = []
+        for k in key:
+            if type(k) is tuple:
+                index.extend(k)
+            else:
+                index.append(k)
+        yield tuple(index)
+
+
+class NeighborIncidence(object):
+    """Sparse incidence of the neighborhoods of a Canvas.
+
+    The neighborhoods are stored in compressed sparse row (CSR) format:
+    the neighbors of site i are indices[indptr[i]:indptr[i+1]], and slots
+    holds the position of each neighbor in the neighborhood of i (used to
+    look up neighbor coefficients). Missing neighbors (None) are left out.
+
+    Attributes:
+        indptr (numpy.ndarray): offsets of the neighbors of each site
+        indices (numpy.ndarray): neighbor sites
+        slots (numpy.ndarray): positions of the neighbors in the neighborhoods
+    """
+
+    # === STANDARD CONSTRUCTOR
+    def __init__(self, canv):
+        """Standard constructor of neighbor incidence.
+
+        Args:
+            canv (Canvas): canvas to take the neighborhoods from.
+        """
+        indptr = [0]
+        indices = []
+        slots = []
+        for Neighborhood in canv.NeighborhoodIndexes:
+            for n, j in enumerate(Neighborhood):
+                if j is not None:
+                    indices.append(j)
+                    slots.append(n)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr, dtype=int)
+        self.indices = np.array(indices, dtype=int)
+        self.slots = np.array(slots, dtype=int)
+        # NOTE: Pyomo indexes are built from Python ints, not numpy ints.
+        self._indptr = indptr
+        self._indices = indices
+        self._slots = slots
+
+    # === PROPERTY EVALUATION METHODS
+    def getCoefs(self, coefs):
+        """Get the coefficient of each neighbor in CSR order.
+
+        Args:
+            coefs (float/list<float>): coefficient for all neighbors or list
+                of coefficients by position in the neighborhood.
+
+        Returns:
+            (list) coefficients aligned with indices.
+        """
+        if _isScalarCoef(coefs):
+            return [coefs] * len(self._indices)
+        if all(type(c) is float or type(c) is int for c in coefs):
+            return np.asarray(coefs, dtype=float)[self.slots].tolist()
+        return [coefs[n] for n in self._slots]
+
+    def getRow(self, i):
+        """Get the CSR bounds and neighbor sites of site i.
+
+        Args:
+            i (int): site to get the neighbors of.
+
+        Returns:
+            (tuple<int,int,list<int>>) start and end offsets and neighbors.
+        """
+        start, end = self._indptr[i], self._indptr[i + 1]
+        return start, end, self._indices[start:end]
+
+
+class ModelBuild(object):
+    """Data shared by the rules while building one Pyomo model.
+
+    Attributes:
+        timing (dict<string:float>): build time (s) of each part of the model
+    """
+
+    # === STANDARD CONSTRUCTOR
+    def __init__(self):
+        """Standard constructor of model build data."""
+        self.timing = {}
+        self._incidences = {}
+
+    # === PROPERTY EVALUATION METHODS
+    def getNeighborIncidence(self, canv):
+        """Get the neighbor incidence of a canvas, computed once per build.
+
+        Args:
+            canv (Canvas): canvas to get the neighbor incidence of.
+
+        Returns:
+            (NeighborIncidence) neighbor incidence of canv.
+        """
+        # NOTE: The canvas is kept with its incidence so that its id is not
+        #       reused during the build.
+        if id(canv) not in self._incidences:
+            self._incidences[id(canv)] = (canv, NeighborIncidence(canv))
+        return self._incidences[id(canv)][1]
+
+
 class Expr(IndexedElem):
     """An abstract class for representing expressions when building rules.
 
@@ -371,6 +551,55 @@ class Expr(IndexedElem):
         """
         raise NotImplementedError
 
+    def _pyomo_linear_exprs(self, indexes, build):
+        """Interface for generating many Pyomo linear expressions at once.
+
+        Expressions that can generate their instances in bulk override this
+        method. Otherwise, None is returned and _pyomo_expr is used.
+
+        Args:
+        indexes (iterable<tuple>): indexes to create instances of the
+            expression for, as passed to _pyomo_expr.
+        build (ModelBuild): data shared by the rules of the model.
+
+        Returns:
+        (dict<tuple:LinearExpression>) expression instances by index, or None.
+        """
+        return None
+
+
+class ExprTable(Expr):
+    """A class for expressions with instances that were generated in bulk.
+
+    Attributes:
+        table (dict<tuple:Pyomo expression>): expression instances by index
+            (index information inherited from IndexedElem)
+    """
+
+    # === STANDARD CONSTRUCTOR
+    def __init__(self, expr, table):
+        """Standard constructor for tables of expression instances.
+
+        Args:
+            expr (Expr): expression that the instances were generated for.
+            table (dict<tuple:Pyomo expression>): expression instances by index.
+        """
+        self.table = table
+        Expr.__init__(self, **expr.index_dict)
+
+    # === PROPERTY EVALUATION METHODS
+    def _pyomo_expr(self, index=None):
+        """Interface for generating Pyomo expressions.
+
+        Args:
+            index (list): Optional, index to to create an instance of a Pyomo
+                expression. In the case of a scalar, the valid index is None.
+
+        Returns:
+            An instance of a Pyomo expression.
+        """
+        return self.table[index]
+
 
 class LinearExpr(Expr):
     """A class for representing simple expressions of site descriptors.
@@ -557,6 +786,56 @@ class SiteCombination(Expr):
         dj = self.descj._pyomo_expr(index=descj_index)
         return self.offset + ci * di + cj * dj
 
+    def _pyomo_linear_exprs(self, indexes, build):
+        """Interface for generating many Pyomo linear expressions at once.
+
+        Args:
+            indexes (iterable<tuple>): indexes to create instances of the
+                expression for.
+            build (ModelBuild): data shared by the rules of the model.
+
+        Returns:
+            (dict<tuple:LinearExpression>) expression instances by index, or
+            None if a term at a site is not a material descriptor.
+        """
+        if not (
+            isinstance(self.desci, MaterialDescriptor)
+            and isinstance(self.descj, MaterialDescriptor)
+        ):
+            return None
+        # NOTE: Only the index types present in Comb matter for masking
+        Comb = IndexedElem(sites=[], bonds=[], site_types=[], bond_types=[])
+        vari = self.desci._pyomo_var
+        varj = self.descj._pyomo_var
+        maski = self.desci._mask_func(Comb)
+        maskj = self.descj._mask_func(Comb)
+        ci, cj = self.coefi, self.coefj
+        scalari = _isScalarCoef(ci)
+        scalarj = _isScalarCoef(cj)
+        coef_maski = None if scalari else ci._mask_func(Comb)
+        coef_maskj = None if scalarj else cj._mask_func(Comb)
+        result = {}
+        for index in indexes:
+            if len(index) == 4:
+                i, j, k, l = index
+            elif len(index) == 2:
+                i, j, k, l = index[0], index[1], (), ()
+            else:
+                raise NotImplementedError(
+                    "Decide how to split the extra " "indices in this case..."
+                )
+            index_i = (i, i, j, k, k, l)
+            index_j = (j, j, i, l, l, k)
+            result[index] = LinearExpression(
+                constant=self.offset,
+                linear_coefs=[
+                    ci if scalari else ci[coef_maski(index_i)],
+                    cj if scalarj else cj[coef_maskj(index_j)],
+                ],
+                linear_vars=[vari[maski(index_i)], varj[maskj(index_j)]],
+            )
+        return result
+
 
 class SumNeighborSites(Expr):
     """A class for expressions for summation across neighbor sites.
@@ -617,6 +896,31 @@ class SumNeighborSites(Expr):
                 ) * self.desc._pyomo_var[(j, *index)]
         return result
 
+    def _pyomo_linear_exprs(self, indexes, build):
+        """Interface for generating many Pyomo linear expressions at once.
+
+        Args:
+            indexes (iterable<tuple>): indexes to create instances of the
+                expression for.
+            build (ModelBuild): data shared by the rules of the model.
+
+        Returns:
+            (dict<tuple:LinearExpression>) expression instances by index.
+        """
+        incidence = build.getNeighborIncidence(self.desc.canv)
+        coefs = incidence.getCoefs(self.coefs)
+        var = self.desc._pyomo_var
+        result = {}
+        for index in indexes:
+            i, *index_rest = index
+            start, end, Neighbors = incidence.getRow(i)
+            result[index] = LinearExpression(
+                constant=self.offset,
+                linear_coefs=coefs[start:end],
+                linear_vars=[var[(j, *index_rest)] for j in Neighbors],
+            )
+        return result
+
 
 class SumNeighborBonds(Expr):
     """A class for expressions from summation of neighbor bond descriptors.
@@ -670,8 +974,7 @@ class SumNeighborBonds(Expr):
         result = self.offset
         for n, j in enumerate(self.desc.canv.NeighborhoodIndexes[i]):
             if j is not None:
-                if self.symmetric_bonds:
-                    i, j = min(i, j), max(i, j)
+                bond = (min(i, j), max(i, j)) if self.symmetric_bonds else (i, j)
                 result += (
                     self.coefs
                     if (
@@ -680,7 +983,39 @@ class SumNeighborBonds(Expr):
                         or type(self.coefs) is SimpleParam
                     )
                     else self.coefs[n]
-                ) * self.desc._pyomo_expr(index=(i, j, *index))
+                ) * self.desc._pyomo_expr(index=(*bond, *index))
+        return result
+
+    def _pyomo_linear_exprs(self, indexes, build):
+        """Interface for generating many Pyomo linear expressions at once.
+
+        Args:
+            indexes (iterable<tuple>): indexes to create instances of the
+                expression for.
+            build (ModelBuild): data shared by the rules of the model.
+
+        Returns:
+            (dict<tuple:LinearExpression>) expression instances by index, or
+            None if the bonds are not a material descriptor.
+        """
+        if not isinstance(self.desc, MaterialDescriptor):
+            return None
+        incidence = build.getNeighborIncidence(self.desc.canv)
+        coefs = incidence.getCoefs(self.coefs)
+        var = self.desc._pyomo_var
+        result = {}
+        for index in indexes:
+            i, *index_rest = index
+            start, end, Neighbors = incidence.getRow(i)
+            if self.symmetric_bonds:
+                Bonds = [(min(i, j), max(i, j)) for j in Neighbors]
+            else:
+                Bonds = [(i, j) for j in Neighbors]
+            result[index] = LinearExpression(
+                constant=self.offset,
+                linear_coefs=coefs[start:end],
+                linear_vars=[var[(*bond, *index_rest)] for bond in Bonds],
+            )
         return result
 
 
@@ -746,6 +1081,34 @@ class SumSites(Expr):
             ) * self.desc._pyomo_var[(i, *index)]
         return result
 
+    def _pyomo_linear_exprs(self, indexes, build):
+        """Interface for generating many Pyomo linear expressions at once.
+
+        Args:
+            indexes (iterable<tuple>): indexes to create instances of the
+                expression for.
+            build (ModelBuild): data shared by the rules of the model.
+
+        Returns:
+            (dict<tuple:LinearExpression>) expression instances by index.
+        """
+        var = self.desc._pyomo_var
+        scalar = _isScalarCoef(self.coefs)
+        result = {}
+        for index in indexes:
+            index_rest = () if index == (None,) else index
+            keys = [(i, *index_rest) for i in self.sites_to_sum]
+            result[index] = LinearExpression(
+                constant=self.offset,
+                linear_coefs=(
+                    [self.coefs] * len(keys)
+                    if scalar
+                    else [self.coefs[key] for key in keys]
+                ),
+                linear_vars=[var[key] for key in keys],
+            )
+        return result
+
 
 class SumBonds(Expr):
     """A class for expressions formed by summation over canvas bonds.
@@ -1027,6 +1390,38 @@ class SumSitesAndTypes(Expr):
                 ) * self.desc._pyomo_var[(i, k, *index)]
         return result
 
+    def _pyomo_linear_exprs(self, indexes, build):
+        """Interface for generating many Pyomo linear expressions at once.
+
+        Args:
+            indexes (iterable<tuple>): indexes to create instances of the
+                expression for.
+            build (ModelBuild): data shared by the rules of the model.
+
+        Returns:
+            (dict<tuple:LinearExpression>) expression instances by index.
+        """
+        var = self.desc._pyomo_var
+        scalar = _isScalarCoef(self.coefs)
+        result = {}
+        for index in indexes:
+            index_rest = () if index == (None,) else index
+            keys = [
+                (i, k, *index_rest)
+                for i in self.sites_to_sum
+                for k in self.site_types_to_sum
+            ]
+            result[index] = LinearExpression(
+                constant=self.offset,
+                linear_coefs=(
+                    [self.coefs] * len(keys)
+                    if scalar
+                    else [self.coefs[key] for key in keys]
+                ),
+                linear_vars=[var[key] for key in keys],
+            )
+        return result
+
 
 class SumBondsAndTypes(Expr):
     """A class for expressions formed by summation over bonds and bond types.
@@ -1320,17 +1715,28 @@ class SimpleDescriptorRule(DescriptorRule):
         DescriptorRule.__init__(self, **kwargs)
 
     # === PROPERTY EVALUATION METHODS
-    def _pyomo_cons(self, var):
+    def _pyomo_cons(self, var, build=None):
         """Method to create a Pyomo constraint from this rule.
 
+        If build is given and the expression of the rule supports it, the
+        instances of the expression are generated in bulk beforehand.
+
         Args:
         var (MaterialDescriptor): The descriptor to be defined by this rule.
+        build (ModelBuild): Optional, data shared by the rules of the model.
 
         Returns:
         (list<Constraint>) list of Pyomo constraint objects.
         """
         ConIndexes = IndexedElem.fromComb(var, self)
-        return [Constraint(*ConIndexes.index_sets, rule=self._pyomo_rule(var))]
+        RHS = None
+        if build is not None:
+            mask = self.expr._mask_func(IndexedElem.fromComb(var, self.expr))
+            indexes = {mask(index) for index in _flatIndexes(ConIndexes)}
+            table = self.expr._pyomo_linear_exprs(indexes, build)
+            if table is not None:
+                RHS = ExprTable(self.expr, table)
+        return [Constraint(*ConIndexes.index_sets, rule=self._pyomo_rule(var, RHS))]
 
     def _pyomo_rule(self, LHS, operator, RHS):
         """Method to create a function for a Pyomo constraint rule.
@@ -1344,10 +1750,12 @@ class SimpleDescriptorRule(DescriptorRule):
             (function) A function interpretable by Pyomo for a 'rule' argument
         """
         ConIndexes = IndexedElem.fromComb(LHS, RHS)
+        LHS_mask = LHS._mask_func(ConIndexes)
+        RHS_mask = RHS._mask_func(ConIndexes)
 
         def rule(m, *args):
-            LHS_index = LHS.mask(args, ConIndexes)
-            RHS_index = RHS.mask(args, ConIndexes)
+            LHS_index = LHS_mask(args)
+            RHS_index = RHS_mask(args)
             return operator(LHS._pyomo_expr(LHS_index), RHS._pyomo_expr(RHS_index))
 
         return rule
@@ -1369,12 +1777,14 @@ class LessThan(SimpleDescriptorRule):
     # --- Inherited from SimpleDescriptorRule ---
 
     # === PROPERTY EVALUATION METHODS
-    def _pyomo_rule(self, desc):
+    def _pyomo_rule(self, desc, RHS=None):
         """Method to create a function for a Pyomo constraint rule.
 
         Args:
             desc (MaterialDescriptor/Expr): A descriptor to define as 'less than'
                 the expression for this rule.
+            RHS (Expr): Optional, expression to use in place of the expression
+                for this rule (e.g., its instances generated in bulk).
 
         Returns:
             (function) A function in the format of a Pyomo rule to construct a
@@ -1384,7 +1794,9 @@ class LessThan(SimpleDescriptorRule):
         def less_than(LHS, RHS):
             return LHS <= RHS
 
-        return SimpleDescriptorRule._pyomo_rule(self, desc, less_than, self.expr)
+        return SimpleDescriptorRule._pyomo_rule(
+            self, desc, less_than, self.expr if RHS is None else RHS
+        )
 
 
 class EqualTo(SimpleDescriptorRule):
@@ -1403,12 +1815,14 @@ class EqualTo(SimpleDescriptorRule):
     # --- Inherited from SimpleDescriptorRule ---
 
     # === PROPERTY EVALUATION METHODS
-    def _pyomo_rule(self, desc):
+    def _pyomo_rule(self, desc, RHS=None):
         """Method to create a function for a Pyomo constraint rule.
 
         Args:
         desc (MaterialDescriptor/Expr): A descriptor to define as 'equal to'
             the expression for this rule.
+        RHS (Expr): Optional, expression to use in place of the expression
+            for this rule (e.g., its instances generated in bulk).
 
         Returns:
         (function) A function in the format of a Pyomo rule to construct a
@@ -1418,7 +1832,9 @@ class EqualTo(SimpleDescriptorRule):
         def equal_to(LHS, RHS):
             return LHS == RHS
 
-        return SimpleDescriptorRule._pyomo_rule(self, desc, equal_to, self.expr)
+        return SimpleDescriptorRule._pyomo_rule(
+            self, desc, equal_to, self.expr if RHS is None else RHS
+        )
 
 
 class GreaterThan(SimpleDescriptorRule):
@@ -1437,12 +1853,14 @@ class GreaterThan(SimpleDescriptorRule):
     # --- Inherited from SimpleDescriptorRule ---
 
     # === PROPERTY EVALUATION METHODS
-    def _pyomo_rule(self, desc):
+    def _pyomo_rule(self, desc, RHS=None):
         """Method to create a function for a Pyomo constraint rule.
 
         Args:
             desc (MaterialDescriptor/Expr): A descriptor to define as 'greater
                 than' the expression for this rule.
+            RHS (Expr): Optional, expression to use in place of the expression
+                for this rule (e.g., its instances generated in bulk).
 
         Returns:
             (function) A function in the format of a Pyomo rule to construct a
@@ -1452,7 +1870,9 @@ class GreaterThan(SimpleDescriptorRule):
         def greater_than(LHS, RHS):
             return LHS >= RHS
 
-        return SimpleDescriptorRule._pyomo_rule(self, desc, greater_than, self.expr)
+        return SimpleDescriptorRule._pyomo_rule(
+            self, desc, greater_than, self.expr if RHS is None else RHS
+        )
 
 
 class FixedTo(DescriptorRule):
@@ -2184,11 +2604,13 @@ class MaterialDescriptor(IndexedElem):
                     fixZic(m, i, c, r.val)
 
     # === PROPERTY EVALUATION METHODS
-    def _pyomo_cons(self, m):
+    def _pyomo_cons(self, m, build=None):
         """Create a list of Pyomo constraints related to this descriptor."""
         result = []
         for rule in self.rules:
-            if rule is not None:
+            if isinstance(rule, SimpleDescriptorRule):
+                result.extend(rule._pyomo_cons(self, build=build))
+            elif rule is not None:
                 result.extend(rule._pyomo_cons(self))
         return result
 
@@ -2299,6 +2721,7 @@ class MatOptModel(object):
         self._atoms = atoms
         self._confDs = confDs
         self._descriptors = []
+        self._build_timing = None
         self.addSitesDescriptor("Yi", binary=True, rules=None)
         self.addBondsDescriptor("Xij", binary=True, rules=None)
         self.addNeighborsDescriptor("Ci", integer=True, rules=None)
@@ -2926,9 +3349,14 @@ class MatOptModel(object):
                 functionality of interest.
                 Choices: minimize/maximize (Pyomo constants 1,-1 respectively)
 
+        The time spent building each part of the model is recorded in
+        build_timing.
+
         Returns:
             (ConcreteModel) Pyomo model object.
         """
+        build = ModelBuild()
+        start = perf_counter()
         m = makeMyPyomoBaseModel(self.canv, Atoms=self.atoms, Confs=self.confDs)
         self.Yi._pyomo_var = m.Yi
         self.Xij._pyomo_var = m.Xij
@@ -2949,9 +3377,19 @@ class MatOptModel(object):
                 )
                 setattr(m, desc.name, v)
                 setattr(desc, "_pyomo_var", v)
+        build.timing["variables"] = perf_counter() - start
         for desc in self._descriptors:
-            for c, pyomo_con in enumerate(desc._pyomo_cons(m)):
+            start = perf_counter()
+            for c, pyomo_con in enumerate(desc._pyomo_cons(m, build=build)):
                 setattr(m, "Assign{}_{}".format(desc.name, c), pyomo_con)
+            if any(r is not None for r in desc.rules):
+                build.timing[desc.name] = perf_counter() - start
+                logging.debug(
+                    "Built rules of {} in {:.3f}s".format(
+                        desc.name, build.timing[desc.name]
+                    )
+                )
+        start = perf_counter()
         if sum(obj_expr.dims) == 0:
             m.obj = Objective(expr=obj_expr._pyomo_expr(index=(None,)), sense=sense)
         else:
@@ -2959,6 +3397,8 @@ class MatOptModel(object):
                 "The MaterialDescriptor chosen is not supported to be an objective, please contact MatOpt "
                 "developer for potential fix"
             )
+        build.timing["objective"] = perf_counter() - start
+        start = perf_counter()
         # NOTE: The timing of the call to addConsForGeneralVars is important
         #       We need to call it after all user-defined descriptors are
         #       encoded.
@@ -2969,6 +3409,8 @@ class MatOptModel(object):
             for r in desc.rules:
                 if isinstance(r, FixedTo):
                     desc._fix_pyomo_var_by_rule(r, m)
+        build.timing["general variables"] = perf_counter() - start
+        self._build_timing = build.timing
         return m
 
     def __solve_pyomo_model(self, tee, disp, keepfiles, tilim, trelim, solver):
@@ -3096,3 +3538,13 @@ class MatOptModel(object):
     @property
     def descriptors(self):
         return self._descriptors
+
+    @property
+    def build_timing(self):
+        """Time (s) spent building each part of the last Pyomo model.
+
+        The keys are 'variables', the names of the descriptors with rules,
+        'objective' and 'general variables' (the constraints for the basic
+        variables and the FixedTo rules).
+        """
+        return self._build_timing
@@ -11,6 +11,7 @@
 # license information.
 #################################################################################
 import numpy as np
+from copy import deepcopy
 from math import sqrt
 from idaes.apps.matopt.materials import (
     Atom,
@@ -49,6 +50,7 @@ from idaes.apps.matopt.opt import (
     MatOptModel,
     SumNeighborSites,
     SumNeighborBonds,
+    SiteCombination,
     SumSites,
     SumBonds,
     SumSiteTypes,
@@ -67,8 +69,12 @@ from idaes.apps.matopt.opt import (
     NegImplies,
     ImpliesSiteCombination,
     ImpliesNeighbors,
+    NeighborIncidence,
 )
-from idaes.apps.matopt.util.util import areEqual
+from pyomo.environ import maximize
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.repn import generate_standard_repn
+from idaes.apps.matopt.util.util import areEqual, myArrayEq
 import pytest
 from test_matopt_objects_construction import *
 
@@ -139,3 +145,173 @@ def test_functionality_WurtziteLattice():
     assert areEqual(lattice.getUniqueLayerCount("0001"), 2, 1e-4)
     assert areEqual(lattice.getUniqueLayerCount("1100"), 2, 1e-4)
     assert areEqual(lattice.getUniqueLayerCount("1120"), 1, 1e-4)
+
+
+def _linearPointIndex(canvas, P):
+    for i, Q in enumerate(canvas.Points):
+        if myArrayEq(P, Q, Canvas.DBL_TOL):
+            return i
+    return None
+
+
+@pytest.mark.unit
+def test_functionality_Canvas_point_lookup():
+    canvas = Canvas()
+    # points straddling the boundaries of the hash cells
+    h = Canvas.HASH_CELL_SIZE
+    canvas.addLocation(np.array([h - 1e-7, 0.0, -h - 1e-7]))
+    canvas.addLocation(np.array([1.0, 2.0, 3.0]))
+    assert canvas.getPointIndex(np.array([h + 5e-6, -5e-6, -h + 5e-6])) == 0
+    assert canvas.getPointIndex(np.array([1.0, 2.0, 3.0 + 9e-6])) == 1
+    assert not canvas.hasPoint(np.array([1.0, 2.0, 3.0 + 2e-5]))
+    assert canvas.getPointIndex(np.array([1.0, 2.0, 3.0 + 2e-5])) is None
+    # the lowest index is found among points closer than DBL_TOL
+    canvas = Canvas(Points=[np.array([0.0, 0.0, 6e-6]), np.zeros(3)])
+    assert canvas.getPointIndex(np.zeros(3)) == 0
+    assert canvas.getPointIndex(np.array([0.0, 0.0, -6e-6])) == 1
+    # the hash follows transformations and direct changes to Points
+    canvas.transform(ShiftFunc(np.array([1.0, 0.0, 0.0])))
+    assert canvas.getPointIndex(np.array([1.0, 0.0, 0.0])) == 0
+    assert not canvas.hasPoint(np.zeros(3))
+    canvas.Points[1][:] = [5.0, 5.0, 5.0]
+    canvas.updatePointHash()
+    assert canvas.getPointIndex(np.array([5.0, 5.0, 5.0])) == 1
+    canvas.Points.append(np.array([7.0, 7.0, 7.0]))
+    canvas.NeighborhoodIndexes.append([])
+    assert canvas.getPointIndex(np.array([7.0, 7.0, 7.0])) == 2
+
+
+@pytest.mark.unit
+def test_functionality_Canvas_neighbors():
+    lattice = test_construct_FCCLattice()
+    canvas = Canvas.fromLatticeAndShape(
+        lattice, RectPrism(2.0, 2.0, 2.0, np.array([-0.01, -0.01, -0.01]))
+    )
+    canvas.addShell(lattice.getNeighbors)
+    assert len(canvas) == len(set(map(tuple, np.round(canvas.Points, 6))))
+    for i, P in enumerate(canvas.Points):
+        assert canvas.getPointIndex(P) == i
+        for l, PN in enumerate(lattice.getNeighbors(P)):
+            assert canvas.NeighborhoodIndexes[i][l] == _linearPointIndex(canvas, PN)
+    atom, _ = test_construct_Atom()
+    design = Design(canvas, atom)
+    shifted = Design(deepcopy(canvas), atom)
+    shifted.Canvas.Points.reverse()
+    shifted.Canvas.updatePointHash()
+    assert design.isEquivalentTo(shifted)
+    shifted.setContent(0, None)
+    assert not design.isEquivalentTo(shifted)
+
+
+@pytest.mark.integration
+def test_functionality_Canvas_construction_point_index():
+    lattices = {
+        "FCC": test_construct_FCCLattice(),
+        "Cubic": test_construct_CubicLattice(),
+        "Diamond": test_construct_DiamondLattice(),
+        "Wurtzite": test_construct_WurtziteLattice(),
+    }
+    for name, lattice in lattices.items():
+        for L in (4.0, 8.0):
+            shape = RectPrism(L, L, L, np.array([-0.01, -0.01, -0.01]))
+            canvas = Canvas.fromLatticeAndShape(lattice, shape)
+            n = len(canvas)
+            canvas.addShell(lattice.getNeighbors)
+            assert len(canvas) > n, name
+            for i, P in enumerate(canvas.Points):
+                assert canvas.getPointIndex(P) == i, name
+
+
+@pytest.mark.unit
+def test_functionality_NeighborIncidence():
+    canvas = Canvas(
+        Points=[np.zeros(3), np.ones(3), 2 * np.ones(3)],
+        NeighborhoodIndexes=[[1, None, 2], [None, 0], [1, 0, None]],
+    )
+    incidence = NeighborIncidence(canvas)
+    assert incidence.indptr.tolist() == [0, 2, 3, 5]
+    assert incidence.indices.tolist() == [1, 2, 0, 1, 0]
+    assert incidence.slots.tolist() == [0, 2, 1, 0, 1]
+    assert incidence.getRow(2) == (3, 5, [1, 0])
+    assert incidence.getCoefs(2) == [2] * 5
+    assert incidence.getCoefs([1.0, 2.0, 3.0]) == [1.0, 3.0, 2.0, 1.0, 2.0]
+
+
+def _linearTerms(con):
+    repn = generate_standard_repn(con.body, compute_values=False)
+    terms = {}
+    for v, coef in zip(repn.linear_vars, repn.linear_coefs):
+        terms[v.name] = terms.get(v.name, 0) + coef
+    return terms, repn.constant, con.lower, con.upper
+
+
+@pytest.mark.unit
+def test_functionality_MatOptModel_bulk_rules():
+    canvas = test_construct_Design().Canvas
+    atoms = list(test_construct_Atom())
+    N = len(canvas)
+    m = MatOptModel(canvas, atoms)
+    m.addSitesDescriptor(
+        "CNi",
+        rules=EqualTo(SumNeighborSites(m.Yi, coefs=list(range(12)), offset=1.0)),
+    )
+    m.addSitesDescriptor(
+        "CNBi",
+        rules=LessThan(
+            SumNeighborBonds(
+                m.Xij, symmetric_bonds=True, sites=list(range(N)), bonds=None
+            )
+        ),
+    )
+    m.addBondsDescriptor(
+        "Bij", rules=EqualTo(SiteCombination(0.5, m.CNi, bond_types=None))
+    )
+    bond_types = [(k, l) for k in atoms for l in atoms]
+    m.addBondsTypesDescriptor(
+        "Bijkl",
+        rules=GreaterThan(
+            SiteCombination(
+                Coef(
+                    {(k, l): 1.0 + (k == l) for k, l in bond_types},
+                    bond_types=bond_types,
+                ),
+                m.Yik,
+            )
+        ),
+    )
+    m.addGlobalDescriptor(
+        "E",
+        rules=EqualTo(
+            SumSitesAndTypes(
+                m.Yik, coefs=Coef({(i, k): i for i in range(N) for k in atoms})
+            )
+        ),
+    )
+    m.addGlobalDescriptor("Size", rules=EqualTo(SumSites(m.Yi, coefs=2)))
+    pm = m._make_pyomo_model(m.E, maximize)
+    assert set(m.build_timing) == {
+        "variables",
+        "CNi",
+        "CNBi",
+        "Bij",
+        "Bijkl",
+        "E",
+        "Size",
+        "objective",
+        "general variables",
+    }
+    # constraints generated in bulk match those generated one index at a time
+    for desc in m.descriptors[7:]:
+        bulk = pm.component("Assign{}_0".format(desc.name))
+        (con,) = desc.rules[0]._pyomo_cons(desc)
+        pm.add_component("Check{}".format(desc.name), con)
+        assert list(bulk.keys()) == list(con.keys())
+        for k in con:
+            assert any(type(e) is LinearExpression for e in bulk[k].expr.args)
+            assert _linearTerms(bulk[k]) == _linearTerms(con[k])
+    # symmetric bonds always have the lower site first
+    assert all(
+        v.index()[0] < v.index()[1]
+        for v in generate_standard_repn(pm.AssignCNBi_0[0].body).linear_vars
+        if v.parent_component() is pm.Xij
+    )
@@ -78,8 +78,17 @@ def convergence_sample(
     help="Addtional module that registers ConvergenceEvaluation classes")
 @click.option('--single-sample', default=None, type=str,
     help="Run only a single sample with given name")
+@click.option('-n', '--workers', default=None, type=int, required=False,
+    help="Run samples in a pool of this many processes (no MPI required)")
+@click.option('--results-file', default=None, type=str, required=False,
+    help="Append per-sample results to this file, and resume from it if it "
+         "exists (requires --workers)")
+@click.option('--warm-start/--no-warm-start', default=None,
+    help="Start each sample from the solution of the nearest solved sample "
+         "(default from the sample file)")
 def convergence_eval(
-    sample_file, dmf, report_file, json_file, convergence_module, single_sample):
+    sample_file, dmf, report_file, json_file, convergence_module, single_sample,
+    workers, results_file, warm_start):
     import idaes.models.convergence
     import idaes.models_extra.convergence
     if convergence_module is not None:
@@ -92,7 +101,10 @@ def convergence_eval(
             return -1
     if single_sample is None:
         (inputs, samples, results) = cnv.run_convergence_evaluation_from_sample_file(
-            sample_file=sample_file
+            sample_file=sample_file,
+            n_workers=workers,
+            results_file=results_file,
+            warm_start=warm_start,
         )
         if results is not None:
             cnv.save_convergence_statistics(
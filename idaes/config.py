@@ -354,6 +354,20 @@ def _new_idaes_config_block():
         ),
     )
 
+    cfg.declare(
+        "use_nlp_cache",
+        pyomo.common.config.ConfigValue(
+            default=False,
+            domain=bool,
+            description="If True, solvers from get_solver reuse compiled NL "
+                        "problems for blocks with unchanged structure.",
+            doc="If True, solvers created by get_solver solve blocks through "
+                "the IDAES NLP cache, which writes the NL file of a block once "
+                "and only updates variable values and bounds on later solves "
+                "while the block structure is unchanged.",
+        ),
+    )
+
     cfg.declare(
         "valid_logger_tags",
         pyomo.common.config.ConfigValue(
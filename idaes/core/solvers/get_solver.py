@@ -43,4 +43,7 @@ def get_solver(solver=None, options=None):
     if options is not None:
         solver_obj.options.update(options)
 
+    if idaes.cfg.use_nlp_cache:
+        solver_obj = idaes.core.solvers.CachedNLPSolver(solver_obj)
+
     return solver_obj
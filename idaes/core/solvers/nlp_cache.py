@@ -0,0 +1,481 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Structure-keyed cache of compiled NL problems for repeated solves.
+
+Initialization routines solve the same blocks many times, for example when a
+flowsheet is re-initialized at every point of a parameter sweep, and each
+solve through an ASL solver (e.g. Ipopt) writes a new NL file. The NLPCache
+keeps the NL representation of each block it has solved and, while the
+structure of the block is unchanged, only rewrites the variable values and
+bounds before the next solve.
+
+Fixed variables are written as variables with equal bounds, which ASL
+solvers treat as fixed, so that fixing and unfixing variables does not
+change the structure. The cached problem of a block is recompiled when its
+active constraints or objectives, their expressions, or the values of the
+mutable parameters (or fixed variables in constraint bounds) they contain
+change, or when the contents of the export suffixes in the block change.
+Changes inside named Expressions are not detected; call ``NLPCache.clear``
+after making them.
+
+Only the initial value (``x``) and variable bound (``b``) segments of the NL
+text are rewritten, in the same format the NL writer uses. The positions of
+these segments are checked against the problem size in the NL header when a
+block is compiled, and an error is raised if the writer's layout is not the
+one expected.
+"""
+
+from collections import OrderedDict
+import io
+import os
+import re
+import time
+import weakref
+
+from pyomo.common.collections import ComponentSet
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.core.expr.visitor import identify_variables, identify_mutable_parameters
+from pyomo.environ import Block, Constraint, Objective, Suffix, value
+from pyomo.opt import ProblemFormat
+from pyomo.repn.plugins.nl_writer import NLWriter
+
+import idaes
+import idaes.logger as idaeslog
+
+_log = idaeslog.getLogger(__name__)
+
+_x_segment = re.compile(r"x(\d+)$")
+
+
+class _CompiledNLP(object):
+    """
+    The NL text of a block with the variable values and bounds segments cut
+    out, and the data needed to check that it is still valid.
+    """
+
+    def __init__(self, blk, constraints, objectives, values, suffixes, info, nl_text):
+        # The cache does not keep the block alive
+        self.block = weakref.ref(blk)
+        # (component, expression) pairs, compared by identity
+        self.constraints = constraints
+        self.objectives = objectives
+        # (component, value) pairs of mutable parameters and bound variables
+        self.values = values
+        # (suffix, [(component, value), ...]) for the export suffixes
+        self.suffixes = suffixes
+        # Variables in NL column order and constraints in NL row order
+        self.variables = [v[0] for v in info.variables]
+        self.rows = [c[0] for c in info.constraints]
+        self.write_time = 0.0
+
+        lines = nl_text.split("\n")
+        n_vars = len(self.variables)
+        n_cons = len(self.rows)
+        try:
+            header = [int(n) for n in lines[1].split("#")[0].split()[:2]]
+        except (IndexError, ValueError):
+            header = None
+        if not lines[0].startswith("g") or header != [n_vars, n_cons]:
+            _nl_layout_error(blk, "the header does not match the problem size")
+        # The header is always 10 lines, the x segment is the first one with
+        # values that change and is followed by the r and b segments
+        x_pos = next(
+            (i for i in range(10, len(lines)) if _x_segment.match(lines[i])),
+            None,
+        )
+        if x_pos is None:
+            _nl_layout_error(blk, "no initial value (x) segment")
+        r_pos = x_pos + 1 + int(lines[x_pos][1:])
+        b_pos = r_pos + 1 + n_cons
+        b_end = b_pos + 1 + n_vars
+        if (
+            r_pos >= len(lines)
+            or lines[r_pos] != "r"
+            or b_pos >= len(lines)
+            or lines[b_pos] != "b"
+            or (
+                n_vars > 0
+                and (b_end >= len(lines) or not lines[b_end].startswith("k"))
+            )
+        ):
+            _nl_layout_error(blk, "the r, b and k segments are not in order")
+        self._head = lines[:x_pos]
+        self._middle = lines[r_pos:b_pos]
+        self._tail = lines[b_end:]
+
+    def is_valid(self, blk, constraints, objectives):
+        return (
+            self.block() is blk
+            and _same_expressions(constraints, self.constraints)
+            and _same_expressions(objectives, self.objectives)
+            and all(value(c) == v for c, v in self.values)
+            and _same_suffixes(_export_suffixes(blk), self.suffixes)
+        )
+
+    def nl_text(self):
+        """
+        Return the NL text with the current variable values and bounds.
+        The values and bounds are formatted the same way as by the NL writer.
+        """
+        x_lines = []
+        b_lines = []
+        for i, v in enumerate(self.variables):
+            val = v.value
+            if val is not None:
+                x_lines.append(f"{i} {val!r}")
+            if v.fixed and val is not None:
+                b_lines.append(f"4 {val!r}")
+                continue
+            lb, ub = v.bounds
+            if lb is not None and ub is not None:
+                if lb == ub:
+                    b_lines.append(f"4 {lb!r}")
+                else:
+                    b_lines.append(f"0 {lb!r} {ub!r}")
+            elif ub is not None:
+                b_lines.append(f"1 {ub!r}")
+            elif lb is not None:
+                b_lines.append(f"2 {lb!r}")
+            else:
+                b_lines.append("3")
+
+        return "\n".join(
+            self._head
+            + [f"x{len(x_lines)}"]
+            + x_lines
+            + self._middle
+            + ["b"]
+            + b_lines
+            + self._tail
+        )
+
+
+def _nl_layout_error(blk, reason):
+    raise RuntimeError(
+        f"Unexpected layout of the NL file written for {blk.name}: {reason}. "
+        "The NLP cache cannot be used with this version of the NL writer, "
+        "disable it with use_nlp_cache(False)."
+    )
+
+
+def _same_expressions(current, cached):
+    return len(current) == len(cached) and all(
+        c is cc and c.expr is ce for c, (cc, ce) in zip(current, cached)
+    )
+
+
+def _export_suffixes(blk):
+    return [
+        (s, list(s.items()))
+        for s in blk.component_objects(Suffix, active=True, descend_into=True)
+        if s.export_enabled()
+    ]
+
+
+def _same_suffixes(current, cached):
+    return len(current) == len(cached) and all(
+        s is cs
+        and len(items) == len(citems)
+        and all(k is ck and v == cv for (k, v), (ck, cv) in zip(items, citems))
+        for (s, items), (cs, citems) in zip(current, cached)
+    )
+
+
+def _active_components(blk):
+    constraints = list(
+        blk.component_data_objects(Constraint, active=True, descend_into=True)
+    )
+    objectives = list(
+        blk.component_data_objects(Objective, active=True, descend_into=True)
+    )
+    return constraints, objectives
+
+
+class NLPCache(object):
+    """
+    Cache of compiled NL problems, keyed by block. Solving a block through
+    the cache writes its NL file once and, for as long as the structure of
+    the block is unchanged, reuses it with the current variable values and
+    bounds. The hits, misses and time spent writing NL files are counted to
+    show how much writing time the cache saves.
+
+    Args:
+        max_size: maximum number of blocks to keep compiled problems for;
+            the least recently used is discarded first (default = 32)
+    """
+
+    def __init__(self, max_size=32):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.reset_statistics()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Discard all compiled problems. Statistics are kept.
+        """
+        self._entries.clear()
+
+    def reset_statistics(self):
+        """
+        Reset the hit and miss counters and timings.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.write_time = 0.0
+        self.update_time = 0.0
+        self.time_saved = 0.0
+
+    @property
+    def statistics(self):
+        """
+        Dict with the number of hits and misses, the total time spent
+        writing NL files on misses and updating them on hits, and the
+        estimated writing time saved by the hits.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "write_time": self.write_time,
+            "update_time": self.update_time,
+            "time_saved": self.time_saved,
+        }
+
+    def report(self, ostream=None):
+        """
+        Print the cache statistics.
+        """
+        lines = [
+            f"NLP cache hits: {self.hits}, misses: {self.misses}",
+            f"  NL write time: {self.write_time:.3f} s",
+            f"  NL update time: {self.update_time:.3f} s",
+            f"  Estimated write time saved: {self.time_saved:.3f} s",
+        ]
+        if ostream is None:
+            print("\n".join(lines))
+        else:
+            ostream.write("\n".join(lines) + "\n")
+
+    def compile(self, blk):
+        """
+        Return the compiled problem for a block and its NL text, reusing the
+        cached problem if the block structure is unchanged.
+
+        Args:
+            blk: Pyomo block to compile
+
+        Returns:
+            tuple of the compiled problem, whose ``variables`` are the
+            variables in NL column order, and the NL text with the current
+            variable values and bounds
+        """
+        start = time.perf_counter()
+        constraints, objectives = _active_components(blk)
+
+        entry = self._entries.get(id(blk))
+        if entry is not None and entry.is_valid(blk, constraints, objectives):
+            nl_text = entry.nl_text()
+            self._entries.move_to_end(id(blk))
+            self.hits += 1
+            elapsed = time.perf_counter() - start
+            self.update_time += elapsed
+            self.time_saved += max(entry.write_time - elapsed, 0.0)
+            return entry, nl_text
+
+        entry = self._compile(blk, constraints, objectives)
+        nl_text = entry.nl_text()
+        entry.write_time = time.perf_counter() - start
+        self.misses += 1
+        self.write_time += entry.write_time
+        self._entries[id(blk)] = entry
+        self._entries.move_to_end(id(blk))
+        # Drop the entry when the block is deleted
+        entry.block = weakref.ref(blk, self._entry_finalizer(id(blk)))
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        _log.debug(
+            f"Compiled NL problem for {blk.name} in {entry.write_time:.3f} s"
+        )
+        return entry, nl_text
+
+    def _entry_finalizer(self, key):
+        def _drop(ref):
+            entry = self._entries.get(key)
+            if entry is not None and entry.block is ref:
+                del self._entries[key]
+
+        return _drop
+
+    @staticmethod
+    def _compile(blk, constraints, objectives):
+        # Variables in the constraint and objective expressions are unfixed
+        # while writing so they stay in the NL file; anything in constraint
+        # bounds is folded into constants by the writer, so it is recorded
+        # and compared before reusing the compiled problem.
+        body_vars = ComponentSet()
+        bound_exprs = []
+        value_exprs = []
+        for c in constraints:
+            body_vars.update(identify_variables(c.body, include_fixed=True))
+            value_exprs.append(c.body)
+            bound_exprs.extend(b for b in (c.lower, c.upper) if b is not None)
+        for o in objectives:
+            body_vars.update(identify_variables(o.expr, include_fixed=True))
+            value_exprs.append(o.expr)
+
+        values = ComponentSet()
+        for e in value_exprs + bound_exprs:
+            values.update(identify_mutable_parameters(e))
+        for e in bound_exprs:
+            values.update(identify_variables(e, include_fixed=True))
+
+        fixed = [v for v in body_vars if v.fixed]
+        for v in fixed:
+            v.unfix()
+        try:
+            ostream = io.StringIO()
+            info = NLWriter().write(blk, ostream)
+        finally:
+            for v in fixed:
+                v.fix()
+
+        return _CompiledNLP(
+            blk,
+            [(c, c.expr) for c in constraints],
+            [(o, o.expr) for o in objectives],
+            [(c, value(c)) for c in values],
+            _export_suffixes(blk),
+            info,
+            ostream.getvalue(),
+        )
+
+    def solve(self, solver, blk, tee=False):
+        """
+        Solve a block with an ASL solver object using the compiled problem
+        from the cache, and load the solution (and duals, if the block has an
+        importing ``dual`` Suffix) into the model.
+
+        Args:
+            solver: Pyomo solver object that reads NL files, e.g. from
+                get_solver
+            blk: Pyomo block to solve
+            tee: show solver output (default = False)
+
+        Returns:
+            Pyomo SolverResults
+        """
+        entry, nl_text = self.compile(blk)
+
+        dual = blk.component("dual")
+        if not (isinstance(dual, Suffix) and dual.import_enabled()):
+            dual = None
+
+        with TempfileManager.new_context() as tempfile:
+            dirname = tempfile.mkdtemp()
+            nl_file = os.path.join(dirname, "nlp_cache.nl")
+            with open(nl_file, "w") as f:
+                f.write(nl_text)
+            kwds = {"suffixes": ["dual"]} if dual is not None else {}
+            results = solver.solve(nl_file, tee=tee, **kwds)
+
+        if len(results.solution) > 0:
+            soln = results.solution(0)
+            for i, v in enumerate(entry.variables):
+                data = soln.variable.get(f"v{i}")
+                if data is not None and not v.fixed:
+                    v.set_value(data["Value"], skip_validation=True)
+            if dual is not None:
+                # Duals are in NL row order, nonlinear constraints first
+                for i, c in enumerate(entry.rows):
+                    data = soln.constraint.get(f"c{i}")
+                    if data is not None and "Dual" in data:
+                        dual[c] = data["Dual"]
+            results.solution.clear()
+        return results
+
+
+class CachedNLPSolver(object):
+    """
+    Wrapper around a solver object whose ``solve`` method goes through an
+    NLPCache. Solves the cache cannot handle (solvers that do not read NL
+    files, or extra solve arguments other than ``tee``) are passed to the
+    wrapped solver unchanged. All other attributes, such as ``options``, are
+    those of the wrapped solver.
+
+    Args:
+        solver: Pyomo solver object to wrap
+        cache: NLPCache to use (default = None, use the global cache from
+            get_nlp_cache)
+    """
+
+    def __init__(self, solver, cache=None):
+        object.__setattr__(self, "_solver", solver)
+        object.__setattr__(self, "_cache", cache)
+
+    @property
+    def cache(self):
+        return self._cache if self._cache is not None else get_nlp_cache()
+
+    def __getattr__(self, name):
+        return getattr(self._solver, name)
+
+    def __setattr__(self, name, val):
+        setattr(self._solver, name, val)
+
+    def solve(self, *args, **kwds):
+        tee = kwds.pop("tee", False)
+        if (
+            len(args) == 1
+            and not kwds
+            and isinstance(args[0], Block)
+            and ProblemFormat.nl
+            in getattr(self._solver, "_valid_problem_formats", ())
+            and self._solver.available(exception_flag=False)
+        ):
+            return self.cache.solve(self._solver, args[0], tee=tee)
+        return self._solver.solve(*args, tee=tee, **kwds)
+
+
+_nlp_cache = NLPCache()
+
+
+def get_nlp_cache():
+    """
+    Return the global NLPCache used by solvers from get_solver when the NLP
+    cache is enabled.
+    """
+    return _nlp_cache
+
+
+def use_nlp_cache(b=True):
+    """
+    This function enables (or disables if given False as the argument) the
+    NLP cache for solvers created by get_solver. When enabled, solving the
+    same block structure repeatedly, e.g. re-initializing a flowsheet in a
+    parameter sweep, reuses the NL problem written for the first solve.
+
+    Args:
+        b: True to solve through the NLP cache, False to solve normally.
+           Default is True.
+
+    Returns:
+        None
+    """
+    idaes.cfg.use_nlp_cache = b
+    if not b:
+        _nlp_cache.clear()
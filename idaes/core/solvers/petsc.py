@@ -18,12 +18,15 @@ import enum
 import copy
 import json
 import gzip
+from collections.abc import MutableMapping
+from time import perf_counter
 import numpy as np
 
 import idaes
 import pyomo.environ as pyo
 from pyomo.common.collections import ComponentSet, ComponentMap
 from pyomo.core.expr.visitor import identify_variables
+from pyomo.core.expr.numvalue import native_types
 import pyomo.dae as pyodae
 from pyomo.common import Executable
 from pyomo.dae.flatten import flatten_dae_components
@@ -41,6 +44,8 @@ import idaes.logger as idaeslog
 from idaes.core.solvers import get_solver
 import idaes.config as icfg
 
+_log = idaeslog.getLogger(__name__)
+
 PetscBinaryIOTrajectory = None
 PetscBinaryIO = None
 
@@ -141,6 +146,19 @@ class PetscTS(Petsc):
                 kwds["options"] = default_options
         super().__init__(**kwds)
         self.options.solver = "petsc_ts"
+        # seconds spent in each phase of the last solve
+        self.timing = {}
+
+    def _presolve(self, *args, **kwds):
+        start = perf_counter()
+        super()._presolve(*args, **kwds)
+        self.timing["write"] = perf_counter() - start
+
+    def _apply_solver(self):
+        start = perf_counter()
+        res = super()._apply_solver()
+        self.timing["integrate"] = perf_counter() - start
+        return res
 
     def _postsolve(self):
         stub = os.path.splitext(self._soln_file)[0]
@@ -211,9 +229,29 @@ def _copy_time(time_vars, t_from, t_to):
     Returns:
         None
     """
-    for v in time_vars:
-        if not v[t_to].fixed:
-            v[t_to].value = v[t_from].value
+    _copy_values(
+        [v[t_from] for v in time_vars],
+        [v[t_to] for v in time_vars],
+    )
+
+
+def _copy_values(vars_from, vars_to):
+    """PRIVATE FUNCTION:
+
+    Copy the values of a list of variables to the unfixed variables in the
+    same positions of another list.
+
+    Args:
+        vars_from (list): variable data objects to copy from
+        vars_to (list): variable data objects to copy to, only unfixed vars
+            will be overwritten
+
+    Returns:
+        None
+    """
+    for vf, vt in zip(vars_from, vars_to):
+        if not vt.fixed:
+            vt.value = vf.value
 
 
 def find_discretization_equations(m, time):
@@ -337,25 +375,168 @@ def _get_derivative_differential_data_map(m, time):
     return ComponentMap(filtered_deriv_diff_list)
 
 
+def _scaling_factor(m, c):
+    """Get the scaling factor of a variable or constraint from the full model,
+    or None if it has none.  This assumes the scaling suffixes could be in two
+    places.  First check the parent block of the component (typical place for
+    idaes models) then check the top-level model.  The top level model will
+    take precedence.
+    """
+    sf = None
+    if hasattr(c.parent_block(), "scaling_factor"):
+        sf = c.parent_block().scaling_factor.get(c, sf)
+    if hasattr(m, "scaling_factor"):
+        sf = m.scaling_factor.get(c, sf)
+    return sf
+
+
 def _sub_problem_scaling_suffix(m, t_block):
-    """Copy scaling factors from the full model to the submodel.  This assumes
-    the scaling suffixes could be in two places.  First check the parent block
-    of the component (typical place for idaes models) then check the top-level
-    model.  The top level model will take precedence.
+    """Copy scaling factors from the full model to the submodel.  See
+    ``_scaling_factor`` for where the scaling factors are looked up.
     """
     if not hasattr(t_block, "scaling_factor"):
         # if the subsystem block doesn't already have a scaling suffix, make one
         t_block.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
-    # first check the parent block for scaling factors
     for c in t_block.component_data_objects((pyo.Var, pyo.Constraint)):
-        if hasattr(c.parent_block(), "scaling_factor"):
-            if c in c.parent_block().scaling_factor:
-                t_block.scaling_factor[c] = c.parent_block().scaling_factor[c]
-    # now check the top level model
-    if hasattr(m, "scaling_factor"):
-        for c in t_block.component_data_objects((pyo.Var, pyo.Constraint)):
-            if c in m.scaling_factor:
-                t_block.scaling_factor[c] = m.scaling_factor[c]
+        sf = _scaling_factor(m, c)
+        if sf is not None:
+            t_block.scaling_factor[c] = sf
+
+
+def _constant_leaves(expr):
+    """PRIVATE FUNCTION:
+
+    Get a tuple of the values of the leaves of an expression that are not
+    variables, i.e. numeric constants and parameters, in a fixed order.
+    """
+    leaves = []
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if type(node) in native_types:
+            leaves.append(node)
+        elif node.is_expression_type():
+            stack.extend(reversed(node.args))
+        elif not node.is_variable_type():
+            leaves.append(pyo.value(node))
+    return tuple(leaves)
+
+
+def _sub_problem_signature(m, t, time_cons, variables, deriv_diff_map):
+    """PRIVATE FUNCTION:
+
+    Get a tuple that identifies the time step sub-problem at time t. Two time
+    points with the same signature have the same active constraints, fixed
+    variables, derivative/differential variable pairs and scaling factors in
+    the same positions, and the same constants and parameter values in their
+    constraints, so a sub-problem built for one time point gives the right
+    equations for the other once the variable values are copied in.
+    """
+    constraints = [con[t] for con in time_cons if t in con]
+    return (
+        tuple(t in con and con[t].active for con in time_cons),
+        tuple(_constant_leaves(c.expr) for c in constraints if c.active),
+        tuple(v.fixed for v in variables),
+        tuple(v in deriv_diff_map for v in variables),
+        tuple(_scaling_factor(m, c) for c in constraints),
+        tuple(_scaling_factor(m, v) for v in variables),
+    )
+
+
+class _DAESubProblem(object):
+    """PRIVATE CLASS:
+
+    Sub-problem integrated by ``petsc_dae_by_time_element`` from the previous
+    time point to time t. If ``reuse_sub_problem`` is True, the sub-problem for
+    the first step is used as a template for the following steps with the
+    same signature. Their variable values are copied into the template before
+    integrating and the results are copied back after, so the sub-problem
+    block, suffixes and scaling factors are only set up once. The solver still
+    writes an NL file for every step.
+    """
+
+    def __init__(self, m, t, time_cons, time_vars, deriv_diff_map, timevar=None):
+        self.t = t
+        constraints = [con[t] for con in time_cons if t in con]
+        self.variables = [var[t] for var in time_vars]
+        # Create a temporary block with references to original constraints
+        # and variables so we can integrate this "subsystem" without
+        # altering the rest of the model.
+        self.block = create_subsystem_block(constraints, self.variables)
+        self.differential_vars = _set_dae_suffixes_from_variables(
+            self.block,
+            self.variables,
+            deriv_diff_map,
+        )
+        # We need to check if there are derivatives in the problem before
+        # sending this to the solver.  We'll assume that if you are using
+        # this and don't have any differential equations, you are making a
+        # mistake.
+        if len(self.differential_vars) < 1:
+            raise RuntimeError(
+                f"No differential equations found at t = {t}, not a DAE")
+        if timevar is not None:
+            self.block.dae_suffix[timevar[t]] = int(DaeVarTypes.TIME)
+        # Set up the scaling factor suffix
+        _sub_problem_scaling_suffix(m, self.block)
+        self.signature = _sub_problem_signature(
+            m, t, time_cons, self.variables, deriv_diff_map)
+        self._names = None
+        self._saved_values = None
+
+    def references_other_times(self, regular_vars):
+        """Return True if the constraints contain variables other than the
+        time-indexed variables at this time point and the non-time-indexed
+        variables, in which case values can't be mapped to another time point
+        by copying them into this sub-problem.
+
+        Args:
+            regular_vars (list): non-time-indexed variables of the model
+        """
+        known = ComponentSet(self.variables)
+        known.update(regular_vars)
+        # inactive constraints, like the discretization equations, aren't
+        # sent to the solver
+        for con in self.block.cons.values():
+            if not con.active:
+                continue
+            for v in identify_variables(con.body, include_fixed=True):
+                if v not in known:
+                    return True
+        return False
+
+    def load_values(self, variables):
+        """Copy the values of the variables at another time point into the
+        sub-problem. The sub-problem's own values are saved to be put back by
+        ``restore_values``.
+        """
+        self._saved_values = [v.value for v in self.variables]
+        for tv, v in zip(self.variables, variables):
+            tv.value = v.value
+
+    def store_values(self, variables):
+        """Copy the sub-problem values to unfixed variables at another time
+        point."""
+        for tv, v in zip(self.variables, variables):
+            if not v.fixed:
+                v.value = tv.value
+
+    def restore_values(self):
+        """Put back the sub-problem's own values saved by ``load_values``"""
+        if self._saved_values is None:
+            return
+        for tv, val in zip(self.variables, self._saved_values):
+            tv.value = val
+        self._saved_values = None
+
+    def name_map(self, variables):
+        """Map sub-problem variable names to the names of the variables at
+        another time point, to relabel the trajectory of a reused sub-problem.
+        """
+        if self._names is None:
+            self._names = [str(v) for v in self.variables]
+        return {k: str(v) for k, v in zip(self._names, variables)}
+
 
 class PetscDAEResults(object):
     """This class stores the results of ``petsc_dae_by_time_element()`` it has
@@ -365,11 +546,16 @@ class PetscDAEResults(object):
     more steps, the results of multiple solves are returned.  The trajectory is
     a ``PetscTrajectory`` object which gives the full trajectory of the solution
     for all time steps taken by the PETSc solver. This is generally finer than
-    the Pyomo.DAE discretization.
+    the Pyomo.DAE discretization. The ``timing`` attribute is a dictionary of
+    the total seconds spent over all the time steps in each phase: "build"
+    (setting up the sub-problems), "write" (writing the NL files),
+    "integrate" (running the solver) and "read" (reading the solutions and
+    trajectories back into the model).
     """
-    def __init__(self, results=None, trajectory=None):
+    def __init__(self, results=None, trajectory=None, timing=None):
         self.results = results
         self.trajectory = trajectory
+        self.timing = timing
 
 def petsc_dae_by_time_element(
     m,
@@ -386,6 +572,7 @@ def petsc_dae_by_time_element(
     between=None,
     interpolate=True,
     calculate_derivatives=True,
+    reuse_sub_problem=False,
 ):
     """Solve a DAE problem step by step using the PETSc DAE solver.  This
     integrates from one time point to the next.
@@ -430,6 +617,15 @@ def petsc_dae_by_time_element(
         calculate_derivatives: (bool) if True, calculate the derivative values
             based on the values of the differential variables in the discretized
             Pyomo model.
+        reuse_sub_problem: (bool) if True, set up the sub-problem for the first
+            time step once and reuse it for every following step with the same
+            structure (active constraints, fixed variables and scaling
+            factors) and the same constants and parameter values in the
+            constraints, copying the variable values in and out of it. Steps
+            that differ get their own sub-problem. This is ignored if the
+            constraints at a time point contain variables at other time
+            points. Only the Python-side setup of the sub-problem is reused,
+            the NL file is still written for every step.
 
     Returns (PetscDAEResults):
         See PetscDAEResults documentation for more informations.
@@ -512,83 +708,110 @@ def petsc_dae_by_time_element(
         # Solver time steps
         deriv_diff_map = _get_derivative_differential_data_map(m, time)
         tj = None # trajectory data
-        for t in between:
-            if t == between.first():
-                # t == between.first() was handled above
-                continue
-            constraints = [con[t] for con in time_cons if t in con]
-            variables = [var[t] for var in time_vars]
-            # Create a temporary block with references to original constraints
-            # and variables so we can integrate this "subsystem" without
-            # altering the rest of the model.
-            t_block = create_subsystem_block(constraints, variables)
-            differential_vars = _set_dae_suffixes_from_variables(
-                t_block,
-                variables,
-                deriv_diff_map,
-            )
-            # We need to check if there are derivatives in the problem before
-            # sending this to the solver.  We'll assume that if you are using
-            # this and don't have any differential equations, you are making a
-            # mistake.
-            if len(differential_vars) < 1:
-                raise RuntimeError(
-                    f"No differential equations found at t = {t}, not a DAE")
-            if timevar is not None:
-                t_block.dae_suffix[timevar[t]] = int(DaeVarTypes.TIME)
-            # Set up the scaling factor suffix
-            _sub_problem_scaling_suffix(m, t_block)
-            # Take initial conditions for this step from the result of previous
-            _copy_time(time_vars, tprev, t)
-            with idaeslog.solver_log(solve_log, idaeslog.INFO) as slc:
-                res = solver_dae.solve(
-                    t_block,
-                    tee=slc.tee,
-                    keepfiles=keepfiles,
-                    symbolic_solver_labels=symbolic_solver_labels,
-                    export_nonlinear_variables=differential_vars,
-                    options={"--ts_init_time": tprev, "--ts_max_time": t},
-                )
-            if save_trajectory:
-                tj_prev = tj
-                tj = PetscTrajectory(
-                    stub="tmp_vars_stub",
-                    delete_on_read=True,
-                    unscale=True,
-                    model=t_block,
-                )
-                # add fixed vars to the trajectory. this does two things 1)
-                # helps users looking for fixed var trajectory and 2) lets
-                # us concatenate trajectories with section that are mixed fixed
-                # and unfixed
-                for i, v in enumerate(variables):
-                    if isinstance(v.parent_component(), pyodae.DerivativeVar):
-                        continue # skip derivative vars
-                    try:
-                        vec = tj.get_vec(v)
-                    except KeyError:
-                        tj._set_vec(v,[pyo.value(v)]*len(tj.time))
-                if tj_prev is not None:
-                    # due to the way variables is generated we know variables
-                    # have corresponding positions in the list
-                    no_repeat = set()
+        template = None # sub-problem reused for steps with the same structure
+        variables_tprev = [var[tprev] for var in time_vars]
+        timing = {"build": 0.0, "write": 0.0, "integrate": 0.0, "read": 0.0}
+        try:
+            for t in between:
+                if t == between.first():
+                    # t == between.first() was handled above
+                    continue
+                start = perf_counter()
+                variables = [var[t] for var in time_vars]
+                sub_problem = None
+                if template is not None and template.signature == (
+                    _sub_problem_signature(
+                        m, t, time_cons, variables, deriv_diff_map)
+                ):
+                    sub_problem = template
+                else:
+                    sub_problem = _DAESubProblem(
+                        m, t, time_cons, time_vars, deriv_diff_map, timevar)
+                    if reuse_sub_problem and template is None:
+                        if sub_problem.references_other_times(regular_vars):
+                            _log.warning(
+                                "Constraints contain variables at other time "
+                                "points, sub-problems will not be reused")
+                            reuse_sub_problem = False
+                        else:
+                            template = sub_problem
+                # Take initial conditions for this step from the result of previous
+                _copy_values(variables_tprev, variables)
+                if sub_problem.t != t:
+                    sub_problem.load_values(variables)
+                t_block = sub_problem.block
+                timing["build"] += perf_counter() - start
+                start = perf_counter()
+                with idaeslog.solver_log(solve_log, idaeslog.INFO) as slc:
+                    res = solver_dae.solve(
+                        t_block,
+                        tee=slc.tee,
+                        keepfiles=keepfiles,
+                        symbolic_solver_labels=symbolic_solver_labels,
+                        export_nonlinear_variables=sub_problem.differential_vars,
+                        options={"--ts_init_time": tprev, "--ts_max_time": t},
+                    )
+                solve_time = perf_counter() - start
+                start = perf_counter()
+                if sub_problem.t != t:
+                    sub_problem.store_values(variables)
+                    sub_problem.restore_values()
+                if save_trajectory:
+                    tj_prev = tj
+                    tj = PetscTrajectory(
+                        stub="tmp_vars_stub",
+                        delete_on_read=True,
+                        unscale=True,
+                        model=t_block,
+                    )
+                    if sub_problem.t != t:
+                        # label the trajectory with the variables at t
+                        tj._rename_columns(sub_problem.name_map(variables))
+                    fixed_vars = []
                     for i, v in enumerate(variables):
-                        vp = variables_prev[i]
-                        if id(v) in no_repeat:
-                            continue # variables can be repeated in list
                         if isinstance(v.parent_component(), pyodae.DerivativeVar):
                             continue # skip derivative vars
-                        no_repeat.add(id(v))
-                        # We'll add fixed vars in case they aren't fixed in
-                        # another section. Fixed vars don't go to the solver
-                        # so they don't show up in the trajectory data
-                        vec = tj.get_vec(v)
-                        vec_prev = tj_prev.get_vec(vp)
-                        tj._set_vec(v, vec_prev + vec)
-                    tj._set_time_vec(tj_prev.time + tj.time)
-                variables_prev = variables
-            tprev = t
-            res_list.append(res)
+                        try:
+                            vec = tj.get_vec(v)
+                        except KeyError:
+                            fixed_vars.append(v)
+                    tj._add_constant_vecs(
+                        fixed_vars, [pyo.value(v) for v in fixed_vars])
+                    if tj_prev is not None:
+                        # due to the way variables is generated we know variables
+                        # have corresponding positions in the list
+                        no_repeat = set()
+                        var_pairs = []
+                        for i, v in enumerate(variables):
+                            vp = variables_prev[i]
+                            if id(v) in no_repeat:
+                                continue # variables can be repeated in list
+                            if isinstance(v.parent_component(), pyodae.DerivativeVar):
+                                continue # skip derivative vars
+                            no_repeat.add(id(v))
+                            # We'll add fixed vars in case they aren't fixed in
+                            # another section. Fixed vars don't go to the solver
+                            # so they don't show up in the trajectory data
+                            var_pairs.append((v, vp))
+                        tj._prepend(tj_prev, var_pairs)
+                    variables_prev = variables
+                read_time = perf_counter() - start
+                write_time = solver_dae.timing.get("write", 0.0)
+                integrate_time = solver_dae.timing.get("integrate", 0.0)
+                timing["write"] += write_time
+                timing["integrate"] += integrate_time
+                # reading the solution back is part of the solve call
+                timing["read"] += max(
+                    solve_time - write_time - integrate_time, 0.0) + read_time
+                tprev = t
+                variables_tprev = variables
+                res_list.append(res)
+        finally:
+            if template is not None:
+                template.restore_values()
+        _log.debug(
+            "PETSc DAE step timing [s]: "
+            + ", ".join(f"{k}: {v:.3f}" for k, v in timing.items()))
         # If the interpolation option is True and the trajectory is available
         # interpolate the values any skipped time points from the trajectory
         if interpolate and tj is not None:
@@ -600,13 +823,18 @@ def petsc_dae_by_time_element(
                 for t in itime:
                     timevar[t] = t
                 no_repeat.add(id(timevar[tlast]))
+            interp_vars = []
             for var in time_vars:
                 if id(var[tlast]) in no_repeat:
                     continue
                 no_repeat.add(id(var[tlast]))
                 if isinstance(var[t0].parent_component(), pyodae.DerivativeVar):
                     continue # skip derivative vars
-                vec = tj.interpolate_vec(itime, var[tlast])
+                interp_vars.append(var)
+            # interpolate all the variables at once
+            vecs = tj.interpolate_vecs(itime, [var[tlast] for var in interp_vars])
+            for j, var in enumerate(interp_vars):
+                vec = vecs[:, j]
                 for i, (t, v) in enumerate(var.items()):
                     if t < t0 or t > tlast or t in between:
                         # Time is outside the range or already set
@@ -622,7 +850,7 @@ def petsc_dae_by_time_element(
             # equations to calculate the time derivative values
             calculate_time_derivatives(m, time)
         # return the solver results and trajectory if available
-    return PetscDAEResults(results=res_list, trajectory=tj)
+    return PetscDAEResults(results=res_list, trajectory=tj, timing=timing)
 
 def calculate_time_derivatives(m, time):
     """Calculate the derivative values from the discretization equations.
@@ -649,6 +877,29 @@ def calculate_time_derivatives(m, time):
                         pass # discretization equation may not exist at first time
 
 
+class _TrajectoryVecs(MutableMapping):
+    """Live mapping of column names to the columns of a ``PetscTrajectory``"""
+
+    def __init__(self, trajectory):
+        self._trajectory = trajectory
+
+    def __getitem__(self, key):
+        tj = self._trajectory
+        return tj._data[:, tj._columns[key]]
+
+    def __setitem__(self, key, vec):
+        self._trajectory._set_vec(key, vec)
+
+    def __delitem__(self, key):
+        raise TypeError("Columns cannot be removed from a PetscTrajectory")
+
+    def __iter__(self):
+        return iter(self._trajectory._columns)
+
+    def __len__(self):
+        return len(self._trajectory._columns)
+
+
 class PetscTrajectory(object):
     def __init__(
         self,
@@ -661,10 +912,16 @@ class PetscTrajectory(object):
         unscale=None,
         model=None,
         no_read=False,
+        npy=None,
+        mmap_mode=None,
     ):
         """Class to read PETSc TS solver trajectory data.  This can either read
         PETSc output by providing the ``stub`` argument, a trajectory dict by
-        providing ``vecs`` or a json file by providing ``json``.
+        providing ``vecs``, a json file by providing ``json`` or a binary file
+        written by ``to_npy`` by providing ``npy``.
+
+        The trajectory is stored as a single 2D array with a row for each time
+        point and a column for each variable (and one for time).
 
         Args:
             stub (str): file name stub for variable info
@@ -678,7 +935,14 @@ class PetscTrajectory(object):
                 False or None do not unscale.
             model (Block): if specified use for unscaling
             no_read (bool): if True make an uninitialized trajectory object
+            npy (str): path of a ``.npy`` file written by ``to_npy``
+            mmap_mode (str): memory-map mode passed to ``numpy.load`` when
+                reading ``npy``, e.g. "r" for read-only. If None, read the
+                whole file into memory.
         """
+        self.id_map = {}
+        self._columns = {}
+        self._data = np.empty((0, 0))
         if no_read:
             return
         if PetscBinaryIOTrajectory is None and stub is not None:
@@ -687,7 +951,6 @@ class PetscTrajectory(object):
         if model is not None and unscale is True:
             unscale = model
         self.model = model
-        self.id_map = {}
         if pth is not None:
             stub = os.path.join(pth, stub)
             vis_dir = os.path.join(pth, vis_dir)
@@ -702,12 +965,51 @@ class PetscTrajectory(object):
             if unscale is not None:
                 self._unscale(unscale)
         elif vecs is not None:
-            self.vecs = vecs
-            self.time = vecs["_time"]
+            self._set_vecs(vecs)
         elif json is not None:
             self.from_json(json)
+        elif npy is not None:
+            self.from_npy(npy, mmap_mode=mmap_mode)
         else:
-            raise RuntimeError("To read trajectory, provide stub, vecs, or json")
+            raise RuntimeError(
+                "To read trajectory, provide stub, vecs, json, or npy")
+
+    @property
+    def time(self):
+        """Vector of time points. This is a numpy array view of the trajectory
+        data, not a list, so ``+`` adds elementwise; use ``numpy.concatenate``
+        to join time vectors or ``time.tolist()`` to get a list.
+        """
+        return self._data[:, self._columns["_time"]]
+
+    @property
+    def vecs(self):
+        """Mapping of variable name keys and '_time' to vectors of values at
+        each time point. The vectors are numpy array views of the trajectory
+        data, looked up one column at a time. Assigning a vector to a key sets
+        (or adds) that column of the trajectory; columns cannot be deleted.
+        """
+        return _TrajectoryVecs(self)
+
+    @property
+    def names(self):
+        """List of column names in column order"""
+        return list(self._columns)
+
+    def _set_data(self, data, names):
+        if data.ndim != 2 or data.shape[1] != len(names):
+            raise ValueError(
+                f"Trajectory data with shape {data.shape} does not match "
+                f"{len(names)} column names")
+        self._data = data
+        self._columns = {k: j for j, k in enumerate(names)}
+
+    def _set_vecs(self, vecs):
+        names = list(vecs)
+        data = np.empty((len(vecs["_time"]), len(names)))
+        for j, k in enumerate(names):
+            data[:, j] = vecs[k]
+        self._set_data(data, names)
 
     def _read(self):
         with open(f"{self.stub}.col") as f:
@@ -716,48 +1018,103 @@ class PetscTrajectory(object):
             typ = list(map(int, f.readlines()))
         vars = [name for i, name in enumerate(names) if typ[i] in [0, 1]]
         (t, v, names) = PetscBinaryIOTrajectory.ReadTrajectory("Visualization-data")
-        self.time = t
         self.vecs_by_time = v
-        self.vecs = dict.fromkeys(vars, None)
-        for k in self.vecs.keys():
-            self.vecs[k] = [0] * len(self.time)
-        self.vecs["_time"] = list(self.time)
-        for i, v in enumerate(vars):
-            for j, vt in enumerate(self.vecs_by_time):
-                self.vecs[v][j] = vt[i]
-
-    def _set_vec(self, var, vec):
+        data = np.empty((len(t), len(vars) + 1))
+        if len(t):
+            data[:, : len(vars)] = np.asarray(v)[:, : len(vars)]
+        data[:, -1] = t
+        self._set_data(data, vars + ["_time"])
+
+    def _column(self, var):
+        # column names are used as is, only components are mapped by id
+        if isinstance(var, str):
+            return var
         try:
             var = self.id_map[id(var)]
         except KeyError:
             var_str = str(var)
             self.id_map[id(var)] = var_str
             var = var_str
-        self.vecs[var] = vec
+        return var
+
+    def _set_vec(self, var, vec):
+        var = self._column(var)
+        vec = np.asarray(vec, dtype=float)
+        if vec.shape != (self._data.shape[0],):
+            raise ValueError(
+                f"Vector for {var} has {vec.size} values, expected "
+                f"{self._data.shape[0]}")
+        j = self._columns.get(var)
+        if j is None:
+            self._columns[var] = self._data.shape[1]
+            self._data = np.column_stack((self._data, vec))
+        else:
+            self._data[:, j] = vec
+
+    def _add_constant_vecs(self, vars, values):
+        """Add columns with a constant value at every time point for variables
+        not in the trajectory, e.g. fixed variables which are not sent to the
+        solver.
+        """
+        new = {}
+        for var, value in zip(vars, values):
+            var = self._column(var)
+            if var not in self._columns:
+                new[var] = value
+        if not new:
+            return
+        n = self._data.shape[1]
+        for j, var in enumerate(new):
+            self._columns[var] = n + j
+        block = np.empty((self._data.shape[0], len(new)))
+        block[:] = np.array(list(new.values()), dtype=float)
+        self._data = np.hstack((self._data, block))
+
+    def _rename_columns(self, names):
+        """Rename columns using a dictionary of old name keys and new name
+        values. Columns not in the dictionary keep their names.
+        """
+        self._columns = {names.get(k, k): j for k, j in self._columns.items()}
+        self.id_map = {}
 
     def _set_time_vec(self, vec):
-        self.vecs["_time"] = vec
-        self.time = self.vecs["_time"]
+        self._set_vec("_time", vec)
+
+    def _prepend(self, tj_prev, var_pairs):
+        """Prepend an earlier trajectory segment to this one. Columns of this
+        trajectory with no counterpart in the previous segment are filled with
+        NaN over the previous segment's time points.
 
+        Args:
+            tj_prev (PetscTrajectory): trajectory of the previous segment
+            var_pairs (list): (var, var_prev) pairs of variables in this
+                trajectory and the corresponding variables in tj_prev
+
+        Returns:
+            None
+        """
+        cols = [self._columns["_time"]]
+        cols_prev = [tj_prev._columns["_time"]]
+        for var, var_prev in var_pairs:
+            cols.append(self._columns[self._column(var)])
+            cols_prev.append(tj_prev._columns[tj_prev._column(var_prev)])
+        n_prev = tj_prev._data.shape[0]
+        data = np.full((n_prev + self._data.shape[0], self._data.shape[1]), np.nan)
+        data[:n_prev, cols] = tj_prev._data[:, cols_prev]
+        data[n_prev:] = self._data
+        self._data = data
 
     def get_vec(self, var):
         """Return the vector of variable values at each time point for var.
 
         Args:
             var (str or Var): Variable to get vector for.
-            time (Set): Time index set
 
-        Retruns (list):
+        Returns (numpy.ndarray):
             vector of variable values at each time point
 
         """
-        try:
-            var = self.id_map[id(var)]
-        except KeyError:
-            var_str = str(var)
-            self.id_map[id(var)] = var_str
-            var = var_str
-        return self.vecs[var]
+        return self._data[:, self._columns[self._column(var)]]
 
     def get_dt(self):
         """Get a list of time steps
@@ -768,47 +1125,76 @@ class PetscTrajectory(object):
         Returns:
             (list)
         """
-        dt = [None] * (len(self.time) - 1)
-        for i in range(len(self.time) - 1):
-            dt[i] = self.time[i + 1] - self.time[i]
-        return dt
+        return np.diff(self.time).tolist()
+
+    def _interpolation_weights(self, times):
+        """Get the row indexes and weights to linearly interpolate the
+        trajectory at times. Like ``numpy.interp``, values outside the time
+        range are taken from the first or last time point.
+        """
+        t = self.time
+        times = np.array(list(times), dtype=float)
+        if len(t) < 2:
+            k = np.zeros(len(times), dtype=int)
+            return k, k, np.zeros(len(times))
+        k = np.clip(np.searchsorted(t, times, side="right") - 1, 0, len(t) - 2)
+        dt = t[k + 1] - t[k]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            w = np.where(dt > 0, (times - t[k]) / dt, 1.0)
+        return k, k + 1, np.clip(w, 0.0, 1.0)
+
+    def _interpolate_columns(self, times, cols):
+        lo, hi, w = self._interpolation_weights(times)
+        w = w[:, np.newaxis]
+        return self._data[lo][:, cols] * (1 - w) + self._data[hi][:, cols] * w
 
     def interpolate(self, times):
-        """Create a new vector dictionary interpolated at times. This method
-        will also extrapolate values outside the original time range, so care
-        should be taken not to specify times too far outside the range.
+        """Create a new trajectory interpolated at times. Values outside the
+        original time range are taken from the first or last time point.
 
         Args:
             times (list): list of times to interpolate. These must be in
                 increasing order.
 
-        Returns (dict):
-            Dictionary of vectors for values at interpolated points
+        Returns (PetscTrajectory):
+            Trajectory with values at interpolated points
         """
         tj = PetscTrajectory(no_read=True)
         tj.id_map = copy.copy(self.id_map)
-        tj.vecs = dict.fromkeys(self.vecs.keys(), None)
-        tj.vecs["_time"] = copy.copy(times)
-        tj.time = tj.vecs["_time"]
-        for var in self.vecs:
-            if var == "_time":
-                continue
-            tj.vecs[var] = np.interp(tj.time, self.time, self.vecs[var])
+        data = self._interpolate_columns(times, slice(None))
+        data[:, self._columns["_time"]] = list(times)
+        tj._set_data(data, self.names)
         return tj
 
     def interpolate_vec(self, times, var):
-        """Create a new vector dictionary interpolated at times. This method
-        will also extrapolate values outside the original time range, so care
-        should be taken not to specify times too far outside the range.
+        """Interpolate the values of a variable at times. Values outside the
+        original time range are taken from the first or last time point.
 
         Args:
             times (list): list of times to interpolate. These must be in
                 increasing order.
+            var (str or Var): Variable to interpolate
 
-        Returns (dict):
-            Dictionary of vectors for values at interpolated points
+        Returns (numpy.ndarray):
+            vector of values at interpolated points
         """
-        return np.interp(times, self.time, self.get_vec(var))
+        return self.interpolate_vecs(times, [var])[:, 0]
+
+    def interpolate_vecs(self, times, vars):
+        """Interpolate the values of several variables at times in one pass.
+        Values outside the original time range are taken from the first or
+        last time point.
+
+        Args:
+            times (list): list of times to interpolate. These must be in
+                increasing order.
+            vars (list): list of variables (str or Var) to interpolate
+
+        Returns (numpy.ndarray):
+            array with a row for each time and a column for each variable
+        """
+        cols = [self._columns[self._column(var)] for var in vars]
+        return self._interpolate_columns(times, cols)
 
     def _unscale(self, m):
         """If variable scale factors are used, the solver will see scaled
@@ -822,25 +1208,30 @@ class PetscTrajectory(object):
         Returns:
             None
         """
-        # Variables might show up more than once because of References
-        already_scaled = set()
-        for var in m.component_data_objects():
-            try:
-                vec = self.get_vec(var)
-            except KeyError:
-                continue
-            vid = id(var)
-            if vid in already_scaled:
+        # Only the variables in scaling factor suffixes need to be looked up.
+        # A suffix on the parent block of a variable is used unless the
+        # top-level block has a scaling factor for it.
+        factors = {}
+        for sfx in m.component_objects(pyo.Suffix, descend_into=True):
+            if sfx.local_name != "scaling_factor" or sfx is getattr(
+                m, "scaling_factor", None
+            ):
                 continue
-            s = None
-            if hasattr(var.parent_block(), "scaling_factor"):
-                s = var.parent_block().scaling_factor.get(var, s)
-            if hasattr(m, "scaling_factor"):
-                s = m.scaling_factor.get(var, s)
-            if s is not None:
-                for i, x in enumerate(vec):
-                    vec[i] = x / s
-            already_scaled.add(vid)
+            blk = sfx.parent_block()
+            for c, sf in sfx.items():
+                if c.parent_block() is blk:
+                    factors[id(c)] = (c, sf)
+        if hasattr(m, "scaling_factor"):
+            for c, sf in m.scaling_factor.items():
+                factors[id(c)] = (c, sf)
+        # a variable seen more than once through References sets the same
+        # column, so it isn't unscaled twice
+        scale = np.ones(self._data.shape[1])
+        for c, sf in factors.values():
+            j = self._columns.get(str(c))
+            if j is not None and sf is not None:
+                scale[j] = sf
+        self._data /= scale
 
     def delete_files(self):
         """Delete the trajectory data and variable information files.
@@ -865,26 +1256,67 @@ class PetscTrajectory(object):
         Returns:
             None
         """
+        vecs = {k: v.tolist() for k, v in self.vecs.items()}
         if pth.endswith(".gz"):
             with gzip.open(pth, "w") as fp:
-                fp.write(json.dumps(self.vecs).encode("utf-8"))
+                fp.write(json.dumps(vecs).encode("utf-8"))
         else:
             with open(pth, "w") as fp:
-                json.dump(self.vecs, fp)
+                json.dump(vecs, fp)
 
     def from_json(self, pth):
         """Read the trajectory data from a json file in the form of a dictionary.
 
         Args:
-            pth (str): path for json file to write
+            pth (str): path for json file to read
 
         Returns:
             None
         """
         if pth.endswith(".gz"):
             with gzip.open(pth, "r") as fp:
-                self.vecs = json.loads(fp.read())
+                vecs = json.loads(fp.read())
         else:
             with open(pth, "r") as fp:
-                self.vecs = json.load(fp)
-        self.time = self.vecs["_time"]
+                vecs = json.load(fp)
+        self._set_vecs(vecs)
+
+    @staticmethod
+    def _npy_paths(pth):
+        if pth.endswith(".npy"):
+            pth = pth[:-4]
+        return f"{pth}.npy", f"{pth}.col"
+
+    def to_npy(self, pth):
+        """Write the trajectory array to a binary ``.npy`` file and the column
+        names, one per line, to a ``.col`` file with the same stem. This is
+        much faster to read and write than json and the array can be
+        memory-mapped when it is read back.
+
+        Args:
+            pth (str): path for the ``.npy`` file to write
+
+        Returns:
+            None
+        """
+        data_pth, col_pth = self._npy_paths(pth)
+        np.save(data_pth, self._data)
+        with open(col_pth, "w") as fp:
+            fp.write("\n".join(self.names) + "\n")
+
+    def from_npy(self, pth, mmap_mode=None):
+        """Read the trajectory data written by ``to_npy``.
+
+        Args:
+            pth (str): path of the ``.npy`` file to read
+            mmap_mode (str): memory-map mode passed to ``numpy.load``, e.g. "r"
+                to read values from disk only as they are accessed. If None,
+                read the whole file into memory.
+
+        Returns:
+            None
+        """
+        data_pth, col_pth = self._npy_paths(pth)
+        with open(col_pth, "r") as fp:
+            names = [line.rstrip("\n") for line in fp if line.strip()]
+        self._set_data(np.load(data_pth, mmap_mode=mmap_mode), names)
@@ -0,0 +1,309 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Tests for the NLP cache.
+"""
+import gc
+import io
+
+import pyomo.environ as pyo
+from pyomo.opt import SolverResults, Solution
+import pytest
+from pyomo.repn.plugins.nl_writer import NLWriter
+
+import idaes
+from idaes.core.solvers import (
+    get_solver,
+    NLPCache,
+    CachedNLPSolver,
+    get_nlp_cache,
+    use_nlp_cache,
+)
+from idaes.core.solvers.nlp_cache import _CompiledNLP
+
+
+def _model():
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var(initialize=1, bounds=(0, 5))
+    m.y = pyo.Var(initialize=2)
+    m.z = pyo.Var()
+    m.p = pyo.Param(initialize=3, mutable=True)
+    m.c1 = pyo.Constraint(expr=m.x**2 + m.y * m.p == 4)
+    m.c2 = pyo.Constraint(expr=m.x + m.z <= 3)
+    m.y.fix(2)
+    return m
+
+
+@pytest.mark.unit
+def test_compile_hit_and_miss():
+    m = _model()
+    cache = NLPCache()
+
+    entry, nl_text = cache.compile(m)
+    assert cache.hits == 0
+    assert cache.misses == 1
+    assert len(cache) == 1
+    # The fixed variable is kept in the problem with equal bounds
+    assert [v.name for v in entry.variables] == ["x", "y", "z"]
+    assert "\nb\n0 0 5\n4 2\n3\n" in nl_text
+
+    # Changing values, bounds and fixed flags reuses the compiled problem
+    m.y.fix(4)
+    m.x.value = 2
+    m.z.setlb(-1)
+    entry2, nl_text2 = cache.compile(m)
+    assert entry2 is entry
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert "\nx2\n0 2\n1 4\n" in nl_text2
+    assert "\nb\n0 0 5\n4 4\n2 -1\n" in nl_text2
+
+    # and gives the same problem as compiling from scratch
+    assert NLPCache().compile(m)[1] == nl_text2
+
+    m.y.unfix()
+    assert "\nb\n0 0 5\n3\n2 -1\n" in cache.compile(m)[1]
+    assert cache.hits == 2
+
+    stats = cache.statistics
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["write_time"] > 0
+    assert stats["time_saved"] >= 0
+
+    stream = io.StringIO()
+    cache.report(stream)
+    assert "NLP cache hits: 2, misses: 1" in stream.getvalue()
+
+
+def _writer_nl_text(m):
+    """
+    Write m with the NL writer, with fixed variables written as variables with
+    equal bounds the same way the cache writes them.
+    """
+    fixed = [v for v in m.component_data_objects(pyo.Var) if v.fixed]
+    bounds = [(v.lb, v.ub) for v in fixed]
+    for v in fixed:
+        v.unfix()
+        v.setlb(v.value)
+        v.setub(v.value)
+    try:
+        ostream = io.StringIO()
+        NLWriter().write(m, ostream)
+    finally:
+        for v, (lb, ub) in zip(fixed, bounds):
+            v.setlb(lb)
+            v.setub(ub)
+            v.fix()
+    return ostream.getvalue()
+
+
+@pytest.mark.unit
+def test_compile_matches_writer():
+    m = _model()
+    m.o = pyo.Objective(expr=m.z**2)
+    m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.scaling_factor[m.x] = 10
+    cache = NLPCache()
+    assert cache.compile(m)[1] == _writer_nl_text(m)
+
+    # value, bound and fixed flag changes give the writer's output
+    m.y.unfix()
+    m.z.value = 1.5
+    m.x.setub(4.5)
+    m.z.setlb(-2)
+    m.x.fix(0.25)
+    assert cache.compile(m)[1] == _writer_nl_text(m)
+    m.x.unfix()
+    m.x.value = None
+    m.y.setlb(2)
+    m.y.setub(2)
+    assert cache.compile(m)[1] == _writer_nl_text(m)
+    assert cache.misses == 1
+    assert cache.hits == 2
+
+    # export suffixes are written to the problem
+    m.scaling_factor[m.x] = 5
+    assert cache.compile(m)[1] == _writer_nl_text(m)
+    assert cache.misses == 2
+
+
+@pytest.mark.unit
+def test_compile_layout_error():
+    m = _model()
+    ostream = io.StringIO()
+    info = NLWriter().write(m, ostream)
+    nl_text = ostream.getvalue()
+    _CompiledNLP(m, [], [], [], [], info, nl_text)
+    with pytest.raises(RuntimeError, match="Unexpected layout"):
+        _CompiledNLP(m, [], [], [], [], info, nl_text.replace("\nr\n", "\n"))
+    with pytest.raises(RuntimeError, match="Unexpected layout"):
+        _CompiledNLP(m, [], [], [], [], info, nl_text.replace("\nx", "\ny"))
+    with pytest.raises(RuntimeError, match="Unexpected layout"):
+        _CompiledNLP(m, [], [], [], [], info, nl_text.replace(" 2 2 0", " 3 2 0", 1))
+
+
+@pytest.mark.unit
+def test_blocks_not_kept_alive():
+    m = _model()
+    cache = NLPCache()
+    cache.compile(m)
+    cache.compile(m.clone())
+    gc.collect()
+    assert len(cache) == 1
+    del m
+    gc.collect()
+    assert len(cache) == 0
+
+
+class _DualsSolver(object):
+    """
+    Stand-in for an ASL solver that returns the NL row number of each
+    constraint as its dual.
+    """
+
+    def solve(self, nl_file, tee=False, suffixes=()):
+        with open(nl_file) as f:
+            n_vars, n_cons = [int(n) for n in f.read().split("\n")[1].split()[:2]]
+        results = SolverResults()
+        results.solution.insert(Solution())
+        soln = results.solution(0)
+        for i in range(n_vars):
+            soln.variable[f"v{i}"] = {"Value": 1.0}
+        for i in range(n_cons):
+            soln.constraint[f"c{i}"] = {"Dual": float(i)}
+        return results
+
+
+@pytest.mark.unit
+def test_solve_duals_row_order():
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var(initialize=0)
+    m.y = pyo.Var(initialize=0)
+    m.c1 = pyo.Constraint(expr=m.x + m.y == 2)
+    m.c2 = pyo.Constraint(expr=m.x**2 - m.y == 0)
+    m.c3 = pyo.Constraint(expr=m.x - m.y <= 1)
+    m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+    cache = NLPCache()
+    cache.solve(_DualsSolver(), m)
+
+    ostream = io.StringIO()
+    info = NLWriter().write(m, ostream)
+    rows = [c[0] for c in info.constraints]
+    # the nonlinear constraint is written first
+    assert rows[0] is m.c2
+    for i, c in enumerate(rows):
+        assert m.dual[c] == i
+    assert pyo.value(m.x) == 1.0
+
+
+@pytest.mark.unit
+def test_compile_invalidation():
+    m = _model()
+    cache = NLPCache()
+    entry = cache.compile(m)[0]
+
+    # Mutable parameters are folded into the problem
+    m.p = 4
+    assert cache.compile(m)[0] is not entry
+    assert cache.misses == 2
+    entry = cache.compile(m)[0]
+    assert cache.hits == 1
+
+    m.c2.deactivate()
+    entry2 = cache.compile(m)[0]
+    assert entry2 is not entry
+    assert len(entry2.variables) == 2
+    assert cache.misses == 3
+
+    m.c2.activate()
+    m.c2.set_value(m.x - m.z <= 3)
+    assert cache.compile(m)[0] is not entry2
+    assert cache.misses == 4
+
+    m.o = pyo.Objective(expr=m.z**2)
+    cache.compile(m)
+    assert cache.misses == 5
+
+    cache.clear()
+    assert len(cache) == 0
+    cache.compile(m)
+    assert cache.misses == 6
+
+
+@pytest.mark.unit
+def test_max_size():
+    with pytest.raises(ValueError):
+        NLPCache(max_size=0)
+
+    m1 = _model()
+    m2 = _model()
+    cache = NLPCache(max_size=1)
+    cache.compile(m1)
+    cache.compile(m2)
+    assert len(cache) == 1
+    cache.compile(m1)
+    assert cache.misses == 3
+    assert cache.hits == 0
+
+
+@pytest.mark.unit
+def test_cached_solver_wrapper():
+    solver = pyo.SolverFactory("ipopt")
+    wrapper = CachedNLPSolver(solver)
+    assert wrapper.cache is get_nlp_cache()
+    wrapper.options["tol"] = 1e-6
+    assert solver.options["tol"] == 1e-6
+    wrapper.options = {"tol": 1e-7}
+    assert solver.options["tol"] == 1e-7
+
+    cache = NLPCache()
+    assert CachedNLPSolver(solver, cache).cache is cache
+
+
+@pytest.mark.unit
+def test_get_solver_use_nlp_cache():
+    assert not isinstance(get_solver(), CachedNLPSolver)
+    try:
+        use_nlp_cache()
+        assert idaes.cfg.use_nlp_cache
+        solver = get_solver(options={"tol": 1e-5})
+        assert isinstance(solver, CachedNLPSolver)
+        assert solver.options["tol"] == 1e-5
+    finally:
+        use_nlp_cache(False)
+    assert not idaes.cfg.use_nlp_cache
+    assert not isinstance(get_solver(), CachedNLPSolver)
+
+
+@pytest.mark.skipif(
+    not pyo.SolverFactory("ipopt").available(False), reason="no Ipopt"
+)
+@pytest.mark.component
+def test_solve():
+    m = _model()
+    m.o = pyo.Objective(expr=m.z**2)
+    m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+    cache = NLPCache()
+    solver = CachedNLPSolver(get_solver(), cache)
+
+    for y in [1, 1.5]:
+        m.y.fix(y)
+        results = solver.solve(m)
+        assert pyo.check_optimal_termination(results)
+        assert pyo.value(m.x) == pytest.approx((4 - 3 * y) ** 0.5, rel=1e-6)
+        assert pyo.value(m.z) == pytest.approx(0, abs=1e-6)
+        assert pyo.value(m.y) == y
+        assert m.c1 in m.dual
+    assert cache.misses == 1
+    assert cache.hits == 1
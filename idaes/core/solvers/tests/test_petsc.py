@@ -506,6 +506,153 @@ def test_set_dae_suffix():
     assert m.ydot[t, 4] not in t_block.dae_suffix
 
 
+@pytest.mark.unit
+def test_dae_sub_problem():
+    m, y1, y2, y3, y4, y5, y6 = dae_with_non_time_indexed_constraint(nfe=4)
+    for con in petsc.find_discretization_equations(m, m.t):
+        con.deactivate()
+    regular_vars, time_vars = pyodae.flatten.flatten_dae_components(m, m.t, pyo.Var)
+    regular_cons, time_cons = pyodae.flatten.flatten_dae_components(
+        m, m.t, pyo.Constraint
+    )
+    deriv_diff_map = petsc._get_derivative_differential_data_map(m, m.t)
+    t1, t2, t3 = m.t.at(2), m.t.at(3), m.t.at(4)
+    sub = petsc._DAESubProblem(m, t1, time_cons, time_vars, deriv_diff_map)
+    assert not sub.references_other_times(regular_vars)
+    assert len(sub.differential_vars) == 5
+
+    variables = [var[t2] for var in time_vars]
+    assert sub.signature == petsc._sub_problem_signature(
+        m, t2, time_cons, variables, deriv_diff_map
+    )
+    m.eq_ydot4[t3].deactivate()
+    assert sub.signature != petsc._sub_problem_signature(
+        m, t3, time_cons, [var[t3] for var in time_vars], deriv_diff_map
+    )
+    # a sub-problem with other scaling factors can't be reused, since the
+    # template's scaling factor suffix would be wrong for it
+    m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.scaling_factor[m.y[t2, 1]] = 10
+    assert sub.signature != petsc._sub_problem_signature(
+        m, t2, time_cons, variables, deriv_diff_map
+    )
+    del m.scaling_factor[m.y[t2, 1]]
+    m.scaling_factor[m.eq_ydot1[t2]] = 10
+    assert sub.signature != petsc._sub_problem_signature(
+        m, t2, time_cons, variables, deriv_diff_map
+    )
+    m.scaling_factor[m.eq_ydot1[t1]] = 10
+    sub = petsc._DAESubProblem(m, t1, time_cons, time_vars, deriv_diff_map)
+    assert sub.block.scaling_factor[m.eq_ydot1[t1]] == 10
+    assert sub.signature == petsc._sub_problem_signature(
+        m, t2, time_cons, variables, deriv_diff_map
+    )
+
+    # copy values in and out of the sub-problem
+    m.y[t1, 1] = 1
+    m.y[t2, 1] = 2
+    sub.load_values(variables)
+    assert m.y[t1, 1].value == 2
+    m.y[t1, 1] = 3
+    sub.store_values(variables)
+    assert m.y[t2, 1].value == 3
+    sub.restore_values()
+    assert m.y[t1, 1].value == 1
+    assert sub.name_map(variables)[str(m.y[t1, 1])] == str(m.y[t2, 1])
+
+    # a constraint with variables at another time point can't be reused
+    @m.Constraint(m.t)
+    def lag(b, t):
+        if t == b.t.first():
+            return pyo.Constraint.Skip
+        return b.Fin[t] == b.Fin[b.t.prev(t)]
+
+    regular_cons, time_cons = pyodae.flatten.flatten_dae_components(
+        m, m.t, pyo.Constraint
+    )
+    sub = petsc._DAESubProblem(m, t1, time_cons, time_vars, deriv_diff_map)
+    assert sub.references_other_times(regular_vars)
+
+
+@pytest.mark.unit
+def test_dae_sub_problem_constants():
+    m = pyo.ConcreteModel()
+    m.time = pyodae.ContinuousSet(initialize=(0.0, 2.0))
+    m.x = pyo.Var(m.time, initialize=1)
+    m.dxdt = pyodae.DerivativeVar(m.x, wrt=m.time)
+    m.p = pyo.Param(m.time, default=1, mutable=True)
+    m.q = pyo.Param(initialize=2, mutable=True)
+
+    @m.Constraint(m.time)
+    def eq(b, t):
+        return b.dxdt[t] == -b.x[t] + b.p[t] + b.q
+
+    discretizer = pyo.TransformationFactory("dae.finite_difference")
+    discretizer.apply_to(m, nfe=2, scheme="BACKWARD")
+    m.x[0].fix()
+    for con in petsc.find_discretization_equations(m, m.time):
+        con.deactivate()
+    regular_vars, time_vars = pyodae.flatten.flatten_dae_components(
+        m, m.time, pyo.Var
+    )
+    regular_cons, time_cons = pyodae.flatten.flatten_dae_components(
+        m, m.time, pyo.Constraint
+    )
+    deriv_diff_map = petsc._get_derivative_differential_data_map(m, m.time)
+    sub = petsc._DAESubProblem(m, 1.0, time_cons, time_vars, deriv_diff_map)
+    assert not sub.references_other_times(regular_vars)
+
+    def signature(t):
+        return petsc._sub_problem_signature(
+            m, t, time_cons, [var[t] for var in time_vars], deriv_diff_map
+        )
+
+    # same parameter values, the sub-problem can be reused
+    assert sub.signature == signature(2.0)
+    # a time-indexed parameter with another value at t = 2 can't be reused
+    m.p[2.0] = 3
+    assert sub.signature != signature(2.0)
+    m.p[2.0] = 1
+    # time as a constant in the constraint
+    m.eq.deactivate()
+
+    @m.Constraint(m.time)
+    def eq_t(b, t):
+        return b.dxdt[t] == -b.x[t] + b.p[t] + t
+
+    regular_cons, time_cons = pyodae.flatten.flatten_dae_components(
+        m, m.time, pyo.Constraint
+    )
+    sub = petsc._DAESubProblem(m, 1.0, time_cons, time_vars, deriv_diff_map)
+    assert sub.signature != signature(2.0)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not petsc.petsc_available(), reason="PETSc solver not available")
+def test_petsc_reuse_sub_problem():
+    m, y1, y2, y3, y4, y5, y6 = dae_with_non_time_indexed_constraint(nfe=10)
+    res = petsc.petsc_dae_by_time_element(
+        m,
+        time=m.t,
+        ts_options={
+            "--ts_type": "cn",  # Crank–Nicolson
+            "--ts_adapt_type": "basic",
+            "--ts_dt": 0.01,
+            "--ts_save_trajectory": 1,
+        },
+        reuse_sub_problem=True,
+    )
+    assert pytest.approx(y1, rel=1e-3) == pyo.value(m.y[m.t.last(), 1])
+    assert pytest.approx(y6, rel=1e-3) == pyo.value(m.y[m.t.last(), 6])
+    assert set(res.timing) == {"build", "write", "integrate", "read"}
+
+    tj = res.trajectory
+    assert tj.get_vec(m.y[180, 1])[-1] == pytest.approx(y1, rel=1e-3)
+    y1_trj = tj.interpolate_vec(m.t, m.y[180, 1])
+    for i, t in enumerate(m.t):
+        assert y1_trj[i] == pytest.approx(pyo.value(m.y[t, 1]))
+
+
 @pytest.mark.unit
 @pytest.mark.skipif(not petsc.petsc_available(), reason="PETSc solver not available")
 def test_petsc_read_trajectory():
@@ -716,3 +863,118 @@ def test_rp_example5b():
                 "--ts_save_trajectory": 1,
             },
         )
+
+
+def _trajectory_vecs():
+    t = np.array([0.0, 0.5, 1.5, 3.0])
+    return {"x[1]": 2 * t, "x[2]": t**2, "_time": t}
+
+
+@pytest.mark.unit
+def test_trajectory_array():
+    tj = petsc.PetscTrajectory(vecs=_trajectory_vecs())
+    assert tj.names == ["x[1]", "x[2]", "_time"]
+    assert tj.time.tolist() == [0.0, 0.5, 1.5, 3.0]
+    assert tj.get_dt() == [0.5, 1.0, 1.5]
+    assert tj.get_vec("x[2]").tolist() == [0.0, 0.25, 2.25, 9.0]
+    # vectors are views of the trajectory array
+    assert tj.get_vec("x[1]").base is tj._data
+    assert tj.vecs["x[2]"].base is tj._data
+    # vecs is a live mapping, assignment goes into the trajectory array
+    vecs = tj.vecs
+    assert len(vecs) == 3
+    vecs["x[3]"] = [1.0, 2.0, 3.0, 4.0]
+    assert tj.names == ["x[1]", "x[2]", "_time", "x[3]"]
+    assert vecs["x[3]"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert vecs["x[3]"].base is tj._data
+    with pytest.raises(TypeError):
+        del vecs["x[3]"]
+    tj._set_data(tj._data[:, :3], ["x[1]", "x[2]", "_time"])
+
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var([1, 2, 3], initialize=4)
+    m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.scaling_factor[m.x[1]] = 2
+    m.scaling_factor[m.x[2]] = 0.5
+    m.x_ref = pyo.Reference(m.x)  # make sure references don't get unscaled twice
+    # scaling factors on the parent block of a variable are used too
+    m.b = pyo.Block()
+    m.b.z = pyo.Var()
+    m.b.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.b.scaling_factor[m.b.z] = 4
+    tj.vecs["b.z"] = [4.0, 8.0, 12.0, 16.0]
+    tj._unscale(m)
+    # only the scaled variables are looked up
+    assert not tj.id_map
+    assert tj.get_vec(m.x[1]).tolist() == tj.time.tolist()
+    assert tj.get_vec(m.x[2]).tolist() == [0.0, 0.5, 4.5, 18.0]
+    assert tj.get_vec(m.b.z).tolist() == [1.0, 2.0, 3.0, 4.0]
+    tj._set_data(tj._data[:, :3], ["x[1]", "x[2]", "_time"])
+
+    tj._add_constant_vecs([m.x[3], m.x[1]], [4, 0])
+    assert tj.names == ["x[1]", "x[2]", "_time", "x[3]"]
+    assert tj.get_vec(m.x[3]).tolist() == [4] * 4
+    assert tj.get_vec(m.x[1]).tolist() == tj.time.tolist()
+    with pytest.raises(ValueError):
+        tj._set_vec(m.x[3], [1, 2])
+
+    tj_prev = petsc.PetscTrajectory(
+        vecs={"y": [1.0, 2.0], "x[2]": [5.0, 6.0], "_time": [-2.0, -1.0]}
+    )
+    tj._prepend(tj_prev, [("x[1]", "y")])
+    assert tj.time.tolist() == [-2.0, -1.0, 0.0, 0.5, 1.5, 3.0]
+    assert tj.get_vec("x[1]").tolist() == [1.0, 2.0, 0.0, 0.5, 1.5, 3.0]
+    # no counterpart in the previous segment
+    assert np.isnan(tj.get_vec("x[3]")[:2]).all()
+
+
+@pytest.mark.unit
+def test_trajectory_interpolate():
+    tj = petsc.PetscTrajectory(vecs=_trajectory_vecs())
+    times = [-1.0, 0.0, 0.25, 1.0, 1.5, 2.9, 4.0]
+    vecs = tj.interpolate_vecs(times, ["x[2]", "x[1]"])
+    assert vecs.shape == (7, 2)
+    for j, name in enumerate(["x[2]", "x[1]"]):
+        expected = np.interp(times, tj.time, tj.get_vec(name))
+        assert vecs[:, j] == pytest.approx(expected)
+        assert tj.interpolate_vec(times, name) == pytest.approx(expected)
+
+    tj2 = tj.interpolate(times)
+    assert tj2.names == tj.names
+    assert tj2.time.tolist() == times
+    assert tj2.get_vec("x[2]") == pytest.approx(vecs[:, 0])
+
+    # repeated time points at the boundary between trajectory segments
+    tj = petsc.PetscTrajectory(
+        vecs={"x": [0.0, 1.0, 1.0, 3.0], "_time": [0.0, 1.0, 1.0, 2.0]}
+    )
+    assert tj.interpolate_vec([0.5, 1.0, 1.5], "x").tolist() == [0.5, 1.0, 2.0]
+
+    tj = petsc.PetscTrajectory(vecs={"x": [3.0], "_time": [1.0]})
+    assert tj.interpolate_vec([0.0, 2.0], "x").tolist() == [3.0, 3.0]
+
+
+@pytest.mark.unit
+def test_trajectory_files(tmp_path):
+    tj = petsc.PetscTrajectory(vecs=_trajectory_vecs())
+
+    pth = str(tmp_path / "traj.json")
+    tj.to_json(pth)
+    with open(pth, "r") as fp:
+        assert json.load(fp)["x[2]"] == [0.0, 0.25, 2.25, 9.0]
+    tj2 = petsc.PetscTrajectory(json=pth)
+    assert tj2.vecs.keys() == tj.vecs.keys()
+    assert tj2.get_vec("x[2]").tolist() == [0.0, 0.25, 2.25, 9.0]
+
+    pth = str(tmp_path / "traj.npy")
+    tj.to_npy(pth)
+    assert os.path.exists(str(tmp_path / "traj.col"))
+    tj2 = petsc.PetscTrajectory(npy=pth, mmap_mode="r")
+    assert isinstance(tj2._data, np.memmap)
+    assert tj2.names == tj.names
+    assert tj2.get_vec("x[2]").tolist() == [0.0, 0.25, 2.25, 9.0]
+    assert tj2.interpolate_vec([1.0], "x[1]").tolist() == [2.0]
+
+    tj2 = petsc.PetscTrajectory(npy=str(tmp_path / "traj"))
+    assert not isinstance(tj2._data, np.memmap)
+    assert tj2.time.tolist() == tj.time.tolist()
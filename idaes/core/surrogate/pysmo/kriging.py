@@ -23,11 +23,13 @@ import numpy as np
 import pandas as pd
 import pickle
 from pyomo.core import Param, exp
+from scipy.linalg import cho_factor, cho_solve
 from scipy.optimize import basinhopping
 import scipy.optimize as opt
 
 # Imports from IDAES namespace
 from idaes.core.surrogate.pysmo.sampling import FeatureScaling as fs
+from idaes.core.surrogate.pysmo.utils import predict_in_chunks
 
 
 class MyBounds(object):
@@ -82,6 +84,8 @@ class KrigingModel:
         regularization=True,
         fname=None,
         overwrite=False,
+        subset_size=None,
+        random_state=None,
     ):
         """
         Initialization of **KrigingModel** class.
@@ -92,13 +96,17 @@ class KrigingModel:
         Keyword Args:
             numerical_gradients(bool)               : Whether or not numerical gradients should be used in training. This choice determines the algorithm used to solve the problem.
 
-                                                            - numerical_gradients = True: The problem is solved with BFGS using central differencing with a step size of :math:`10^{-6}` to evaluate numerical gradients.
-                                                            - numerical_gradients = False: The problem is solved with Basinhopping, a stochastic optimization algorithm.
+                                                            - numerical_gradients = True: The problem is solved with BFGS, using analytic gradients of the likelihood function.
+                                                            - numerical_gradients = False: The problem is solved with Basinhopping, a stochastic optimization algorithm, with BFGS and analytic gradients as the local minimizer.
 
             regularization(bool)                    :  This option determines whether or not regularization is considered during Kriging training. Default is True.
 
                                                             - When regularization is turned off, the model generates an interpolating kriging model.
 
+            subset_size(int)                        :  Maximum number of training samples used to build the Kriging model. Training cost grows with the cube of the number of samples, so for large datasets a random subset of **subset_size** samples is used to train the model (subset of data approximation). The input scaling is still based on the complete dataset. Default is None, which uses all the samples.
+
+            random_state(int or numpy Generator)    :  Seed or random number generator used to draw the training subset when **subset_size** is set. Default is None, which seeds a generator from numpy's global random state, so ``np.random.seed`` still makes the subset reproducible.
+
         Returns:
             self object with the input information and settings.
 
@@ -109,6 +117,8 @@ class KrigingModel:
 
             Exception:  - regularization is not boolean
 
+            Exception:  - subset_size is not a positive integer
+
         **Example:**
 
         .. code-block:: python
@@ -185,6 +195,24 @@ class KrigingModel:
         else:
             raise Exception("Choice of regularization must be boolean.")
 
+        if subset_size is not None:
+            if (
+                not isinstance(subset_size, (int, np.integer))
+                or isinstance(subset_size, bool)
+                or subset_size < 2
+            ):
+                raise Exception("subset_size must be an integer greater than 1.")
+            if self.x_data.shape[0] > subset_size:
+                if random_state is None:
+                    random_state = np.random.randint(2**31)
+                rng = np.random.default_rng(random_state)
+                subset = np.sort(
+                    rng.choice(self.x_data.shape[0], subset_size, replace=False)
+                )
+                self.x_data = self.x_data[subset, :]
+                self.y_data = self.y_data[subset, :]
+                self.x_data_scaled = self.x_data_scaled[subset, :]
+
         # Results
         self.optimal_weights = None
         self.optimal_p = None
@@ -198,6 +226,44 @@ class KrigingModel:
         self.training_R2 = None
         self.training_rmse = None
 
+    @staticmethod
+    def feature_distance_matrix(x, j, p):
+        """
+        The feature_distance_matrix method returns the matrix of distances :math:`\\left|x_{i,j} - x_{k,j}\\right|^{p}` between all pairs of samples for feature j.
+
+        Args:
+            x                       : scaled features data
+            j                       : feature (column of x)
+            p                       : Kriging exponent
+
+        Returns:
+            NumPy Array             : Distance matrix for feature j
+
+        """
+        return np.abs(x[:, j, np.newaxis] - x[np.newaxis, :, j]) ** p
+
+    @staticmethod
+    def distance_matrix_generator(x, theta, p):
+        """
+        The distance_matrix_generator method generates the matrix of weighted distances between all pairs of samples.
+
+        The distances are summed up one feature at a time, so only arrays of size (number of samples)^2 are created.
+
+        Args:
+            x                       : scaled features data
+            theta                   : Kriging weights
+            p                       : Kriging exponent
+
+        Returns:
+            distance_matrix         : Weighted distance matrix
+
+        """
+        theta = np.reshape(theta, (-1,))
+        distance_matrix = np.zeros((x.shape[0], x.shape[0]))
+        for j in range(0, x.shape[1]):
+            distance_matrix += theta[j] * KrigingModel.feature_distance_matrix(x, j, p)
+        return distance_matrix
+
     @staticmethod
     def covariance_matrix_generator(x, theta, reg_param, p):
         """
@@ -213,11 +279,7 @@ class KrigingModel:
             cov_matrix              : Regularized co-variance matrix
 
         """
-        distance_matrix = np.zeros((x.shape[0], x.shape[0]))
-        for i in range(0, x.shape[0]):
-            distance_matrix[i, :] = (
-                np.matmul(((np.abs(x[i, :] - x)) ** p), theta)
-            ).transpose()
+        distance_matrix = KrigingModel.distance_matrix_generator(x, theta, p)
         cov_matrix = np.exp(-1 * distance_matrix)
         cov_matrix = cov_matrix + reg_param * np.eye(
             cov_matrix.shape[0]
@@ -320,26 +382,83 @@ class KrigingModel:
                 https://onlinelibrary.wiley.com/doi/pdf/10.1002/9780470770801
 
         """
-        theta = var_vector[:-1]
+        return self._concentrated_likelihood(var_vector, x, y, p)[0]
+
+    def analytic_gradient(self, var_vector, x, y, p):
+        """
+        The analytic_gradient method calculates the gradients of the concentrated likelihood function for the Kriging hyperparameters.
+
+        Since the Kriging mean and variance are at their MLE estimates, for a hyperparameter :math:`\phi` the gradient is
+
+        grad(phi) = 0.5 * trace((R^-1 - R^-1 y_mu y_mu' R^-1 / sigma^2) dR/dphi)
+
+        where R is the regularized co-variance matrix. The Cholesky factorization of R used for the likelihood is reused.
+
+        Args:
+            var_vector(NumPy Array)        : Numpy array containing the Kriging paramaters (Kriging weights and regularization parameter)
+            x(NumPy Array)                 : Scaled version of input features/variables
+            y(NumPy Array)                 : Output variable y (unscaled)
+            p(float)                       : Kriging model exponent (fixed to 2) to ensure model smoothness
+
+        Returns:
+            grad_vec(NumPy Array)          : Array of the gradients of the variables in var_vector
+
+        """
+        return self._concentrated_likelihood(var_vector, x, y, p, gradient=True)[1]
+
+    def _objective_and_gradient(self, var_vector, x, y, p):
+        """
+        Return the concentrated likelihood and its gradient together, for optimizers called with jac=True.
+        """
+        return self._concentrated_likelihood(var_vector, x, y, p, gradient=True)
+
+    def _concentrated_likelihood(self, var_vector, x, y, p, gradient=False):
+        """
+        Evaluate the concentrated likelihood function, and if gradient is True its analytic gradient, with a single Cholesky factorization of the co-variance matrix.
+        """
+        var_vector = np.reshape(var_vector, (-1,))
+        theta = 10 ** var_vector[:-1]  # Assumes log(theta) provided
         reg_param = var_vector[-1]
-        theta = 10**theta  # Assumes log(theta) provided
         ns = y.shape[0]
+        grad_vec = np.zeros(len(var_vector))
         cov_mat = self.covariance_matrix_generator(x, theta, reg_param, p)
         try:  # Check Cholesky factorization
-            L = np.linalg.cholesky(cov_mat)
-            lndetcov = 2 * np.sum(
-                np.log(np.abs(np.diag(L)))
-            )  # Approximation to 2nd term from Forrester book, making use of the Ch. factorization
-            cov_inv = self.covariance_inverse_generator(cov_mat)
-            km = self.kriging_mean(cov_inv, y)
-            y_mu = self.y_mu_calculation(y, km)
-            ssd = self.kriging_sd(cov_inv, y_mu, ns)
-            # log_like = (0.5 * ns * np.log(ssd)) + (0.5 * np.log(np.abs(np.linalg.det(cov_mat))))
-            log_like = (0.5 * ns * np.log(ssd)) + (0.5 * lndetcov)
-            conc_log_like = log_like[0, 0]
-        except:  # When Cholesky fails - non-positive definite covariance matrix
-            conc_log_like = 1e4
-        return conc_log_like
+            factor = cho_factor(cov_mat, lower=True)
+        except np.linalg.LinAlgError:
+            # When Cholesky fails - non-positive definite covariance matrix
+            return 1e4, grad_vec
+        # 2nd term from Forrester book, making use of the Ch. factorization
+        lndetcov = 2 * np.sum(np.log(np.abs(np.diag(factor[0]))))
+        ones_vec = np.ones((ns, 1))
+        cov_inv_ones = cho_solve(factor, ones_vec)
+        cov_inv_y = cho_solve(factor, y)
+        km = np.matmul(ones_vec.transpose(), cov_inv_y) / np.matmul(
+            ones_vec.transpose(), cov_inv_ones
+        )
+        y_mu = self.y_mu_calculation(y, km)
+        cov_inv_y_mu = cov_inv_y - km * cov_inv_ones
+        ssd = (np.matmul(y_mu.transpose(), cov_inv_y_mu) / ns)[0, 0]
+        if not (np.isfinite(ssd) and ssd > 0):
+            return 1e4, grad_vec
+        conc_log_like = (0.5 * ns * np.log(ssd)) + (0.5 * lndetcov)
+        if not gradient:
+            return conc_log_like, grad_vec
+
+        cov_inv = cho_solve(factor, np.eye(ns))
+        w = cov_inv - np.matmul(cov_inv_y_mu, cov_inv_y_mu.transpose()) / ssd
+        # d(cov_mat)/d(log10(theta_j)) = -ln(10) * theta_j * correlation * distance_j
+        w_corr = w * (cov_mat - reg_param * np.eye(ns))
+        for j in range(0, x.shape[1]):
+            grad_vec[j] = (
+                -0.5
+                * np.log(10)
+                * theta[j]
+                * np.sum(w_corr * self.feature_distance_matrix(x, j, p))
+            )
+        if self.regularization is True:
+            # d(cov_mat)/d(reg_param) is the identity matrix
+            grad_vec[-1] = 0.5 * np.trace(w)
+        return conc_log_like, grad_vec
 
     def numerical_gradient(self, var_vector, x, y, p):
         """
@@ -390,7 +509,6 @@ class KrigingModel:
         initial_value_list = initial_value_list.tolist()
         initial_value_list.append(1e-4)
         initial_value = np.array(initial_value_list)
-        initial_value = initial_value.reshape(initial_value.shape[0], 1)
         # Create bounds for variables. All logthetas btw (-4, 4), reg param between (1e-9, 0.1)
         bounds = []
         for i in range(0, len(initial_value_list)):
@@ -406,22 +524,22 @@ class KrigingModel:
         if self.num_grads:
             print("Optimizing kriging parameters using L-BFGS-B algorithm...")
             other_args = (self.x_data_scaled, self.y_data, p)
-            # opt_results = opt.minimize(self.objective_function, initial_value, args=other_args, method='L-BFGS-B', jac=self.numerical_gradient, bounds=bounds, options={'gtol': 1e-7}) #, 'disp': True})
+            # The likelihood and its analytic gradient share one Cholesky factorization
             opt_results1 = opt.minimize(
-                self.objective_function,
+                self._objective_and_gradient,
                 initial_value,
                 args=other_args,
                 method="tnc",
-                jac=self.numerical_gradient,
+                jac=True,
                 bounds=bounds,
                 options={"gtol": 1e-7},
             )
             opt_results2 = opt.minimize(
-                self.objective_function,
+                self._objective_and_gradient,
                 initial_value,
                 args=other_args,
                 method="L-BFGS-B",
-                jac=self.numerical_gradient,
+                jac=True,
                 bounds=bounds,
                 options={"gtol": 1e-7},
             )  # , 'disp': True})
@@ -429,16 +547,31 @@ class KrigingModel:
                 opt_results = opt_results1
             else:
                 opt_results = opt_results2
+            if not opt_results.success:
+                # With exact gradients the line search can stall at the optimum,
+                # restart from the best point found to confirm convergence
+                opt_results3 = opt.minimize(
+                    self._objective_and_gradient,
+                    opt_results.x,
+                    args=other_args,
+                    method="L-BFGS-B",
+                    jac=True,
+                    bounds=bounds,
+                    options={"gtol": 1e-7},
+                )
+                if opt_results3.fun <= opt_results.fun:
+                    opt_results = opt_results3
         else:
             print("Optimizing Kriging parameters using Basinhopping algorithm...")
             other_args = {
                 "args": (self.x_data_scaled, self.y_data, p),
                 "bounds": bounds,
+                "jac": True,
             }
             # other_args = {"args": (self.x_data, self.y_data, p)}
             mybounds = MyBounds()  # Bounds on regularization parameter
             opt_results = basinhopping(
-                self.objective_function,
+                self._objective_and_gradient,
                 initial_value_list,
                 minimizer_kwargs=other_args,
                 niter=250,
@@ -480,7 +613,10 @@ class KrigingModel:
         cov_mat = self.covariance_matrix_generator(
             self.x_data_scaled, theta, reg_param, p
         )
-        cov_inv = self.covariance_inverse_generator(cov_mat)
+        try:
+            cov_inv = cho_solve(cho_factor(cov_mat, lower=True), np.eye(ns))
+        except np.linalg.LinAlgError:
+            cov_inv = self.covariance_inverse_generator(cov_mat)
         mean = self.kriging_mean(cov_inv, self.y_data)
         y_mu = self.y_mu_calculation(self.y_data, mean)
         variance = self.kriging_sd(cov_inv, y_mu, ns)
@@ -516,13 +652,11 @@ class KrigingModel:
             y_prediction    : Predicted values of y
 
         """
-        y_prediction = np.zeros((x.shape[0], 1))
-        for i in range(0, x.shape[0]):
-            cmt = (np.matmul(((np.abs(x[i, :] - x)) ** p), theta)).transpose()
-            cov_matrix_tests = np.exp(-1 * cmt)
-            y_prediction[i, 0] = mean + np.matmul(
-                np.matmul(cov_matrix_tests.transpose(), cov_inv), y_mu
-            )
+        cov_matrix_tests = np.exp(
+            -1 * KrigingModel.distance_matrix_generator(x, theta, p)
+        )
+        y_prediction = mean + np.matmul(cov_matrix_tests, np.matmul(cov_inv, y_mu))
+        y_prediction = y_prediction.reshape(x.shape[0], 1)
         ss_error = (1 / y_data.shape[0]) * (np.sum((y_data - y_prediction) ** 2))
         rmse_error = np.sqrt(ss_error)
         return ss_error, rmse_error, y_prediction
@@ -548,13 +682,19 @@ class KrigingModel:
         r_square = 1 - (ss_residual / ss_total)
         return r_square
 
-    def predict_output(self, x_pred):
+    def predict_output(self, x_pred, chunk_size=None, n_jobs=None):
         """
         The ``predict_output`` method generates output predictions for input data x_pred based a previously trained Kriging model.
 
+        The predictions for all the rows of x_pred are computed together, in chunks of rows to limit the size of the temporary distance arrays.
+
         Args:
             x_pred(NumPy Array)             : Array of designs for which the output is to be evaluated/predicted.
 
+        Keyword Args:
+            chunk_size(int)                 : Number of designs to evaluate at once. If None, a size that keeps the temporary arrays to roughly 32 MB is used.
+            n_jobs(int)                     : Number of threads used to evaluate chunks. None or 1 evaluates all chunks in the calling thread, -1 uses one thread per CPU.
+
         Returns:
              NumPy Array                    : Output variable predictions based on the Kriging model.
 
@@ -563,20 +703,28 @@ class KrigingModel:
         x_pred = x_pred_scaled.reshape(x_pred.shape)
         if x_pred.ndim == 1:
             x_pred = x_pred.reshape(1, len(x_pred))
-        y_pred = np.zeros((x_pred.shape[0], 1))
-        for i in range(0, x_pred.shape[0]):
-            cmt = (
-                np.matmul(
-                    ((np.abs(x_pred[i, :] - self.x_data_scaled)) ** self.optimal_p),
-                    self.optimal_weights,
-                )
-            ).transpose()
-            cov_matrix_tests = np.exp(-1 * cmt)
-            y_pred[i, 0] = self.optimal_mean + np.matmul(
-                np.matmul(cov_matrix_tests.transpose(), self.covariance_matrix_inverse),
-                self.optimal_y_mu,
-            )
-        return y_pred
+        # Weights of the training point correlations, the same for every design
+        kriging_weights = np.matmul(self.covariance_matrix_inverse, self.optimal_y_mu)
+        return predict_in_chunks(
+            lambda x: self._predict_scaled(x, kriging_weights),
+            x_pred,
+            elements_per_row=self.x_data_scaled.shape[0] * self.x_data_scaled.shape[1],
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+        )
+
+    def _predict_scaled(self, x_pred, kriging_weights):
+        """
+        Predict the outputs for a 2-D array of scaled designs.
+        """
+        cmt = np.matmul(
+            np.abs(x_pred[:, np.newaxis, :] - self.x_data_scaled[np.newaxis, :, :])
+            ** self.optimal_p,
+            np.reshape(self.optimal_weights, (-1,)),
+        )
+        cov_matrix_tests = np.exp(-1 * cmt)
+        y_pred = self.optimal_mean + np.matmul(cov_matrix_tests, kriging_weights)
+        return np.reshape(y_pred, (x_pred.shape[0], 1))
 
     def training(self):
         """
@@ -32,7 +32,7 @@ from scipy.special import comb as comb
 from six import string_types
 
 # Imports from IDAES namespace
-from idaes.core.surrogate.pysmo.utils import NumpyEvaluator
+from idaes.core.surrogate.pysmo.utils import NumpyEvaluator, predict_in_chunks
 
 
 __author__ = "Oluwamayowa Amusat"
@@ -1636,32 +1636,55 @@ class PolynomialRegression:
                 ans += float(w) * replace_expressions(expr, user_term_map)
         return ans
 
-    def predict_output(self, x_data):
+    def predict_output(self, x_data, chunk_size=None, n_jobs=None):
         """
 
         The ``predict_output`` method generates output predictions for input data x_data based a previously generated polynomial fitting.
 
+        The polynomial features for all the rows of x_data are generated together with ``polygeneration``, in chunks of rows to limit the size of the feature arrays.
+
         Args:
             x_data          : Numpy array of designs for which the output is to be evaluated/predicted.
 
+        Keyword Args:
+            chunk_size      : Number of designs to evaluate at once. If None, a size that keeps the feature arrays to roughly 32 MB is used.
+            n_jobs          : Number of threads used to evaluate chunks. None or 1 evaluates all chunks in the calling thread, -1 uses one thread per CPU.
+
         Returns:
              Numpy Array    : Output variable predictions based on the polynomial fit.
 
         """
-        nf = x_data.shape[1]
-        x_list = [i for i in range(0, nf)]
-        import pyomo.environ as aml
-
-        m = aml.ConcreteModel()
-        i = aml.Set(initialize=x_list)
-        m.xx = aml.Var(i)
-        m.o2 = aml.Objective(expr=self.generate_expression([m.xx[i] for i in x_list]))
-        y_eq = np.zeros((x_data.shape[0], 1))
-        for j in range(0, x_data.shape[0]):
-            for i in x_list:
-                m.xx[i] = x_data[j, i]
-            y_eq[j, 0] = aml.value(m.o2([m.xx[i] for i in x_list]))
-        return y_eq
+        x_data = np.asarray(x_data, dtype=float)
+        if x_data.ndim == 1:
+            x_data = x_data.reshape(1, len(x_data))
+        return predict_in_chunks(
+            self._predict_batch,
+            x_data,
+            elements_per_row=np.size(self.optimal_weights_array),
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+        )
+
+    def _predict_batch(self, x_data):
+        """
+        Predict the outputs for a 2-D array of designs.
+        """
+        weights = np.reshape(self.optimal_weights_array, (-1,))
+        terms = PolynomialRegression.polygeneration(
+            self.final_polynomial_order, self.multinomials, x_data
+        )
+        n = terms.shape[1]
+        y_eq = np.matmul(terms, weights[:n])
+        if len(self.additional_term_expressions) > 0:
+            # Evaluate the user terms with the columns of x_data in place of
+            # the feature vector
+            cMap = ComponentMap()
+            for i, feature in enumerate(self.extra_terms_feature_vector):
+                cMap[feature] = x_data[:, i]
+            npe = NumpyEvaluator(cMap)
+            for w, expr in zip(weights[n:], self.additional_term_expressions):
+                y_eq = y_eq + w * npe.walk_expression(expr)
+        return y_eq.reshape(x_data.shape[0], 1)
 
     def pickle_save(self, solutions):
         """
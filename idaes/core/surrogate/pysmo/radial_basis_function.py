@@ -15,6 +15,7 @@
 # Imports from the python standard library
 from __future__ import division, print_function
 from builtins import int, str
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 import os.path
 import pprint
@@ -32,6 +33,7 @@ from six import string_types
 
 # Imports from IDAES namespace
 from idaes.core.surrogate.pysmo.sampling import FeatureScaling as fs
+from idaes.core.surrogate.pysmo.utils import predict_in_chunks
 
 __author__ = "Oluwamayowa Amusat"
 
@@ -186,6 +188,7 @@ class RadialBasisFunctions:
         regularization=None,
         fname=None,
         overwrite=False,
+        n_jobs=None,
     ):
         """
 
@@ -218,6 +221,8 @@ class RadialBasisFunctions:
 
             regularization(bool): This option determines whether or not the regularization parameter :math:`\lambda` is considered during RBF fitting. Default setting is True.
 
+            n_jobs(int): Number of threads used to evaluate the leave-one-out cross-validation error over the grid of (:math:`\sigma,\lambda`) pairs. None or 1 evaluates the grid in the calling thread (default), -1 uses one thread per CPU. The 'pyomo' solution method always evaluates the grid serially.
+
 
         Returns:
             **self** object with the input information
@@ -231,6 +236,8 @@ class RadialBasisFunctions:
                 * **solution_method** is not 'algebraic', 'pyomo' or 'bfgs'.
             Exception:
                 - :math:`\lambda` is not boolean.
+            Exception:
+                - **n_jobs** is not an integer.
 
         **Example:**
 
@@ -349,6 +356,10 @@ class RadialBasisFunctions:
             self.regularization = regularization
         print("Regularization done: ", self.regularization)
 
+        if n_jobs is not None and not isinstance(n_jobs, int):
+            raise Exception("n_jobs must be an integer or None.")
+        self.n_jobs = n_jobs
+
         # Results
         self.weights = None
         self.sigma = None
@@ -966,37 +977,52 @@ class RadialBasisFunctions:
 
         machine_precision = np.finfo(float).eps
 
-        error_vector = np.zeros((len(r_set) * len(reg_parameter), 3))
-        counter = 0
+        # The LOOCV errors of the (sigma, lambda) pairs are independent; the
+        # numpy linear algebra releases the GIL, so the pairs may be evaluated
+        # in a thread pool. Pyomo models are not thread safe.
+        grid = list(itertools.product(r_set, reg_parameter))
+        n_jobs = getattr(self, "n_jobs", None)
+        if n_jobs is None or n_jobs == 1 or self.solution_method == "pyomo":
+            grid_results = [
+                self.loo_error_estimation_with_rippa_method(sigma, lambda_reg)
+                for sigma, lambda_reg in grid
+            ]
+        else:
+            workers = None if n_jobs < 0 else n_jobs
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                grid_results = list(
+                    executor.map(
+                        lambda pair: self.loo_error_estimation_with_rippa_method(
+                            *pair
+                        ),
+                        grid,
+                    )
+                )
+
+        error_vector = np.zeros((len(grid), 3))
         print(
             "==========================================================================================================="
         )
-        for i in range(0, len(r_set)):
-            sigma = r_set[i]
-            for j in range(0, len(reg_parameter)):
-                lambda_reg = reg_parameter[j]
-                (
-                    cond_no_pure,
-                    cond_no_reg,
-                    cv_error,
-                ) = self.loo_error_estimation_with_rippa_method(sigma, lambda_reg)
-                error_vector[counter, :] = [sigma, lambda_reg, cv_error]
-                counter += 1
-                print(
-                    sigma,
-                    "   |    ",
-                    lambda_reg,
-                    "   |    ",
-                    cv_error,
-                    "   |    ",
-                    cond_no_pure,
-                    "   |    ",
-                    cond_no_pure * machine_precision,
-                    "   |    ",
-                    cond_no_reg,
-                    "   |    ",
-                    cond_no_reg * machine_precision,
-                )
+        for counter, ((sigma, lambda_reg), grid_result) in enumerate(
+            zip(grid, grid_results)
+        ):
+            cond_no_pure, cond_no_reg, cv_error = grid_result
+            error_vector[counter, :] = [sigma, lambda_reg, cv_error]
+            print(
+                sigma,
+                "   |    ",
+                lambda_reg,
+                "   |    ",
+                cv_error,
+                "   |    ",
+                cond_no_pure,
+                "   |    ",
+                cond_no_pure * machine_precision,
+                "   |    ",
+                cond_no_reg,
+                "   |    ",
+                cond_no_reg * machine_precision,
+            )
         minimum_value_column = np.argmin(error_vector[:, 2], axis=0)
         r_best = error_vector[minimum_value_column, 0]
         lambda_best = error_vector[minimum_value_column, 1]
@@ -1088,35 +1114,44 @@ class RadialBasisFunctions:
         self.pickle_save({"model": self})
         return self
 
-    def predict_output(self, x_data):
+    def predict_output(self, x_data, chunk_size=None, n_jobs=None):
         """
 
         The ``predict_output`` method generates output predictions for input data x_data based a previously generated RBF fitting.
 
+        The predictions for all the rows of x_data are computed together, in chunks of rows to limit the size of the temporary distance arrays.
+
         Args:
             x_data(NumPy Array)    : Designs for which the output is to be evaluated/predicted.
 
+        Keyword Args:
+            chunk_size(int)        : Number of designs to evaluate at once. If None, a size that keeps the temporary arrays to roughly 32 MB is used.
+            n_jobs(int)            : Number of threads used to evaluate chunks. None or 1 evaluates all chunks in the calling thread, -1 uses one thread per CPU.
+
         Returns:
              Numpy Array    : Output variable predictions based on the rbf fit.
 
         """
-        radial_weights = self.weights
-        centres_matrix = self.centres
-        r = self.sigma
-        lambda_reg = self.regularization_parameter
         scale = self.x_data_max - self.x_data_min
         scale[scale == 0.0] = 1.0
         x_pred_scaled = (x_data - self.x_data_min) / scale
         x_data = x_pred_scaled.reshape(x_data.shape)
+        return predict_in_chunks(
+            self._predict_scaled,
+            x_data,
+            elements_per_row=self.centres.shape[0] * self.centres.shape[1],
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+        )
 
-        basis_vector = np.zeros((x_data.shape[0], centres_matrix.shape[0]))
-        # Calculate distances from centres
-        for i in range(0, centres_matrix.shape[0]):
-            basis_vector[:, i] = np.sqrt(
-                np.sum(((x_data - centres_matrix[i, :]) ** 2), axis=1)
-            )
-        # Initialization of x_transformed
-        x_transformed = np.zeros((basis_vector.shape[0], basis_vector.shape[1]))
+    def _predict_scaled(self, x_data):
+        """
+        Predict the outputs for a 2-D array of scaled designs.
+        """
+        # Distances from every design to every centre
+        differences = x_data[:, np.newaxis, :] - self.centres[np.newaxis, :, :]
+        basis_vector = np.sqrt(np.sum(differences**2, axis=2))
+        r = self.sigma
 
         # Transform X
         if self.basis_function == "gaussian":
@@ -1141,13 +1176,10 @@ class RadialBasisFunctions:
             x_transformed = RadialBasisFunctions.thin_plate_spline_transformation(
                 basis_vector
             )
+        else:
+            x_transformed = np.zeros((basis_vector.shape[0], basis_vector.shape[1]))
 
-        # Add regularization shifting?
-        x_transformed = x_transformed + (
-            0 * np.eye(x_transformed.shape[0], x_transformed.shape[1])
-        )
-        # x_transformed = x_transformed + (lambda_reg * np.eye(x_transformed.shape[0], x_transformed.shape[1]))
-        y_prediction_scaled = np.matmul(x_transformed, radial_weights)
+        y_prediction_scaled = np.matmul(x_transformed, self.weights)
         y_prediction_unscaled = self.y_data_min + y_prediction_scaled * (
             self.y_data_max - self.y_data_min
         )
@@ -17,6 +17,7 @@ from six import string_types
 # from builtins import int, str
 import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
 import warnings
 import itertools
 
@@ -1249,8 +1250,19 @@ class CVTSampling(SamplingMethods):
         >>> b = rbf.CVTSampling(data_bounds, 10, tolerance = 1e-5, sampling_type="creation")
         >>> samples = b.sample_points()
 
+        # For 500 CVT samples in a 10-D space, with fewer random points per iteration:
+        >>> b = rbf.CVTSampling(data_bounds, 500, sampling_type="creation", points_per_centre=100, convergence_criterion="centre_shift")
+        >>> samples = b.sample_points()
+
     """
 
+    # Problems with at most this many features assign the random points to their
+    # nearest centres with a KD-tree, larger ones with batched distance products.
+    _kdtree_max_features = 6
+
+    # Maximum number of elements in the distance block of a single batch
+    _distance_block_elements = 2**22
+
     def __init__(
         self,
         data_input,
@@ -1259,6 +1271,9 @@ class CVTSampling(SamplingMethods):
         sampling_type=None,
         xlabels=None,
         ylabels=None,
+        points_per_centre=None,
+        max_iterations=None,
+        convergence_criterion=None,
     ):
         """
         Initialization of CVTSampling class. Two inputs are required, while an optional option to control the solution accuracy may be specified.
@@ -1279,6 +1294,13 @@ class CVTSampling(SamplingMethods):
 
                 - The smaller the value of tolerance, the better the solution but the longer the algorithm requires to converge. Default value is :math:`10^{-7}`.
 
+            points_per_centre(int): Number of random points drawn per centre at each iteration to estimate the mass centroids. Default is 1000.
+            max_iterations(int): Maximum number of iterations of the algorithm. Default is 1000.
+            convergence_criterion(str): Quantity compared with **tolerance** to terminate the algorithm. Two options are available:
+
+                (a) 'cost_change'  : Change between consecutive iterations of the norm of the centre displacements (Default).
+                (b) 'centre_shift' : Largest Euclidean distance moved by any centre in the last iteration.
+
         Returns:
                 **self** function containing the input information.
 
@@ -1292,6 +1314,8 @@ class CVTSampling(SamplingMethods):
 
                 Exception: When the tolerance specified is too loose (tolerance > 0.1) or invalid
 
+                Exception: When **points_per_centre** or **max_iterations** is not a positive integer, or **convergence_criterion** is invalid
+
                 warnings.warn: when the tolerance specified by the user is too tight (tolerance < :math:`10^{-9}`)
 
         """
@@ -1396,6 +1420,28 @@ class CVTSampling(SamplingMethods):
             raise Exception("Invalid tolerance input")
         self.eps = tolerance
 
+        if points_per_centre is None:
+            points_per_centre = 1000
+        elif not isinstance(points_per_centre, int) or points_per_centre <= 0:
+            raise Exception("points_per_centre must be a positive, non-zero integer.")
+        self.points_per_centre = points_per_centre
+
+        if max_iterations is None:
+            max_iterations = 1000
+        elif not isinstance(max_iterations, int) or max_iterations <= 0:
+            raise Exception("max_iterations must be a positive, non-zero integer.")
+        self.max_iterations = max_iterations
+
+        if convergence_criterion is None:
+            convergence_criterion = "cost_change"
+        elif not isinstance(convergence_criterion, string_types) or (
+            convergence_criterion.lower() not in ("cost_change", "centre_shift")
+        ):
+            raise Exception(
+                'Invalid convergence criterion entered. Enter "cost_change" or "centre_shift".'
+            )
+        self.convergence_criterion = convergence_criterion.lower()
+
     @staticmethod
     def random_sample_selection(no_samples, no_features):
         """
@@ -1460,20 +1506,62 @@ class CVTSampling(SamplingMethods):
         (3) Create the new centres as the weighted average of the current centres (initial_centres) and the mean data calculated in the second step. The weighting is done based on the number of iterations (counter).
 
         """
-        centres = np.zeros((initial_centres.shape[0], initial_centres.shape[1]))
-        current_centres = current_centres.reshape(current_centres.shape[0], 1)
-        for i in range(0, initial_centres.shape[0]):
-            data_matrix = current_random_points[current_centres[:, 0] == i]
-            m_prime, n_prime = data_matrix.shape
-            if m_prime == 0:
-                centres[i, :] = np.mean(initial_centres, axis=0)
-            else:
-                centres[i, :] = np.mean(data_matrix, axis=0)
+        no_centres = initial_centres.shape[0]
+        current_centres = np.asarray(current_centres, dtype=int).ravel()
+        # Accumulate the points and their count for each class, one pass per feature
+        centres = np.stack(
+            [
+                np.bincount(
+                    current_centres,
+                    weights=current_random_points[:, j],
+                    minlength=no_centres,
+                )
+                for j in range(initial_centres.shape[1])
+            ],
+            axis=1,
+        )
+        class_size = np.bincount(current_centres, minlength=no_centres)
+        empty = class_size == 0
+        centres[~empty] /= class_size[~empty, None]
+        if np.any(empty):
+            centres[empty] = np.mean(initial_centres, axis=0)
 
         # Weighted average based on previous number of iterations
         centres = ((counter * initial_centres) + centres) / (counter + 1)
         return centres
 
+    @classmethod
+    def nearest_centre(cls, points, centres):
+        """
+        The function nearest_centre finds the index of the closest centre to each point.
+
+        Low-dimensional problems are solved with a KD-tree built on the centres. For higher dimensions, where KD-trees lose their advantage,
+        the squared distances :math:`\|x\|^{2} - 2x \cdot c + \|c\|^{2}` are evaluated with matrix products over batches of points.
+
+        Args:
+            points(NumPy Array): A 2-D array containing the points to be classified.
+            centres(NumPy Array): A 2-D array containing the centres, with the same number of features as **points**.
+
+        Returns:
+            NumPy Array: Array of size points.shape[0] containing the index of the closest centre to each point.
+
+        """
+        if centres.shape[1] <= cls._kdtree_max_features:
+            _, nearest = cKDTree(centres).query(points)
+            return nearest
+
+        nearest = np.empty(points.shape[0], dtype=int)
+        centres_sq = np.einsum("ij,ij->i", centres, centres)
+        batch = max(1, cls._distance_block_elements // centres.shape[0])
+        for start in range(0, points.shape[0], batch):
+            block = points[start : start + batch]
+            # |x|^2 is constant over the centres, so it does not change the argmin
+            distance = block @ centres.T
+            distance *= -2
+            distance += centres_sq
+            nearest[start : start + batch] = np.argmin(distance, axis=1)
+        return nearest
+
     def sample_points(self):
         """
         The ``sample_points`` method determines the best/optimal centre points (centroids) for a data set based on the minimization of the total distance between points and centres.
@@ -1486,31 +1574,27 @@ class CVTSampling(SamplingMethods):
 
         """
         _, n = self.x_data.shape
-        size_multiple = 1000
         initial_centres = self.random_sample_selection(self.number_of_centres, n)
+        # The random points are redrawn into the same buffer at each iteration.
+        # The generator is seeded from numpy's global state so that
+        # np.random.seed still makes the samples reproducible.
+        rng = np.random.default_rng(np.random.randint(2**31))
+        current_random_points = np.empty(
+            (self.number_of_centres * self.points_per_centre, n)
+        )
         # Iterative optimization process
         cost_old = 0
         cost_new = 0
         cost_change = float("Inf")
         counter = 1
-        while (cost_change > self.eps) and (counter <= 1000):
+        while (cost_change > self.eps) and (counter <= self.max_iterations):
             cost_old = cost_new
-            current_random_points = self.random_sample_selection(
-                self.number_of_centres * size_multiple, n
+            rng.random(out=current_random_points)
+
+            # Classify the random points by nearest centre, estimate new centres
+            current_centres = self.nearest_centre(
+                current_random_points, initial_centres
             )
-            distance_matrix = np.zeros(
-                (current_random_points.shape[0], initial_centres.shape[0])
-            )  # Vector to store distances from centroids
-            current_centres = np.zeros(
-                (current_random_points.shape[0], 1)
-            )  # Vector containing the centroid each point belongs to
-
-            # Calculate distance between random points and centres, sort and estimate new centres
-            for i in range(0, self.number_of_centres):
-                distance_matrix[:, i] = self.eucl_distance(
-                    current_random_points, initial_centres[i, :]
-                )
-            current_centres = np.argmin(distance_matrix, axis=1)
             new_centres = self.create_centres(
                 initial_centres, current_random_points, current_centres, counter
             )
@@ -1518,9 +1602,11 @@ class CVTSampling(SamplingMethods):
             # Estimate distance between new and old centres
             distance_btw_centres = self.eucl_distance(new_centres, initial_centres)
             cost_new = np.sqrt(np.sum(distance_btw_centres**2))
-            cost_change = np.abs(cost_old - cost_new)
+            if self.convergence_criterion == "centre_shift":
+                cost_change = np.max(distance_btw_centres)
+            else:
+                cost_change = np.abs(cost_old - cost_new)
             counter += 1
-            # print(counter, cost_change)
             if cost_change >= self.eps:
                 initial_centres = new_centres
 
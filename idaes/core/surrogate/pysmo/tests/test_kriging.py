@@ -122,6 +122,50 @@ class TestKrigingModel:
         assert KrigingClass1.filename == file_name1
         assert KrigingClass2.filename == file_name2
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test__init__10(self, array_type):
+        input_array = array_type(self.y)
+        KrigingClass = KrigingModel(input_array, subset_size=50)
+        assert KrigingClass.x_data.shape == (50, 2)
+        assert KrigingClass.y_data.shape == (50, 1)
+        assert KrigingClass.x_data_scaled.shape == (50, 2)
+        # scaling is based on the full dataset
+        np.testing.assert_array_equal(KrigingClass.x_data_min, [[0, 0]])
+        np.testing.assert_array_equal(KrigingClass.x_data_max, [[10, 10]])
+        np.testing.assert_array_equal(
+            KrigingClass.y_data[:, 0],
+            (KrigingClass.x_data[:, 0] + 1) ** 2 + (KrigingClass.x_data[:, 1] + 1) ** 2,
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test__init__11(self, array_type):
+        input_array = array_type(self.test_data)
+        KrigingClass = KrigingModel(input_array, subset_size=50)
+        assert KrigingClass.x_data.shape == (10, 1)
+        with pytest.raises(Exception):
+            KrigingClass = KrigingModel(input_array, subset_size=1)
+        with pytest.raises(Exception):
+            KrigingClass = KrigingModel(input_array, subset_size=10.0)
+
+    @pytest.mark.unit
+    def test__init__12(self):
+        input_array = np.array(self.y)
+        K1 = KrigingModel(input_array, subset_size=50, random_state=1)
+        K2 = KrigingModel(
+            input_array, subset_size=50, random_state=np.random.default_rng(1)
+        )
+        K3 = KrigingModel(input_array, subset_size=50, random_state=2)
+        np.testing.assert_array_equal(K1.x_data, K2.x_data)
+        assert not np.array_equal(K1.x_data, K3.x_data)
+        # without a seed the subset follows numpy's global random state
+        np.random.seed(0)
+        K4 = KrigingModel(input_array, subset_size=50)
+        np.random.seed(0)
+        K5 = KrigingModel(input_array, subset_size=50)
+        np.testing.assert_array_equal(K4.x_data, K5.x_data)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_covariance_matrix_generator(self, array_type):
@@ -275,6 +319,34 @@ class TestKrigingModel:
         grad_vec_exp = np.array([0, 0, 0])
         np.testing.assert_array_equal(np.round(grad_vec, 5), np.round(grad_vec_exp, 5))
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test_analytic_gradient_01(self, array_type):
+        input_array = array_type(self.training_data)
+        KrigingClass = KrigingModel(input_array, regularization=True)
+        p = 2
+        for var_vector in [np.array([0.2, -0.5, 1e-3]), np.array([-1, 0.3, 0.05])]:
+            grad_vec = KrigingClass.analytic_gradient(
+                var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p
+            )
+            grad_vec_exp = KrigingClass.numerical_gradient(
+                var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p
+            )
+            np.testing.assert_allclose(grad_vec, grad_vec_exp, rtol=1e-5, atol=1e-6)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test_analytic_gradient_02(self, array_type):
+        input_array = array_type(self.training_data)
+        KrigingClass = KrigingModel(input_array, regularization=False)
+        p = 2
+        var_vector = np.array([0.2, -0.5, 1e-3])
+        grad_vec = KrigingClass.analytic_gradient(
+            var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p
+        )
+        assert grad_vec[-1] == 0
+        assert np.all(grad_vec[:-1] != 0)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_parameter_optimization_01(self, array_type):
@@ -1883,6 +1883,34 @@ class TestRadialBasisFunction:
         assert (lambda_best in reg_parameter) == True
         assert error_best == expected_errors
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test_leave_one_out_crossvalidation_12(self, array_type):
+        input_array = array_type(self.training_data)
+        data_feed = RadialBasisFunctions(
+            input_array, basis_function=None, solution_method=None, regularization=True
+        )
+        data_feed_threaded = RadialBasisFunctions(
+            input_array,
+            basis_function=None,
+            solution_method=None,
+            regularization=True,
+            n_jobs=2,
+        )
+        assert data_feed.n_jobs is None
+        assert data_feed_threaded.n_jobs == 2
+        assert (
+            data_feed.leave_one_out_crossvalidation()
+            == data_feed_threaded.leave_one_out_crossvalidation()
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test_leave_one_out_crossvalidation_13(self, array_type):
+        input_array = array_type(self.training_data)
+        with pytest.raises(Exception):
+            RadialBasisFunctions(input_array, n_jobs=1.5)
+
     @pytest.mark.unit
     @pytest.fixture(scope="module")
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
@@ -2194,6 +2194,56 @@ class TestCVTSampling:
         )
         np.testing.assert_array_equal(expected_output, output)
 
+    @pytest.mark.unit
+    def test_create_centres_05(self):
+        initial_centres = np.array([[0, 0], [1, 1], [0.5, 0.2]])
+        current_random_points = np.array([[0.6, 0.6], [0.8, 0.8]])
+        current_centres = np.array([1, 1])
+        counter = 1
+        expected_output = np.array(
+            [[0.5 / 2, 0.4 / 2], [1.7 / 2, 1.7 / 2], [1.0 / 2, 0.6 / 2]]
+        )
+        output = CVTSampling.create_centres(
+            initial_centres, current_random_points, current_centres, counter
+        )
+        np.testing.assert_allclose(expected_output, output)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("no_features", [2, 10])
+    def test_nearest_centre(self, no_features):
+        np.random.seed(0)
+        points = np.random.rand(500, no_features)
+        centres = np.random.rand(20, no_features)
+        expected_output = np.argmin(
+            ((points[:, None, :] - centres[None, :, :]) ** 2).sum(axis=2), axis=1
+        )
+        output = CVTSampling.nearest_centre(points, centres)
+        np.testing.assert_array_equal(expected_output, output)
+
+    @pytest.mark.unit
+    def test__init__creation_options(self):
+        input_array = self.input_array_list
+        CVTClass = CVTSampling(input_array, number_of_samples=5)
+        assert CVTClass.points_per_centre == 1000
+        assert CVTClass.max_iterations == 1000
+        assert CVTClass.convergence_criterion == "cost_change"
+        CVTClass = CVTSampling(
+            input_array,
+            number_of_samples=5,
+            points_per_centre=50,
+            max_iterations=20,
+            convergence_criterion="Centre_Shift",
+        )
+        assert CVTClass.points_per_centre == 50
+        assert CVTClass.max_iterations == 20
+        assert CVTClass.convergence_criterion == "centre_shift"
+        with pytest.raises(Exception):
+            CVTSampling(input_array, number_of_samples=5, points_per_centre=0)
+        with pytest.raises(Exception):
+            CVTSampling(input_array, number_of_samples=5, max_iterations=1.5)
+        with pytest.raises(Exception):
+            CVTSampling(input_array, number_of_samples=5, convergence_criterion="x")
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array])
     def test_sample_points_01(self, array_type):
@@ -2239,6 +2289,25 @@ class TestCVTSampling:
                 unique_sample_points.shape,
             )
 
+    @pytest.mark.unit
+    def test_sample_points_03(self):
+        input_array = [[0] * 10, [1] * 10]
+        np.random.seed(1)
+        CVTClass = CVTSampling(
+            input_array,
+            number_of_samples=50,
+            tolerance=1e-4,
+            sampling_type="creation",
+            points_per_centre=20,
+            max_iterations=50,
+            convergence_criterion="centre_shift",
+        )
+        unique_sample_points = CVTClass.sample_points()
+        assert unique_sample_points.shape == (50, 10)
+        assert (unique_sample_points >= 0).all() and (unique_sample_points <= 1).all()
+        np.random.seed(1)
+        np.testing.assert_array_equal(CVTClass.sample_points(), unique_sample_points)
+
 
 if __name__ == "__main__":
     pytest.main()
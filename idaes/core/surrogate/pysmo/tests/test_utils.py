@@ -22,7 +22,7 @@
 
 import pyomo.common.unittest as unittest
 import pytest
-from idaes.core.surrogate.pysmo.utils import NumpyEvaluator
+from idaes.core.surrogate.pysmo.utils import NumpyEvaluator, predict_in_chunks
 from pyomo.environ import ConcreteModel, Param, Var, value, sin, atan, atanh
 from pyomo.core import ComponentMap
 
@@ -90,5 +90,46 @@ class TestNumpyEvaluator:
         assert value(expr) == pytest.approx(6.75, rel=1e-12)
 
 
+@unittest.skipIf(not _numpy_available, "Test requires numpy")
+class TestPredictInChunks:
+    @staticmethod
+    def _predict(x):
+        return np.sum(x**2, axis=1).reshape(x.shape[0], 1)
+
+    @pytest.mark.unit
+    def test_chunks(self):
+        x = np.arange(30, dtype=float).reshape(10, 3)
+        expected = self._predict(x)
+        for chunk_size in [1, 3, 10, 20]:
+            result = predict_in_chunks(self._predict, x, chunk_size=chunk_size)
+            assert result.shape == (10, 1)
+            np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.unit
+    def test_threads(self):
+        x = np.arange(300, dtype=float).reshape(100, 3)
+        expected = self._predict(x)
+        for n_jobs in [2, -1]:
+            result = predict_in_chunks(self._predict, x, chunk_size=7, n_jobs=n_jobs)
+            np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.unit
+    def test_default_chunk_size(self):
+        sizes = []
+
+        def predict(x):
+            sizes.append(x.shape[0])
+            return x
+
+        x = np.zeros((10, 1))
+        predict_in_chunks(predict, x, elements_per_row=2**20)
+        assert sizes == [4, 4, 2]
+
+    @pytest.mark.unit
+    def test_bad_chunk_size(self):
+        with pytest.raises(ValueError):
+            predict_in_chunks(self._predict, np.zeros((2, 2)), chunk_size=0)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -22,6 +22,8 @@
 
 __author__ = "Oluwamayowa Amusat, John Siirola"
 
+from concurrent.futures import ThreadPoolExecutor
+
 from pyomo.core.expr import current as EXPR, native_types
 from pyomo.core.expr.numvalue import value
 from pyomo.common.collections import ComponentMap
@@ -92,3 +94,45 @@ class NumpyEvaluator(EXPR.StreamBasedExpressionVisitor):
         # Assume everything else is a constant...
         #
         return False, value(child)
+
+
+# Approximate number of array elements in the temporary arrays made for one
+# chunk of predictions, about 32 MB of float64 values.
+_chunk_elements = 2**22
+
+
+def predict_in_chunks(predict, x, elements_per_row=1, chunk_size=None, n_jobs=None):
+    """
+    Evaluate a batched prediction function on blocks of rows of x and stack
+    the results, so the temporary arrays made by predict stay a bounded size.
+
+    Args:
+        predict(callable): function taking a 2-D array of rows and returning
+            an array with one row of predictions per row.
+        x(NumPy Array): 2-D array of points to predict.
+        elements_per_row(int): approximate number of temporary array elements
+            predict makes for each row, used to pick the default chunk size.
+        chunk_size(int): number of rows in each chunk, if None the size is
+            chosen from elements_per_row.
+        n_jobs(int): number of threads to evaluate chunks with, None or 1 to
+            evaluate chunks in this thread, -1 to use one thread per CPU.
+
+    Returns:
+        NumPy Array: the stacked predictions
+    """
+    if chunk_size is None:
+        chunk_size = max(1, _chunk_elements // max(1, int(elements_per_row)))
+    chunk_size = int(chunk_size)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    n = x.shape[0]
+    if n <= chunk_size:
+        return predict(x)
+    chunks = [x[i : i + chunk_size] for i in range(0, n, chunk_size)]
+    if n_jobs is None or n_jobs == 1:
+        results = [predict(c) for c in chunks]
+    else:
+        workers = None if n_jobs < 0 else int(n_jobs)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(predict, chunks))
+    return numpy.concatenate(results, axis=0)
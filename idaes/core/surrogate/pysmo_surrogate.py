@@ -13,10 +13,13 @@
 
 
 # stdlib
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
 import io
 import json
 from json import JSONEncoder, JSONDecodeError
 import logging
+import os
 from typing import Dict, Union
 
 # third-party
@@ -28,7 +31,7 @@ import pyomo.core as pc
 from pyomo.core.base.param import Param
 from pyomo.environ import Constraint, sin, cos, log, exp, Set, Reals
 from pyomo.common.config import ConfigValue, In, Bool
-from pyomo.common.config import PositiveInt, PositiveFloat
+from pyomo.common.config import PositiveInt, PositiveFloat, NonNegativeInt
 from idaes.core.surrogate.base.surrogate_base import SurrogateTrainer, SurrogateBase
 from idaes.core.surrogate.pysmo import (
     polynomial_regression as pr,
@@ -161,6 +164,17 @@ class PysmoTrainer(SurrogateTrainer):
     # Initialize with configuration for base SurrogateTrainer
     CONFIG = SurrogateTrainer.CONFIG()
 
+    CONFIG.declare(
+        "n_jobs",
+        ConfigValue(
+            default=None,
+            domain=int,
+            description="Number of processes used to train the models for different outputs "
+            "in parallel. None or 1 trains the outputs one at a time in this process, "
+            "-1 uses one process per CPU.",
+        ),
+    )
+
     # Subclasses must override this with a specific surrogate model type name
     model_type = "base"
 
@@ -204,25 +218,71 @@ class PysmoTrainer(SurrogateTrainer):
         return {}
 
     def _training_main_loop(self):
-        for i, output_label in enumerate(self._output_labels):
-            # Create input dataframe
-            pysmo_input = pd.concat(
-                [
-                    self._training_dataframe[self._input_labels],
-                    self._training_dataframe[[self._output_labels[i]]],
-                ],
-                axis=1,
-            )
-            # Create and train model
-            model = self._create_model(pysmo_input, output_label)
-            model.training()
-            # Store results
-            result = PysmoSurrogateTrainingResult()
-            result.model = model
-            result.metrics = self._get_metrics(model)
-            self._trained.add_result(output_label, result)
-            # Log the status
-            _log.info(f"Model for output {output_label} trained successfully")
+        n_jobs = self.config.n_jobs
+        if n_jobs is None or n_jobs == 1 or len(self._output_labels) < 2:
+            for output_label in self._output_labels:
+                model, metrics = self._train_output(output_label)
+                self._add_trained_result(output_label, model, metrics)
+            return
+
+        # Train the outputs in a process pool, the printed output of each
+        # training is captured and logged per output
+        workers = None if n_jobs < 0 else n_jobs
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_train_output_in_process, self, output_label)
+                for output_label in self._output_labels
+            ]
+            for output_label, future in zip(self._output_labels, futures):
+                model, metrics, training_log = future.result()
+                if training_log:
+                    _log.debug(
+                        f"Training log for output {output_label}:\n{training_log}"
+                    )
+                self._add_trained_result(output_label, model, metrics)
+
+    def _train_output(self, output_label, filename=None):
+        """
+        Create and train the model for one output, and return it with its metrics.
+        If filename is given, the PySMO model saves its results there instead of
+        the default pickle file.
+        """
+        # Create input dataframe
+        pysmo_input = pd.concat(
+            [
+                self._training_dataframe[self._input_labels],
+                self._training_dataframe[[output_label]],
+            ],
+            axis=1,
+        )
+        # Create and train model
+        model = self._create_model(pysmo_input, output_label)
+        if filename is not None:
+            model.filename = filename
+        model.training()
+        return model, self._get_metrics(model)
+
+    def _add_trained_result(self, output_label, model, metrics):
+        # Store results
+        result = PysmoSurrogateTrainingResult()
+        result.model = model
+        result.metrics = metrics
+        self._trained.add_result(output_label, result)
+        # Log the status
+        _log.info(f"Model for output {output_label} trained successfully")
+
+
+def _train_output_in_process(trainer, output_label):
+    """
+    Train the model for one output in a process pool worker. Returns the
+    model, its metrics and the text printed during training. The workers
+    would all save their results to the same default pickle file at the same
+    time, so the results are not saved.
+    """
+    training_log = io.StringIO()
+    with contextlib.redirect_stdout(training_log):
+        model, metrics = trainer._train_output(output_label, filename=os.devnull)
+    return model, metrics, training_log.getvalue()
 
 
 class PysmoPolyTrainer(PysmoTrainer):
@@ -341,7 +401,7 @@ class PysmoRBFTrainer(PysmoTrainer):
     base_model_type = "rbf"
     model_type = "rbf"
 
-    CONFIG = SurrogateTrainer.CONFIG()
+    CONFIG = PysmoTrainer.CONFIG()
 
     CONFIG.declare(
         "basis_function",
@@ -371,6 +431,17 @@ class PysmoRBFTrainer(PysmoTrainer):
         ),
     )
 
+    CONFIG.declare(
+        "loocv_n_jobs",
+        ConfigValue(
+            default=None,
+            domain=int,
+            description="Number of threads used to evaluate the leave-one-out cross-validation "
+            "error over the grid of shape and regularization parameters for each model. "
+            "None or 1 evaluates the grid in one thread, -1 uses one thread per CPU.",
+        ),
+    )
+
     def __init__(self, **settings):
         super().__init__(**settings)
         self.model_type = f"{self.config.basis_function} {self.base_model_type}"
@@ -382,6 +453,7 @@ class PysmoRBFTrainer(PysmoTrainer):
             solution_method=self.config.solution_method,
             regularization=self.config.regularization,
             overwrite=True,
+            n_jobs=self.config.loocv_n_jobs,
         )
         variable_headers = model.get_feature_vector()
         return model
@@ -426,6 +498,27 @@ class PysmoKrigingTrainer(PysmoTrainer):
         ),
     )
 
+    CONFIG.declare(
+        "subset_size",
+        ConfigValue(
+            default=None,
+            domain=PositiveInt,
+            description="Maximum number of training samples used to train each Kriging model. "
+            "For larger datasets a random subset of this size is used, since training time grows "
+            "with the cube of the number of samples. Default (None) uses all samples.",
+        ),
+    )
+
+    CONFIG.declare(
+        "random_state",
+        ConfigValue(
+            default=None,
+            domain=NonNegativeInt,
+            description="Seed for drawing the training subset when subset_size is set. "
+            "Default (None) uses numpy's global random state.",
+        ),
+    )
+
     def __init__(self, **settings):
         super().__init__(**settings)
 
@@ -435,6 +528,8 @@ class PysmoKrigingTrainer(PysmoTrainer):
             numerical_gradients=self.config.numerical_gradients,
             regularization=self.config.regularization,
             overwrite=True,
+            subset_size=self.config.subset_size,
+            random_state=self.config.random_state,
         )
         variable_headers = model.get_feature_vector()
         return model
@@ -467,26 +562,36 @@ class PysmoSurrogate(SurrogateBase):
             input_bounds,
         )
 
-    def evaluate_surrogate(self, inputs: pd.DataFrame) -> pd.DataFrame:
+    def evaluate_surrogate(
+        self, inputs: pd.DataFrame, chunk_size: int = None, n_jobs: int = None
+    ) -> pd.DataFrame:
         """Evaluate the surrogate model at a set of user-provided values.
 
         Args:
             inputs: The dataframe of input values to be used in the evaluation.
                 The dataframe needs to contain a column corresponding to each of the input labels.
                 Additional columns are fine, but are not used.
+            chunk_size: Number of input rows each model evaluates at once, if None
+                the models choose a size that limits the memory used.
+            n_jobs: Number of threads each model uses to evaluate chunks of rows,
+                None or 1 to use only the calling thread, -1 to use one thread per CPU.
 
         Returns:
             output: A dataframe of the the output values evaluated at the provided inputs.
                 The index of the output dataframe should match the index of the provided inputs.
         """
-        inputdata = inputs[self._input_labels].to_numpy()
+        inputdata = inputs[self._input_labels].to_numpy(dtype=float)
         outputs = np.zeros(shape=(inputs.shape[0], len(self._output_labels)))
 
-        for i in range(inputdata.shape[0]):
-            row_data = inputdata[i, :].reshape(1, len(self._input_labels))
+        if inputdata.shape[0] > 0:
             for j, output_label in enumerate(self._output_labels):
                 result = self._trained.get_result(output_label)
-                outputs[i, j] = result.model.predict_output(row_data)
+                outputs[:, j] = np.reshape(
+                    result.model.predict_output(
+                        inputdata, chunk_size=chunk_size, n_jobs=n_jobs
+                    ),
+                    (-1,),
+                )
 
         return pd.DataFrame(
             data=outputs, index=inputs.index, columns=self._output_labels
@@ -698,6 +698,8 @@ class TestPysmoRBFTrainer:
         assert pysmo_rbf_trainer.config.basis_function == None
         assert pysmo_rbf_trainer.config.regularization == None
         assert pysmo_rbf_trainer.config.solution_method == None
+        assert pysmo_rbf_trainer.config.n_jobs == None
+        assert pysmo_rbf_trainer.config.loocv_n_jobs == None
 
     @pytest.mark.unit
     def test_set_basis_function_righttype_1(self, pysmo_rbf_trainer):
@@ -859,6 +861,55 @@ class TestPysmoRBFTrainer:
         # assert model.filename == 'pysmo_Nonerbf_z5.pickle'
         assert list(model.feature_list._data.keys()) == data.columns.tolist()[:-1]
 
+    @pytest.mark.unit
+    def test_create_model_loocv_n_jobs(self, pysmo_rbf_trainer):
+        pysmo_rbf_trainer.config.loocv_n_jobs = 2
+
+        output_label = "z5"
+        data = {"x1": [1, 2, 3, 4], "x2": [5, 6, 7, 8], "z1": [10, 20, 30, 40]}
+        data = pd.DataFrame(data)
+
+        model = pysmo_rbf_trainer._create_model(data, output_label)
+        assert model.n_jobs == 2
+
+    @pytest.mark.unit
+    def test_train_surrogate_n_jobs(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        x = np.linspace(0, 10, 6)
+        data = pd.DataFrame(
+            {
+                "x1": np.repeat(x, 6),
+                "x2": np.tile(x, 6),
+            }
+        )
+        data["z1"] = data["x1"] ** 2 + data["x2"]
+        data["z2"] = data["x1"] - 2 * data["x2"] ** 2
+        data["z3"] = data["x1"] * data["x2"]
+        settings = dict(
+            input_labels=["x1", "x2"],
+            output_labels=["z1", "z2", "z3"],
+            training_dataframe=data,
+            basis_function="cubic",
+            solution_method="algebraic",
+            regularization=True,
+        )
+        parallel = PysmoRBFTrainer(n_jobs=2, **settings).train_surrogate()
+        # the workers do not save their results to the default pickle file
+        assert not os.path.exists("solution.pickle")
+        serial = PysmoRBFTrainer(**settings).train_surrogate()
+
+        assert list(parallel._data) == ["z1", "z2", "z3"]
+        for label in ["z1", "z2", "z3"]:
+            np.testing.assert_allclose(
+                parallel._data[label].model.weights,
+                serial._data[label].model.weights,
+            )
+            assert parallel._data[label].metrics == serial._data[label].metrics
+            assert (
+                parallel._data[label].expression_str
+                == serial._data[label].expression_str
+            )
+
 
 class TestPysmoKrigingTrainer:
     @pytest.fixture
@@ -1659,6 +1710,18 @@ class TestPysmoSurrogate:
                 )
             )
 
+    @pytest.mark.unit
+    def test_evaluate_unisurrogate_rbf_chunked(self, pysmo_surr5_rbf):
+        # Test ``evaluate_surrogate`` gives the same values in chunks and threads
+        inputs = pd.DataFrame(np.linspace(1.0, 5.0, 101), columns=["x1"])
+
+        sol, rbf_trained = pysmo_surr5_rbf
+        out = rbf_trained.evaluate_surrogate(inputs)
+        out_chunked = rbf_trained.evaluate_surrogate(inputs, chunk_size=7, n_jobs=3)
+        assert list(out_chunked.index) == list(inputs.index)
+        for i in range(inputs.shape[0]):
+            assert pytest.approx(out["z1"][i], rel=1e-12) == out_chunked["z1"][i]
+
     @pytest.mark.unit
     def test_populate_block_unisurrogate_rbf(self, pysmo_surr5_rbf):
         # Test ``populate_block`` for RBF with one input/output
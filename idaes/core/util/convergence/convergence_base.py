@@ -59,23 +59,27 @@ See the documentation in convergence.py for more information.
 """
 # stdlib
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import getpass
 import importlib as il
 import json
 import logging
 import numpy as np
+import os
 import sys
 from io import StringIO
+from time import perf_counter
 
 # pyomo
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.common.tee import capture_output
-from pyomo.core import Param, Var
+from pyomo.core import Param, Suffix, Var
 from pyomo.opt import TerminationCondition
 from pyomo.common.log import LoggingIntercept
 
 # idaes
 import idaes.core.util.convergence.mpi_utils as mpiu
+from idaes.core.util.model_serializer import StateCheckpointer, StoreSpec
 from idaes.dmf import resource
 import idaes.logger as idaeslog
 
@@ -97,8 +101,21 @@ def register_convergence_class(name):
 
 
 class ConvergenceEvaluationSpecification(object):
-    def __init__(self):
+    def __init__(self, warm_start=False, warm_start_cache_size=10):
+        """
+        Parameters
+        ----------
+        warm_start : bool
+           If True, the convergence evaluation solves the samples in a nearest
+           neighbor order, starting each sample from the stored solution
+           (including IPOPT duals) of the nearest sample already solved. If
+           False, each sample is solved starting from the initialized model.
+        warm_start_cache_size : int
+           The maximum number of sample solutions to keep for warm starts
+        """
         self._inputs = OrderedDict()
+        self.warm_start = warm_start
+        self.warm_start_cache_size = warm_start_cache_size
 
     def add_sampled_input(
         self, name, pyomo_path, lower, upper, mean=None, std=None, distribution="normal"
@@ -223,7 +240,9 @@ def _class_import(class_path):
     return ret_class
 
 
-def _run_ipopt_with_stats(model, solver, max_iter=500, max_cpu_time=120):
+def _run_ipopt_with_stats(
+    model, solver, max_iter=500, max_cpu_time=120, warm_start=False
+):
     """
     Run the solver (must be ipopt) and return the convergence statistics
 
@@ -242,6 +261,10 @@ def _run_ipopt_with_stats(model, solver, max_iter=500, max_cpu_time=120):
     max_cpu_time : int
        The maximum cpu time to allow for ipopt (in seconds)
 
+    warm_start : bool
+       If True, tell ipopt to start from the current variable values and the
+       multipliers in the dual, ipopt_zL_in and ipopt_zU_in suffixes
+
     Returns
     -------
        Returns a tuple with (solve status object, bool (solve successful or
@@ -252,6 +275,8 @@ def _run_ipopt_with_stats(model, solver, max_iter=500, max_cpu_time=120):
     TempfileManager.push()
     tempfile = TempfileManager.create_tempfile(suffix="ipopt_out", text=True)
     opts = {"output_file": tempfile, "max_iter": max_iter, "max_cpu_time": max_cpu_time}
+    if warm_start:
+        opts.update(_warm_start_options)
 
     status_obj = solver.solve(model, options=opts, tee=True)
     solved = True
@@ -281,6 +306,16 @@ def _run_ipopt_with_stats(model, solver, max_iter=500, max_cpu_time=120):
     return status_obj, solved, iters, time
 
 
+# ipopt options for starting from a stored solution, the default bound pushes
+# would move the starting point away from a solution with active bounds
+_warm_start_options = {
+    "warm_start_init_point": "yes",
+    "warm_start_bound_push": 1e-8,
+    "warm_start_mult_bound_push": 1e-8,
+    "mu_init": 1e-6,
+}
+
+
 def _progress_bar(fraction, msg, length=20):
     length = length - 2
     n_complete = int(length * fraction)
@@ -405,12 +440,15 @@ def write_sample_file(
     jsondict["seed"] = seed
     jsondict["samples"] = samples
     jsondict["convergence_evaluation_class_str"] = convergence_evaluation_class_str
+    if eval_spec.warm_start:
+        jsondict["warm_start"] = eval_spec.warm_start
+        jsondict["warm_start_cache_size"] = eval_spec.warm_start_cache_size
 
     with open(filename, "w") as fd:
         json.dump(jsondict, fd, indent=3)
 
 
-def run_convergence_evaluation_from_sample_file(sample_file):
+def run_convergence_evaluation_from_sample_file(sample_file, **kwargs):
     # load the sample file
     try:
         with open(sample_file, "r") as fd:
@@ -430,7 +468,7 @@ def run_convergence_evaluation_from_sample_file(sample_file):
             f"Invalid value specified for convergence_evaluation_class_str:"
             "{convergence_evaluation_class_str} in sample file: {sample_file}"
         )
-    return run_convergence_evaluation(jsondict, conv_eval)
+    return run_convergence_evaluation(jsondict, conv_eval, **kwargs)
 
 
 def run_single_sample_from_sample_file(sample_file, name):
@@ -465,7 +503,274 @@ def run_single_sample(sample_file_dict, conv_eval, name):
     return _run_ipopt_with_stats(model, solver)
 
 
-def run_convergence_evaluation(sample_file_dict, conv_eval):
+def _evaluate_sample(model, solver, inputs, sample_point, warm_start=False):
+    """
+    Set the sample point on the model, solve it and return the results
+    dictionary for the sample.
+    """
+    sample_name = sample_point["_name"]
+    # capture the output
+    # ToDo: make this an option and turn off for single sample execution
+    output_buffer = StringIO()
+    start = perf_counter()
+    with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
+        with capture_output():  # as str_out:
+            _set_model_parameters_from_sample(model, inputs, sample_point)
+            (status_obj, solved, iters, time) = _run_ipopt_with_stats(
+                model, solver, warm_start=warm_start
+            )
+    wall_time = perf_counter() - start
+
+    if not solved:
+        _log.error(f"Sample: {sample_name} failed to converge.")
+
+    results_dict = OrderedDict()
+    results_dict["name"] = sample_name
+    results_dict["sample_point"] = sample_point
+    results_dict["solved"] = solved
+    results_dict["iters"] = iters
+    results_dict["time"] = time
+    results_dict["wall_time"] = wall_time
+    results_dict["status"] = str(status_obj.solver.termination_condition)
+    results_dict["warm_start"] = warm_start
+    return results_dict
+
+
+# State of a process pool worker, the model is built and initialized once per
+# worker and reset to the baseline state before each sample.
+_worker_state = {}
+
+
+def _process_worker_init(conv_eval):
+    output_buffer = StringIO()
+    with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
+        with capture_output():
+            model = conv_eval.get_initialized_model()
+    checkpointer = StateCheckpointer(model, max_checkpoints=1)
+    _worker_state["model"] = model
+    _worker_state["solver"] = conv_eval.get_solver()
+    _worker_state["checkpointer"] = checkpointer
+    _worker_state["baseline"] = checkpointer.save()
+
+
+def _process_worker_run(inputs, sample_point):
+    # the last solve may have changed anything in the model
+    _worker_state["checkpointer"].restore(_worker_state["baseline"])
+    return _evaluate_sample(
+        _worker_state["model"], _worker_state["solver"], inputs, sample_point
+    )
+
+
+def _normalized_sample_points(inputs, samples_list):
+    """
+    Return an array with a row for each sample point, with the inputs scaled
+    by their lower and upper bounds so distances between points do not depend
+    on the units of the inputs.
+    """
+    x = np.array(
+        [[float(ss[k]) for k in inputs] for ss in samples_list], dtype=float
+    ).reshape(len(samples_list), len(inputs))
+    lower = np.array([inputs[k]["lower"] for k in inputs], dtype=float)
+    upper = np.array([inputs[k]["upper"] for k in inputs], dtype=float)
+    scale = upper - lower
+    scale[~(scale > 0)] = 1.0
+    return (x - lower) / scale
+
+
+def _nearest_neighbor_tour(x):
+    """
+    Order points so each point is followed by the nearest point not yet
+    visited, starting from the point closest to the center of the points.
+
+    Parameters
+    ----------
+    x : numpy array
+       Array of points, one point per row
+
+    Returns
+    -------
+       List of row indexes in tour order
+    """
+    n = x.shape[0]
+    if n == 0:
+        return []
+    remaining = np.ones(n, dtype=bool)
+    i = int(np.argmin(np.sum((x - np.mean(x, axis=0)) ** 2, axis=1)))
+    tour = [i]
+    remaining[i] = False
+    for _ in range(n - 1):
+        d = np.sum((x - x[i]) ** 2, axis=1)
+        d[~remaining] = np.inf
+        i = int(np.argmin(d))
+        tour.append(i)
+        remaining[i] = False
+    return tour
+
+
+class _SolutionCache(object):
+    """
+    A bounded cache of solved sample states used to warm start the following
+    samples. The initialized model state is kept as well, to solve from when
+    the cache is empty. When the cache is full, the least recently used
+    solution is dropped.
+    """
+
+    _suffixes = ("dual", "ipopt_zL_out", "ipopt_zU_out")
+
+    def __init__(self, model, max_size):
+        if max_size < 1:
+            raise ValueError("warm_start_cache_size must be at least 1")
+        _add_warm_start_suffixes(model)
+        wts = StoreSpec.value_isfixed_isactive(only_fixed=False)
+        wts.classes[Suffix] = ((), None)
+        wts.suffix_filter = self._suffixes
+        self.model = model
+        self.max_size = max_size
+        self._checkpointer = StateCheckpointer(
+            model, wts=wts, max_checkpoints=max_size + 1
+        )
+        self._baseline = self._checkpointer.save()
+        self._points = OrderedDict()
+
+    def __len__(self):
+        return len(self._points)
+
+    def nearest(self, point):
+        """Return the name of the cached solution closest to point, or None."""
+        if not self._points:
+            return None
+        names = list(self._points)
+        d = np.sum((np.array(list(self._points.values())) - point) ** 2, axis=1)
+        return names[int(np.argmin(d))]
+
+    def add(self, name, point):
+        """Store the current model state as the solution of sample name."""
+        self._points.pop(name, None)
+        while len(self._points) >= self.max_size:
+            old, _ = self._points.popitem(last=False)
+            self._checkpointer.discard(("solution", old))
+        self._checkpointer.save(("solution", name))
+        self._points[name] = point
+
+    def restore(self, name):
+        """
+        Set the model state to the stored solution of sample name and use the
+        solution bound multipliers as the starting point for the next solve.
+        """
+        self._checkpointer.restore(("solution", name))
+        self._points.move_to_end(name)
+        m = self.model
+        m.ipopt_zL_in.clear()
+        m.ipopt_zL_in.update(m.ipopt_zL_out)
+        m.ipopt_zU_in.clear()
+        m.ipopt_zU_in.update(m.ipopt_zU_out)
+
+    def restore_baseline(self):
+        """Set the model state back to the initialized model."""
+        self._checkpointer.restore(self._baseline)
+
+
+def _add_warm_start_suffixes(model):
+    """
+    Add the suffixes ipopt needs to import and export multipliers, if the
+    model does not already have them.
+    """
+    directions = {
+        "dual": Suffix.IMPORT_EXPORT,
+        "ipopt_zL_out": Suffix.IMPORT,
+        "ipopt_zU_out": Suffix.IMPORT,
+        "ipopt_zL_in": Suffix.EXPORT,
+        "ipopt_zU_in": Suffix.EXPORT,
+    }
+    for name, direction in directions.items():
+        s = model.component(name)
+        if s is None:
+            model.add_component(name, Suffix(direction=direction))
+        elif s.ctype is not Suffix:
+            raise ValueError(
+                f"Model component {name} is not a Suffix, it is needed to "
+                "store ipopt multipliers for warm starts."
+            )
+        else:
+            s.set_direction(direction)
+
+
+def _run_warm_start_chain(
+    model, solver, inputs, samples_list, points, cache_size, progress=None
+):
+    """
+    Solve the samples in order on one model, starting each sample from the
+    solution of the nearest sample already solved.
+
+    Parameters
+    ----------
+    model : Pyomo model
+       The initialized model
+    solver : Pyomo solver
+       The solver to use, must be ipopt
+    inputs : dict
+       The inputs dictionary from the sample file
+    samples_list : list
+       The sample points to solve, in the order they should be solved
+    points : numpy array
+       The normalized sample points, one row for each sample in samples_list
+    cache_size : int
+       The maximum number of solutions to keep for warm starts
+    progress : callable or None
+       Called with the index and name of each sample before it is solved
+
+    Returns
+    -------
+       List of results dictionaries in the same order as samples_list
+    """
+    cache = _SolutionCache(model, cache_size)
+    results = list()
+    for i, ss in enumerate(samples_list):
+        sample_name = ss["_name"]
+        if progress is not None:
+            progress(i, sample_name)
+        neighbor = cache.nearest(points[i])
+        if neighbor is None:
+            cache.restore_baseline()
+        else:
+            cache.restore(neighbor)
+        r = _evaluate_sample(
+            model, solver, inputs, ss, warm_start=neighbor is not None
+        )
+        r["warm_start_from"] = neighbor
+        if r["solved"]:
+            cache.add(sample_name, points[i])
+        results.append(r)
+    return results
+
+
+def _read_results_file(results_file):
+    """
+    Read the per-sample results already written to a results file. Each line
+    is one json results dictionary, a partly written last line is ignored.
+    """
+    results = OrderedDict()
+    if results_file is None or not os.path.exists(results_file):
+        return results
+    with open(results_file, "r") as fd:
+        for line in fd:
+            try:
+                r = json.loads(line, object_pairs_hook=OrderedDict)
+            except json.JSONDecodeError:
+                _log.warning(f"Ignoring incomplete line in {results_file}")
+                continue
+            results[r["name"]] = r
+    return results
+
+
+def run_convergence_evaluation(
+    sample_file_dict,
+    conv_eval,
+    n_workers=None,
+    results_file=None,
+    warm_start=None,
+    warm_start_cache_size=None,
+):
     """
     Run convergence evaluation and generate the statistics based on information
     in the sample_file.
@@ -479,6 +784,33 @@ def run_convergence_evaluation(sample_file_dict, conv_eval):
     conv_eval : ConvergenceEvaluation
         The ConvergenceEvaluation object that should be used
 
+    n_workers : int or None
+        If None, run the samples in this process (or distributed over MPI
+        processes if run under MPI), building a new model for each sample. If
+        an int, run the samples in a pool of n_workers processes. Each worker
+        builds and initializes the model once, and resets it to the initialized
+        state before each sample. This does not require MPI, and conv_eval must
+        be picklable.
+
+    results_file : str or None
+        Optional path of a file to append the results of each sample to as it
+        finishes (one json dictionary per line). If the file already exists,
+        samples with results in the file are not run again, so an interrupted
+        evaluation can be resumed. Only used when n_workers is given.
+
+    warm_start : bool or None
+        If True, build the model once (per MPI process) and solve the samples
+        in a nearest neighbor order, starting each sample from the stored
+        solution, including IPOPT duals, of the nearest sample already solved.
+        The results record which samples were warm started so the statistics
+        can report cold and warm start iterations separately. If None, use the
+        warm_start setting from the sample file (default False). Cannot be
+        used with n_workers.
+
+    warm_start_cache_size : int or None
+        Maximum number of solutions to keep for warm starts. If None, use the
+        setting from the sample file (default 10).
+
     Returns
     -------
        N/A
@@ -496,6 +828,23 @@ def run_convergence_evaluation(sample_file_dict, conv_eval):
         samples_list.append(v)
     n_samples = len(samples_list)
 
+    if warm_start is None:
+        warm_start = sample_file_dict.get("warm_start", False)
+    if warm_start_cache_size is None:
+        warm_start_cache_size = sample_file_dict.get("warm_start_cache_size", 10)
+
+    if n_workers is not None:
+        if warm_start:
+            raise ValueError("warm_start cannot be used with n_workers")
+        return _run_convergence_evaluation_pool(
+            inputs, samples, samples_list, conv_eval, n_workers, results_file
+        )
+
+    if warm_start:
+        return _run_convergence_evaluation_warm_start(
+            inputs, samples, samples_list, conv_eval, warm_start_cache_size
+        )
+
     task_mgr = mpiu.ParallelTaskManager(n_samples)
     local_samples_list = task_mgr.global_to_local_data(samples_list)
 
@@ -509,28 +858,113 @@ def run_convergence_evaluation(sample_file_dict, conv_eval):
                 "Root Process: {}".format(sample_name),
             )
 
-        # capture the output
-        # ToDo: make this an option and turn off for single sample execution
         output_buffer = StringIO()
         with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
-            with capture_output():  # as str_out:
+            with capture_output():
                 model = conv_eval.get_initialized_model()
-                _set_model_parameters_from_sample(model, inputs, ss)
-                solver = conv_eval.get_solver()
-                (status_obj, solved, iters, time) = _run_ipopt_with_stats(model, solver)
+        solver = conv_eval.get_solver()
+        results.append(_evaluate_sample(model, solver, inputs, ss))
+
+    global_results = task_mgr.gather_global_data(results)
+    return inputs, samples, global_results
 
-        if not solved:
-            _log.error(f"Sample: {sample_name} failed to converge.")
 
-        results_dict = OrderedDict()
-        results_dict["name"] = sample_name
-        results_dict["sample_point"] = ss
-        results_dict["solved"] = solved
-        results_dict["iters"] = iters
-        results_dict["time"] = time
-        results.append(results_dict)
+def _run_convergence_evaluation_warm_start(
+    inputs, samples, samples_list, conv_eval, cache_size
+):
+    """
+    Run the convergence evaluation samples as warm started chains, see
+    run_convergence_evaluation. The samples are put in nearest neighbor order
+    before they are split between MPI processes, so each process gets a run
+    of samples that are close together.
+    """
+    points = _normalized_sample_points(inputs, samples_list)
+    tour = _nearest_neighbor_tour(points)
+    task_mgr = mpiu.ParallelTaskManager(len(samples_list))
+    local_tour = task_mgr.global_to_local_data(tour)
+    local_samples_list = [samples_list[i] for i in local_tour]
+
+    def _progress(i, sample_name):
+        if task_mgr.is_root():
+            _progress_bar(
+                float(i) / float(len(local_samples_list)),
+                "Root Process: {}".format(sample_name),
+            )
+
+    results = list()
+    if local_samples_list:
+        output_buffer = StringIO()
+        with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
+            with capture_output():
+                model = conv_eval.get_initialized_model()
+        results = _run_warm_start_chain(
+            model,
+            conv_eval.get_solver(),
+            inputs,
+            local_samples_list,
+            points[local_tour],
+            cache_size,
+            progress=_progress,
+        )
 
     global_results = task_mgr.gather_global_data(results)
+    if global_results is not None:
+        # return results in the sample order
+        by_name = {r["name"]: r for r in global_results}
+        global_results = [by_name[ss["_name"]] for ss in samples_list]
+    return inputs, samples, global_results
+
+
+def _run_convergence_evaluation_pool(
+    inputs, samples, samples_list, conv_eval, n_workers, results_file
+):
+    """
+    Run the convergence evaluation samples in a process pool, see
+    run_convergence_evaluation.
+    """
+    done = _read_results_file(results_file)
+    remaining = [ss for ss in samples_list if ss["_name"] not in done]
+    if done:
+        _log.info(
+            f"Resuming convergence evaluation, {len(done)} of "
+            f"{len(samples_list)} samples already in {results_file}"
+        )
+
+    if remaining:
+        fd = None
+        if results_file is not None:
+            fd = open(results_file, "a+")
+            # make sure a partly written last line doesn't run into new results
+            if fd.tell() > 0:
+                fd.seek(fd.tell() - 1)
+                if fd.read(1) != "\n":
+                    fd.write("\n")
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_process_worker_init,
+                initargs=(conv_eval,),
+            ) as executor:
+                futures = [
+                    executor.submit(_process_worker_run, inputs, ss)
+                    for ss in remaining
+                ]
+                for n, future in enumerate(as_completed(futures)):
+                    r = future.result()
+                    done[r["name"]] = r
+                    if fd is not None:
+                        fd.write(json.dumps(r) + "\n")
+                        fd.flush()
+                    _progress_bar(
+                        float(n + 1) / float(len(remaining)),
+                        "Finished: {}".format(r["name"]),
+                    )
+        finally:
+            if fd is not None:
+                fd.close()
+
+    # return results in the sample order
+    global_results = [done[ss["_name"]] for ss in samples_list]
     return inputs, samples, global_results
 
 
@@ -608,6 +1042,27 @@ class Stats(object):
             self.time_std = float(np.std(self.time_successful))
             self.time_max = float(np.max(self.time_successful))
 
+        # separate cold and warm start data for warm started evaluations
+        self.n_warm_start = 0
+        self.iters_cold_mean = 0
+        self.iters_warm_mean = 0
+        self.time_cold_mean = 0
+        self.time_warm_mean = 0
+        iters = {True: [], False: []}
+        times = {True: [], False: []}
+        for r in results:
+            warm = bool(r.get("warm_start", False))
+            self.n_warm_start += warm
+            if r["solved"] is True:
+                iters[warm].append(r["iters"])
+                times[warm].append(r["time"])
+        if len(iters[False]) > 0:
+            self.iters_cold_mean = float(np.mean(iters[False]))
+            self.time_cold_mean = float(np.mean(times[False]))
+        if len(iters[True]) > 0:
+            self.iters_warm_mean = float(np.mean(iters[True]))
+            self.time_warm_mean = float(np.mean(times[True]))
+
         for r in results:
             flag = ""
             if r["solved"] is not True:
@@ -702,6 +1157,19 @@ class Stats(object):
             f"{s.time_max:10.3g}\n"
         )
         fp.write(f"{'-'*70}\n\n")
+        if getattr(s, "n_warm_start", 0) > 0:
+            fp.write(f"Number of Warm Started Cases: {s.n_warm_start}/{n}\n\n")
+            fp.write(f"{'':20s}{'cold':>10s}{'warm':>10s}\n")
+            fp.write(f"{'-'*40}\n")
+            fp.write(
+                f"{'Mean Iterations':>20s}{s.iters_cold_mean:10.3g}"
+                f"{s.iters_warm_mean:10.3g}\n"
+            )
+            fp.write(
+                f"{'Mean Solver Time (s)':>20s}{s.time_cold_mean:10.3g}"
+                f"{s.time_warm_mean:10.3g}\n"
+            )
+            fp.write(f"{'-'*40}\n\n")
         # print the detailed table
         fp.write(f"\n{'='*24}{'Table of Results':^24s}{'='*24}\n\n")
         fp.write(
@@ -266,3 +266,152 @@ if __name__ == "__main__":
     # test_convergence_evaluation_specification_file_unfixedvar_mutableparam()
     # test_convergence_evaluation_specification_file_fixedvar_immutableparam()
     test_convergence_evaluation_fixedvar_mutableparam()
+
+
+@pytest.mark.skipif(not ipopt_available, reason="Ipopt solver not available")
+@pytest.mark.unit
+def test_convergence_evaluation_process_pool():
+    ceval_class = cb._class_import(ceval_fixedvar_mutableparam_str)
+    ceval = ceval_class()
+    spec = ceval.get_specification()
+    fname = os.path.join(wrtdir, "ceval_fixedvar_mutableparam.3.43.pool.json")
+    results_fname = os.path.join(wrtdir, "ceval_fixedvar_mutableparam.3.43.jsonl")
+    cb.write_sample_file(
+        spec, fname, ceval_fixedvar_mutableparam_str, n_points=3, seed=43
+    )
+    if os.path.exists(results_fname):
+        os.remove(results_fname)
+
+    inputs, samples, results = cb.run_convergence_evaluation_from_sample_file(
+        fname, n_workers=2, results_file=results_fname
+    )
+    assert [r["name"] for r in results] == ["Sample-1", "Sample-2", "Sample-3"]
+    # models are reset to the initialized state between samples, so the
+    # iteration counts match the serial run
+    assert results[0]["iters"] == pytest.approx(14, abs=2)
+    assert results[1]["iters"] == pytest.approx(15, abs=2)
+    assert results[2]["iters"] == pytest.approx(12, abs=2)
+    for r in results:
+        assert r["solved"]
+        assert r["status"] == "optimal"
+        assert r["wall_time"] >= 0
+
+    # drop the last result and resume, only the missing sample is run again
+    with open(results_fname) as f:
+        lines = f.readlines()
+    assert len(lines) == 3
+    with open(results_fname, "w") as f:
+        f.writelines(lines[:2])
+    inputs, samples, resumed = cb.run_convergence_evaluation_from_sample_file(
+        fname, n_workers=2, results_file=results_fname
+    )
+    assert [r["name"] for r in resumed] == ["Sample-1", "Sample-2", "Sample-3"]
+    with open(results_fname) as f:
+        assert len(f.readlines()) == 3
+
+    os.remove(fname)
+    os.remove(results_fname)
+
+
+@pytest.mark.unit
+def test_nearest_neighbor_tour():
+    inputs = {
+        "a": {"lower": 0.0, "upper": 10.0},
+        "b": {"lower": 0.0, "upper": 1000.0},
+    }
+    samples_list = [
+        {"_name": "S1", "a": 0.0, "b": 0.0},
+        {"_name": "S2", "a": 10.0, "b": 1000.0},
+        {"_name": "S3", "a": 5.0, "b": 500.0},
+        {"_name": "S4", "a": 1.0, "b": 100.0},
+        {"_name": "S5", "a": 9.0, "b": 900.0},
+    ]
+    x = cb._normalized_sample_points(inputs, samples_list)
+    assert x[1] == pytest.approx([1.0, 1.0])
+    assert x[2] == pytest.approx([0.5, 0.5])
+    tour = cb._nearest_neighbor_tour(x)
+    assert sorted(tour) == [0, 1, 2, 3, 4]
+    # start in the center and always move to the closest unvisited point
+    assert tour[0] == 2
+    assert tour[1:3] in ([3, 0], [4, 1])
+    assert cb._nearest_neighbor_tour(x[:0]) == []
+
+
+@pytest.mark.unit
+def test_warm_start_solution_cache():
+    ceval = cb._class_import(ceval_fixedvar_mutableparam_str)()
+    m = ceval.get_initialized_model()
+    m.c1 = pe.Constraint(expr=m.x >= 0)
+    cache = cb._SolutionCache(m, max_size=2)
+    assert isinstance(m.dual, pe.Suffix)
+    assert cache.nearest([0.0]) is None
+
+    for i, name in enumerate(["S1", "S2", "S3"]):
+        m.x.value = float(i)
+        m.dual[m.c1] = float(i) + 0.5
+        m.ipopt_zL_out[m.x] = float(i) + 0.25
+        cache.add(name, [float(i)])
+    # S1 was dropped from the cache
+    assert len(cache) == 2
+    assert cache.nearest([-1.0]) == "S2"
+    cache.restore("S2")
+    assert m.x.value == 1.0
+    assert m.dual[m.c1] == 1.5
+    assert m.ipopt_zL_in[m.x] == 1.25
+    cache.restore_baseline()
+    assert m.x.value == 2.0
+
+
+@pytest.mark.unit
+def test_convergence_statistics_warm_start():
+    inputs = {"a": {"lower": 0.0, "upper": 1.0, "distribution": "uniform"}}
+    results = []
+    for i, (warm, iters) in enumerate([(False, 10), (True, 4), (True, 6)]):
+        results.append(
+            {
+                "name": f"Sample-{i + 1}",
+                "sample_point": {"_name": f"Sample-{i + 1}", "a": 0.1 * i},
+                "solved": True,
+                "iters": iters,
+                "time": 0.1 * iters,
+                "warm_start": warm,
+            }
+        )
+    s = cb.Stats(inputs, results)
+    assert s.n_warm_start == 2
+    assert s.iters_cold_mean == pytest.approx(10)
+    assert s.iters_warm_mean == pytest.approx(5)
+    assert s.time_warm_mean == pytest.approx(0.5)
+    buf = io.StringIO()
+    s.report(buf)
+    assert "Number of Warm Started Cases: 2/3" in buf.getvalue()
+
+
+@pytest.mark.skipif(not ipopt_available, reason="Ipopt solver not available")
+@pytest.mark.unit
+def test_convergence_evaluation_warm_start():
+    ceval_class = cb._class_import(ceval_fixedvar_mutableparam_str)
+    ceval = ceval_class()
+    spec = ceval.get_specification()
+    spec.warm_start = True
+    fname = os.path.join(wrtdir, "ceval_fixedvar_mutableparam.5.43.warm.json")
+    cb.write_sample_file(
+        spec, fname, ceval_fixedvar_mutableparam_str, n_points=5, seed=43
+    )
+
+    inputs, samples, results = cb.run_convergence_evaluation_from_sample_file(
+        fname
+    )
+    assert [r["name"] for r in results] == [f"Sample-{i}" for i in range(1, 6)]
+    # only the first sample of the chain starts from the initialized model
+    assert sum(1 for r in results if r["warm_start"]) == 4
+    for r in results:
+        assert r["solved"]
+        assert (r["warm_start_from"] is None) == (not r["warm_start"])
+    s = cb.Stats(inputs, results)
+    assert s.n_warm_start == 4
+
+    with pytest.raises(ValueError):
+        cb.run_convergence_evaluation_from_sample_file(fname, n_workers=2)
+
+    os.remove(fname)
@@ -15,8 +15,11 @@
 This module contains utility functions for dynamic IDAES models.
 """
 
-from pyomo.environ import Block, Constraint, Var
+import numpy as np
+
+from pyomo.environ import Block, ComponentUID, Constraint, Var
 from pyomo.dae import DerivativeVar
+from pyomo.dae.flatten import flatten_dae_components
 from pyomo.dae.set_utils import (
     is_explicitly_indexed_by,
     is_in_block_indexed_by,
@@ -698,7 +701,13 @@ def copy_non_time_indexed_values(
 
 
 def copy_values_at_time(
-    fs_tgt, fs_src, t_target, t_source, copy_fixed=True, outlvl=idaeslog.NOTSET
+    fs_tgt,
+    fs_src,
+    t_target,
+    t_source,
+    copy_fixed=True,
+    outlvl=idaeslog.NOTSET,
+    plan=None,
 ):
     """
     Function to set the values of all (explicitly or implicitly) time-indexed
@@ -715,10 +724,18 @@ def copy_values_at_time(
         copy_fixed : Bool of whether or not to copy over fixed variables in
                      target model
         outlvl : IDAES logger output level
+        plan : Optional TimeShiftPlan built by TimeShiftPlan.from_blocks for
+               these flowsheets. Copying values repeatedly, e.g. to every time
+               point, is much faster with a plan, as the variables are only
+               looked up once.
 
     Returns:
         None
     """
+    if plan is not None:
+        plan.copy_values(t_target, t_source, copy_fixed=copy_fixed)
+        return
+
     time_target = fs_tgt.time
     var_visited = set()
     for var_target in fs_tgt.component_objects(Var):
@@ -833,3 +850,222 @@ def copy_values_at_time(
                         local_parent, var_target.parent_component().local_name
                     )[var_target.index()]
                     var_target.set_value(var_source.value)
+
+
+class TimeShiftPlan(object):
+    """
+    Precomputed map from time-indexed variables to arrays of their data
+    objects, with a row for each variable and a column for each time point,
+    for copying values between time points. Building the plan looks up every
+    variable at every time point once; after that, shifting or copying values
+    over a whole horizon only reads and writes the values in the columns
+    involved, instead of looking up components by name or index for every
+    time point. A plan stays valid as long as no time-indexed variables are
+    added to or removed from the models.
+
+    Args:
+        time : Time set of the target variables
+        variables : List of target variables (or references) indexed only by
+                    time, e.g. from flatten_dae_components
+        source_variables : List of source variables indexed only by time
+                           corresponding to ``variables``. If None, values are
+                           copied between time points of ``variables``.
+        source_time : Time set of the source variables, if different from
+                      ``time``
+    """
+
+    def __init__(self, time, variables, source_variables=None, source_time=None):
+        self.time = time
+        self.source_time = time if source_time is None else source_time
+        self.target_data = _time_data_array(variables, time)
+        if source_variables is None:
+            self.source_data = self.target_data
+        else:
+            if len(source_variables) != len(variables):
+                raise ValueError(
+                    "source_variables must correspond to variables, got "
+                    f"{len(source_variables)} source variables for "
+                    f"{len(variables)} variables"
+                )
+            self.source_data = _time_data_array(source_variables, self.source_time)
+        self._shift_indices = {}
+
+    @classmethod
+    def from_blocks(cls, fs_tgt, fs_src=None, time=None, outlvl=idaeslog.NOTSET):
+        """
+        Build a plan for all variables in a flowsheet that are (explicitly or
+        implicitly) indexed by time. Variables are matched to variables with
+        the same name in the source flowsheet, as in copy_values_at_time.
+
+        Args:
+            fs_tgt : Target flowsheet
+            fs_src : Source flowsheet, if None use the target flowsheet
+            time : Time set, if None use ``fs_tgt.time``
+            outlvl : IDAES logger output level
+
+        Returns:
+            TimeShiftPlan
+        """
+        if time is None:
+            time = fs_tgt.time
+        _, variables = flatten_dae_components(fs_tgt, time, Var)
+        if fs_src is None or fs_src is fs_tgt:
+            return cls(time, variables)
+
+        source_time = fs_src.time
+        _, source_variables = flatten_dae_components(fs_src, source_time, Var)
+        by_name = {
+            str(ComponentUID(var.referent, context=fs_src)): var
+            for var in source_variables
+        }
+        targets = []
+        sources = []
+        for var in variables:
+            name = str(ComponentUID(var.referent, context=fs_tgt))
+            source = by_name.get(name)
+            if source is None:
+                init_log = idaeslog.getInitLogger(__name__, outlvl)
+                init_log.warning(
+                    "Warning copying values: "
+                    + name
+                    + " does not exist in source block "
+                    + fs_src.name
+                )
+                continue
+            targets.append(var)
+            sources.append(source)
+        return cls(time, targets, sources, source_time)
+
+    def _time_indices(self, time, points):
+        return [time.ord(t) - 1 for t in points]
+
+    def get_values(self, t=None):
+        """
+        Get the values of the target variables.
+
+        Args:
+            t : Time point or list of time points, if None use all time
+                points
+
+        Returns:
+            Array with a row for each variable and a column for each time
+            point (or a vector if t is a single time point). Values of None
+            are NaN.
+        """
+        data = self.target_data
+        if t is not None:
+            if _is_time_list(t):
+                data = data[:, self._time_indices(self.time, t)]
+            else:
+                data = data[:, self.time.ord(t) - 1]
+        return _get_values(data)
+
+    def copy_values(self, t_target, t_source, copy_fixed=True):
+        """
+        Set the values of the target variables at one or more time points to
+        the values of the source variables at a time point.
+
+        Args:
+            t_target : Target time point or list of time points
+            t_source : Source time point
+            copy_fixed : Bool of whether or not to copy over fixed variables
+                         in the target model
+
+        Returns:
+            None
+        """
+        if not _is_time_list(t_target):
+            t_target = [t_target]
+        dst = self._time_indices(self.time, t_target)
+        src = self.source_time.ord(t_source) - 1
+        # Read the source values before writing, in case they overlap
+        values = _get_values(self.source_data[:, src])
+        values = np.repeat(values[:, np.newaxis], len(dst), axis=1)
+        _set_values(self.target_data[:, dst], values, copy_fixed)
+
+    def shift_values(self, t_shift, copy_fixed=True, tolerance=1e-8):
+        """
+        Set the value of each target variable at every time point t to the
+        value of its source variable at t + t_shift. Time points where
+        t + t_shift is outside the source time set are not changed.
+
+        Args:
+            t_shift : Time offset of the source values
+            copy_fixed : Bool of whether or not to copy over fixed variables
+                         in the target model
+            tolerance : Tolerance for finding t + t_shift in the source time
+                        set
+
+        Returns:
+            None
+        """
+        dst, src = self.get_shift_indices(t_shift, tolerance)
+        if not dst:
+            return
+        # All the values are read before any are written, so each value is
+        # taken from its time point before the shift.
+        values = _get_values(self.source_data[:, src])
+        _set_values(self.target_data[:, dst], values, copy_fixed)
+
+    def get_shift_indices(self, t_shift, tolerance=1e-8):
+        """
+        Get the positions of the target time points t and of the source time
+        points t + t_shift that they take values from. The positions are
+        cached for each shift.
+
+        Args:
+            t_shift : Time offset of the source values
+            tolerance : Tolerance for finding t + t_shift in the source time
+                        set
+
+        Returns:
+            Tuple of lists of target and source time positions
+        """
+        key = (t_shift, tolerance)
+        indices = self._shift_indices.get(key)
+        if indices is None:
+            dst = []
+            src = []
+            source_time = self.source_time
+            for i, t in enumerate(self.time):
+                ts = t + t_shift
+                if hasattr(source_time, "find_nearest_index"):
+                    idx = source_time.find_nearest_index(ts, tolerance)
+                else:
+                    idx = source_time.ord(ts) if ts in source_time else None
+                if idx is None:
+                    # t + t_shift is outside the source time set
+                    continue
+                dst.append(i)
+                src.append(idx - 1)
+            indices = self._shift_indices[key] = (dst, src)
+        return indices
+
+
+def _is_time_list(t):
+    return isinstance(t, (list, tuple, range, np.ndarray))
+
+
+def _time_data_array(variables, time):
+    """
+    Object array of the data objects of variables indexed only by time, with a
+    row for each variable and a column for each time point.
+    """
+    data = np.empty((len(variables), len(time)), dtype=object)
+    for i, var in enumerate(variables):
+        # Looking up var[t] is faster than iterating over a reference's values
+        for j, t in enumerate(time):
+            data[i, j] = var[t]
+    return data
+
+
+def _get_values(data):
+    values = np.array([v.value for v in data.flat], dtype=float)
+    return values.reshape(data.shape)
+
+
+def _set_values(data, values, copy_fixed):
+    for v, val in zip(data.flat, values.flat):
+        if not copy_fixed and v.fixed:
+            continue
+        v.set_value(None if np.isnan(val) else float(val))
@@ -15,6 +15,10 @@
 This module contains utility functions for initialization of IDAES models.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+import numpy as np
 from pyomo.environ import (
     Block,
     check_optimal_termination,
@@ -23,11 +27,15 @@ from pyomo.environ import (
     Var,
     value,
 )
+from pyomo.core.base.block import _BlockData
 from pyomo.network import Arc
+from pyomo.common.collections import ComponentMap
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
 from pyomo.dae import ContinuousSet
+from pyomo.dae.set_utils import is_explicitly_indexed_by
 from pyomo.core.expr.visitor import identify_variables
 
-from idaes.core import FlowsheetBlock
+from idaes.core import FlowsheetBlock, FlowsheetBlockData
 from idaes.core.util.exceptions import ConfigurationError
 from idaes.core.util.model_statistics import degrees_of_freedom
 from idaes.core.util.dyn_utils import (
@@ -36,8 +44,9 @@ from idaes.core.util.dyn_utils import (
     deactivate_constraints_unindexed_by,
     fix_vars_unindexed_by,
     get_derivatives_at,
-    copy_values_at_time,
     get_implicit_index_of_set,
+    get_location_of_coordinate_set,
+    TimeShiftPlan,
 )
 import idaes.logger as idaeslog
 from idaes.core.solvers import get_solver
@@ -229,25 +238,453 @@ def propagate_state(
             ) from e
 
 
-# HACK, courtesy of J. Siirola
-def solve_indexed_blocks(solver, blocks, **kwds):
+class PropagationPlan(object):
+    """
+    Precompiled plan for propagating values along a set of Arcs.
+
+    Building the plan resolves the Port members of each Arc and collects flat
+    lists of the source and destination component data once, so values can be
+    copied in bulk by calling propagate() many times. This gives the same
+    result as calling propagate_state() for each Arc in order, but is much
+    faster for dynamic models with many time points.
+
+    The plan records the Ports and Port members of each Arc when it is built.
+    If these change (e.g. the Arc is reconnected or a Port member is replaced
+    or gains indices), the plan is rebuilt the next time it is used.
+
+    Args:
+        arcs: an Arc (scalar or indexed), a list of Arcs, or a Block in which
+            case all the Arcs in the Block and its sub-blocks are used.
+        direction (str): Direction in which to propagate values.
+            Default = 'forward' Valid values: 'forward', 'backward'.
+        overwrite_fixed (bool): If True overwrite fixed values, otherwise do
+            not overwrite fixed values.
+    """
+
+    def __init__(self, arcs, direction="forward", overwrite_fixed=False):
+        if direction not in ("forward", "backward"):
+            raise ValueError(
+                "Unexpected value for direction argument: ({}). "
+                "Value must be either 'forward' or 'backward'.".format(direction)
+            )
+        self.direction = direction
+        self.overwrite_fixed = overwrite_fixed
+        if getattr(arcs, "ctype", None) is Block:
+            arcs = list(arcs.component_data_objects(Arc, descend_into=True))
+        elif not isinstance(arcs, (list, tuple)):
+            arcs = [arcs]
+        self.arcs = []
+        for a in arcs:
+            if a.ctype is not Arc:
+                raise TypeError(
+                    "PropagationPlan can only be built from Arcs, got {}".format(
+                        a.name
+                    )
+                )
+            if a.is_indexed():
+                self.arcs.extend(a.values())
+            else:
+                self.arcs.append(a)
+        self._signature = None
+        self.build()
+
+    def _ports(self, arc):
+        if self.direction == "forward":
+            return arc.src, arc.dest
+        return arc.dest, arc.src
+
+    def _arc_signature(self, arc):
+        source, destination = self._ports(arc)
+        sig = [id(source), id(destination)]
+        for port in (source, destination):
+            for k, v in port.vars.items():
+                sig.append((k, id(v), len(v) if v.is_indexed() else 1))
+        return tuple(sig)
+
+    def signature(self):
+        """
+        Return a tuple describing the structure the plan was built from.
+        """
+        return tuple(self._arc_signature(a) for a in self.arcs)
+
+    def is_valid(self):
+        """
+        Return True if the Arcs and Ports still have the structure the plan was
+        built from.
+        """
+        return self._signature == self.signature()
+
+    @staticmethod
+    def _time_set(arc):
+        """
+        Get the time set of the flowsheet containing an Arc, or None if the
+        Arc is not in a flowsheet.
+        """
+        b = arc.parent_block()
+        while b is not None:
+            if isinstance(b, FlowsheetBlockData):
+                return b.time
+            b = b.parent_block()
+        return None
+
+    def build(self):
+        """
+        (Re)build the flat lists of source and destination component data.
+        """
+        destinations = []
+        sources = []
+        source_is_var = []
+        times = []
+        for arc in self.arcs:
+            source, destination = self._ports(arc)
+            source_vars = source.vars
+            time = self._time_set(arc)
+            for k, v in destination.vars.items():
+                # position of the time index of the Port member, or None if the
+                # member is not indexed by the flowsheet time set
+                loc = None
+                if (
+                    time is not None
+                    and v.is_indexed()
+                    and is_explicitly_indexed_by(v, time)
+                ):
+                    loc = get_location_of_coordinate_set(v.index_set(), time)
+                try:
+                    src = source_vars[k]
+                    for i, d in v.items():
+                        if not d.is_variable_type():
+                            raise TypeError(
+                                f"propagate_state() is can only change the value "
+                                f"of variables and cannot set a {d.ctype}.  "
+                                f"This likely indicates either a malformed port "
+                                f"or a misuse of propagate_state."
+                            )
+                        s = src[i]
+                        destinations.append(d)
+                        sources.append(s)
+                        source_is_var.append(s.is_variable_type())
+                        if loc is None:
+                            times.append(np.nan)
+                        else:
+                            times.append(i[loc] if isinstance(i, tuple) else i)
+                except KeyError as e:
+                    raise KeyError(
+                        "In propagate_state, variables have incompatible index sets"
+                    ) from e
+        self.destinations = destinations
+        self.sources = sources
+        self.source_is_var = source_is_var
+        self.times = np.array(times, dtype=float)
+        self._signature = self.signature()
+
+    def __len__(self):
+        return len(self.destinations)
+
+    def propagate(self, time_window=None, check=True):
+        """
+        Copy values from the source to the destination of each Arc.
+
+        Args:
+            time_window: Optional (start, end) tuple. If given, only values at
+                time points between start and end (inclusive) are copied.
+                Port members that are not indexed by the time set of the
+                flowsheet containing the Arc are always copied.
+            check: If True, check that the model structure hasn't changed and
+                rebuild the plan if needed.
+
+        Returns:
+            None
+        """
+        if check and not self.is_valid():
+            self.build()
+        dests = self.destinations
+        srcs = self.sources
+        is_var = self.source_is_var
+        if time_window is None:
+            positions = range(len(dests))
+        else:
+            t0, t1 = time_window
+            times = self.times
+            with np.errstate(invalid="ignore"):
+                mask = np.isnan(times) | ((times >= t0) & (times <= t1))
+            positions = np.flatnonzero(mask).tolist()
+        overwrite_fixed = self.overwrite_fixed
+        for n in positions:
+            d = dests[n]
+            if d.fixed and not overwrite_fixed:
+                continue
+            s = srcs[n]
+            d.set_value(s.value if is_var[n] else value(s))
+
+
+def solve_indexed_blocks(
+    solver, blocks, decompose=False, batch_size=1, n_workers=None, **kwds
+):
     """
     This method allows for solving of Indexed Block components as if they were
     a single Block. A temporary Block object is created which is populated with
     the contents of the objects in the blocks argument and then solved.
 
+    If decompose is True, the blocks are first split into groups that do not
+    share any unfixed variables in their active constraints (for example
+    independent state blocks). Groups are solved separately, batch_size groups
+    at a time, and a batch that fails to solve is re-solved one group at a time
+    so that one bad block does not prevent the others from converging.  The
+    groups of a failed batch are re-solved from the variable values they had
+    before the batch solve.  If the solver raises an exception for a batch, it
+    is logged and the batch is treated as failed with an error termination
+    condition.
+
     Args:
         solver : a Pyomo solver object to use when solving the Indexed Block
         blocks : an object which inherits from Block, or a list of Blocks
+        decompose : if True solve independent groups of blocks separately
+        batch_size : number of independent groups to solve together when
+            decompose is True
+        n_workers : if decompose is True and this is greater than 1, batches are
+            solved concurrently in this many worker processes. Workers are
+            forked from the current process, so this is only available on
+            platforms that support fork. Only variable values are returned
+            from the workers.
         kwds : a dict of argumnets to be passed to the solver
 
     Returns:
-        A Pyomo solver results object
+        A Pyomo solver results object. If decompose is True this is an
+        IndexedBlockSolverResults object, which also reports the termination
+        condition of each block.
     """
     # Check blocks argument, and convert to a list of Blocks
     if isinstance(blocks, Block):
         blocks = [blocks]
 
+    if not decompose:
+        return _solve_block_list(solver, blocks, **kwds)
+
+    block_data = []
+    for b in blocks:
+        if not isinstance(b, (Block, _BlockData)):
+            raise TypeError(
+                "Trying to apply solve_indexed_blocks to "
+                "object containing non-Block objects"
+            )
+        if b.is_indexed():
+            block_data.extend(b.values())
+        else:
+            block_data.append(b)
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1, got {}".format(batch_size))
+
+    groups = independent_block_groups(block_data)
+    batches = [
+        [b for g in groups[i : i + batch_size] for b in g]
+        for i in range(0, len(groups), batch_size)
+    ]
+    block_status = ComponentMap()
+    n_solves = 0
+    # save the starting point of batches that may be re-solved group by group,
+    # so the retries don't start from the iterate of the failed batch solve
+    initial_values = {
+        i: [v.value for v in _batch_vars(batch)]
+        for i, batch in enumerate(batches)
+        if len(groups[i * batch_size : (i + 1) * batch_size]) > 1
+    }
+    batch_results = _solve_batches(solver, batches, n_workers, kwds)
+    n_solves += len(batches)
+    retry = []
+    for i, (tc, status) in enumerate(batch_results):
+        start = i * batch_size
+        batch_groups = groups[start : start + batch_size]
+        if tc != TerminationCondition.optimal and len(batch_groups) > 1:
+            for v, val in zip(_batch_vars(batches[i]), initial_values[i]):
+                v.set_value(val, skip_validation=True)
+            retry.extend(batch_groups)
+            continue
+        for b in batches[i]:
+            block_status[b] = (tc, status)
+    if retry:
+        _log = idaeslog.getLogger(__name__)
+        _log.debug(
+            "solve_indexed_blocks re-solving {} groups of blocks from failed "
+            "batches individually".format(len(retry))
+        )
+        for g, (tc, status) in zip(
+            retry, _solve_batches(solver, retry, n_workers, kwds)
+        ):
+            for b in g:
+                block_status[b] = (tc, status)
+        n_solves += len(retry)
+
+    return IndexedBlockSolverResults(
+        [(b, block_status[b]) for b in block_data], n_solves
+    )
+
+
+class IndexedBlockSolverResults(SolverResults):
+    """
+    Aggregate solver results for a decomposed solve_indexed_blocks call. The
+    solver status and termination condition are optimal only if every block
+    was solved to optimality, otherwise they are taken from the first block
+    that failed.
+
+    Attributes:
+        block_status: ComponentMap of BlockData to a (termination condition,
+            solver status) tuple
+        failed_blocks: list of blocks that were not solved to optimality
+        n_solves: number of solver calls made
+    """
+
+    def __init__(self, block_status, n_solves):
+        super().__init__()
+        self._block_status = ComponentMap(block_status)
+        self._n_solves = n_solves
+        failed = self.failed_blocks
+        info = self.solver.add()
+        if failed:
+            info.termination_condition, info.status = self._block_status[failed[0]]
+            info.message = "{} of {} blocks failed to solve".format(
+                len(failed), len(self._block_status)
+            )
+        else:
+            info.termination_condition = TerminationCondition.optimal
+            info.status = SolverStatus.ok
+            info.message = "All {} blocks solved".format(len(self._block_status))
+
+    @property
+    def block_status(self):
+        return self._block_status
+
+    @property
+    def failed_blocks(self):
+        return [
+            b
+            for b, (tc, _) in self._block_status.items()
+            if tc != TerminationCondition.optimal
+        ]
+
+    @property
+    def n_solves(self):
+        return self._n_solves
+
+
+def independent_block_groups(blocks):
+    """
+    Split a list of blocks into groups that do not share any unfixed variables
+    in their active constraints, so each group can be solved separately.
+
+    Args:
+        blocks : list of BlockData objects
+
+    Returns:
+        list of lists of blocks, in the order of the first block in each group
+    """
+    parent = list(range(len(blocks)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner = {}
+    for n, b in enumerate(blocks):
+        for c in b.component_data_objects(Constraint, active=True, descend_into=True):
+            for v in identify_variables(c.body, include_fixed=False):
+                k = owner.setdefault(id(v), n)
+                if k != n:
+                    rk, rn = find(k), find(n)
+                    if rk != rn:
+                        parent[max(rk, rn)] = min(rk, rn)
+    groups = {}
+    for n, b in enumerate(blocks):
+        groups.setdefault(find(n), []).append(b)
+    return list(groups.values())
+
+
+def _solve_batches(solver, batches, n_workers, kwds):
+    """
+    Solve each list of blocks in batches, in this process or in a pool of
+    forked worker processes. Returns a (termination condition, solver status)
+    tuple for each batch, a batch for which the solver raised an exception
+    gets an error termination condition and status.
+    """
+    if n_workers is None or n_workers <= 1 or len(batches) <= 1:
+        results = []
+        for batch in batches:
+            try:
+                res = _solve_block_list(solver, batch, **kwds)
+            except Exception:
+                _log_batch_error(batch)
+                results.append(_BATCH_ERROR)
+                continue
+            results.append(
+                (res.solver.termination_condition, res.solver.status)
+            )
+        return results
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:
+        raise ConfigurationError(
+            "solve_indexed_blocks with n_workers > 1 requires the fork start "
+            "method, which is not available on this platform."
+        )
+    # Workers inherit the model and this state when they are forked
+    _batch_worker_state["solver"] = solver
+    _batch_worker_state["batches"] = batches
+    _batch_worker_state["kwds"] = kwds
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as pool:
+            futures = [
+                pool.submit(_solve_batch_in_worker, i) for i in range(len(batches))
+            ]
+            results = []
+            for batch, future in zip(batches, futures):
+                try:
+                    tc, status, values = future.result()
+                except Exception:
+                    _log_batch_error(batch)
+                    results.append(_BATCH_ERROR)
+                    continue
+                for v, val in zip(_batch_vars(batch), values):
+                    v.set_value(val, skip_validation=True)
+                results.append((tc, status))
+    finally:
+        _batch_worker_state.clear()
+    return results
+
+
+_batch_worker_state = {}
+
+_BATCH_ERROR = (TerminationCondition.error, SolverStatus.error)
+
+
+def _log_batch_error(batch):
+    _log = idaeslog.getLogger(__name__)
+    _log.warning(
+        "solve_indexed_blocks: solver raised an exception for the batch "
+        "starting at block {}".format(batch[0].name),
+        exc_info=True,
+    )
+
+
+def _batch_vars(batch):
+    for b in batch:
+        yield from b.component_data_objects(Var, descend_into=True)
+
+
+def _solve_batch_in_worker(i):
+    batch = _batch_worker_state["batches"][i]
+    res = _solve_block_list(
+        _batch_worker_state["solver"], batch, **_batch_worker_state["kwds"]
+    )
+    values = [v.value for v in _batch_vars(batch)]
+    return res.solver.termination_condition, res.solver.status, values
+
+
+# HACK, courtesy of J. Siirola
+def _solve_block_list(solver, blocks, **kwds):
+    """
+    Solve a list of Blocks as a single problem using a temporary Block.
+    """
     try:
         # Create a temporary Block
         tmp = Block(concrete=True)
@@ -257,7 +694,7 @@ def solve_indexed_blocks(solver, blocks, **kwds):
         # Iterate over indexed objects
         for i, b in enumerate(blocks):
             # Check that object is a Block
-            if not isinstance(b, Block):
+            if not isinstance(b, (Block, _BlockData)):
                 raise TypeError(
                     "Trying to apply solve_indexed_blocks to "
                     "object containing non-Block objects"
@@ -424,6 +861,9 @@ def initialize_by_time_element(fs, time, **kwargs):
         for t in time
     }
 
+    # Variables copied from the initial conditions of each finite element
+    time_shift_plan = TimeShiftPlan.from_blocks(fs, outlvl=idaeslog.ERROR)
+
     # Perform a solve for 1 -> nfe; i is the index of the finite element
     init_log.info(
         "Flowsheet has been deactivated. Beginning element-wise initialization"
@@ -475,10 +915,7 @@ def initialize_by_time_element(fs, time, **kwargs):
                         var.fix()
 
         # Initialize finite element from its initial conditions
-        for t in fe:
-            copy_values_at_time(
-                fs, fs, t, t_prev, copy_fixed=False, outlvl=idaeslog.ERROR
-            )
+        time_shift_plan.copy_values(fe, t_prev, copy_fixed=False)
 
         # Log that we are solving finite element {i}
         init_log.info(f"Solving finite element {i}")
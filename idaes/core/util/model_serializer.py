@@ -23,12 +23,16 @@ import datetime
 import time
 import gzip
 import logging
+import collections
+import itertools
+import numpy as np
 
 _log = logging.getLogger(__name__)
 
 # Some more inforation about this module
 __author__ = "John Eslick"
 __format_version__ = 4
+__npz_format_version__ = 1
 
 
 def _can_serialize(o):
@@ -996,3 +1000,861 @@ def from_json(o, sd=None, fname=None, s=None, wts=None, gz=None, root_name=None)
     pdict["etime_read_dict"] = read_time - dict_time
     pdict["etime_read_suffixes"] = suffix_time - read_time
     return pdict
+
+
+# Attributes are applied to the model in this order when reading columnar
+# state, so activating/fixing happens before bounds and values are set.  Any
+# other attributes are applied afterwards in the order they are found.
+_COLUMN_READ_ORDER = ("active", "fixed", "stale", "lb", "ub", "value")
+
+
+class _ColumnarLayout(object):
+    """
+    Flat, stably ordered view of the components and component data in a model
+    that a StoreSpec selects.  The order is the same order the json serializer
+    walks the model, so it only depends on the model structure.
+
+    Attributes:
+        names: list of relative names, one for each entry
+        elements: list of Pyomo components and component data objects
+        attrs: list of attribute tuples to read/write for each entry
+        filters: list of read filter functions (or None) for each entry
+        suffixes: list of (position, Suffix) tuples for suffixes to store
+        attr_index: dict of attribute name to the list of entry positions that
+            store that attribute
+        filter_index: dict of read filter function to the list of entry
+            positions that use it
+        lookup: dict of python id() of an entry to its position
+        ends: list of the position after the last entry below each entry, the
+            entries from a position up to its end are the entry and everything
+            stored under it
+    """
+
+    def __init__(self, o, wts):
+        self.names = []
+        self.elements = []
+        self.attrs = []
+        self.filters = []
+        self.suffixes = []
+        self.attr_index = {}
+        self.filter_index = {}
+        self.lookup = {}
+        self.ends = []
+        self._attr_masks = {}
+        self._walk_component(o, "", wts)
+        for idx in self.attr_index.values():
+            idx.sort()
+        for idx in self.filter_index.values():
+            idx.sort()
+
+    def __len__(self):
+        return len(self.elements)
+
+    def _add(self, o, name, alist, ff):
+        pos = len(self.elements)
+        self.names.append(name)
+        self.elements.append(o)
+        self.attrs.append(alist)
+        self.filters.append(ff)
+        self.lookup[id(o)] = pos
+        self.ends.append(pos + 1)
+        for a in alist:
+            self.attr_index.setdefault(a, []).append(pos)
+        if ff is not None:
+            self.filter_index.setdefault(ff, []).append(pos)
+        return pos
+
+    def attr_mask(self, a):
+        """
+        Return a boolean array that is True for entries that store attribute a.
+        Don't modify the returned array, it is cached.
+        """
+        try:
+            return self._attr_masks[a]
+        except KeyError:
+            mask = np.zeros(len(self), dtype=bool)
+            mask[self.attr_index.get(a, [])] = True
+            self._attr_masks[a] = mask
+            return mask
+
+    def subtree(self, o):
+        """
+        Return the (start, end) range of positions of a component or component
+        data and everything stored under it.
+        """
+        pos = self.lookup[id(o)]
+        # scalar components are stored as both a component and component data
+        if pos > 0 and self.elements[pos - 1] is o:
+            pos -= 1
+        return pos, self.ends[pos]
+
+    def _walk_component(self, o, name, wts):
+        alist, ff = wts.get_class_attr_list(o)
+        if alist is None:
+            return
+        pos = self._add(o, name, alist, ff)
+        if isinstance(o, Suffix):
+            oname = o.getname(fully_qualified=False)
+            if wts.suffix_filter is None or oname in wts.suffix_filter:
+                self.suffixes.append((pos, o))
+            return
+        self._walk_data(o, name, wts)
+        self.ends[pos] = len(self.elements)
+
+    def _walk_data(self, o, name, wts):
+        try:
+            items = o.items()
+        except AttributeError:
+            items = [(None, o)]
+        data_positions = []
+        alist = None
+        ff = None
+        for key, el in items:
+            if alist is None:  # assume all item are same type, use first to get alist
+                alist, ff = wts.get_data_class_attr_list(el)
+                if alist is None:
+                    return
+            ename = "{}[{!r}]".format(name, key)
+            dpos = None
+            if isinstance(el, ComponentData):
+                # immutable Param data are plain numbers, and can't be loaded
+                # back in anyway so they are skipped
+                dpos = len(self.elements)
+                data_positions.append(dpos)
+                self.lookup[id(el)] = dpos
+                self.names.append(ename)
+                self.elements.append(el)
+                self.attrs.append(alist)
+                self.filters.append(ff)
+                self.ends.append(dpos + 1)
+            if _may_have_subcomponents(el):
+                for o2 in el.component_objects(descend_into=False):
+                    self._walk_component(
+                        o2, "{}.{}".format(ename, o2.getname(fully_qualified=False)), wts
+                    )
+                if dpos is not None:
+                    self.ends[dpos] = len(self.elements)
+        if alist is not None:
+            for a in alist:
+                self.attr_index.setdefault(a, []).extend(data_positions)
+            if ff is not None:
+                self.filter_index.setdefault(ff, []).extend(data_positions)
+        return
+
+
+def _column_from_list(vals, dtype=None):
+    """
+    Convert a list of attribute values to a numpy array.  Boolean attributes
+    give a bool array, anything else gives a float array where None is stored
+    as NaN.  Values that don't fit in the array are returned separately in a
+    dictionary keyed by their position in the list.
+
+    Args:
+        vals: list of attribute values
+        dtype: if float, always make a float array, used when the values are
+            part of a column that is already known to be a float column
+
+    Returns:
+        (numpy array, dict of values that are not in the array)
+    """
+    if dtype != np.float64 and all(v.__class__ is bool for v in vals):
+        return np.array(vals, dtype=bool), {}
+    if not any(v.__class__ is bool for v in vals):
+        try:
+            return np.array(vals, dtype=np.float64), {}
+        except (TypeError, ValueError):
+            pass
+    data = np.empty(len(vals), dtype=np.float64)
+    objects = {}
+    for k, v in enumerate(vals):
+        if v is None:
+            data[k] = np.nan
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            data[k] = v
+        else:
+            data[k] = np.nan
+            objects[k] = v
+    return data, objects
+
+
+def _column_to_list(data, objects=None):
+    """
+    Convert a column array back to a list of Python values. NaN is converted
+    to None and values from the objects dictionary are put back in place.
+    """
+    vals = data.tolist()
+    if data.dtype != bool:
+        vals = [None if v != v else v for v in vals]
+    if objects:
+        for k, v in objects.items():
+            vals[int(k)] = v
+    return vals
+
+
+def _gather_columns(layout, wts, positions=None, dtypes=None):
+    """
+    Read the attributes selected by a StoreSpec from the model into columns.
+
+    Args:
+        layout: a _ColumnarLayout of the model
+        wts: StoreSpec object
+        positions: optional dict of attribute to the entry positions to read,
+            default is all the entries that store the attribute.
+        dtypes: optional dict of attribute to the dtype of the full column,
+            used when only part of a column is read
+
+    Returns:
+        dict of attribute name to (positions, data array, objects dict)
+    """
+    if positions is None:
+        positions = layout.attr_index
+    if dtypes is None:
+        dtypes = {}
+    els = layout.elements
+    columns = {}
+    for a, idx in positions.items():
+        cb = wts.write_cbs.get(a, None)
+        if cb is None:
+            vals = [getattr(els[i], a, None) for i in idx]
+        else:
+            vals = [cb(els[i]) for i in idx]
+        data, objects = _column_from_list(vals, dtypes.get(a))
+        columns[a] = (np.asarray(idx, dtype=np.int64), data, objects)
+    return columns
+
+
+def _gather_suffixes(layout):
+    """
+    Read the suffix values for a model into columns.
+
+    Args:
+        layout: a _ColumnarLayout of the model
+
+    Returns:
+        list of (suffix position, key positions, data array, objects dict)
+    """
+    suffixes = []
+    for pos, s in layout.suffixes:
+        keys = []
+        vals = []
+        for key, val in s.items():
+            try:
+                keys.append(layout.lookup[id(key)])
+            except KeyError:
+                # didn't store these compoents so can't write suffix.
+                continue
+            vals.append(val)
+        data, objects = _column_from_list(vals)
+        suffixes.append((pos, np.asarray(keys, dtype=np.int64), data, objects))
+    return suffixes
+
+
+def _apply_columns(layout, wts, columns, stored_names=None):
+    """
+    Set model attributes from columns made by _gather_columns().  The
+    StoreSpec read callbacks and filter functions are applied the same way
+    from_json() applies them.
+
+    Args:
+        layout: a _ColumnarLayout of the model to load into
+        wts: StoreSpec object specifying what to read in
+        columns: dict of attribute name to (positions, data array, objects dict)
+        stored_names: names of the stored entries, if None the stored
+            positions are assumed to match the layout positions
+
+    Returns:
+        array mapping stored positions to layout positions (-1 if not found)
+    """
+    n = len(layout)
+    if stored_names is None or stored_names == layout.names:
+        to_model = np.arange(n if stored_names is None else len(stored_names))
+    else:
+        pos_map = {name: i for i, name in enumerate(layout.names)}
+        to_model = np.fromiter(
+            (pos_map.get(name, -1) for name in stored_names),
+            dtype=np.int64,
+            count=len(stored_names),
+        )
+        if not wts.ignore_missing:
+            found = np.zeros(n, dtype=bool)
+            found[to_model[to_model >= 0]] = True
+            if not found.all():
+                raise KeyError(layout.names[int(np.argmin(found))])
+
+    # Model side mask of which entries can have each attribute read
+    readable = {a: layout.attr_mask(a).copy() for a in columns}
+
+    # Stored values by model position, used by filter functions
+    def _stored_values(a):
+        idx, data, objects = columns[a]
+        stored = np.empty(len(data), dtype=object)
+        stored[:] = _column_to_list(data, objects)
+        vals = np.empty(n, dtype=object)
+        midx = to_model[idx]
+        ok = midx >= 0
+        vals[midx[ok]] = stored[ok]
+        has = np.zeros(n, dtype=bool)
+        has[midx[ok]] = True
+        return vals, has
+
+    for ff, idx in layout.filter_index.items():
+        idx = np.asarray(idx, dtype=np.int64)
+        if ff is _only_fixed and "value" in readable:
+            # Only read values of variables that were fixed
+            if "fixed" in columns:
+                fixed, has = _stored_values("fixed")
+                keep = has[idx] & (fixed[idx] == True)
+            else:
+                keep = np.zeros(len(idx), dtype=bool)
+            readable["value"][idx[~keep]] = False
+            for a, mask in readable.items():
+                if a not in ("value", "fixed"):
+                    mask[idx] = False
+        elif ff is _value_if_not_fixed and "value" in readable:
+            # Only read values of variables that are not fixed in the model
+            els = layout.elements
+            fixed = np.fromiter(
+                (els[i].fixed for i in idx), dtype=bool, count=len(idx)
+            )
+            readable["value"][idx[fixed]] = False
+            for a, mask in readable.items():
+                if a != "value":
+                    mask[idx] = False
+        else:
+            stored = {a: _stored_values(a) for a in columns}
+            for i in idx:
+                edict = {a: v[i] for a, (v, has) in stored.items() if has[i]}
+                alist = ff(layout.elements[i], edict)
+                for a, mask in readable.items():
+                    mask[i] = a in alist
+
+    order = [a for a in _COLUMN_READ_ORDER if a in columns]
+    order += [a for a in columns if a not in _COLUMN_READ_ORDER]
+    els = layout.elements
+    for a in order:
+        if a in wts.read_cbs:
+            cb = wts.read_cbs[a]
+            if cb is None:
+                continue
+        else:
+            cb = None
+        idx, data, objects = columns[a]
+        midx = to_model[idx]
+        keep = midx >= 0
+        keep[keep] = readable[a][midx[keep]]
+        ks = np.flatnonzero(keep)
+        if objects:
+            kpos = {k: n for n, k in enumerate(ks.tolist())}
+            objects = {
+                kpos[int(k)]: v for k, v in objects.items() if int(k) in kpos
+            }
+        # only convert the entries that are set, and set them with map() to
+        # keep the per element Python overhead to a single call
+        vals = _column_to_list(data[ks], objects)
+        targets = [els[i] for i in midx[ks].tolist()]
+        if cb is None:
+            collections.deque(
+                map(setattr, targets, itertools.repeat(a), vals), maxlen=0
+            )
+        elif cb is _set_value:
+            # values were validated against the variable domain when they were
+            # stored, so skip validation for variables to save time
+            collections.deque(
+                map(_set_value_unvalidated, targets, vals), maxlen=0
+            )
+        else:
+            collections.deque(map(cb, targets, vals), maxlen=0)
+    return to_model
+
+
+def _set_value_unvalidated(o, d):
+    """
+    Set a value read from stored columns, skipping domain validation for
+    variables.
+    """
+    if o.ctype is Var:
+        o.set_value(d, skip_validation=True)
+    else:
+        _set_value(o, d)
+
+
+def _apply_suffixes(layout, suffixes, to_model):
+    """
+    Set suffix values from columns made by _gather_suffixes().
+
+    Args:
+        layout: a _ColumnarLayout of the model to load into
+        suffixes: list of (suffix position, key positions, data, objects)
+        to_model: array mapping stored positions to layout positions
+
+    Returns:
+        None
+    """
+    model_suffixes = {pos for pos, s in layout.suffixes}
+    els = layout.elements
+    for pos, keys, data, objects in suffixes:
+        mpos = int(to_model[pos])
+        if mpos not in model_suffixes:
+            continue
+        s = els[mpos]
+        mkeys = to_model[keys]
+        vals = _column_to_list(data, objects)
+        for i, v in zip(mkeys.tolist(), vals):
+            if i >= 0:
+                s[els[i]] = v
+
+
+def to_npz(o, fname, wts=None, metadata=None, compress=False):
+    """
+    Save the state of a model to a binary numpy .npz file.  This stores the
+    same information as to_json(), but as a structure manifest and flat arrays
+    of values, fixed flags, bounds, etc. keyed by a stable ordering of the
+    component data.  This is much faster to read and write and much smaller
+    than json for large models.  To load a model state, a model with the same
+    structure must exist.
+
+    Args:
+        o: The Pyomo component object to save.  Usually a Pyomo model, but could
+            also be a subcomponent of a model (usually a sub-block).
+        fname: file name or file-like object to save the model state to, numpy
+            adds the '.npz' extension if a file name without it is given
+        wts: is What To Save, this is a StoreSpec object that specifies what
+            object types and attributes to save.  If None, the default is used
+            which saves the state of the compelte model state.
+        metadata: additional metadata to save beyond the standard format_version,
+            date, and time.
+        compress: if True, compress the arrays in the .npz file
+
+    Returns:
+        Dictionary with some perfomance information. The keys are
+        "n_components", the number of components and component data stored,
+        "etime_make_arrays", how long in seconds it took to read the model
+        state and "etime_write_file", how long in seconds it took to write the
+        file.
+    """
+    if metadata is None:
+        metadata = {}
+    if wts is None:
+        wts = StoreSpec()
+    start_time = time.time()
+    layout = _ColumnarLayout(o, wts)
+    columns = _gather_columns(layout, wts)
+    suffixes = _gather_suffixes(layout)
+    arrays_time = time.time()
+    now = datetime.datetime.now()
+    arrays = {}
+    manifest = {
+        "__metadata__": {
+            "format_version": __npz_format_version__,
+            "date": datetime.date.isoformat(now.date()),
+            "time": datetime.time.isoformat(now.time()),
+            "other": metadata,
+        },
+        "names": layout.names,
+        "columns": {},
+        "suffixes": [],
+    }
+    for k, (a, (idx, data, objects)) in enumerate(columns.items()):
+        arrays["c{}_index".format(k)] = idx
+        arrays["c{}_data".format(k)] = data
+        manifest["columns"][a] = {"key": "c{}".format(k), "objects": objects}
+    for k, (pos, keys, data, objects) in enumerate(suffixes):
+        arrays["s{}_index".format(k)] = keys
+        arrays["s{}_data".format(k)] = data
+        manifest["suffixes"].append(
+            {"key": "s{}".format(k), "position": pos, "objects": objects}
+        )
+    arrays["__manifest__"] = np.frombuffer(
+        json.dumps(manifest, separators=(",", ":")).encode("utf-8"), dtype=np.uint8
+    )
+    if compress:
+        np.savez_compressed(fname, **arrays)
+    else:
+        np.savez(fname, **arrays)
+    file_time = time.time()
+    return {
+        "n_components": len(layout),
+        "etime_make_arrays": arrays_time - start_time,
+        "etime_write_file": file_time - arrays_time,
+    }
+
+
+def from_npz(o, fname, wts=None):
+    """
+    Load the state of a Pyomo component from a .npz file written by to_npz().
+    Model entries are matched to stored entries by name, and the values are
+    assigned in bulk one attribute at a time.  If the saved state contains
+    extra information, it is ignored.  If the saved state doesn't contain an
+    entry for a model component that is to be loaded an error will be raised,
+    unless the StoreSpec has ignore_missing = True.
+
+    Args:
+        o: Pyomo component to for which to load state
+        fname: file name or file-like object to load
+        wts: StoreSpec object specifying what to load
+
+    Returns:
+        Dictionary with some perfomance information. The keys are
+        "etime_load_file", how long in seconds it took to load the file
+        "etime_read_arrays", how long in seconds it took to read models state
+        "etime_read_suffixes", how long in seconds it took to read suffixes
+    """
+    if wts is None:
+        wts = StoreSpec()
+    start_time = time.time()
+    with np.load(fname, allow_pickle=False) as npz:
+        manifest = json.loads(npz["__manifest__"].tobytes().decode("utf-8"))
+        columns = {}
+        for a, c in manifest["columns"].items():
+            columns[a] = (
+                npz["{}_index".format(c["key"])],
+                npz["{}_data".format(c["key"])],
+                c["objects"],
+            )
+        suffixes = []
+        for s in manifest["suffixes"]:
+            suffixes.append(
+                (
+                    s["position"],
+                    npz["{}_index".format(s["key"])],
+                    npz["{}_data".format(s["key"])],
+                    s["objects"],
+                )
+            )
+    load_time = time.time()
+    layout = _ColumnarLayout(o, wts)
+    to_model = _apply_columns(
+        layout, wts, columns, stored_names=manifest["names"]
+    )
+    read_time = time.time()
+    _apply_suffixes(layout, suffixes, to_model)
+    suffix_time = time.time()
+    return {
+        "etime_load_file": load_time - start_time,
+        "etime_read_arrays": read_time - load_time,
+        "etime_read_suffixes": suffix_time - read_time,
+    }
+
+
+def _column_changes(old, new):
+    """
+    Return a boolean array that is True where two column arrays differ.  NaN
+    (stored None) values compare equal to each other.
+    """
+    changed = old != new
+    if new.dtype != bool:
+        changed &= ~(np.isnan(old) & np.isnan(new))
+    return changed
+
+
+def _column_diff(base, js, data, objects):
+    """
+    Make the diff of part of a column against the base column.
+
+    Args:
+        base: base column, (positions, data array, objects dict)
+        js: sorted array of the column entries that were read
+        data: array of the values read for the js entries
+        objects: dict of column entry to values that are not in the array
+
+    Returns:
+        (changed column entries, data array, objects dict) of the entries that
+        differ from the base
+    """
+    base_objects = base[2]
+    changed = _column_changes(base[1][js], data)
+    if objects or base_objects:
+        pos = {j: n for n, j in enumerate(js.tolist())}
+        for j in set(objects) | (set(base_objects) & set(pos)):
+            if objects.get(j, None) != base_objects.get(j, None):
+                changed[pos[j]] = True
+    keep = js[changed]
+    return (
+        keep,
+        data[changed],
+        {j: objects[j] for j in keep.tolist() if j in objects},
+    )
+
+
+def _checkpoint_values(base, diff, js):
+    """
+    Get the values of a checkpoint for some column entries.
+
+    Args:
+        base: base column, (positions, data array, objects dict)
+        diff: checkpoint column diff made by _column_diff()
+        js: sorted array of column entries to get
+
+    Returns:
+        (data array, objects dict) for the js entries
+    """
+    base_objects = base[2]
+    changed, changed_data, changed_objects = diff
+    data = base[1][js]
+    k = np.searchsorted(changed, js)
+    hit = k < len(changed)
+    hit[hit] = changed[k[hit]] == js[hit]
+    data[hit] = changed_data[k[hit]]
+    objects = {}
+    if base_objects or changed_objects:
+        for j, h in zip(js.tolist(), hit.tolist()):
+            src = changed_objects if h else base_objects
+            if j in src:
+                objects[j] = src[j]
+    return data, objects
+
+
+def _merge_diffs(old, new, js):
+    """
+    Replace the js column entries of a checkpoint diff with a new diff of
+    those entries.
+    """
+    changed, data, objects = old
+    keep = ~np.isin(changed, js)
+    merged = np.concatenate((changed[keep], new[0]))
+    order = np.argsort(merged, kind="stable")
+    objects = {j: v for j, v in objects.items() if keep[np.searchsorted(changed, j)]}
+    objects.update(new[2])
+    return (
+        merged[order],
+        np.concatenate((data[keep], new[1]))[order],
+        objects,
+    )
+
+
+_NO_ENTRIES = np.zeros(0, dtype=np.int64)
+
+
+class StateCheckpointer(object):
+    """
+    Keep a history of model state checkpoints to roll back to, for example
+    before trying a solve that may fail.  One full base snapshot of the model
+    state is stored on the first save(), and later checkpoints are stored as
+    the difference from the base.  Only a limited number of checkpoints are
+    kept, when there are too many the least recently used one is dropped.
+
+    The model structure is walked once when the checkpointer is created, so if
+    components are added or removed call rebase().
+
+    By default save() and restore() read the state of the whole model, and
+    restore() sets every attribute value that differs from the checkpoint.
+    Both also take a changed argument, the components that may have changed
+    since the last save() or restore() (for example the block that was
+    solved).  If it is given only those components are read from the model,
+    and restoring takes time proportional to what changed, not to the model
+    size, but changes made outside the changed components are not undone.
+
+    Args:
+        o: The Pyomo component to checkpoint. Usually a Pyomo model, but could
+            also be a subcomponent of a model (usually a sub-block).
+        wts: StoreSpec object specifying what to store, the default is
+            StoreSpec.value_isfixed_isactive(only_fixed=False), which stores
+            variable values, if variables are fixed and if components are
+            active.
+        max_checkpoints: maximum number of checkpoints to keep
+    """
+
+    def __init__(self, o, wts=None, max_checkpoints=10):
+        if wts is None:
+            wts = StoreSpec.value_isfixed_isactive(only_fixed=False)
+        if max_checkpoints < 1:
+            raise ValueError("max_checkpoints must be at least 1")
+        self.component = o
+        self.wts = wts
+        self.max_checkpoints = max_checkpoints
+        self._tag_counter = itertools.count()
+        self.rebase()
+
+    def rebase(self):
+        """
+        Walk the model structure again and clear all the stored checkpoints,
+        the next call to save() stores a new base snapshot.
+        """
+        self._layout = _ColumnarLayout(self.component, self.wts)
+        self._attr_pos = {
+            a: np.asarray(idx, dtype=np.int64)
+            for a, idx in self._layout.attr_index.items()
+        }
+        self._base = None
+        # diff of the model state as of the last save() or restore()
+        self._state = None
+        self._checkpoints = collections.OrderedDict()
+
+    @property
+    def tags(self):
+        """List of stored checkpoint tags from least to most recently used."""
+        return list(self._checkpoints.keys())
+
+    def __len__(self):
+        return len(self._checkpoints)
+
+    def __contains__(self, tag):
+        return tag in self._checkpoints
+
+    def _changed_entries(self, changed):
+        """
+        Get the column entries of each attribute stored for some components
+        and everything under them.
+        """
+        if changed is None:
+            return {}
+        if hasattr(changed, "ctype"):
+            changed = [changed]
+        ranges = []
+        for c in changed:
+            try:
+                ranges.append(self._layout.subtree(c))
+            except KeyError:
+                raise ValueError(
+                    "{} is not stored by the checkpointer".format(c.name)
+                )
+        entries = {}
+        for a, pos in self._attr_pos.items():
+            js = [
+                np.arange(np.searchsorted(pos, start), np.searchsorted(pos, end))
+                for start, end in ranges
+            ]
+            js = np.unique(np.concatenate(js)) if js else _NO_ENTRIES
+            if len(js):
+                entries[a] = js
+        return entries
+
+    def _read_entries(self, entries):
+        """
+        Read column entries from the model, returns a dict of attribute to
+        (data array, objects dict keyed by column entry).
+        """
+        columns = _gather_columns(
+            self._layout,
+            self.wts,
+            positions={a: self._attr_pos[a][js] for a, js in entries.items()},
+            dtypes={a: col[1].dtype for a, col in self._base.items()},
+        )
+        values = {}
+        for a, js in entries.items():
+            idx, data, objects = columns[a]
+            values[a] = (data, {int(js[k]): v for k, v in objects.items()})
+        return values
+
+    def save(self, tag=None, changed=None):
+        """
+        Save a checkpoint of the current model state.
+
+        Args:
+            tag: hashable tag for the checkpoint, if None an integer tag is
+                generated.  Saving with an existing tag replaces the checkpoint.
+            changed: optional component or list of components that changed
+                since the last save() or restore(), if given only these are
+                read from the model.  The first save always reads the whole
+                model.
+
+        Returns:
+            The checkpoint tag
+        """
+        if tag is None:
+            tag = next(self._tag_counter)
+            while tag in self._checkpoints:
+                tag = next(self._tag_counter)
+        if self._base is None or changed is None:
+            columns = _gather_columns(self._layout, self.wts)
+            if self._base is None:
+                self._base = columns
+            diff = {
+                a: _column_diff(
+                    self._base[a], np.arange(len(data)), data, objects
+                )
+                for a, (idx, data, objects) in columns.items()
+            }
+        else:
+            entries = self._changed_entries(changed)
+            values = self._read_entries(entries)
+            diff = dict(self._state)
+            for a, js in entries.items():
+                new = _column_diff(self._base[a], js, *values[a])
+                diff[a] = _merge_diffs(diff[a], new, js)
+        if self._layout.suffixes:
+            suffixes = _gather_suffixes(self._layout)
+        else:
+            suffixes = []
+        self._state = diff
+        self._checkpoints.pop(tag, None)
+        self._checkpoints[tag] = (diff, suffixes)
+        while len(self._checkpoints) > self.max_checkpoints:
+            self._checkpoints.popitem(last=False)
+        return tag
+
+    def discard(self, tag):
+        """
+        Remove a checkpoint, it is not an error if the tag is not stored.
+        """
+        self._checkpoints.pop(tag, None)
+
+    def n_changed(self, tag):
+        """
+        Return the number of stored attribute values in a checkpoint that
+        differ from the base snapshot.
+        """
+        diff = self._checkpoints[tag][0]
+        return sum(len(changed) for changed, data, objects in diff.values())
+
+    def restore(self, tag=None, changed=None):
+        """
+        Restore the model state to a checkpoint.
+
+        Args:
+            tag: tag of the checkpoint to restore, if None restore the most
+                recently saved or restored checkpoint.
+            changed: optional component or list of components that changed
+                since the last save() or restore(), for example a block that
+                was solved.  If given only these are read from the model and
+                restored along with the stored diffs, otherwise the whole
+                model is compared to the checkpoint.
+
+        Returns:
+            The number of attribute values that were set.
+        """
+        if not self._checkpoints:
+            raise KeyError("No checkpoints to restore")
+        if tag is None:
+            tag = next(reversed(self._checkpoints))
+        target, suffixes = self._checkpoints[tag]
+        self._checkpoints.move_to_end(tag)
+        if changed is None:
+            entries = {
+                a: np.arange(len(col[1]))
+                for a, col in self._base.items()
+                if len(col[1])
+            }
+        else:
+            entries = self._changed_entries(changed)
+        values = self._read_entries(entries)
+        columns = {}
+        n_set = 0
+        for a, base in self._base.items():
+            read = entries.get(a, _NO_ENTRIES)
+            js = np.union1d(np.union1d(target[a][0], self._state[a][0]), read)
+            data, objects = _checkpoint_values(base, target[a], js)
+            cur_data, cur_objects = _checkpoint_values(base, self._state[a], js)
+            if len(read):
+                cur_data[np.searchsorted(js, read)] = values[a][0]
+                for j in read.tolist():
+                    cur_objects.pop(j, None)
+                cur_objects.update(values[a][1])
+            k = _column_changes(cur_data, data)
+            if objects or cur_objects:
+                pos = {j: n for n, j in enumerate(js.tolist())}
+                for j in set(objects) | set(cur_objects):
+                    if objects.get(j, None) != cur_objects.get(j, None):
+                        k[pos[j]] = True
+            k = np.flatnonzero(k)
+            columns[a] = (
+                base[0][js[k]],
+                data[k],
+                {n: objects[j] for n, j in enumerate(js[k].tolist()) if j in objects},
+            )
+            n_set += len(k)
+        _apply_columns(self._layout, self.wts, columns)
+        if suffixes:
+            _apply_suffixes(self._layout, suffixes, np.arange(len(self._layout)))
+        self._state = target
+        return n_set
@@ -19,11 +19,17 @@ IDAES models.
 __author__ = "Andrew Lee"
 
 import sys
+import weakref
 
-from pyomo.environ import Block, Constraint, Expression, Objective, Var, value
+import numpy as np
+
+from pyomo.environ import Block, Constraint, Expression, Objective, Param, Var, value
 from pyomo.dae import DerivativeVar
 from pyomo.core.expr.current import identify_variables
-from pyomo.common.collections import ComponentSet
+from pyomo.core.expr.visitor import identify_mutable_parameters
+from pyomo.common.collections import ComponentSet, ComponentMap
+from pyomo.contrib.pynumero.asl import AmplInterface
+from pyomo.common.modeling import unique_component_name
 
 
 # -------------------------------------------------------------------------
@@ -688,31 +694,45 @@ def variables_near_bounds_generator(
         A generator which returns all Var components block that are close to a
         bound
     """
-    for v in block.component_data_objects(ctype=Var, active=True, descend_into=True):
+    var_list = [
+        v
+        for v in block.component_data_objects(ctype=Var, active=True, descend_into=True)
         # To avoid errors, check that v has a value
-        if v.value is None:
-            continue
-
+        if v.value is not None
+    ]
+    # Gather values and bounds into arrays (None bounds become NaN), so the
+    # bound distances can be calculated for all variables at once
+    val = np.array([v.value for v in var_list], dtype=np.float64)
+    lb = np.array([v.lb for v in var_list], dtype=np.float64)
+    ub = np.array([v.ub for v in var_list], dtype=np.float64)
+    has_lb = ~np.isnan(lb)
+    has_ub = ~np.isnan(ub)
+
+    with np.errstate(invalid="ignore"):
         if relative:
-            # First, determine absolute tolerance to apply to bounds
-            if v.ub is not None and v.lb is not None:
-                # Both upper and lower bounds, apply tol to (upper - lower)
-                atol = value((v.ub - v.lb) * tol)
-            elif v.ub is not None:
-                # Only upper bound, apply tol to bound value
-                atol = abs(value(v.ub * tol))
-            elif v.lb is not None:
-                # Only lower bound, apply tol to bound value
-                atol = abs(value(v.lb * tol))
-            else:
-                continue
+            # Both upper and lower bounds, apply tol to (upper - lower), only
+            # one bound, apply tol to bound value, no bounds, skip variable
+            atol = np.where(
+                has_lb & has_ub,
+                (ub - lb) * tol,
+                np.where(has_ub, np.abs(ub * tol), np.abs(lb * tol)),
+            )
+            checked = has_lb | has_ub
         else:
-            atol = tol
+            atol = np.full(len(var_list), tol, dtype=np.float64)
+            checked = np.ones(len(var_list), dtype=bool)
 
-        if v.ub is not None and not skip_lb and value(v.ub - v.value) <= atol:
-            yield v
-        elif v.lb is not None and not skip_ub and value(v.value - v.lb) <= atol:
-            yield v
+        if skip_lb:
+            near_ub = np.zeros(len(var_list), dtype=bool)
+        else:
+            near_ub = has_ub & (ub - val <= atol)
+        if skip_ub:
+            near_lb = np.zeros(len(var_list), dtype=bool)
+        else:
+            near_lb = has_lb & (val - lb <= atol)
+
+    for i in np.flatnonzero(checked & (near_ub | near_lb)):
+        yield var_list[i]
 
 
 def variables_near_bounds_set(
@@ -1289,7 +1309,164 @@ def degrees_of_freedom(block):
     ) - number_activated_equalities(block)
 
 
-def large_residuals_set(block, tol=1e-5, return_residual_values=False):
+def _constraint_residual(c):
+    """
+    Return the residual of a Constraint component, i.e. how far the body is
+    outside of the bounds (0 if the body is within bounds).
+    """
+    r = 0.0  # residual
+
+    # skip if no lower bound set
+    if c.lower is None:
+        r_temp = 0
+    else:
+        r_temp = value(c.lower - c.body())
+    # update the residual
+    if r_temp > r:
+        r = r_temp
+
+    # skip if no upper bound set
+    if c.upper is None:
+        r_temp = 0
+    else:
+        r_temp = value(c.body() - c.upper)
+
+    # update the residual
+    if r_temp > r:
+        r = r_temp
+    return r
+
+
+class _CompiledResidualEvaluator(object):
+    """
+    Class to evaluate the residuals of all the active Constraints in a block
+    at once using a PyNumero NLP.  The NLP is compiled when the object is
+    created, and only the variable values are updated for each evaluation, so
+    it is only valid as long as the structure of the block does not change.
+    Fixed variables and mutable parameters are written to the NLP as
+    constants, so the structure includes the active Constraints and the fixed
+    flags and fixed values of the variables and the values of the mutable
+    parameters that appear in them.
+
+    Args:
+        block : model to be studied
+        constraints : list of active Constraint components in block
+    """
+
+    def __init__(self, block, constraints):
+        # Avoid import when PyNumero is not used
+        from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
+
+        self.constraints = constraints
+        variables = ComponentSet()
+        params = ComponentSet()
+        for c in constraints:
+            variables.update(identify_variables(c.body, include_fixed=True))
+            for e in (c.lower, c.body, c.upper):
+                if e is not None:
+                    params.update(identify_mutable_parameters(e))
+        self.variables = list(variables)
+        self.params = list(params)
+        self.state = self._state()
+        # Pynumero requires an objective, so add one if there isn't one
+        dummy_objective = None
+        if next(block.component_data_objects(Objective, active=True), None) is None:
+            dummy_objective = Objective(expr=0)
+            block.add_component(
+                unique_component_name(block, "objective"), dummy_objective
+            )
+        try:
+            self.nlp = PyomoNLP(block)
+        finally:
+            if dummy_objective is not None:
+                block.del_component(dummy_objective)
+        self.nlp_variables = self.nlp.get_pyomo_variables()
+        nlp_constraints = self.nlp.get_pyomo_constraints()
+        index = ComponentMap((c, i) for i, c in enumerate(nlp_constraints))
+        # Position of each active constraint in the NLP, -1 if the NLP writer
+        # left it out (e.g. no variables), those are evaluated as expressions
+        self.positions = np.array(
+            [index.get(c, -1) for c in constraints], dtype=np.int64
+        )
+        self.lower = self.nlp.constraints_lb()
+        self.upper = self.nlp.constraints_ub()
+
+    def _state(self):
+        """
+        Return the fixed flags and values of the variables and the parameter
+        values that are compiled into the NLP.
+        """
+        return (
+            [(v.fixed, v.value if v.fixed else None) for v in self.variables],
+            [value(p, exception=False) for p in self.params],
+        )
+
+    def is_valid(self, constraints):
+        """
+        Check whether the compiled NLP is still valid for a list of active
+        Constraints.  Only the variables and parameters in the compiled
+        Constraints are checked.
+        """
+        if len(constraints) != len(self.constraints) or any(
+            c1 is not c2 for c1, c2 in zip(constraints, self.constraints)
+        ):
+            return False
+        return self._state() == self.state
+
+    def residuals(self):
+        """
+        Return an array of the residuals of the active Constraints.
+        Constraints with a residual that is not finite (e.g. variables without
+        a value) are evaluated as Pyomo expressions, so they raise the same
+        errors as the default engine.
+        """
+        x = np.array([v.value for v in self.nlp_variables], dtype=np.float64)
+        self.nlp.set_primals(x)
+        g = self.nlp.evaluate_constraints()
+        with np.errstate(invalid="ignore"):
+            r = np.maximum(np.maximum(self.lower - g, g - self.upper), 0.0)
+        residuals = np.empty(len(self.constraints), dtype=np.float64)
+        in_nlp = self.positions >= 0
+        residuals[in_nlp] = r[self.positions[in_nlp]]
+        for i in np.flatnonzero(~(in_nlp & np.isfinite(residuals))):
+            residuals[i] = _constraint_residual(self.constraints[i])
+        return residuals
+
+
+# Compiled residual evaluators keyed by block, the evaluators are dropped with
+# the block.
+_residual_evaluator_cache = weakref.WeakKeyDictionary()
+
+
+def _compiled_residuals(block):
+    """
+    Return the active Constraints in block and an array of their residuals,
+    using a cached compiled NLP if the block structure has not changed.
+    """
+    if not AmplInterface.available():
+        raise RuntimeError(
+            "Evaluating residuals with the pynumero engine requires the "
+            "PyNumero ASL library (run 'idaes get-extensions')."
+        )
+    constraints = list(
+        block.component_data_objects(ctype=Constraint, active=True, descend_into=True)
+    )
+    evaluator = _residual_evaluator_cache.get(block, None)
+    if evaluator is None or not evaluator.is_valid(constraints):
+        evaluator = _CompiledResidualEvaluator(block, constraints)
+        _residual_evaluator_cache[block] = evaluator
+    return evaluator.constraints, evaluator.residuals()
+
+
+def clear_residual_cache():
+    """
+    Clear the cache of compiled NLPs used by large_residuals_set() and
+    number_large_residuals() with engine="pynumero".
+    """
+    _residual_evaluator_cache.clear()
+
+
+def large_residuals_set(block, tol=1e-5, return_residual_values=False, engine=None):
     """
     Method to return a ComponentSet of all Constraint components with a
     residual greater than a given threshold which appear in a model.
@@ -1299,6 +1476,10 @@ def large_residuals_set(block, tol=1e-5, return_residual_values=False):
         tol : residual threshold for inclusion in ComponentSet
         return_residual_values: boolean, if true return dictionary with
             residual values
+        engine: None to evaluate each constraint as a Pyomo expression or
+            "pynumero" to compile the active constraints into a PyNumero NLP
+            and evaluate all residuals at once. The compiled NLP is cached and
+            reused while the block structure does not change.
 
     Returns:
         large_residual_set: A ComponentSet including all Constraint components
@@ -1310,37 +1491,27 @@ def large_residuals_set(block, tol=1e-5, return_residual_values=False):
     large_residuals_set = ComponentSet()
     if return_residual_values:
         residual_values = dict()
-    for c in block.component_data_objects(
-        ctype=Constraint, active=True, descend_into=True
-    ):
-
-        r = 0.0  # residual
-
-        # skip if no lower bound set
-        if c.lower is None:
-            r_temp = 0
-        else:
-            r_temp = value(c.lower - c.body())
-        # update the residual
-        if r_temp > r:
-            r = r_temp
-
-        # skip if no upper bound set
-        if c.upper is None:
-            r_temp = 0
-        else:
-            r_temp = value(c.body() - c.upper)
-
-        # update the residual
-        if r_temp > r:
-            r = r_temp
-
-        # save residual if it is above threshold
-        if r > tol:
+    if engine is None:
+        for c in block.component_data_objects(
+            ctype=Constraint, active=True, descend_into=True
+        ):
+            r = _constraint_residual(c)
+
+            # save residual if it is above threshold
+            if r > tol:
+                large_residuals_set.add(c)
+
+                if return_residual_values:
+                    residual_values[c] = r
+    elif engine == "pynumero":
+        constraints, residuals = _compiled_residuals(block)
+        for i in np.flatnonzero(residuals > tol):
+            c = constraints[i]
             large_residuals_set.add(c)
-
             if return_residual_values:
-                residual_values[c] = r
+                residual_values[c] = float(residuals[i])
+    else:
+        raise ValueError(f"Unrecognised residual evaluation engine {engine}")
 
     if return_residual_values:
         return residual_values
@@ -1348,7 +1519,7 @@ def large_residuals_set(block, tol=1e-5, return_residual_values=False):
         return large_residuals_set
 
 
-def number_large_residuals(block, tol=1e-5):
+def number_large_residuals(block, tol=1e-5, engine=None):
     """
     Method to return the number Constraint components with a residual greater
     than a given threshold which appear in a model.
@@ -1356,11 +1527,16 @@ def number_large_residuals(block, tol=1e-5):
     Args:
         block : model to be studied
         tol : residual threshold for inclusion in ComponentSet
+        engine: None to evaluate each constraint as a Pyomo expression or
+            "pynumero" to evaluate all residuals at once using a compiled
+            PyNumero NLP (see large_residuals_set)
 
     Returns:
         Number of Constraint components with a residual greater than tol which
         appear in block
     """
+    if engine is not None:
+        return len(large_residuals_set(block, tol=tol, engine=engine))
     lr = 0
     for c in block.component_data_objects(
         ctype=Constraint, active=True, descend_into=True
@@ -1407,21 +1583,632 @@ def number_active_variables_in_deactivated_blocks(block):
     return len(active_variables_in_deactivated_blocks_set(block))
 
 
+# -------------------------------------------------------------------------
+# Model census
+class _CensusBlock(object):
+    """
+    Record of the local contents of one BlockData in a ModelCensus, and the
+    flags that were used to add it to the census tallies.
+    """
+
+    __slots__ = (
+        "block",
+        "parent",
+        "end",
+        "variables",
+        "constraints",
+        "con_vars",
+        "con_kind",
+        "con_active",
+        "objectives",
+        "obj_active",
+        "expressions",
+        "derivative_vars",
+        "active",
+        "counted",
+        "visible",
+    )
+
+    def __init__(self, block, parent):
+        self.block = block
+        self.parent = parent  # index of parent record, None for the root
+        self.end = None  # index after the last record in this subtree
+        self.variables = list(
+            block.component_data_objects(ctype=Var, active=None, descend_into=False)
+        )
+        self.constraints = list(
+            block.component_data_objects(
+                ctype=Constraint, active=None, descend_into=False
+            )
+        )
+        self.con_vars = [tuple(identify_variables(c.body)) for c in self.constraints]
+        self.objectives = list(
+            block.component_data_objects(
+                ctype=Objective, active=None, descend_into=False
+            )
+        )
+        self.expressions = list(
+            block.component_data_objects(
+                ctype=Expression, active=None, descend_into=False
+            )
+        )
+        self.derivative_vars = list(
+            block.component_data_objects(
+                ctype=DerivativeVar, active=None, descend_into=False
+            )
+        )
+        self.con_kind = None
+        self.con_active = None
+        self.obj_active = None
+        self.active = False
+        # counted: components are included in total_* tallies
+        # visible: component_data_objects(active=True) would find components
+        self.counted = False
+        self.visible = False
+
+    def scan(self, parent_visible):
+        """
+        Read the current activity and constraint type flags from the model.
+        """
+        self.active = self.block.active
+        self.visible = self.active and parent_visible
+        self.counted = self.visible or self.parent is None
+        self.con_kind = [_constraint_kind(c) for c in self.constraints]
+        self.con_active = [c.active for c in self.constraints]
+        self.obj_active = [o.active for o in self.objectives]
+
+
+def _constraint_kind(c):
+    """
+    Return "eq" for an equality Constraint, "ineq" for an inequality and None
+    for a ranged Constraint.
+    """
+    if c.upper is None or c.lower is None:
+        return "ineq"
+    if value(c.upper) == value(c.lower):
+        return "eq"
+    return None
+
+
+class ModelCensus(object):
+    """
+    Class which walks a model once and keeps tallies of the model statistics,
+    so that the statistics from the functions in this module can be answered
+    without walking the model again. The census holds variables by fixed state,
+    constraints and objectives by activity and type, and the incidence of
+    variables in active constraints.
+
+    When Blocks, Constraints or Objectives are activated or deactivated, or
+    variables are fixed or unfixed, call update() with the blocks that changed
+    (or contain the variables and constraints that changed). Only those blocks
+    are rescanned, so methods like degrees_of_freedom() stay cheap inside
+    initialization loops. If components are added to or removed from the model,
+    or constraint expressions change, call refresh() to walk the whole model
+    again.
+
+    Args:
+        block : model to be studied
+    """
+
+    def __init__(self, block):
+        self.block = block
+        self.refresh()
+
+    # ---------------------------------------------------------------------
+    # Building and updating the census
+    def refresh(self):
+        """
+        Walk the whole model again and rebuild the census.
+        """
+        self._records = []
+        self._index = {}
+        self._add_record(self.block, None)
+
+        # Tallies of components in visible blocks, keyed by id() with values
+        # [component, count] (a component may appear more than once through
+        # References).
+        self._variables = {}
+        self._expressions = {}
+        self._derivative_vars = {}
+        self._in_constraints = {}
+        self._in_equalities = {}
+        self._in_inequalities = {}
+        self._fixed = {}
+        self._n_fixed = 0
+        self._n_unfixed_in_equalities = 0
+        # Constraint and objective counts, keyed by (kind, active) for
+        # constraints in counted blocks
+        self._con_counts = {}
+        self._n_active_equalities = 0  # in visible blocks
+        self._n_objectives = 0
+        self._n_active_objectives = 0
+
+        for r in self._records:
+            parent_visible = r.parent is None or self._records[r.parent].visible
+            r.scan(parent_visible)
+            self._tally(r, 1)
+
+    def _add_record(self, block, parent):
+        i = len(self._records)
+        r = _CensusBlock(block, parent)
+        self._records.append(r)
+        self._index[id(block)] = i
+        for b in block.component_data_objects(
+            ctype=Block, active=None, descend_into=False
+        ):
+            self._add_record(b, i)
+        r.end = len(self._records)
+
+    def update(self, *blocks):
+        """
+        Rescan the activity, fixed and constraint type flags in some blocks
+        (and their sub-blocks) and update the census.  Variables that appear in
+        the constraints of these blocks are also checked for fixed status.
+
+        Args:
+            blocks : Blocks to rescan, indexed Blocks rescan all their elements
+
+        Returns:
+            None
+        """
+        ranges = []
+        for b in blocks:
+            if b.is_indexed():
+                bdata = b.values()
+            else:
+                bdata = [b]
+            for bd in bdata:
+                try:
+                    i = self._index[id(bd)]
+                except KeyError:
+                    raise KeyError(
+                        f"Block {bd.name} is not part of the model census, "
+                        f"call refresh() after adding components to the model."
+                    )
+                ranges.append((i, self._records[i].end))
+        # Merge nested and overlapping ranges, so records are only handled once
+        positions = []
+        last = -1
+        for start, end in sorted(ranges):
+            start = max(start, last)
+            if start < end:
+                positions.extend(range(start, end))
+                last = end
+
+        records = [self._records[i] for i in positions]
+        for r in records:
+            self._tally(r, -1)
+        for r in records:
+            for v in r.variables:
+                self._update_fixed(v)
+            for cvars in r.con_vars:
+                for v in cvars:
+                    self._update_fixed(v)
+        for r in records:
+            parent_visible = r.parent is None or self._records[r.parent].visible
+            r.scan(parent_visible)
+            self._tally(r, 1)
+
+    def _is_fixed(self, v):
+        try:
+            return self._fixed[id(v)]
+        except KeyError:
+            f = self._fixed[id(v)] = v.fixed
+            return f
+
+    def _update_fixed(self, v):
+        vid = id(v)
+        old = self._is_fixed(v)
+        new = v.fixed
+        if old == new:
+            return
+        self._fixed[vid] = new
+        change = 1 if new else -1
+        if vid in self._variables:
+            self._n_fixed += change
+        if vid in self._in_equalities:
+            self._n_unfixed_in_equalities -= change
+
+    def _count(self, tally, o, sign):
+        """
+        Add (sign=1) or remove (sign=-1) a component from a tally. Returns True
+        if the component was added to or removed from the tally completely.
+        """
+        oid = id(o)
+        if sign > 0:
+            try:
+                tally[oid][1] += 1
+                return False
+            except KeyError:
+                tally[oid] = [o, 1]
+                return True
+        else:
+            entry = tally[oid]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del tally[oid]
+                return True
+            return False
+
+    def _tally(self, r, sign):
+        """
+        Add (sign=1) or remove (sign=-1) the contribution of a block record to
+        the census tallies, based on the flags from the last scan.
+        """
+        if r.visible:
+            for v in r.variables:
+                if self._count(self._variables, v, sign) and self._is_fixed(v):
+                    self._n_fixed += sign
+            for e in r.expressions:
+                self._count(self._expressions, e, sign)
+            for dv in r.derivative_vars:
+                self._count(self._derivative_vars, dv, sign)
+            for cvars, kind, active in zip(r.con_vars, r.con_kind, r.con_active):
+                if not active:
+                    continue
+                for v in cvars:
+                    self._count(self._in_constraints, v, sign)
+                if kind == "eq":
+                    self._n_active_equalities += sign
+                    for v in cvars:
+                        if self._count(
+                            self._in_equalities, v, sign
+                        ) and not self._is_fixed(v):
+                            self._n_unfixed_in_equalities += sign
+                elif kind == "ineq":
+                    for v in cvars:
+                        self._count(self._in_inequalities, v, sign)
+        if r.counted:
+            for kind, active in zip(r.con_kind, r.con_active):
+                key = (kind, active)
+                self._con_counts[key] = self._con_counts.get(key, 0) + sign
+            for active in r.obj_active:
+                self._n_objectives += sign
+                if active:
+                    self._n_active_objectives += sign
+
+    # ---------------------------------------------------------------------
+    # Helpers for building sets
+    def _constraints(self, kind=(None, "eq", "ineq"), active=(True, False)):
+        cset = ComponentSet()
+        for r in self._records:
+            if not r.counted:
+                continue
+            for c, k, a in zip(r.constraints, r.con_kind, r.con_active):
+                if k in kind and a in active:
+                    cset.add(c)
+        return cset
+
+    def _objectives(self, active=(True, False)):
+        oset = ComponentSet()
+        for r in self._records:
+            if not r.counted:
+                continue
+            for o, a in zip(r.objectives, r.obj_active):
+                if a in active:
+                    oset.add(o)
+        return oset
+
+    def _n_constraints(self, kind=(None, "eq", "ineq"), active=(True, False)):
+        return sum(self._con_counts.get((k, a), 0) for k in kind for a in active)
+
+    def _set(self, tally, fixed=None):
+        if fixed is None:
+            return ComponentSet(o for o, n in tally.values())
+        return ComponentSet(
+            o for oid, (o, n) in tally.items() if self._fixed[oid] == fixed
+        )
+
+    # ---------------------------------------------------------------------
+    # Block statistics
+    def total_blocks_set(self):
+        """ComponentSet of all Block components in the model"""
+        return ComponentSet(r.block for r in self._records)
+
+    def number_total_blocks(self):
+        """Number of Block components in the model"""
+        return len(self._records)
+
+    def activated_blocks_set(self):
+        """ComponentSet of all activated Block components in the model"""
+        return ComponentSet(r.block for r in self._records if r.visible)
+
+    def number_activated_blocks(self):
+        """Number of activated Block components in the model"""
+        return sum(1 for r in self._records if r.visible)
+
+    def deactivated_blocks_set(self):
+        """ComponentSet of all deactivated Block components in the model"""
+        return ComponentSet(r.block for r in self._records if not r.visible)
+
+    def number_deactivated_blocks(self):
+        """Number of deactivated Block components in the model"""
+        return self.number_total_blocks() - self.number_activated_blocks()
+
+    # ---------------------------------------------------------------------
+    # Constraint statistics
+    def total_constraints_set(self):
+        """ComponentSet of all Constraint components in the model"""
+        return self._constraints()
+
+    def number_total_constraints(self):
+        """Number of Constraint components in the model"""
+        return self._n_constraints()
+
+    def activated_constraints_set(self):
+        """ComponentSet of all activated Constraint components in the model"""
+        return self._constraints(active=(True,))
+
+    def number_activated_constraints(self):
+        """Number of activated Constraint components in the model"""
+        return self._n_constraints(active=(True,))
+
+    def deactivated_constraints_set(self):
+        """ComponentSet of all deactivated Constraint components in the model"""
+        return self._constraints(active=(False,))
+
+    def number_deactivated_constraints(self):
+        """Number of deactivated Constraint components in the model"""
+        return self._n_constraints(active=(False,))
+
+    def total_equalities_set(self):
+        """ComponentSet of all equality Constraint components in the model"""
+        return self._constraints(kind=("eq",))
+
+    def number_total_equalities(self):
+        """Number of equality Constraint components in the model"""
+        return self._n_constraints(kind=("eq",))
+
+    def activated_equalities_set(self):
+        """ComponentSet of activated equality Constraint components"""
+        if not self._records[0].visible:
+            return ComponentSet()
+        return self._constraints(kind=("eq",), active=(True,))
+
+    def number_activated_equalities(self):
+        """Number of activated equality Constraint components"""
+        return self._n_active_equalities
+
+    def deactivated_equalities_set(self):
+        """ComponentSet of deactivated equality Constraint components"""
+        return self._constraints(kind=("eq",), active=(False,))
+
+    def number_deactivated_equalities(self):
+        """Number of deactivated equality Constraint components"""
+        return self._n_constraints(kind=("eq",), active=(False,))
+
+    def total_inequalities_set(self):
+        """ComponentSet of all inequality Constraint components in the model"""
+        return self._constraints(kind=("ineq",))
+
+    def number_total_inequalities(self):
+        """Number of inequality Constraint components in the model"""
+        return self._n_constraints(kind=("ineq",))
+
+    def activated_inequalities_set(self):
+        """ComponentSet of activated inequality Constraint components"""
+        if not self._records[0].visible:
+            return ComponentSet()
+        return self._constraints(kind=("ineq",), active=(True,))
+
+    def number_activated_inequalities(self):
+        """Number of activated inequality Constraint components"""
+        return len(self.activated_inequalities_set())
+
+    def deactivated_inequalities_set(self):
+        """ComponentSet of deactivated inequality Constraint components"""
+        return self._constraints(kind=("ineq",), active=(False,))
+
+    def number_deactivated_inequalities(self):
+        """Number of deactivated inequality Constraint components"""
+        return self._n_constraints(kind=("ineq",), active=(False,))
+
+    # ---------------------------------------------------------------------
+    # Variable statistics
+    def variables_set(self):
+        """ComponentSet of all Var components in the model"""
+        return self._set(self._variables)
+
+    def number_variables(self):
+        """Number of Var components in the model"""
+        return len(self._variables)
+
+    def fixed_variables_set(self):
+        """ComponentSet of all fixed Var components in the model"""
+        return self._set(self._variables, fixed=True)
+
+    def number_fixed_variables(self):
+        """Number of fixed Var components in the model"""
+        return self._n_fixed
+
+    def unfixed_variables_set(self):
+        """ComponentSet of all unfixed Var components in the model"""
+        return self._set(self._variables, fixed=False)
+
+    def number_unfixed_variables(self):
+        """Number of unfixed Var components in the model"""
+        return len(self._variables) - self._n_fixed
+
+    def variables_in_activated_constraints_set(self):
+        """ComponentSet of Var components in activated Constraints"""
+        return self._set(self._in_constraints)
+
+    def number_variables_in_activated_constraints(self):
+        """Number of Var components in activated Constraints"""
+        return len(self._in_constraints)
+
+    def variables_in_activated_equalities_set(self):
+        """ComponentSet of Var components in activated equality Constraints"""
+        return self._set(self._in_equalities)
+
+    def number_variables_in_activated_equalities(self):
+        """Number of Var components in activated equality Constraints"""
+        return len(self._in_equalities)
+
+    def variables_in_activated_inequalities_set(self):
+        """ComponentSet of Var components in activated inequality Constraints"""
+        return self._set(self._in_inequalities)
+
+    def number_variables_in_activated_inequalities(self):
+        """Number of Var components in activated inequality Constraints"""
+        return len(self._in_inequalities)
+
+    def variables_only_in_inequalities(self):
+        """ComponentSet of Var components only in inequality Constraints"""
+        return ComponentSet(
+            v
+            for vid, (v, n) in self._in_inequalities.items()
+            if vid not in self._in_equalities
+        )
+
+    def number_variables_only_in_inequalities(self):
+        """Number of Var components only in inequality Constraints"""
+        return len(self.variables_only_in_inequalities())
+
+    def fixed_variables_in_activated_equalities_set(self):
+        """ComponentSet of fixed Var components in activated equalities"""
+        return self._set(self._in_equalities, fixed=True)
+
+    def number_fixed_variables_in_activated_equalities(self):
+        """Number of fixed Var components in activated equalities"""
+        return len(self._in_equalities) - self._n_unfixed_in_equalities
+
+    def unfixed_variables_in_activated_equalities_set(self):
+        """ComponentSet of unfixed Var components in activated equalities"""
+        return self._set(self._in_equalities, fixed=False)
+
+    def number_unfixed_variables_in_activated_equalities(self):
+        """Number of unfixed Var components in activated equalities"""
+        return self._n_unfixed_in_equalities
+
+    def fixed_variables_only_in_inequalities(self):
+        """ComponentSet of fixed Var components only in inequalities"""
+        return ComponentSet(
+            v for v in self.variables_only_in_inequalities() if self._fixed[id(v)]
+        )
+
+    def number_fixed_variables_only_in_inequalities(self):
+        """Number of fixed Var components only in inequalities"""
+        return len(self.fixed_variables_only_in_inequalities())
+
+    def unused_variables_set(self):
+        """ComponentSet of Var components not in any activated Constraint"""
+        return ComponentSet(
+            v
+            for vid, (v, n) in self._variables.items()
+            if vid not in self._in_constraints
+        )
+
+    def number_unused_variables(self):
+        """Number of Var components not in any activated Constraint"""
+        return len(self.unused_variables_set())
+
+    def fixed_unused_variables_set(self):
+        """ComponentSet of fixed Var components not in any active Constraint"""
+        return ComponentSet(
+            v for v in self.unused_variables_set() if self._fixed[id(v)]
+        )
+
+    def number_fixed_unused_variables(self):
+        """Number of fixed Var components not in any activated Constraint"""
+        return len(self.fixed_unused_variables_set())
+
+    def active_variables_in_deactivated_blocks_set(self):
+        """
+        ComponentSet of Var components in activated Constraints which belong
+        to a deactivated Block
+        """
+        visible = set(id(r.block) for r in self._records if r.visible)
+        return ComponentSet(
+            v
+            for v, n in self._in_constraints.values()
+            if id(v.parent_block()) not in visible
+        )
+
+    def number_active_variables_in_deactivated_blocks(self):
+        """
+        Number of Var components in activated Constraints which belong to a
+        deactivated Block
+        """
+        return len(self.active_variables_in_deactivated_blocks_set())
+
+    def derivative_variables_set(self):
+        """ComponentSet of DerivativeVar components in the model"""
+        return self._set(self._derivative_vars)
+
+    def number_derivative_variables(self):
+        """Number of DerivativeVar components in the model"""
+        return len(self._derivative_vars)
+
+    # ---------------------------------------------------------------------
+    # Objective and Expression statistics
+    def total_objectives_set(self):
+        """ComponentSet of all Objective components in the model"""
+        return self._objectives()
+
+    def number_total_objectives(self):
+        """Number of Objective components in the model"""
+        return self._n_objectives
+
+    def activated_objectives_set(self):
+        """ComponentSet of activated Objective components in the model"""
+        return self._objectives(active=(True,))
+
+    def number_activated_objectives(self):
+        """Number of activated Objective components in the model"""
+        return self._n_active_objectives
+
+    def deactivated_objectives_set(self):
+        """ComponentSet of deactivated Objective components in the model"""
+        return self._objectives(active=(False,))
+
+    def number_deactivated_objectives(self):
+        """Number of deactivated Objective components in the model"""
+        return self._n_objectives - self._n_active_objectives
+
+    def expressions_set(self):
+        """ComponentSet of Expression components in the model"""
+        return self._set(self._expressions)
+
+    def number_expressions(self):
+        """Number of Expression components in the model"""
+        return len(self._expressions)
+
+    # ---------------------------------------------------------------------
+    # Other model statistics
+    def degrees_of_freedom(self):
+        """
+        Degrees of freedom of the model. This is answered from the census
+        tallies without walking the model.
+        """
+        return self._n_unfixed_in_equalities - self._n_active_equalities
+
+    def report_statistics(self, ostream=None):
+        """
+        Print a report of the model statistics, see report_statistics().
+        """
+        report_statistics(self.block, ostream=ostream, census=self)
+
+
 # -------------------------------------------------------------------------
 # Reporting methods
-def report_statistics(block, ostream=None):
+def report_statistics(block, ostream=None, census=None):
     """
     Method to print a report of the model statistics for a Pyomo Block
 
     Args:
         block : the Block object to report statistics from
         ostream : output stream for printing (defaults to sys.stdout)
+        census : optional ModelCensus of block to report from, if None a new
+            ModelCensus is made (which walks the model once).
 
     Returns:
         Printed output of the model statistics
     """
     if ostream is None:
         ostream = sys.stdout
+    if census is None:
+        census = ModelCensus(block)
 
     tab = " " * 4
     header = "=" * 72
@@ -1435,56 +2222,58 @@ def report_statistics(block, ostream=None):
     ostream.write(header + "\n")
     ostream.write(f"Model Statistics  {name_str} \n")
     ostream.write("\n")
-    ostream.write(f"Degrees of Freedom: " f"{degrees_of_freedom(block)} \n")
+    ostream.write(f"Degrees of Freedom: " f"{census.degrees_of_freedom()} \n")
     ostream.write("\n")
-    ostream.write(f"Total No. Variables: " f"{number_variables(block)} \n")
+    ostream.write(f"Total No. Variables: " f"{census.number_variables()} \n")
     ostream.write(
-        f"{tab}No. Fixed Variables: " f"{number_fixed_variables(block)}" f"\n"
+        f"{tab}No. Fixed Variables: " f"{census.number_fixed_variables()}" f"\n"
     )
     ostream.write(
         f"{tab}No. Unused Variables: "
-        f"{number_unused_variables(block)} (Fixed):"
-        f"{number_fixed_unused_variables(block)})"
+        f"{census.number_unused_variables()} (Fixed):"
+        f"{census.number_fixed_unused_variables()})"
         f"\n"
     )
-    nv_alias = number_variables_only_in_inequalities
-    nfv_alias = number_fixed_variables_only_in_inequalities
+    nv_alias = census.number_variables_only_in_inequalities
+    nfv_alias = census.number_fixed_variables_only_in_inequalities
     ostream.write(
         f"{tab}No. Variables only in Inequalities:"
-        f" {nv_alias(block)}"
-        f" (Fixed: {nfv_alias(block)}) \n"
+        f" {nv_alias()}"
+        f" (Fixed: {nfv_alias()}) \n"
     )
     ostream.write("\n")
-    ostream.write(f"Total No. Constraints: " f"{number_total_constraints(block)} \n")
+    ostream.write(
+        f"Total No. Constraints: " f"{census.number_total_constraints()} \n"
+    )
     ostream.write(
         f"{tab}No. Equality Constraints: "
-        f"{number_total_equalities(block)}"
+        f"{census.number_total_equalities()}"
         f" (Deactivated: "
-        f"{number_deactivated_equalities(block)})"
+        f"{census.number_deactivated_equalities()})"
         f"\n"
     )
     ostream.write(
         f"{tab}No. Inequality Constraints: "
-        f"{number_total_inequalities(block)}"
+        f"{census.number_total_inequalities()}"
         f" (Deactivated: "
-        f"{number_deactivated_inequalities(block)})"
+        f"{census.number_deactivated_inequalities()})"
         f"\n"
     )
     ostream.write("\n")
     ostream.write(
         f"No. Objectives: "
-        f"{number_total_objectives(block)}"
+        f"{census.number_total_objectives()}"
         f" (Deactivated: "
-        f"{number_deactivated_objectives(block)})"
+        f"{census.number_deactivated_objectives()})"
         f"\n"
     )
     ostream.write("\n")
     ostream.write(
-        f"No. Blocks: {number_total_blocks(block)}"
+        f"No. Blocks: {census.number_total_blocks()}"
         f" (Deactivated: "
-        f"{number_deactivated_blocks(block)}) \n"
+        f"{census.number_deactivated_blocks()}) \n"
     )
-    ostream.write(f"No. Expressions: " f"{number_expressions(block)} \n")
+    ostream.write(f"No. Expressions: " f"{census.number_expressions()} \n")
     ostream.write(header + "\n")
     ostream.write("\n")
 
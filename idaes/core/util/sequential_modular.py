@@ -0,0 +1,657 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Sequential-modular initialization of flowsheets.
+
+The units of a flowsheet and the Arcs connecting them are used to build a
+directed graph. Recycle loops (strongly connected components of the graph) are
+broken by selecting tear streams, which gives an acyclic calculation order.
+Units that do not depend on each other are initialized concurrently in a pool
+of worker processes, with the state of each unit shipped between processes
+using the model serializer. Recycle loops are converged by direct substitution
+or Wegstein's method on the tear stream variables.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from pyomo.environ import Block, value
+from pyomo.network import Arc
+from pyomo.common.config import (
+    ConfigBlock,
+    ConfigValue,
+    In,
+    add_docstring_list,
+)
+
+from idaes.core.base.unit_model import UnitModelBlockData
+from idaes.core.util.exceptions import ConfigurationError
+from idaes.core.util.initialization import PropagationPlan
+from idaes.core.util.model_serializer import StoreSpec, to_json, from_json
+import idaes.logger as idaeslog
+
+_log = idaeslog.getLogger(__name__)
+
+
+Stage = namedtuple("Stage", ["levels", "tear_arcs"])
+Stage.__doc__ = """
+A step in a sequential-modular calculation order.
+
+Attributes:
+    levels: list of lists of units. The units in a level only depend on units
+        in earlier levels (or earlier stages), so they can be initialized
+        concurrently.
+    tear_arcs: list of the Arcs torn to break the recycle loop of the stage.
+        Empty if the stage is not a recycle loop, in which case the levels are
+        only calculated once.
+"""
+
+
+class FlowsheetGraph(object):
+    """
+    Directed graph of the units in a flowsheet, with an edge for each Arc
+    connecting two units.
+
+    Attributes:
+        units: list of unit blocks in model order. Units are the direct
+            sub-blocks of the flowsheet that are unit models or contain a Port
+            connected by an Arc.
+        arcs: list of (Arc, source unit, destination unit) tuples. The source
+            unit is None if the Arc source is not part of a unit.
+        successors: dict of unit to list of (Arc, destination unit)
+        predecessors: dict of unit to list of (Arc, source unit)
+    """
+
+    def __init__(self, fs):
+        if not (hasattr(fs, "is_flowsheet") and fs.is_flowsheet()):
+            raise TypeError(
+                f"{fs.name} is not a FlowsheetBlock, a flowsheet is required to "
+                f"build a flowsheet graph."
+            )
+        self.flowsheet = fs
+        units = {}
+        for b in fs.component_data_objects(Block, descend_into=False):
+            if isinstance(b, UnitModelBlockData):
+                units[id(b)] = b
+        self.arcs = []
+        for arc in fs.component_data_objects(Arc, descend_into=True):
+            src = _unit_of(arc.src, fs)
+            dest = _unit_of(arc.dest, fs)
+            if dest is None:
+                # Nothing to initialize downstream of a flowsheet level port
+                continue
+            if src is dest:
+                # Connection internal to a unit
+                continue
+            for u in (src, dest):
+                if u is not None:
+                    units.setdefault(id(u), u)
+            self.arcs.append((arc, src, dest))
+        # keep the units in the order they appear in the model
+        order = {
+            id(b): n
+            for n, b in enumerate(fs.component_data_objects(Block, descend_into=False))
+        }
+        self.units = sorted(units.values(), key=lambda b: order[id(b)])
+        self.successors = {u: [] for u in self.units}
+        self.predecessors = {u: [] for u in self.units}
+        for arc, src, dest in self.arcs:
+            self.predecessors[dest].append((arc, src))
+            if src is not None:
+                self.successors[src].append((arc, dest))
+
+    def strongly_connected_components(self):
+        """
+        Find the strongly connected components of the graph using Tarjan's
+        algorithm. Components are returned in topological order, and units
+        within a component are in model order.
+
+        Returns:
+            list of lists of units
+        """
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+        for root in self.units:
+            if root in index:
+                continue
+            # iterative depth first search, each work item is a unit and an
+            # iterator over its successors
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.successors[root]))]
+            while work:
+                u, it = work[-1]
+                advanced = False
+                for _, v in it:
+                    if v not in index:
+                        index[v] = low[v] = counter
+                        counter += 1
+                        stack.append(v)
+                        on_stack.add(v)
+                        work.append((v, iter(self.successors[v])))
+                        advanced = True
+                        break
+                    elif v in on_stack:
+                        low[u] = min(low[u], index[v])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    p = work[-1][0]
+                    low[p] = min(low[p], low[u])
+                if low[u] == index[u]:
+                    comp = []
+                    while True:
+                        v = stack.pop()
+                        on_stack.discard(v)
+                        comp.append(v)
+                        if v is u:
+                            break
+                    components.append(comp)
+        # Tarjan's algorithm gives reverse topological order
+        components.reverse()
+        position = {u: n for n, u in enumerate(self.units)}
+        for comp in components:
+            comp.sort(key=lambda u: position[u])
+        return components
+
+    def select_tear_arcs(self, component):
+        """
+        Select a set of Arcs to tear to break all the cycles in a strongly
+        connected component. A depth first search is started from the units
+        fed from outside the component, and the Arcs that close a cycle (back
+        edges) are torn, so the tears are the recycle streams returning to the
+        start of the loop.
+
+        Args:
+            component: list of units in a strongly connected component
+
+        Returns:
+            list of Arcs
+        """
+        members = set(component)
+        starts = [
+            u
+            for u in component
+            if any(src not in members for _, src in self.predecessors[u])
+        ]
+        starts.extend(u for u in component if u not in starts)
+        tears = []
+        state = {}  # 1 on the search path, 2 finished
+        for root in starts:
+            if root in state:
+                continue
+            state[root] = 1
+            work = [(root, iter(self.successors[root]))]
+            while work:
+                u, it = work[-1]
+                for arc, v in it:
+                    if v not in members:
+                        continue
+                    if v not in state:
+                        state[v] = 1
+                        work.append((v, iter(self.successors[v])))
+                        break
+                    elif state[v] == 1:
+                        tears.append(arc)
+                else:
+                    state[u] = 2
+                    work.pop()
+        return tears
+
+    def levels(self, units, tear_arcs=()):
+        """
+        Split a set of units into levels that can be calculated concurrently,
+        ignoring the torn Arcs. The first level contains the units that do
+        not depend on any other unit in the set.
+
+        Args:
+            units: list of units
+            tear_arcs: Arcs to ignore
+
+        Returns:
+            list of lists of units
+
+        Raises:
+            ConfigurationError: if the torn Arcs do not break all the cycles
+        """
+        members = set(units)
+        torn = set(id(a) for a in tear_arcs)
+        n_in = {u: 0 for u in units}
+        for u in units:
+            for arc, src in self.predecessors[u]:
+                if src in members and id(arc) not in torn:
+                    n_in[u] += 1
+        level = [u for u in units if n_in[u] == 0]
+        levels = []
+        n_done = 0
+        while level:
+            levels.append(level)
+            n_done += len(level)
+            nxt = set()
+            for u in level:
+                for arc, v in self.successors[u]:
+                    if v in members and id(arc) not in torn:
+                        n_in[v] -= 1
+                        if n_in[v] == 0:
+                            nxt.add(v)
+            level = [v for v in units if v in nxt]
+        if n_done != len(units):
+            raise ConfigurationError(
+                "The tear streams do not break all the recycle loops between "
+                "units {}.".format(", ".join(u.name for u in units if n_in[u] > 0))
+            )
+        return levels
+
+
+def _unit_of(port, fs):
+    """
+    Return the direct sub-block of the flowsheet fs that contains port, or None
+    if the port is not in a sub-block of fs.
+    """
+    b = port.parent_block()
+    while b is not None and b.parent_block() is not fs:
+        b = b.parent_block()
+    return b
+
+
+def _default_unit_initializer(unit, **kwargs):
+    unit.initialize(**kwargs)
+
+
+# State of a process pool worker, the model is built once per worker
+_worker_state = {}
+
+
+def _process_worker_init(model_builder):
+    _worker_state["model"] = model_builder()
+
+
+def _process_worker_run(unit_name, state, unit_initializer, kwargs):
+    unit = _worker_state["model"].find_component(unit_name)
+    if unit is None:
+        raise ConfigurationError(
+            f"Unit {unit_name} was not found in the model built by the "
+            f"model_builder in the worker process."
+        )
+    wts = StoreSpec.value_isfixed_isactive(only_fixed=False)
+    from_json(unit, sd=state, wts=wts)
+    unit_initializer(unit, **kwargs)
+    return to_json(unit, wts=wts, return_dict=True)
+
+
+class SequentialModularInitializer(object):
+    """
+    Initialize a flowsheet unit by unit in sequential-modular order.
+
+    The calculation order is found from the Arcs connecting the units of the
+    flowsheet. Before a unit is initialized, the state of each Arc feeding the
+    unit is propagated to it. Units that do not depend on each other can be
+    initialized concurrently in a pool of worker processes. Each worker builds
+    its own copy of the model by calling model_builder, and the state of a unit
+    is sent to and from the workers with the model serializer. Recycle loops
+    are converged by iterating on the variables of the torn Arc destinations.
+
+    Keyword arguments below can be given to the constructor, and are stored
+    in the config attribute.
+
+    """
+
+    CONFIG = ConfigBlock()
+    CONFIG.declare(
+        "n_workers",
+        ConfigValue(
+            default=None,
+            domain=int,
+            description="Number of worker processes to initialize units in",
+            doc="Number of worker processes used to initialize independent "
+            "units concurrently. If None or 1, units are initialized in this "
+            "process. More than one worker requires model_builder.",
+        ),
+    )
+    CONFIG.declare(
+        "model_builder",
+        ConfigValue(
+            default=None,
+            description="Picklable callable that builds the model",
+            doc="Picklable callable with no arguments that returns a model with "
+            "the same structure as the model being initialized. It is called "
+            "once in each worker process.",
+        ),
+    )
+    CONFIG.declare(
+        "unit_initializer",
+        ConfigValue(
+            default=_default_unit_initializer,
+            description="Callable used to initialize a unit",
+            doc="Callable taking a unit block and keyword arguments from "
+            "unit_options that initializes the unit, the default calls the "
+            "initialize method of the unit. Must be picklable if n_workers > 1.",
+        ),
+    )
+    CONFIG.declare(
+        "unit_options",
+        ConfigValue(
+            default=None,
+            description="Initialization arguments for units",
+            doc="Dictionary of unit (or unit name) to a dictionary of keyword "
+            "arguments to pass to unit_initializer for that unit.",
+        ),
+    )
+    CONFIG.declare(
+        "tear_arcs",
+        ConfigValue(
+            default=None,
+            description="Arcs to tear",
+            doc="List of Arcs to tear to break the recycle loops. If None, "
+            "tear streams are selected automatically.",
+        ),
+    )
+    CONFIG.declare(
+        "tear_guesses",
+        ConfigValue(
+            default=None,
+            description="Initial guesses for tear streams",
+            doc="Dictionary of torn Arc to a dictionary of initial guesses for "
+            "the destination Port, keyed by Port member name. Guesses for "
+            "indexed members are dictionaries keyed by index. Members "
+            "without a guess keep their current value.",
+        ),
+    )
+    CONFIG.declare(
+        "tear_method",
+        ConfigValue(
+            default="Wegstein",
+            domain=In(["Wegstein", "Direct"]),
+            description="Method used to converge recycle loops",
+        ),
+    )
+    CONFIG.declare(
+        "max_iterations",
+        ConfigValue(
+            default=40,
+            domain=int,
+            description="Maximum number of iterations for each recycle loop",
+        ),
+    )
+    CONFIG.declare(
+        "tol",
+        ConfigValue(
+            default=1e-5,
+            domain=float,
+            description="Tear stream convergence tolerance",
+            doc="A recycle loop is converged when the change in each tear "
+            "variable is less than tol times the larger of 1 and the "
+            "magnitude of the variable.",
+        ),
+    )
+    CONFIG.declare(
+        "accel_min",
+        ConfigValue(
+            default=-5.0,
+            domain=float,
+            description="Lower bound of the Wegstein acceleration factor",
+        ),
+    )
+    CONFIG.declare(
+        "accel_max",
+        ConfigValue(
+            default=0.0,
+            domain=float,
+            description="Upper bound of the Wegstein acceleration factor",
+        ),
+    )
+    CONFIG.declare(
+        "outlvl",
+        ConfigValue(
+            default=idaeslog.NOTSET,
+            description="Output level for the initialization log",
+        ),
+    )
+
+    __doc__ = add_docstring_list(__doc__, CONFIG)
+
+    def __init__(self, **kwargs):
+        self.config = self.CONFIG(kwargs)
+        self.iterations = {}
+        self._plans = {}
+
+    def create_schedule(self, fs):
+        """
+        Build the calculation order for a flowsheet.
+
+        Args:
+            fs: FlowsheetBlock to initialize
+
+        Returns:
+            (FlowsheetGraph, list of Stage)
+        """
+        graph = FlowsheetGraph(fs)
+        user_tears = None
+        if self.config.tear_arcs is not None:
+            user_tears = set(id(a) for a in self.config.tear_arcs)
+            known = set(id(a) for a, _, _ in graph.arcs)
+            for a in self.config.tear_arcs:
+                if id(a) not in known:
+                    raise ConfigurationError(
+                        f"Tear stream {a.name} is not an Arc between two units "
+                        f"of {fs.name}."
+                    )
+        stages = []
+        # Stages at the same depth of the graph of components do not depend on
+        # each other. Units of acyclic components at the same depth are
+        # collected in one stage so they are initialized concurrently.
+        depth = {}
+        batches = {}
+        loops = {}
+        for comp in graph.strongly_connected_components():
+            members = set(comp)
+            d = 0
+            for u in comp:
+                for _, src in graph.predecessors[u]:
+                    if src is not None and src not in members:
+                        d = max(d, depth[src] + 1)
+            for u in comp:
+                depth[u] = d
+            cyclic = len(comp) > 1 or any(
+                v is comp[0] for _, v in graph.successors[comp[0]]
+            )
+            if not cyclic:
+                batches.setdefault(d, []).extend(comp)
+                continue
+            if user_tears is None:
+                tears = graph.select_tear_arcs(comp)
+            else:
+                tears = [
+                    a
+                    for a, src, dest in graph.arcs
+                    if id(a) in user_tears and src in members and dest in members
+                ]
+            loops.setdefault(d, []).append(Stage(graph.levels(comp, tears), tears))
+        position = {u: n for n, u in enumerate(graph.units)}
+        for d in sorted(set(batches) | set(loops)):
+            if d in batches:
+                batch = sorted(batches[d], key=lambda u: position[u])
+                stages.append(Stage([batch], []))
+            stages.extend(loops.get(d, []))
+        return graph, stages
+
+    def initialize(self, fs):
+        """
+        Initialize all the units in a flowsheet.
+
+        Args:
+            fs: FlowsheetBlock to initialize
+
+        Returns:
+            None
+        """
+        init_log = idaeslog.getInitLogger(fs.name, self.config.outlvl)
+        graph, stages = self.create_schedule(fs)
+        n_workers = self.config.n_workers
+        executor = None
+        if n_workers is not None and n_workers > 1:
+            if self.config.model_builder is None:
+                raise ConfigurationError(
+                    "A model_builder is required to initialize units in more "
+                    "than one worker process."
+                )
+            executor = ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_process_worker_init,
+                initargs=(self.config.model_builder,),
+            )
+        self.iterations = {}
+        # Arc propagation plans are built on first use and reused for every
+        # pass through a recycle loop
+        self._plans = {}
+        try:
+            for stage in stages:
+                if stage.tear_arcs:
+                    self._converge_loop(graph, stage, executor, init_log)
+                else:
+                    self._run_levels(graph, stage, executor)
+        finally:
+            self._plans = {}
+            if executor is not None:
+                executor.shutdown()
+        init_log.info("Flowsheet initialization complete.")
+
+    def _unit_kwargs(self, unit):
+        opts = self.config.unit_options
+        if not opts:
+            return {}
+        if unit in opts:
+            return opts[unit]
+        return opts.get(unit.local_name, {})
+
+    def _run_levels(self, graph, stage, executor):
+        torn = set(id(a) for a in stage.tear_arcs)
+        for level in stage.levels:
+            for u in level:
+                for arc, _ in graph.predecessors[u]:
+                    if id(arc) not in torn:
+                        self._propagate(arc)
+            self._initialize_units(level, executor)
+
+    def _propagate(self, arc):
+        try:
+            plan = self._plans[id(arc)]
+        except KeyError:
+            plan = self._plans[id(arc)] = PropagationPlan(arc)
+        plan.propagate()
+
+    def _initialize_units(self, units, executor):
+        unit_initializer = self.config.unit_initializer
+        if executor is None or len(units) == 1:
+            for u in units:
+                _log.debug(f"Initializing {u.name}")
+                unit_initializer(u, **self._unit_kwargs(u))
+            return
+        wts = StoreSpec.value_isfixed_isactive(only_fixed=False)
+        futures = []
+        for u in units:
+            _log.debug(f"Initializing {u.name} in worker process")
+            futures.append(
+                executor.submit(
+                    _process_worker_run,
+                    u.name,
+                    to_json(u, wts=wts, return_dict=True),
+                    unit_initializer,
+                    self._unit_kwargs(u),
+                )
+            )
+        # load results in unit order, so the outcome does not depend on timing
+        for u, future in zip(units, futures):
+            from_json(u, sd=future.result(), wts=wts)
+
+    def _converge_loop(self, graph, stage, executor, init_log):
+        guesses = self.config.tear_guesses or {}
+        dest_vars = []
+        src_vals = []
+        for arc in stage.tear_arcs:
+            if arc in guesses:
+                _set_guesses(arc.dest, guesses[arc])
+            for k, v in arc.dest.vars.items():
+                for i in v:
+                    if v[i].is_variable_type() and not v[i].fixed:
+                        dest_vars.append(v[i])
+                        src_vals.append(arc.src.vars[k][i])
+        lb = np.array(
+            [-np.inf if v.lb is None else v.lb for v in dest_vars], dtype=float
+        )
+        ub = np.array(
+            [np.inf if v.ub is None else v.ub for v in dest_vars], dtype=float
+        )
+        x = np.array(
+            [0.0 if v.value is None else v.value for v in dest_vars], dtype=float
+        )
+        name = ", ".join(a.name for a in stage.tear_arcs)
+        wegstein = self.config.tear_method == "Wegstein"
+        x_prev = gx_prev = None
+        converged = False
+        it = 0
+        while it < self.config.max_iterations:
+            it += 1
+            for v, xi in zip(dest_vars, x):
+                v.value = xi
+            self._run_levels(graph, stage, executor)
+            gx = np.array([value(s) for s in src_vals], dtype=float)
+            err = np.abs(gx - x)
+            if np.all(err <= self.config.tol * np.maximum(1.0, np.abs(x))):
+                converged = True
+                x = gx
+                break
+            init_log.info_high(
+                f"Tear streams {name} iteration {it}, max change {err.max():.3e}"
+            )
+            x_new = gx
+            if wegstein and x_prev is not None:
+                dx = x - x_prev
+                dg = gx - gx_prev
+                q = np.zeros_like(x)
+                ok = dx != 0
+                s = dg[ok] / dx[ok]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    qs = s / (s - 1.0)
+                qs[~np.isfinite(qs)] = 0.0
+                q[ok] = np.clip(qs, self.config.accel_min, self.config.accel_max)
+                x_new = q * x + (1.0 - q) * gx
+            x_prev, gx_prev = x, gx
+            x = np.clip(x_new, lb, ub)
+        for v, xi in zip(dest_vars, x):
+            v.value = xi
+        self.iterations[tuple(stage.tear_arcs)] = it
+        if converged:
+            init_log.info(f"Tear streams {name} converged in {it} iterations.")
+        else:
+            init_log.warning(
+                f"Tear streams {name} did not converge in {it} iterations."
+            )
+
+
+def _set_guesses(port, guesses):
+    for k, g in guesses.items():
+        v = port.vars[k]
+        if isinstance(g, dict):
+            for i, gi in g.items():
+                v[i].value = gi
+        else:
+            for i in v:
+                v[i].value = g
@@ -22,6 +22,7 @@ from pyomo.environ import (
     Var,
     Set,
     TransformationFactory,
+    Reference,
 )
 from pyomo.dae import ContinuousSet, DerivativeVar
 from pyomo.common.collections import ComponentSet
@@ -390,3 +391,113 @@ def test_get_implicit_index_of_set():
 
     with pytest.raises(ValueError) as exc_test:
         get_implicit_index_of_set(m.b1.b2["e", 5, 2].b3.v2[1], m.s1)
+
+
+def _make_time_shift_model(v_init=1):
+    m = ConcreteModel()
+    m.time = ContinuousSet(initialize=[0, 1, 2, 3, 4])
+    m.space = Set(initialize=["a", "b"])
+    m.v = Var(m.time, m.space, initialize=v_init)
+    m.dv = DerivativeVar(m.v, wrt=m.time, initialize=v_init)
+    m.u = Var(initialize=v_init)
+
+    @m.Block(m.time)
+    def b(b, t):
+        b.w = Var(m.space, initialize=v_init)
+
+    TransformationFactory("dae.finite_difference").apply_to(m, wrt=m.time, nfe=4)
+    return m
+
+
+def _time_values(m):
+    return {v.name: v.value for v in m.component_data_objects(Var)}
+
+
+@pytest.mark.unit
+def test_time_shift_plan_copy_values():
+    m1 = _make_time_shift_model()
+    m2 = _make_time_shift_model()
+    for m in (m1, m2):
+        for t in m.time:
+            m.v[t, "a"].set_value(10 * t)
+            m.dv[t, "b"].set_value(-t)
+            m.b[t].w["b"].set_value(t + 0.5)
+        m.v[3, "b"].fix(7)
+        m.u.set_value(-1)
+
+    plan = TimeShiftPlan.from_blocks(m2)
+    assert plan.target_data.shape == (6, 5)
+    assert sorted(plan.get_values(2)) == [-2.0, 1.0, 1.0, 1.0, 2.5, 20.0]
+    assert plan.get_values().shape == (6, 5)
+
+    copy_values_at_time(m1, m1, 3, 1, copy_fixed=False)
+    copy_values_at_time(m2, m2, 3, 1, copy_fixed=False, plan=plan)
+    assert _time_values(m1) == _time_values(m2)
+    assert m2.v[3, "a"].value == 10
+    assert m2.v[3, "b"].value == 7
+
+    for t in [2, 3, 4]:
+        copy_values_at_time(m1, m1, t, 0)
+    plan.copy_values([2, 3, 4], 0)
+    assert _time_values(m1) == _time_values(m2)
+    assert m2.v[3, "b"].value == 1
+    assert m2.u.value == -1
+
+    # values of None are copied
+    m2.b[0].w["a"].set_value(None)
+    plan.copy_values(1, 0)
+    assert m2.b[1].w["a"].value is None
+
+
+@pytest.mark.unit
+def test_time_shift_plan_between_models(caplog):
+    m_ss = _make_time_shift_model(v_init=5)
+    m_ss.v[0, "a"].set_value(2)
+    m_dyn = _make_time_shift_model()
+    m_dyn.x = Var(m_dyn.time)
+
+    plan = TimeShiftPlan.from_blocks(m_dyn, m_ss)
+    assert "x[*] does not exist in source block" in caplog.text
+    assert plan.target_data.shape == (6, 5)
+    plan.copy_values(list(m_dyn.time), 0)
+    for t in m_dyn.time:
+        assert m_dyn.v[t, "a"].value == 2
+        assert m_dyn.v[t, "b"].value == 5
+        assert m_dyn.b[t].w["a"].value == 5
+        assert m_dyn.x[t].value is None
+    assert m_dyn.u.value == 1
+
+    with pytest.raises(ValueError):
+        TimeShiftPlan(m_dyn.time, [m_dyn.x], [])
+
+
+@pytest.mark.unit
+def test_time_shift_plan_shift_values():
+    m = _make_time_shift_model()
+    for t in m.time:
+        m.v[t, "a"].set_value(t)
+        m.b[t].w["a"].set_value(t)
+    m.v[0, "b"].fix(3)
+
+    plan = TimeShiftPlan(
+        m.time,
+        [Reference(m.v[:, "a"]), Reference(m.v[:, "b"]), Reference(m.b[:].w["a"])],
+    )
+    plan.shift_values(2, copy_fixed=False)
+    assert [m.v[t, "a"].value for t in m.time] == [2, 3, 4, 3, 4]
+    assert [m.b[t].w["a"].value for t in m.time] == [2, 3, 4, 3, 4]
+    assert m.v[0, "b"].value == 3
+    assert plan.get_shift_indices(2) == ([0, 1, 2], [2, 3, 4])
+
+    plan.shift_values(-1.00001, tolerance=1e-3)
+    assert [m.v[t, "a"].value for t in m.time] == [2, 2, 3, 4, 3]
+    assert m.v[1, "b"].value == 3
+    plan.shift_values(10)
+    assert [m.v[t, "a"].value for t in m.time] == [2, 2, 3, 4, 3]
+
+    # time sets without find_nearest_index
+    m.s = Set(initialize=[1, 2, 3])
+    m.y = Var(m.s, initialize={1: 1, 2: 2, 3: 3})
+    plan = TimeShiftPlan(m.s, [m.y])
+    plan.shift_values(1)
+    assert [m.y[t].value for t in m.s] == [2, 3, 3]
@@ -31,6 +31,9 @@ from pyomo.environ import (
     check_optimal_termination,
 )
 from pyomo.network import Arc, Port
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
+from pyomo.util.calc_var_value import calculate_variable_from_constraint
 
 from idaes.core import (
     FlowsheetBlock,
@@ -56,7 +59,10 @@ from idaes.core.util.initialization import (
     fix_state_vars,
     revert_state_vars,
     propagate_state,
+    PropagationPlan,
     solve_indexed_blocks,
+    independent_block_groups,
+    IndexedBlockSolverResults,
     initialize_by_time_element,
 )
 from idaes.core.solvers import get_solver
@@ -941,6 +947,177 @@ def test_propagate_state_invalid_direction():
         propagate_state(m.s1, direction="foo")
 
 
+def _propagation_plan_model():
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(default={"dynamic": False, "time_set": [0, 1, 2, 3]})
+    time = m.fs.time
+    m.comp = Set(initialize=["a", "b"])
+    m.stage = Set(initialize=[1, 2, 3, 4, 5])
+
+    def block_rule(b):
+        b.flow = Var(m.comp, time, initialize=0)
+        b.temp = Var(time, initialize=0)
+        b.pres = Var(initialize=0)
+        b.duty = Var(m.stage, initialize=0)
+        b.e = Expression(time, rule=lambda b, t: 2 * b.temp[t])
+
+        b.inlet = Port()
+        b.inlet.add(b.flow, "flow")
+        b.inlet.add(b.temp, "temp")
+        b.inlet.add(b.pres, "pres")
+        b.inlet.add(b.duty, "duty")
+
+        b.outlet = Port()
+        b.outlet.add(b.flow, "flow")
+        b.outlet.add(b.e, "temp")
+        b.outlet.add(b.pres, "pres")
+        b.outlet.add(b.duty, "duty")
+
+    m.fs.b1 = Block(rule=block_rule)
+    m.fs.b2 = Block(rule=block_rule)
+    m.fs.b3 = Block(rule=block_rule)
+    m.fs.s1 = Arc(source=m.fs.b1.outlet, destination=m.fs.b2.inlet)
+    m.fs.s2 = Arc(source=m.fs.b2.outlet, destination=m.fs.b3.inlet)
+
+    for n, t in enumerate(time):
+        m.fs.b1.flow["a", t].value = 10 + n
+        m.fs.b1.flow["b", t].value = 20 + n
+        m.fs.b1.temp[t].value = 300 + n
+    m.fs.b1.pres.value = 1e5
+    for i in m.stage:
+        m.fs.b1.duty[i].value = 100 * i
+    return m
+
+
+@pytest.mark.unit
+def test_propagation_plan():
+    m = _propagation_plan_model()
+    m2 = _propagation_plan_model()
+
+    plan = PropagationPlan(m.fs)
+    assert plan.arcs == [m.fs.s1, m.fs.s2]
+    assert len(plan) == 2 * (8 + 4 + 1 + 5)
+    assert plan.is_valid()
+
+    plan.propagate()
+    propagate_state(m2.fs.s1)
+    propagate_state(m2.fs.s2)
+    for v1, v2 in zip(
+        m.component_data_objects(Var, sort=True),
+        m2.component_data_objects(Var, sort=True),
+    ):
+        assert v1.value == v2.value
+    assert m.fs.b3.temp[2].value == 4 * 302
+    assert m.fs.b3.flow["b", 3].value == 23
+    assert m.fs.b3.pres.value == 1e5
+
+
+@pytest.mark.unit
+def test_propagation_plan_time_window():
+    m = _propagation_plan_model()
+    plan = PropagationPlan(m.fs.s1)
+    plan.propagate(time_window=(1, 2))
+    assert m.fs.b2.temp[0].value == 0
+    assert m.fs.b2.temp[1].value == 2 * 301
+    # time is not the first index of flow
+    assert m.fs.b2.flow["a", 2].value == 12
+    assert m.fs.b2.flow["a", 3].value == 0
+    # members not indexed by time are always copied
+    assert m.fs.b2.pres.value == 1e5
+    assert m.fs.b2.duty[5].value == 500
+
+
+@pytest.mark.unit
+def test_propagation_plan_fixed():
+    m = _propagation_plan_model()
+    m.fs.b2.temp[1].fix(5)
+    m.fs.b1.pres.value = 7
+    m.fs.b2.pres.value = 3
+
+    PropagationPlan([m.fs.s1]).propagate()
+    assert m.fs.b2.temp[1].value == 5
+    assert m.fs.b2.temp[2].value == 2 * 302
+
+    PropagationPlan(m.fs.s1, overwrite_fixed=True).propagate()
+    assert m.fs.b2.temp[1].value == 2 * 301
+
+
+@pytest.mark.unit
+def test_propagation_plan_rebuild():
+    m = _propagation_plan_model()
+    plan = PropagationPlan(m.fs.s1)
+    n = len(plan)
+
+    m.fs.b1.v = Var(m.fs.time, initialize=4)
+    m.fs.b2.v = Var(m.fs.time, initialize=0)
+    m.fs.b1.outlet.add(m.fs.b1.v, "v")
+    m.fs.b2.inlet.add(m.fs.b2.v, "v")
+    assert not plan.is_valid()
+
+    plan.propagate()
+    assert plan.is_valid()
+    assert len(plan) == n + 4
+    assert m.fs.b2.v[3].value == 4
+
+    m.fs.b1.outlet.remove("v")
+    with pytest.raises(KeyError):
+        plan.propagate()
+
+
+@pytest.mark.unit
+def test_propagation_plan_errors():
+    m = _propagation_plan_model()
+    with pytest.raises(ValueError):
+        PropagationPlan(m.fs.s1, direction="foo")
+    with pytest.raises(TypeError):
+        PropagationPlan(m.fs.b1.inlet)
+    # the destination of a backward plan has an Expression member
+    with pytest.raises(TypeError):
+        PropagationPlan(m.fs.s1, direction="backward")
+
+    m.fs.b4 = Block()
+    m.fs.b4.flow = Var(m.fs.time, initialize=0)
+    m.fs.b4.inlet = Port()
+    m.fs.b4.inlet.add(m.fs.b4.flow, "flow")
+    m.fs.s3 = Arc(source=m.fs.b3.outlet, destination=m.fs.b4.inlet)
+    with pytest.raises(KeyError):
+        PropagationPlan(m.fs.s3)
+
+
+@pytest.mark.unit
+def test_propagation_plan_indexed_arc():
+    m = ConcreteModel()
+
+    def block_rule(b):
+        b.s = Set(initialize=[1, 2])
+        b.v1 = Var()
+        b.v2 = Var(b.s)
+
+        b.p = Port(b.s)
+        b.p[1].add(b.v1, "V1")
+        b.p[2].add(b.v2, "V2")
+
+    m.b1 = Block(rule=block_rule)
+    m.b2 = Block(rule=block_rule)
+
+    def arc_rule(m, i):
+        return {"source": m.b1.p[i], "destination": m.b2.p[i]}
+
+    m.s1 = Arc([1, 2], rule=arc_rule)
+    m.b1.v1.value = 1
+    m.b1.v2[1].value = 2
+    m.b1.v2[2].value = 3
+
+    PropagationPlan(m.s1).propagate()
+    assert m.b2.v1.value == 1
+    assert m.b2.v2[1].value == 2
+    assert m.b2.v2[2].value == 3
+
+    m.b2.v2[2].value = 4
+    PropagationPlan(m.s1, direction="backward").propagate()
+    assert m.b1.v2[2].value == 4
+
+
 @pytest.mark.skipif(solver is None, reason="Solver not available")
 @pytest.mark.unit
 def test_solve_indexed_block_list():
@@ -986,6 +1163,176 @@ def test_solve_indexed_block_error():
         solve_indexed_blocks(solver=None, blocks=[1, 2, 3])
 
 
+class _EquationSolver(object):
+    """
+    Solver for tests that solves each active constraint for its last unfixed
+    variable in turn, and fails if any block it is given has a fail flag.
+    """
+
+    def __init__(self, fail_value=None):
+        self.n_calls = 0
+        # if not None, unfixed variables are set to this when a solve fails
+        self.fail_value = fail_value
+        # values of the v variables at the start of each solve
+        self.start_values = []
+
+    def solve(self, blk, **kwds):
+        self.n_calls += 1
+        self.start_values.append(
+            {
+                v.name: v.value
+                for v in blk.component_data_objects(Var, descend_into=True)
+                if v.local_name == "v"
+            }
+        )
+        results = SolverResults()
+        blocks = list(blk.component_data_objects(Block, descend_into=True))
+        if any(getattr(b, "error", False) for b in blocks):
+            raise RuntimeError("solver error")
+        fail = any(b.fail for b in blocks)
+        if fail:
+            if self.fail_value is not None:
+                for v in blk.component_data_objects(Var, descend_into=True):
+                    if not v.fixed:
+                        v.value = self.fail_value
+            results.solver.termination_condition = TerminationCondition.infeasible
+            results.solver.status = SolverStatus.warning
+            return results
+        for c in blk.component_data_objects(Constraint, active=True, descend_into=True):
+            v = list(identify_variables(c.body, include_fixed=False))[-1]
+            calculate_variable_from_constraint(v, c)
+        results.solver.termination_condition = TerminationCondition.optimal
+        results.solver.status = SolverStatus.ok
+        return results
+
+
+def _decomposable_blocks():
+    m = ConcreteModel()
+    m.s = Set(initialize=[1, 2, 3, 4])
+
+    def block_rule(b, i):
+        b.v = Var(initialize=1.0)
+        b.w = Var(initialize=1.0)
+        b.w.fix(i)
+        b.fail = False
+        b.c = Constraint(expr=b.v == 2.0 * b.w)
+
+    m.b = Block(m.s, rule=block_rule)
+    # b[1] and b[2] are coupled, b[2].c2 also uses the fixed var b[3].w
+    m.b[2].u = Var(initialize=1.0)
+    m.b[2].c2 = Constraint(expr=m.b[1].v + m.b[3].w + m.b[2].u == 0)
+    return m
+
+
+@pytest.mark.unit
+def test_independent_block_groups():
+    m = _decomposable_blocks()
+    groups = independent_block_groups(list(m.b.values()))
+    assert groups == [[m.b[1], m.b[2]], [m.b[3]], [m.b[4]]]
+
+    m.b[2].c2.deactivate()
+    groups = independent_block_groups(list(m.b.values()))
+    assert groups == [[m.b[1]], [m.b[2]], [m.b[3]], [m.b[4]]]
+
+
+@pytest.mark.unit
+def test_solve_indexed_blocks_decompose():
+    m = _decomposable_blocks()
+    opt = _EquationSolver()
+
+    res = solve_indexed_blocks(opt, m.b, decompose=True)
+    assert isinstance(res, IndexedBlockSolverResults)
+    assert check_optimal_termination(res)
+    assert res.n_solves == 3
+    assert opt.n_calls == 3
+    assert res.failed_blocks == []
+    assert res.solver.message == "All 4 blocks solved"
+    for i in m.s:
+        assert res.block_status[m.b[i]] == (
+            TerminationCondition.optimal,
+            SolverStatus.ok,
+        )
+        assert value(m.b[i].v) == pytest.approx(2.0 * i)
+    assert value(m.b[2].u) == pytest.approx(-5)
+
+    # default behaviour is a single solve
+    opt = _EquationSolver()
+    res = solve_indexed_blocks(opt, [m.b])
+    assert not isinstance(res, IndexedBlockSolverResults)
+    assert opt.n_calls == 1
+
+    with pytest.raises(ValueError):
+        solve_indexed_blocks(opt, m.b, decompose=True, batch_size=0)
+    with pytest.raises(TypeError):
+        solve_indexed_blocks(opt, [1, 2], decompose=True)
+
+
+@pytest.mark.unit
+def test_solve_indexed_blocks_decompose_failed_batch():
+    m = _decomposable_blocks()
+    m.b[3].fail = True
+    opt = _EquationSolver()
+
+    res = solve_indexed_blocks(
+        opt, [m.b[1], m.b[2], m.b[3], m.b[4]], decompose=True, batch_size=2
+    )
+    # two batches, the first fails and both of its groups are solved again
+    assert res.n_solves == 4
+    assert opt.n_calls == 4
+    assert not check_optimal_termination(res)
+    assert res.solver.termination_condition == TerminationCondition.infeasible
+    assert res.solver.message == "1 of 4 blocks failed to solve"
+    assert res.failed_blocks == [m.b[3]]
+    assert value(m.b[1].v) == pytest.approx(2.0)
+    assert value(m.b[4].v) == pytest.approx(8.0)
+    assert value(m.b[3].v) == 1.0
+
+
+@pytest.mark.unit
+def test_solve_indexed_blocks_decompose_retry_start():
+    m = _decomposable_blocks()
+    m.b[1].fail = True
+    m.b[3].v = 5.0
+    opt = _EquationSolver(fail_value=99.0)
+
+    res = solve_indexed_blocks(opt, m.b, decompose=True, batch_size=2)
+    # the groups of the failed batch are re-solved from their initial values
+    assert res.n_solves == 4
+    assert opt.start_values[3] == {"b[3].v": 5.0}
+    assert res.failed_blocks == [m.b[1], m.b[2]]
+    assert value(m.b[3].v) == pytest.approx(6.0)
+
+    # a solver exception fails the batch and its groups are solved one by one
+    m = _decomposable_blocks()
+    m.b[3].error = True
+    opt = _EquationSolver()
+    res = solve_indexed_blocks(opt, m.b, decompose=True, batch_size=2)
+    assert res.n_solves == 4
+    assert res.failed_blocks == [m.b[3]]
+    assert res.block_status[m.b[3]] == (
+        TerminationCondition.error,
+        SolverStatus.error,
+    )
+    for i in [1, 2, 4]:
+        assert value(m.b[i].v) == pytest.approx(2.0 * i)
+
+
+@pytest.mark.component
+def test_solve_indexed_blocks_decompose_workers():
+    m = _decomposable_blocks()
+    m.b[4].fail = True
+    opt = _EquationSolver()
+
+    res = solve_indexed_blocks(opt, m.b, decompose=True, n_workers=2)
+    # the solves happen in the worker processes
+    assert opt.n_calls == 0
+    assert res.n_solves == 3
+    assert res.failed_blocks == [m.b[4]]
+    for i in [1, 2, 3]:
+        assert value(m.b[i].v) == pytest.approx(2.0 * i)
+    assert value(m.b[2].u) == pytest.approx(-5)
+
+
 @pytest.mark.integration
 @pytest.mark.skipif(solver is None, reason="Solver not available")
 def test_initialize_by_time_element():
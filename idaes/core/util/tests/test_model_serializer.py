@@ -18,7 +18,8 @@ import unittest
 import os
 
 from pyomo.environ import *
-from idaes.core.util import to_json, from_json, StoreSpec
+from idaes.core.util import to_json, from_json, to_npz, from_npz, StoreSpec
+from idaes.core.util.model_serializer import StateCheckpointer
 from idaes.core.util.model_serializer import _only_fixed
 from idaes.util.system import mkdtemp
 import shutil
@@ -32,16 +33,18 @@ class TestModelSerialize(unittest.TestCase):
     def setUpClass(cls):
         cls.dirname = mkdtemp()
         cls.fname = os.path.join(cls.dirname, "crAzYStuff1010202030.json")
+        cls.npz_fname = os.path.join(cls.dirname, "crAzYStuff1010202030.npz")
 
     @classmethod
     def tearDownClass(cls):
         shutil.rmtree(cls.dirname)
 
     def tearDown(self):
-        try:
-            os.remove(self.fname)
-        except:
-            pass
+        for fname in (self.fname, self.npz_fname):
+            try:
+                os.remove(fname)
+            except:
+                pass
 
     def setup_model01(self, name=None):
         if name is not None:
@@ -585,6 +588,167 @@ class TestModelSerialize(unittest.TestCase):
         assert value(model.b[1].x[3, 3]) == 1
         assert value(model.b[2].x[3, 3]) == 3
 
+    @pytest.mark.unit
+    def test_npz01(self):
+        """
+        Simple test of load save npz
+        """
+        model = self.setup_model01("m1")
+        a = model.b[1].a
+        b = model.b[1].b
+        to_npz(model, fname=self.npz_fname)
+        # change variable values
+        a.value = 0.11
+        b.value = 0.11
+        a.unfix()
+        model.b[1].deactivate()
+        model.x = False
+        b.setlb(2)
+        b.setub(None)
+        # reload values into a model with the same structure
+        from_npz(model, fname=self.npz_fname)
+        assert a.fixed
+        assert model.b[1].active
+        assert value(b) == 20
+        assert value(a) == 2
+        assert b.lb == -100
+        assert b.ub == 100
+        assert value(model.x) == True
+        model2 = self.setup_model01("m2")
+        model2.b[1].b = 0.11
+        from_npz(model2, fname=self.npz_fname)
+        assert value(model2.b[1].b) == 20
+
+    @pytest.mark.unit
+    def test_npz02(self):
+        """Test npz with only fixed values and params"""
+        model = self.setup_model02()
+        model.x[1].fix(1)
+        model.a = 5
+        wts = StoreSpec.value_isfixed_isactive(only_fixed=True)
+        to_npz(model, fname=self.npz_fname, wts=wts, compress=True)
+        model.g.deactivate()
+        model.x[1].setlb(-4)
+        model.x[1].value = 3
+        model.x[1].unfix()
+        model.x[2].value = 6
+        model.a = 2
+        from_npz(model, fname=self.npz_fname, wts=wts)
+        assert value(model.x[1]) == 1
+        assert model.x[1].fixed
+        assert model.x[1].lb == -4
+        assert value(model.x[2]) == 6
+        assert not model.x[2].fixed
+        assert model.g.active
+        assert value(model.a) == 5
+
+    @pytest.mark.unit
+    def test_npz03(self):
+        """Test npz suffixes, suffix filter and structure changes"""
+        model = self.setup_model02()
+        model.dual[model.g] = 1
+        model.ipopt_zL_out[model.x[1]] = 1
+        model.ipopt_zL_out[model.x[2]] = 1
+        model.suf1[model.x] = 3
+        to_npz(model, fname=self.npz_fname, wts=StoreSpec.suffix())
+
+        model2 = self.setup_model02()
+        model2.y = Var(initialize=7)
+        model2.dual[model2.g] = 10
+        model2.ipopt_zL_out[model2.x[1]] = 10
+        model2.ipopt_zL_out[model2.x[2]] = 10
+        wts = StoreSpec.suffix(suffix_filter=("dual", "suf1"))
+        from_npz(model2, fname=self.npz_fname, wts=wts)
+        assert model2.dual[model2.g] == 1
+        assert model2.suf1[model2.x] == 3
+        assert model2.ipopt_zL_out[model2.x[1]] == 10
+        assert model2.ipopt_zL_out[model2.x[2]] == 10
+
+        wts = StoreSpec.suffix()
+        wts.ignore_missing = False
+        with pytest.raises(KeyError):
+            from_npz(model2, fname=self.npz_fname, wts=wts)
+
+    @pytest.mark.unit
+    def test_npz04(self):
+        """Test npz with references, values only"""
+        model = self.setup_model03()
+        model.r[1, 3] = 1
+        model.r[2, 3] = 3
+        to_npz(model, fname=self.npz_fname, wts=StoreSpec.value())
+        model.r[1, 3] = 6
+        model.r[2, 3] = 8
+        model.b[1].x[3, 3].fix()
+        from_npz(model, fname=self.npz_fname, wts=StoreSpec.value(only_not_fixed=True))
+        assert value(model.b[1].x[3, 3]) == 6
+        assert value(model.b[2].x[3, 3]) == 3
+
+    @pytest.mark.unit
+    def test_checkpointer(self):
+        """Test saving and restoring incremental checkpoints"""
+        model = self.setup_model02()
+        model.x[1].fix(1)
+        ckpt = StateCheckpointer(model, max_checkpoints=2)
+        base = ckpt.save()
+        assert ckpt.n_changed(base) == 0
+
+        model.x[2].value = 7
+        model.g.deactivate()
+        t1 = ckpt.save("t1")
+        assert t1 == "t1"
+        # scalar g is stored as both a component and component data
+        assert ckpt.n_changed(t1) == 3
+
+        model.x[1].unfix()
+        model.x[1].value = 4
+        model.a = 3
+        # only the stored diffs and the components passed as changed are set
+        assert ckpt.restore(t1, changed=[model.x, model.a]) == 3
+        assert model.x[1].fixed
+        assert value(model.x[1]) == 1
+        assert value(model.x[2]) == 7
+        assert value(model.a) == 1
+        assert not model.g.active
+
+        assert ckpt.restore(base) == 3
+        assert value(model.x[2]) == 2.5
+        assert model.g.active
+        assert ckpt.restore() == 0
+
+        # base was most recently used, so t1 is dropped
+        ckpt.save("t2")
+        assert ckpt.tags == [base, "t2"]
+        with pytest.raises(KeyError):
+            ckpt.restore("t1")
+
+        # without changed, the whole model is compared to the checkpoint
+        model.x[2].value = 5
+        model.x[1].unfix()
+        assert ckpt.restore(base) == 2
+        assert value(model.x[2]) == 2.5
+        assert model.x[1].fixed
+        # with changed, changes outside the changed components are not read
+        model.x[2].value = 5
+        model.a = 3
+        assert ckpt.restore(base, changed=model.x[2]) == 1
+        assert value(model.x[2]) == 2.5
+        assert value(model.a) == 3
+        model.a = 1
+
+        # save only reads the changed components
+        model.x[2].value = 6
+        model.g.deactivate()
+        t3 = ckpt.save(changed=model.x)
+        assert ckpt.n_changed(t3) == 1
+        t4 = ckpt.save(changed=[model.g])
+        assert ckpt.n_changed(t4) == 3
+        model.x[2].value = 1
+        assert ckpt.restore(t3, changed=model.x) == 3
+        assert value(model.x[2]) == 6
+        assert model.g.active
+        with pytest.raises(ValueError):
+            ckpt.save(changed=Var())
+
 
 if __name__ == "__main__":
     unittest.main()
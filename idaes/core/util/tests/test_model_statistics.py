@@ -28,8 +28,10 @@ from pyomo.environ import (
 )
 from pyomo.dae import ContinuousSet, DerivativeVar
 from pyomo.common.collections import ComponentSet
+from pyomo.contrib.pynumero.asl import AmplInterface
 
 from idaes.core.util.model_statistics import *
+from idaes.core.util import model_statistics
 
 
 # Author: Andrew Lee
@@ -524,6 +526,45 @@ def test_number_large_residuals(m):
     assert number_large_residuals(m) == 2
 
 
+@pytest.mark.skipif(
+    not AmplInterface.available(), reason="PyNumero ASL library not available"
+)
+@pytest.mark.unit
+def test_large_residuals_set_pynumero():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], initialize=1)
+    m.x[3].fix(4)
+    m.c1 = Constraint(expr=m.x[1] == 2)
+    m.c2 = Constraint(expr=m.x[1] + m.x[2] <= 1)
+    m.c3 = Constraint(expr=m.x[2] * m.x[3] >= 4)
+
+    clear_residual_cache()
+    expected = large_residuals_set(m, return_residual_values=True)
+    rdict = large_residuals_set(m, return_residual_values=True, engine="pynumero")
+    assert len(rdict) == 2
+    for c, r in expected.items():
+        assert rdict[c] == pytest.approx(r)
+    assert number_large_residuals(m, engine="pynumero") == 2
+
+    # Compiled NLP is reused when only values change
+    nlp = model_statistics._residual_evaluator_cache[m].nlp
+    m.x[1].value = 2
+    assert large_residuals_set(m, engine="pynumero") == ComponentSet([m.c2])
+    assert model_statistics._residual_evaluator_cache[m].nlp is nlp
+
+    # and rebuilt when the structure changes
+    m.x[3].fix(1)
+    assert large_residuals_set(m, engine="pynumero") == ComponentSet([m.c2, m.c3])
+    assert model_statistics._residual_evaluator_cache[m].nlp is not nlp
+
+    # variables without a value raise the same error as the default engine
+    m.x[2].value = None
+    with pytest.raises(ValueError):
+        large_residuals_set(m)
+    with pytest.raises(ValueError):
+        large_residuals_set(m, engine="pynumero")
+
+
 @pytest.mark.unit
 def test_active_variables_in_deactivated_blocks_set(m):
     assert len(active_variables_in_deactivated_blocks_set(m)) == 0
@@ -542,6 +583,80 @@ def test_number_active_variables_in_deactivated_blocks(m):
     assert number_active_variables_in_deactivated_blocks(m) == 1
 
 
+# -------------------------------------------------------------------------
+# Model census
+_census_statistics = [
+    "total_blocks_set",
+    "activated_blocks_set",
+    "deactivated_blocks_set",
+    "total_constraints_set",
+    "activated_constraints_set",
+    "deactivated_constraints_set",
+    "total_equalities_set",
+    "activated_equalities_set",
+    "deactivated_equalities_set",
+    "total_inequalities_set",
+    "activated_inequalities_set",
+    "deactivated_inequalities_set",
+    "variables_set",
+    "fixed_variables_set",
+    "unfixed_variables_set",
+    "variables_in_activated_constraints_set",
+    "variables_in_activated_equalities_set",
+    "variables_in_activated_inequalities_set",
+    "variables_only_in_inequalities",
+    "fixed_variables_in_activated_equalities_set",
+    "unfixed_variables_in_activated_equalities_set",
+    "fixed_variables_only_in_inequalities",
+    "unused_variables_set",
+    "fixed_unused_variables_set",
+    "active_variables_in_deactivated_blocks_set",
+    "derivative_variables_set",
+    "total_objectives_set",
+    "activated_objectives_set",
+    "deactivated_objectives_set",
+    "expressions_set",
+]
+
+
+def _check_census(m, census):
+    for name in _census_statistics:
+        assert getattr(census, name)() == globals()[name](m), name
+        if name.endswith("_set"):
+            number = "number_" + name[: -len("_set")]
+        else:
+            number = "number_" + name
+        assert getattr(census, number)() == globals()[number](m), number
+    assert census.degrees_of_freedom() == degrees_of_freedom(m)
+
+
+@pytest.mark.unit
+def test_model_census(m):
+    census = ModelCensus(m)
+    _check_census(m, census)
+
+    m.b2["a"].c1.activate()
+    m.b2["b"].v2["a"].fix(1)
+    m.b1.activate()
+    census.update(m.b1, m.b2)
+    _check_census(m, census)
+
+    m.b1.sb.deactivate()
+    m.b2["a"].v1.unfix()
+    census.update(m.b1.sb, m.b2["a"])
+    _check_census(m, census)
+
+    m.b2.deactivate()
+    census.update(m.b2)
+    _check_census(m, census)
+
+    m.c = Constraint(expr=m.b1.v1 >= 2)
+    with pytest.raises(AssertionError):
+        _check_census(m, census)
+    census.refresh()
+    _check_census(m, census)
+
+
 # -------------------------------------------------------------------------
 # Reporting methods
 @pytest.mark.unit
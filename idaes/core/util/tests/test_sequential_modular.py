@@ -0,0 +1,201 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Tests for sequential-modular flowsheet initialization.
+"""
+import pytest
+from pyomo.environ import (
+    Block,
+    ConcreteModel,
+    Constraint,
+    Param,
+    Reference,
+    Var,
+    TransformationFactory,
+    value,
+)
+from pyomo.network import Arc, Port
+from pyomo.util.calc_var_value import calculate_variable_from_constraint
+
+from idaes.core import FlowsheetBlock
+from idaes.core.util.exceptions import ConfigurationError
+from idaes.core.util.sequential_modular import (
+    FlowsheetGraph,
+    SequentialModularInitializer,
+)
+
+
+def _unit(inputs, rules, feed=None):
+    # Ports are indexed by time, as they are for IDAES unit models
+    b = Block(concrete=True)
+    b.x = Var(range(inputs), [0], initialize=0)
+    b.y = Var(range(len(rules)), [0], initialize=0)
+    if feed is not None:
+        b.p = Param(initialize=feed, mutable=True)
+    b.eq = Constraint(range(len(rules)), rule=lambda b, i: b.y[i, 0] == rules[i](b))
+    for i in range(inputs):
+        b.add_component(f"inlet{i}", Port(initialize={"flow": Reference(b.x[i, :])}))
+    for i in range(len(rules)):
+        b.add_component(f"outlet{i}", Port(initialize={"flow": Reference(b.y[i, :])}))
+    return b
+
+
+def _build_model():
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(default={"dynamic": False})
+    m.fs.feed = _unit(0, [lambda b: b.p], feed=10)
+    m.fs.mix = _unit(2, [lambda b: b.x[0, 0] + b.x[1, 0]])
+    m.fs.split = _unit(1, [lambda b: 0.5 * b.x[0, 0], lambda b: 0.5 * b.x[0, 0]])
+    m.fs.prod = _unit(1, [lambda b: 2 * b.x[0, 0]])
+    m.fs.feed2 = _unit(0, [lambda b: b.p], feed=3)
+    m.fs.heat2 = _unit(1, [lambda b: 3 * b.x[0, 0]])
+
+    m.fs.s01 = Arc(source=m.fs.feed.outlet0, destination=m.fs.mix.inlet0)
+    m.fs.s02 = Arc(source=m.fs.mix.outlet0, destination=m.fs.split.inlet0)
+    m.fs.s03 = Arc(source=m.fs.split.outlet0, destination=m.fs.mix.inlet1)
+    m.fs.s04 = Arc(source=m.fs.split.outlet1, destination=m.fs.prod.inlet0)
+    m.fs.s05 = Arc(source=m.fs.feed2.outlet0, destination=m.fs.heat2.inlet0)
+    TransformationFactory("network.expand_arcs").apply_to(m)
+    return m
+
+
+def _calculate_unit(unit, scale=1):
+    for i in unit.eq:
+        calculate_variable_from_constraint(unit.y[i, 0], unit.eq[i])
+        unit.y[i, 0].value *= scale
+
+
+def _check_solution(m):
+    assert value(m.fs.mix.x[1, 0]) == pytest.approx(10, rel=1e-5)
+    assert value(m.fs.mix.y[0, 0]) == pytest.approx(20, rel=1e-5)
+    assert value(m.fs.split.y[1, 0]) == pytest.approx(10, rel=1e-5)
+    assert value(m.fs.prod.y[0, 0]) == pytest.approx(20, rel=1e-5)
+    assert value(m.fs.heat2.y[0, 0]) == pytest.approx(9)
+
+
+@pytest.mark.unit
+def test_flowsheet_graph():
+    m = _build_model()
+    fs = m.fs
+    graph = FlowsheetGraph(fs)
+    assert graph.units == [fs.feed, fs.mix, fs.split, fs.prod, fs.feed2, fs.heat2]
+    assert len(graph.arcs) == 5
+    assert graph.successors[fs.split] == [(fs.s03, fs.mix), (fs.s04, fs.prod)]
+    assert graph.predecessors[fs.mix] == [(fs.s01, fs.feed), (fs.s03, fs.split)]
+
+    comps = graph.strongly_connected_components()
+    assert [fs.mix, fs.split] in comps
+    position = {u: n for n, c in enumerate(comps) for u in c}
+    for arc, src, dest in graph.arcs:
+        assert position[src] <= position[dest]
+
+    assert graph.select_tear_arcs([fs.mix, fs.split]) == [fs.s03]
+    assert graph.levels([fs.mix, fs.split], [fs.s03]) == [[fs.mix], [fs.split]]
+    assert graph.levels([fs.mix, fs.split], [fs.s02]) == [[fs.split], [fs.mix]]
+    with pytest.raises(ConfigurationError):
+        graph.levels([fs.mix, fs.split])
+
+    with pytest.raises(TypeError):
+        FlowsheetGraph(m)
+
+
+@pytest.mark.unit
+def test_create_schedule():
+    m = _build_model()
+    fs = m.fs
+    graph, stages = SequentialModularInitializer().create_schedule(fs)
+    assert len(stages) == 4
+    assert stages[0].levels == [[fs.feed, fs.feed2]]
+    assert stages[0].tear_arcs == []
+    assert stages[1].levels == [[fs.heat2]]
+    assert stages[2].levels == [[fs.mix], [fs.split]]
+    assert stages[2].tear_arcs == [fs.s03]
+    assert stages[3].levels == [[fs.prod]]
+
+    graph, stages = SequentialModularInitializer(tear_arcs=[fs.s02]).create_schedule(
+        fs
+    )
+    assert stages[2].levels == [[fs.split], [fs.mix]]
+    assert stages[2].tear_arcs == [fs.s02]
+
+    with pytest.raises(ConfigurationError):
+        SequentialModularInitializer(tear_arcs=[fs.s01]).create_schedule(fs)
+    with pytest.raises(ConfigurationError):
+        SequentialModularInitializer(tear_arcs=[fs.mix.eq]).create_schedule(fs)
+
+
+@pytest.mark.unit
+def test_initialize_wegstein():
+    m = _build_model()
+    smi = SequentialModularInitializer(unit_initializer=_calculate_unit)
+    smi.initialize(m.fs)
+    _check_solution(m)
+    assert smi.iterations[(m.fs.s03,)] == 3
+
+
+@pytest.mark.unit
+def test_initialize_direct():
+    m = _build_model()
+    smi = SequentialModularInitializer(
+        unit_initializer=_calculate_unit, tear_method="Direct", max_iterations=100
+    )
+    smi.initialize(m.fs)
+    _check_solution(m)
+    assert smi.iterations[(m.fs.s03,)] > 10
+
+
+@pytest.mark.unit
+def test_initialize_options():
+    m = _build_model()
+    smi = SequentialModularInitializer(
+        unit_initializer=_calculate_unit,
+        unit_options={m.fs.heat2: {"scale": 2}, "prod": {"scale": 3}},
+        tear_guesses={m.fs.s03: {"flow": {0: 10}}},
+    )
+    smi.initialize(m.fs)
+    assert value(m.fs.heat2.y[0, 0]) == pytest.approx(18)
+    assert value(m.fs.prod.y[0, 0]) == pytest.approx(60, rel=1e-5)
+    # starting from the solution the loop converges immediately
+    assert smi.iterations[(m.fs.s03,)] == 1
+
+
+@pytest.mark.unit
+def test_initialize_not_converged(caplog):
+    m = _build_model()
+    smi = SequentialModularInitializer(
+        unit_initializer=_calculate_unit, tear_method="Direct", max_iterations=2
+    )
+    smi.initialize(m.fs)
+    assert smi.iterations[(m.fs.s03,)] == 2
+    assert "did not converge" in caplog.text
+
+
+@pytest.mark.unit
+def test_initialize_workers_requires_builder():
+    m = _build_model()
+    smi = SequentialModularInitializer(unit_initializer=_calculate_unit, n_workers=2)
+    with pytest.raises(ConfigurationError):
+        smi.initialize(m.fs)
+
+
+@pytest.mark.component
+def test_initialize_workers():
+    m = _build_model()
+    smi = SequentialModularInitializer(
+        unit_initializer=_calculate_unit,
+        n_workers=2,
+        model_builder=_build_model,
+    )
+    smi.initialize(m.fs)
+    _check_solution(m)
+    assert smi.iterations[(m.fs.s03,)] == 3
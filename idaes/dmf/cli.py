@@ -35,6 +35,7 @@ import click
 
 # package
 from idaes.dmf import DMF, DMFConfig, resource, workspace, create_configuration
+from idaes.dmf import resourcedb
 from idaes.dmf.resource import Predicates
 from idaes.dmf import errors
 from idaes.dmf.workspace import Fields
@@ -1134,6 +1135,59 @@ def load_data(datadir, global_):
     echolog(f"Loaded data in '{data_directory}' into the DMF")
 
 
+@click.command(help="Move the workspace resources into a new database")
+@click.option(
+    "--to",
+    "backend",
+    type=click.Choice(["sqlite", "json"]),
+    default="sqlite",
+    help="Database backend to move to (default is sqlite)",
+)
+@click.option(
+    "--file",
+    "db_file",
+    default=None,
+    help="New database file, relative to the workspace "
+    "(default is resourcedb.sqlite or resourcedb.json)",
+)
+def migrate_db(backend, db_file):
+    if db_file is None:
+        db_file = "resourcedb." + backend
+    if resourcedb.is_sqlite_file(db_file) != (backend == "sqlite"):
+        suffixes = ", ".join(resourcedb.SQLITE_SUFFIXES)
+        click.echo(
+            f"Database file '{db_file}' does not match backend '{backend}'. "
+            f"SQLite database files end in one of: {suffixes}"
+        )
+        sys.exit(Code.INPUT_VALUE.value)
+    try:
+        d = DMF()
+    except errors.WorkspaceError as err:
+        click.echo(f"Cannot open workspace: {err}")
+        sys.exit(Code.WORKSPACE_NOT_FOUND.value)
+    path = os.path.join(d.root, db_file)
+    if os.path.exists(path):
+        click.echo(f"Database file '{path}' already exists")
+        sys.exit(Code.DMF_OPER.value)
+    old_db_file = d.db_file
+    _log.info(f"begin migrate-db from={old_db_file} to={db_file}")
+    t0 = time.time()
+    try:
+        n = resourcedb.copy_resources(d._db, resourcedb.open_db(path))
+    except (errors.FileError, errors.ResourceError) as err:
+        if os.path.exists(path):
+            os.unlink(path)
+        click.echo(f"Migration failed. Details: {err}")
+        sys.exit(Code.DMF_OPER.value)
+    # switch the workspace to the new database
+    d.db_file = db_file
+    _timing_log.info(f"end migrate-db resources={n} time={time.time() - t0:.3f}s")
+    click.echo(
+        f"Moved {n} resources from '{old_db_file}' to '{db_file}'. "
+        f"The old database file was not removed."
+    )
+
+
 ######################################################################################
 
 
@@ -1394,6 +1448,7 @@ base_command.add_command(info)
 base_command.add_command(related)
 base_command.add_command(rm)
 base_command.add_command(load_data)
+base_command.add_command(migrate_db)
 
 # if __name__ == '__main__':
 #     base_command()
@@ -229,7 +229,10 @@ class DMF(workspace.Workspace, HasTraits):
     :class:`idaes.dmf.workspace.Workspace`.
     """
 
-    db_file = Unicode(help="Database file name")
+    db_file = Unicode(
+        help="Database file name. Names ending in .sqlite, .sqlite3 or .db "
+        "are stored in SQLite, others in a TinyDB JSON file"
+    )
     datafile_dir = Unicode(help="Data file directory, " "relative to DMF root")
 
     CONF_DB_FILE = "db_file"
@@ -307,7 +310,7 @@ class DMF(workspace.Workspace, HasTraits):
                 raise errors.WorkspaceError(msg)
         # set up rest of DMF
         path = os.path.join(self.root, self.db_file)
-        self._db = resourcedb.ResourceDB(path)
+        self._db = resourcedb.open_db(path)
         self._datafile_path = os.path.join(self.root, self.datafile_dir)
         if not os.path.exists(self._datafile_path):
             os.mkdir(self._datafile_path, 0o750)
@@ -15,8 +15,11 @@ Resource database.
 """
 # system
 from datetime import datetime
+import json
 import logging
+import os
 import re
+import sqlite3
 
 # third party
 from tinydb import TinyDB, Query
@@ -351,6 +354,22 @@ class ResourceDB(object):
         # add resource
         self._db.insert(resource.v)
 
+    def put_many(self, resources):
+        """Put these resources into the database.
+
+        Args:
+            resources (Iterable[Resource]): The resources to add
+
+        Returns:
+            None
+
+        Raises:
+            errors.DuplicateResourceError: If there is already a resource
+                in the database with the same "id".
+        """
+        for resource in resources:
+            self.put(resource)
+
     def delete(self, id_=None, idlist=None, filter_dict=None, internal_ids=False):
         """Delete one or more resources with given identifiers.
 
@@ -412,3 +431,419 @@ class ResourceDB(object):
                 changed[k] = v
         _log.debug(f"update resource {id_} with new values: {changed}")
         self._db.update(changed, self._create_filter_expr(id_cond))
+
+
+#: File name suffixes of resource databases stored in SQLite
+SQLITE_SUFFIXES = ('.sqlite', '.sqlite3', '.db')
+
+# Prefix searches, as built by DMF.find_by_id(), that can use the id index
+_id_prefix_re = re.compile(r'\^?([0-9A-Za-z]+)(?:\[a-z\]\*|\.\*)?')
+
+
+def is_sqlite_file(dbfile):
+    """Whether the resource DB in `dbfile` is stored in SQLite, as opposed to
+    a TinyDB JSON file. This is decided by the file name suffix.
+    """
+    return os.path.splitext(str(dbfile))[1].lower() in SQLITE_SUFFIXES
+
+
+def open_db(dbfile):
+    """Open the resource DB in `dbfile` with the backend matching its suffix.
+
+    Args:
+        dbfile (str): DB location
+
+    Returns:
+        (ResourceDB) A :class:`SQLiteResourceDB` for SQLite files, otherwise
+        a (TinyDB) :class:`ResourceDB`.
+    """
+    if is_sqlite_file(dbfile):
+        return SQLiteResourceDB(dbfile)
+    return ResourceDB(dbfile)
+
+
+def copy_resources(source, target):
+    """Copy all resources from one resource DB into another.
+
+    Args:
+        source (ResourceDB): Resources to copy
+        target (ResourceDB): Destination; resources are added in the order
+            of the source DB.
+
+    Returns:
+        (int) Number of resources copied
+
+    Raises:
+        errors.DuplicateResourceError: If a resource is already in the target
+    """
+    resources = list(source.find({}))
+    for rsrc in resources:
+        rsrc.v.pop('doc_id', None)
+    target.put_many(resources)
+    return len(resources)
+
+
+class SQLiteResourceDB(ResourceDB):
+    """A resource database stored in SQLite.
+
+    Resources are stored as JSON documents, with indexed tables for the
+    identifier, type, tags and relations of each resource. Filters on these
+    fields are run as indexed queries, the rest of the filter is evaluated on
+    the selected documents exactly as for the TinyDB database. Graph
+    traversals in :meth:`find_related` follow the relation table.
+    """
+
+    _schema = (
+        'CREATE TABLE IF NOT EXISTS resources ('
+        'doc_id INTEGER PRIMARY KEY AUTOINCREMENT, '
+        'id TEXT NOT NULL UNIQUE, type TEXT, doc TEXT NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS resources_type ON resources (type)',
+        'CREATE INDEX IF NOT EXISTS resources_id_lower ON resources (lower(id))',
+        'CREATE TABLE IF NOT EXISTS tags (doc_id INTEGER NOT NULL, tag TEXT)',
+        'CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag, doc_id)',
+        'CREATE INDEX IF NOT EXISTS tags_doc_id ON tags (doc_id)',
+        'CREATE TABLE IF NOT EXISTS relations ('
+        'doc_id INTEGER NOT NULL, pos INTEGER NOT NULL, holder TEXT NOT NULL, '
+        'subject TEXT NOT NULL, predicate TEXT, object TEXT NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS relations_subject ON relations (subject)',
+        'CREATE INDEX IF NOT EXISTS relations_object ON relations (object)',
+        'CREATE INDEX IF NOT EXISTS relations_doc_id ON relations (doc_id)',
+    )
+
+    def __init__(self, dbfile=None, connection=None):
+        """Initialize from DMF and given configuration field.
+
+        Args:
+            dbfile (str): DB location
+            connection: If non-empty, this is an existing
+                :class:`sqlite3.Connection` that should be re-used, instead of
+                trying to connect to the location in `dbfile`.
+
+        Raises:
+            ValueError, if dbfile and connection are both None
+        """
+        self._gr = None
+        if connection is not None:
+            self._db = connection
+        elif dbfile is not None:
+            try:
+                self._db = sqlite3.connect(dbfile)
+            except sqlite3.Error:
+                raise errors.FileError('Cannot open resource DB "{}"'.format(dbfile))
+        else:
+            raise ValueError('One of dbfile or connection is required')
+        with self._db:
+            for stmt in self._schema:
+                self._db.execute(stmt)
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM resources').fetchone()[0]
+
+    @staticmethod
+    def _as_resource(doc_id, doc):
+        rsrc = Resource(value=json.loads(doc))
+        rsrc.v['doc_id'] = doc_id
+        return rsrc
+
+    def find(self, filter_dict, id_only=False, flags=0):
+        """Find and return records based on the provided filter.
+
+        Args:
+            filter_dict (dict): Search filter. For syntax, see docs in
+                                :meth:`.dmf.DMF.find`.
+            id_only (bool): If true, return only the identifier of each
+                resource; otherwise a Resource object is returned.
+            flags (int): Flag values for, e.g., regex searches
+
+        Returns:
+            generator of int|Resource, depending on the value of `id_only`
+        """
+        filter_expr, where, params = None, [], []
+        if filter_dict:
+            filter_expr = self._create_filter_expr(filter_dict, flags)
+            where, params = self._indexed_conditions(filter_dict, flags)
+        if filter_expr is None and id_only:
+            sql = 'SELECT doc_id FROM resources'
+        else:
+            sql = 'SELECT doc_id, doc FROM resources'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY doc_id'
+        _log.debug(f'Find resources with: {sql} {params}')
+        # read all rows first, callers may modify the DB while iterating
+        for row in self._db.execute(sql, params).fetchall():
+            if filter_expr is None:
+                if id_only:
+                    yield row[0]
+                else:
+                    yield self._as_resource(*row)
+                continue
+            # the indexed conditions select candidates, the full filter decides
+            value = json.loads(row[1])
+            if not filter_expr(value):
+                continue
+            if id_only:
+                yield row[0]
+            else:
+                rsrc = Resource(value=value)
+                rsrc.v['doc_id'] = row[0]
+                yield rsrc
+
+    @classmethod
+    def _indexed_conditions(cls, filter_dict, flags=0):
+        """Translate the parts of a filter on indexed fields into SQL.
+
+        The conditions select a superset of the matching resources.
+
+        Returns:
+            (list, list) SQL conditions and their parameters
+        """
+        where, params = [], []
+        for k, v in filter_dict.items():
+            if k == Resource.ID_FIELD and isinstance(v, str):
+                if v[:1] not in ('~', '@'):
+                    where.append('id = ?')
+                    params.append(v)
+                    continue
+                match = _id_prefix_re.fullmatch(v[1:])
+                if v[:1] == '~' and match:
+                    prefix, column = match.group(1), 'id'
+                    if flags & re.IGNORECASE:
+                        prefix, column = prefix.lower(), 'lower(id)'
+                    where.append(f'{column} >= ? AND {column} < ?')
+                    params.extend((prefix, prefix + '\U0010ffff'))
+            elif k == Resource.TYPE_FIELD and isinstance(v, str):
+                if v[:1] not in ('~', '@'):
+                    where.append('type = ?')
+                    params.append(v)
+            elif k in ('tags', 'tags!') and isinstance(v, list) and v:
+                if not all(isinstance(tag, str) for tag in v):
+                    continue
+                sub = 'doc_id IN (SELECT doc_id FROM tags WHERE tag {})'
+                if k == 'tags':
+                    marks = ', '.join('?' * len(v))
+                    where.append(sub.format(f'IN ({marks})'))
+                else:
+                    where.extend(sub.format('= ?') for _ in v)
+                params.extend(v)
+        return where, params
+
+    def find_related(self, id_, filter_dict=None, outgoing=True, maxdepth=0, meta=None):
+        """Find all resources connected to the identified one.
+
+        Args:
+            id_ (str): Unique ID of target resource.
+            filter_dict (dict): Filter to these resources
+            outgoing:
+            maxdepth:
+            meta (List[str]): Metadata fields to extract
+        Returns:
+            Generator of (depth, relation, metadata)
+        """
+        if maxdepth <= 0:
+            maxdepth = 9223372036854775807
+        allowed = None
+        if filter_dict:
+            allowed = set(self.find(filter_dict, id_only=True))
+        if outgoing:
+            sql = (
+                'SELECT subject, predicate, object, doc_id FROM relations '
+                'WHERE subject = ? AND holder != subject ORDER BY doc_id, pos'
+            )
+        else:
+            sql = (
+                'SELECT subject, predicate, object, doc_id FROM relations '
+                'WHERE object = ? AND holder != object ORDER BY doc_id, pos'
+            )
+        docs = {}
+
+        def edges(key):
+            # relations from `key`, with metadata from the resource at the end
+            result = []
+            for subj, pred, obj, doc_id in self._db.execute(sql, (key,)):
+                if allowed is not None and doc_id not in allowed:
+                    continue
+                doc = docs.get(doc_id)
+                if doc is None:
+                    row = self._db.execute(
+                        'SELECT doc FROM resources WHERE doc_id = ?', (doc_id,)
+                    ).fetchone()
+                    doc = docs[doc_id] = json.loads(row[0])
+                meta_info = {k: doc[k] for k in meta}
+                result.append((subj, pred, obj, meta_info))
+            return result
+
+        # Breadth-first search through the edges, as in ResourceDB
+        q, depth, visited = edges(id_), 0, {id_}
+        while len(q) > 0 and depth < maxdepth:
+            depth += 1
+            n = len(q)
+            for i in range(n):
+                relation = Triple(*q[i][:3])
+                yield (depth, relation, q[i][3])
+                if depth < maxdepth:
+                    next_id = relation.object if outgoing else relation.subject
+                    if next_id not in visited:
+                        next_edges = edges(next_id)
+                        if next_edges:
+                            q.extend(next_edges)
+                            visited.add(next_id)
+            q = q[n:]
+
+    def get(self, identifier):
+        """Get a resource by identifier.
+
+        Args:
+          identifier: Internal identifier
+
+        Returns:
+            (Resource) A resource or None
+        """
+        row = self._db.execute(
+            'SELECT doc_id, doc FROM resources WHERE doc_id = ?', (identifier,)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._as_resource(*row)
+
+    def put(self, resource):
+        """Put this resource into the database.
+
+        Args:
+            resource (Resource): The resource to add
+
+        Returns:
+            None
+
+        Raises:
+            errors.DuplicateResourceError: If there is already a resource
+                in the database with the same "id".
+        """
+        _log.debug(f"put resource id={resource.id}")
+        with self._db:
+            self._insert(resource)
+
+    def put_many(self, resources):
+        """Put these resources into the database, in one transaction.
+
+        Args:
+            resources (Iterable[Resource]): The resources to add
+
+        Returns:
+            None
+
+        Raises:
+            errors.DuplicateResourceError: If there is already a resource
+                in the database with the same "id". No resources are added.
+        """
+        with self._db:
+            for resource in resources:
+                self._insert(resource)
+
+    def _insert(self, resource):
+        value = {k: v for k, v in resource.v.items() if k != 'doc_id'}
+        try:
+            cursor = self._db.execute(
+                'INSERT INTO resources (id, type, doc) VALUES (?, ?, ?)',
+                (
+                    value[Resource.ID_FIELD],
+                    value.get(Resource.TYPE_FIELD),
+                    json.dumps(value),
+                ),
+            )
+        except sqlite3.IntegrityError:
+            raise errors.DuplicateResourceError("put", resource.id)
+        self._index(cursor.lastrowid, value)
+
+    def _index(self, doc_id, value):
+        """Fill the tag and relation tables for one resource."""
+        uuid = value[Resource.ID_FIELD]
+        self._db.executemany(
+            'INSERT INTO tags (doc_id, tag) VALUES (?, ?)',
+            ((doc_id, tag) for tag in value.get('tags', [])),
+        )
+        self._db.executemany(
+            'INSERT INTO relations '
+            '(doc_id, pos, holder, subject, predicate, object) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                (doc_id, pos, uuid) + tuple(triple_from_resource_relations(uuid, rrel))
+                for pos, rrel in enumerate(value.get('relations', []))
+            ),
+        )
+
+    def _remove(self, doc_ids):
+        with self._db:
+            for table in ('resources', 'tags', 'relations'):
+                self._db.executemany(
+                    f'DELETE FROM {table} WHERE doc_id = ?',
+                    ((i,) for i in doc_ids),
+                )
+
+    def delete(self, id_=None, idlist=None, filter_dict=None, internal_ids=False):
+        """Delete one or more resources with given identifiers.
+
+        Args:
+            id_ (Union[str,int]): If given, delete this id.
+            idlist (list): If given, delete ids in this list
+            filter_dict (dict): If given, perform a search and
+                           delete ids it finds.
+            internal_ids (bool): If True, treat identifiers as numeric
+                (internal) identifiers. Otherwise treat them as
+                resource (string) indentifiers.
+        Returns:
+            None
+        """
+        if internal_ids:
+            doc_ids = idlist if idlist else [id_]
+        else:
+            ID = Resource.ID_FIELD
+            if filter_dict:
+                doc_ids = list(self.find(filter_dict, id_only=True))
+            elif id_:
+                doc_ids = list(self.find({ID: id_}, id_only=True))
+            elif idlist:
+                doc_ids = []
+                for i in idlist:
+                    doc_ids.extend(self.find({ID: i}, id_only=True))
+            else:
+                return
+        self._remove(doc_ids)
+
+    def update(self, id_, new_dict):
+        """Update the identified resource with new values.
+
+        Args:
+            id_ (int): Identifier of resource to update
+            new_dict (dict): New dictionary of resource values
+        Returns:
+            None
+        Raises:
+            ValueError: If new resource is of wrong type
+            KeyError: If old resource is not found
+        """
+        old = self.find_one({Resource.ID_FIELD: id_})
+        if old is None:
+            raise errors.NoSuchResourceError(id_=id_)
+        T = Resource.TYPE_FIELD
+        if old.v[T] != new_dict[T]:
+            raise ValueError(
+                'New resource type="{}" does not '
+                'match current resource type "{}"'.format(new_dict[T], old.v[T])
+            )
+        doc_id = old.v.pop('doc_id')
+        changed = {k: v for k, v in new_dict.items() if k not in old.v or old.v[k] != v}
+        changed.pop('doc_id', None)
+        _log.debug(f"update resource {id_} with new values: {changed}")
+        if not changed:
+            return
+        value = dict(old.v, **changed)
+        with self._db:
+            self._db.execute(
+                'UPDATE resources SET doc = ? WHERE doc_id = ?',
+                (json.dumps(value), doc_id),
+            )
+            if 'tags' in changed or 'relations' in changed:
+                self._db.execute('DELETE FROM tags WHERE doc_id = ?', (doc_id,))
+                self._db.execute('DELETE FROM relations WHERE doc_id = ?', (doc_id,))
+                self._index(doc_id, value)
@@ -0,0 +1,198 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Test the TinyDB and SQLite resource databases in `idaes.dmf.resourcedb`.
+"""
+# stdlib
+import re
+
+# third-party
+from click.testing import CliRunner
+import pytest
+
+# package
+from idaes.dmf import cli, errors, resource, resourcedb, DMF, DMFConfig
+from idaes.dmf.resource import Resource
+
+__author__ = "Dan Gunter"
+
+
+@pytest.fixture(params=["resourcedb.json", "resourcedb.sqlite"])
+def db(request, tmp_path):
+    rdb = resourcedb.open_db(str(tmp_path / request.param))
+    assert isinstance(rdb, resourcedb.SQLiteResourceDB) == request.param.endswith(
+        ".sqlite"
+    )
+    return rdb
+
+
+def _populate(rdb):
+    """Add a chain a -> b -> c, where b also uses d."""
+    rsrc = {}
+    for name, type_, tags, version in [
+        ("a", "data", ["x", "y"], 1),
+        ("b", "code", ["y"], 2),
+        ("c", "data", [], 3),
+        ("d", "json", ["x"], 4),
+    ]:
+        r = Resource(value={"aliases": [name], "tags": tags, "desc": name.upper()})
+        r.v[Resource.TYPE_FIELD] = type_
+        r.v["version_info"]["version"] = [version, 0, 0]
+        rsrc[name] = r
+    resource.create_relation(rsrc["a"], resource.Predicates.derived, rsrc["b"])
+    resource.create_relation(rsrc["b"], resource.Predicates.derived, rsrc["c"])
+    resource.create_relation(rsrc["b"], resource.Predicates.uses, rsrc["d"])
+    for name in "abcd":
+        rdb.put(rsrc[name])
+    return rsrc
+
+
+def _names(results):
+    return [r.v["aliases"][0] for r in results]
+
+
+@pytest.mark.unit
+def test_put_get(db):
+    rsrc = _populate(db)
+    assert len(db) == 4
+    with pytest.raises(errors.DuplicateResourceError):
+        db.put(rsrc["a"])
+    doc_ids = list(db.find({}, id_only=True))
+    assert len(doc_ids) == 4
+    r = db.get(doc_ids[1])
+    assert r.id == rsrc["b"].id
+    assert r.v["doc_id"] == doc_ids[1]
+    assert len(r.v["relations"]) == 3
+    assert db.get(12345) is None
+
+
+@pytest.mark.unit
+def test_find(db):
+    rsrc = _populate(db)
+    ID = Resource.ID_FIELD
+    assert _names(db.find({})) == ["a", "b", "c", "d"]
+    assert _names(db.find({ID: rsrc["c"].id})) == ["c"]
+    assert _names(db.find({"type": "data"})) == ["a", "c"]
+    assert _names(db.find({"type": "data", "tags": ["x"]})) == ["a"]
+    assert _names(db.find({"tags": ["x", "y"]})) == ["a", "b", "d"]
+    assert _names(db.find({"tags!": ["x", "y"]})) == ["a"]
+    assert _names(db.find({"aliases": ["d"]})) == ["d"]
+    assert _names(db.find({"desc": "~[BC]"})) == ["b", "c"]
+    assert _names(db.find({"type": {"$ne": "data"}})) == ["b", "d"]
+    assert _names(db.find({"version_info.version": [3]})) == ["c"]
+    assert _names(db.find({"type": "nothing"})) == []
+    # prefix searches, as done by DMF.find_by_id()
+    prefix = rsrc["b"].id[:6]
+    assert _names(db.find({ID: f"~{prefix}[a-z]*"})) == ["b"]
+    assert (
+        _names(db.find({ID: f"~{prefix.upper()}[a-z]*"}, flags=re.IGNORECASE))
+        == ["b"]
+    )
+    assert db.find_one({"type": "json"}, id_only=True) == 4
+
+
+@pytest.mark.unit
+def test_find_related(db):
+    rsrc = _populate(db)
+    meta = [Resource.ID_FIELD, "desc"]
+
+    found = [
+        (depth, rel.predicate, info["desc"])
+        for depth, rel, info in db.find_related(rsrc["a"].id, meta=meta)
+    ]
+    assert found == [(1, "derived", "B"), (2, "derived", "C"), (2, "uses", "D")]
+
+    found = list(db.find_related(rsrc["a"].id, meta=meta, maxdepth=1))
+    assert len(found) == 1
+
+    found = [
+        info["desc"]
+        for _, _, info in db.find_related(rsrc["c"].id, meta=meta, outgoing=False)
+    ]
+    assert found == ["B", "A"]
+
+    found = [
+        info["desc"]
+        for _, _, info in db.find_related(
+            rsrc["a"].id, meta=meta, filter_dict={"type": "code"}
+        )
+    ]
+    assert found == ["B"]
+    assert list(db.find_related(rsrc["d"].id, meta=meta)) == []
+
+
+@pytest.mark.unit
+def test_update_delete(db):
+    rsrc = _populate(db)
+    new = dict(rsrc["c"].v, tags=["z"], desc="new")
+    db.update(rsrc["c"].id, new)
+    assert _names(db.find({"tags": ["z"]})) == ["c"]
+    assert db.find_one({"desc": "new"}).id == rsrc["c"].id
+
+    with pytest.raises(ValueError):
+        db.update(rsrc["c"].id, dict(new, type="code"))
+    with pytest.raises(errors.NoSuchResourceError):
+        db.update("0" * 32, new)
+
+    db.delete(id_=rsrc["c"].id)
+    assert _names(db.find({})) == ["a", "b", "d"]
+    db.delete(filter_dict={"type": "json"})
+    assert _names(db.find({})) == ["a", "b"]
+    db.delete(idlist=list(db.find({"tags": ["y"]}, id_only=True)), internal_ids=True)
+    assert len(db) == 0
+
+
+@pytest.mark.unit
+def test_sqlite_requires_location():
+    with pytest.raises(ValueError):
+        resourcedb.SQLiteResourceDB()
+
+
+@pytest.mark.unit
+def test_copy_resources(tmp_path):
+    source = resourcedb.open_db(str(tmp_path / "resourcedb.json"))
+    rsrc = _populate(source)
+    target = resourcedb.open_db(str(tmp_path / "resourcedb.db"))
+    assert resourcedb.copy_resources(source, target) == 4
+    assert _names(target.find({})) == ["a", "b", "c", "d"]
+    assert [r.v for r in target.find({})] == [r.v for r in source.find({})]
+    with pytest.raises(errors.DuplicateResourceError):
+        resourcedb.copy_resources(source, target)
+
+
+@pytest.mark.unit
+def test_cli_migrate_db(tmp_path, monkeypatch):
+    ws = tmp_path / "ws"
+    conf = tmp_path / "dmf.yaml"
+    conf.write_text(f"workspace: {ws}\n")
+    monkeypatch.setattr(DMFConfig, "_filename", str(conf))
+    d = DMF(path=str(ws), create=True)
+    rsrc = _populate(d._db)
+
+    runner = CliRunner()
+    result = runner.invoke(cli.migrate_db, ["--file", "resources.json"])
+    assert result.exit_code == cli.Code.INPUT_VALUE.value
+
+    result = runner.invoke(cli.migrate_db, [])
+    assert result.exit_code == 0, result.output
+    assert "Moved 4 resources" in result.output
+    assert (ws / "resourcedb.sqlite").exists()
+    assert (ws / "resourcedb.json").exists()
+
+    d = DMF(path=str(ws))
+    assert d.db_file == "resourcedb.sqlite"
+    assert isinstance(d._db, resourcedb.SQLiteResourceDB)
+    assert d.find_one_by_id(rsrc["b"].id).v["desc"] == "B"
+
+    result = runner.invoke(cli.migrate_db, [])
+    assert result.exit_code == cli.Code.DMF_OPER.value
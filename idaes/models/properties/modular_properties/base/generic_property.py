@@ -16,6 +16,8 @@ Framework for generic property packages
 # Import Python libraries
 import types
 
+import numpy as np
+
 # Import Pyomo libraries
 from pyomo.environ import (
     Block,
@@ -1343,23 +1345,26 @@ class _GenericStateBlock(StateBlock):
 
         # ---------------------------------------------------------------------
         # If present, initialize bubble and dew point calculations
+        # Phase pairs with numeric saturation pressure kernels are initialized
+        # for all state blocks at once, the others one block at a time
+        numeric_pairs = blk._init_bubble_dew_numeric()
         for k in blk.keys():
             T_units = blk[k].params.get_metadata().default_units["temperature"]
             # Bubble temperature initialization
             if hasattr(blk[k], "_mole_frac_tbub"):
-                blk._init_Tbub(blk[k], T_units)
+                blk._init_Tbub(blk[k], T_units, exclude_pairs=numeric_pairs["tbub"])
 
             # Dew temperature initialization
             if hasattr(blk[k], "_mole_frac_tdew"):
-                blk._init_Tdew(blk[k], T_units)
+                blk._init_Tdew(blk[k], T_units, exclude_pairs=numeric_pairs["tdew"])
 
             # Bubble pressure initialization
             if hasattr(blk[k], "_mole_frac_pbub"):
-                blk._init_Pbub(blk[k], T_units)
+                blk._init_Pbub(blk[k], T_units, exclude_pairs=numeric_pairs["pbub"])
 
             # Dew pressure initialization
             if hasattr(blk[k], "_mole_frac_pdew"):
-                blk._init_Pdew(blk[k], T_units)
+                blk._init_Pdew(blk[k], T_units, exclude_pairs=numeric_pairs["pdew"])
 
             # Solve bubble and dew point constraints
             for c in blk[k].component_objects(Constraint):
@@ -1648,8 +1653,70 @@ class _GenericStateBlock(StateBlock):
         init_log = idaeslog.getInitLogger(blk.name, outlvl, tag="properties")
         init_log.info_high("State released.")
 
-    def _init_Tbub(self, blk, T_units):
+    def _init_bubble_dew_numeric(self):
+        """
+        Initialize the bubble and dew points of all state blocks at once for
+        the phase pairs where all components follow Raoult's law with a
+        pressure_sat_comp method providing a numeric_kernel. The saturation
+        pressure parameters are extracted once and the Newton iterations of
+        _init_Tbub and _init_Tdew are carried out on arrays over the state
+        blocks.
+
+        Returns:
+            dict of the phase pairs initialized for each of "tbub", "tdew",
+            "pbub" and "pdew"
+        """
+        done = {"tbub": set(), "tdew": set(), "pbub": set(), "pdew": set()}
+        blocks = {
+            kind: [
+                self[k] for k in self.keys() if hasattr(self[k], "_mole_frac_" + kind)
+            ]
+            for kind in done
+        }
+        if not any(blocks.values()):
+            return done
+
+        b0 = next(b for b in blocks.values() if b)[0]
+        for pp in b0.params._pe_pairs:
+            raoult_comps, henry_comps = _valid_VL_component_list(b0, pp)
+            if raoult_comps == [] or henry_comps != []:
+                continue
+            kernels = _pressure_sat_kernels(b0, raoult_comps)
+            if kernels is None:
+                continue
+
+            # Subtract 1 to avoid potential singularities at Tcrit
+            T_start = (
+                min(
+                    b0.params.get_component(j).temperature_crit.value
+                    for j in raoult_comps
+                )
+                - 1
+            )
+            with np.errstate(all="ignore"):
+                if blocks["tbub"]:
+                    _init_Tbub_numeric(
+                        blocks["tbub"], pp, raoult_comps, kernels, T_start
+                    )
+                    done["tbub"].add(pp)
+                if blocks["tdew"]:
+                    _init_Tdew_numeric(
+                        blocks["tdew"], pp, raoult_comps, kernels, T_start
+                    )
+                    done["tdew"].add(pp)
+                if blocks["pbub"]:
+                    _init_Pbub_numeric(blocks["pbub"], pp, raoult_comps, kernels)
+                    done["pbub"].add(pp)
+                if blocks["pdew"]:
+                    _init_Pdew_numeric(blocks["pdew"], pp, raoult_comps, kernels)
+                    done["pdew"].add(pp)
+
+        return done
+
+    def _init_Tbub(self, blk, T_units, exclude_pairs=()):
         for pp in blk.params._pe_pairs:
+            if pp in exclude_pairs:
+                continue
             raoult_comps, henry_comps = _valid_VL_component_list(blk, pp)
 
             if raoult_comps == []:
@@ -1757,8 +1824,10 @@ class _GenericStateBlock(StateBlock):
                         log(blk._mole_frac_tbub[pp, j])
                     )
 
-    def _init_Tdew(self, blk, T_units):
+    def _init_Tdew(self, blk, T_units, exclude_pairs=()):
         for pp in blk.params._pe_pairs:
+            if pp in exclude_pairs:
+                continue
             raoult_comps, henry_comps = _valid_VL_component_list(blk, pp)
 
             if raoult_comps == []:
@@ -1886,8 +1955,10 @@ class _GenericStateBlock(StateBlock):
                         log(blk._mole_frac_tdew[pp, j])
                     )
 
-    def _init_Pbub(self, blk, T_units):
+    def _init_Pbub(self, blk, T_units, exclude_pairs=()):
         for pp in blk.params._pe_pairs:
+            if pp in exclude_pairs:
+                continue
             raoult_comps, henry_comps = _valid_VL_component_list(blk, pp)
 
             if raoult_comps == []:
@@ -1930,8 +2001,10 @@ class _GenericStateBlock(StateBlock):
                         log(blk._mole_frac_pbub[pp, j])
                     )
 
-    def _init_Pdew(self, blk, T_units):
+    def _init_Pdew(self, blk, T_units, exclude_pairs=()):
         for pp in blk.params._pe_pairs:
+            if pp in exclude_pairs:
+                continue
             raoult_comps, henry_comps = _valid_VL_component_list(blk, pp)
 
             if raoult_comps == []:
@@ -4375,6 +4448,143 @@ def _valid_VL_component_list(blk, pp):
     return raoult_comps, henry_comps
 
 
+def _pressure_sat_kernels(blk, comps):
+    # Get the numeric saturation pressure kernels for comps, or None if the
+    # pressure_sat_comp method of any component does not provide one
+    kernels = []
+    for j in comps:
+        cobj = blk.params.get_component(j)
+        c_arg = cobj.config.pressure_sat_comp
+        if hasattr(c_arg, "pressure_sat_comp"):
+            c_arg = c_arg.pressure_sat_comp
+        try:
+            build_kernel = c_arg.numeric_kernel
+        except AttributeError:
+            return None
+        kernels.append(build_kernel(blk, cobj))
+    return kernels
+
+
+def _pressure_sat_arrays(kernels, T):
+    # Saturation pressures and their temperature derivatives, with one row
+    # per temperature and one column per component
+    psat, dpsat_dT = zip(*(kernel(T) for kernel in kernels))
+    return np.stack(psat, axis=1), np.stack(dpsat_dT, axis=1)
+
+
+def _bubble_dew_state(blocks, comps):
+    mole_frac = np.array(
+        [[value(b.mole_frac_comp[j]) for j in comps] for b in blocks], dtype=float
+    )
+    pressure = np.array([value(b.pressure) for b in blocks], dtype=float)
+    return mole_frac, pressure
+
+
+def _newton_bubble_dew(T0, residual):
+    # Newton solver with step limiter to prevent overshoot, applied to each
+    # state block until its step is below the tolerance of ~1e-1.
+    # Iteration limit of 30
+    T = np.array(T0, dtype=float)
+    active = np.arange(T.shape[0])
+    counter = 0
+    while active.size > 0 and counter < 30:
+        f, df = residual(T[active], active)
+        # Limit temperature step to avoid excessive overshoot
+        T1 = T[active] - np.clip(f / df, -50, 50)
+        err = np.abs(T1 - T[active])
+        T[active] = T1
+        active = active[err > 1e-1]
+        counter += 1
+    return T
+
+
+def _set_bubble_dew_mole_frac(blocks, name, pp, comps, mole_frac):
+    log_name = "log" + name
+    for i, b in enumerate(blocks):
+        mf_var = getattr(b, name)
+        log_var = (
+            getattr(b, log_name) if b.is_property_constructed(log_name) else None
+        )
+        for jj, j in enumerate(comps):
+            mf_var[pp, j].value = float(mole_frac[i, jj])
+            if log_var is not None:
+                log_var[pp, j].value = float(np.log(mole_frac[i, jj]))
+
+
+def _init_Tbub_numeric(blocks, pp, comps, kernels, T_start):
+    x, P = _bubble_dew_state(blocks, comps)
+
+    def residual(T, idx):
+        psat, dpsat_dT = _pressure_sat_arrays(kernels, T)
+        return (psat * x[idx]).sum(axis=1) - P[idx], (dpsat_dT * x[idx]).sum(axis=1)
+
+    Tbub = _newton_bubble_dew(np.full(len(blocks), T_start), residual)
+    for b, T in zip(blocks, Tbub):
+        b.temperature_bubble[pp].value = float(T)
+
+    psat, _ = _pressure_sat_arrays(kernels, Tbub)
+    _set_bubble_dew_mole_frac(
+        blocks, "_mole_frac_tbub", pp, comps, x * psat / P[:, None]
+    )
+
+
+def _init_Tdew_numeric(blocks, pp, comps, kernels, T_start):
+    x, P = _bubble_dew_state(blocks, comps)
+
+    # If Tbub has been calculated, use this as the starting point
+    T0 = np.array(
+        [
+            b.temperature_bubble[pp].value
+            if hasattr(b, "_mole_frac_tbub")
+            and b.temperature_bubble[pp].value is not None
+            else T_start
+            for b in blocks
+        ],
+        dtype=float,
+    )
+
+    def residual(T, idx):
+        psat, dpsat_dT = _pressure_sat_arrays(kernels, T)
+        f = P[idx] * (x[idx] / psat).sum(axis=1) - 1
+        df = -P[idx] * (x[idx] / psat**2 * dpsat_dT).sum(axis=1)
+        return f, df
+
+    Tdew = _newton_bubble_dew(T0, residual)
+    for b, T in zip(blocks, Tdew):
+        b.temperature_dew[pp].value = float(T)
+
+    psat, _ = _pressure_sat_arrays(kernels, Tdew)
+    _set_bubble_dew_mole_frac(
+        blocks, "_mole_frac_tdew", pp, comps, x * P[:, None] / psat
+    )
+
+
+def _init_Pbub_numeric(blocks, pp, comps, kernels):
+    x, _ = _bubble_dew_state(blocks, comps)
+    T = np.array([value(b.temperature) for b in blocks], dtype=float)
+    psat, _ = _pressure_sat_arrays(kernels, T)
+
+    Pbub = (x * psat).sum(axis=1)
+    for b, P in zip(blocks, Pbub):
+        b.pressure_bubble[pp].value = float(P)
+    _set_bubble_dew_mole_frac(
+        blocks, "_mole_frac_pbub", pp, comps, x * psat / Pbub[:, None]
+    )
+
+
+def _init_Pdew_numeric(blocks, pp, comps, kernels):
+    x, _ = _bubble_dew_state(blocks, comps)
+    T = np.array([value(b.temperature) for b in blocks], dtype=float)
+    psat, _ = _pressure_sat_arrays(kernels, T)
+
+    Pdew = 1 / (x / psat).sum(axis=1)
+    for b, P in zip(blocks, Pdew):
+        b.pressure_dew[pp].value = float(P)
+    _set_bubble_dew_mole_frac(
+        blocks, "_mole_frac_pdew", pp, comps, x * Pdew[:, None] / psat
+    )
+
+
 def _temperature_pressure_bubble_dew(b, name):
     #  temperature/pressure bubble/dew
     splt = name.split("_")
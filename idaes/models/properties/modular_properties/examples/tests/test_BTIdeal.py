@@ -369,3 +369,85 @@ class TestStateBlock(object):
     @pytest.mark.unit
     def test_report(self, model):
         model.props[1].report()
+
+
+class TestBubbleDewNumericInitialization(object):
+    @pytest.fixture(scope="class")
+    def model(self):
+        model = ConcreteModel()
+        model.params = GenericParameterBlock(default=configuration)
+
+        model.props = model.params.build_state_block(
+            [1, 2, 3], default={"defined_state": True}
+        )
+
+        for k, (x, T, P) in enumerate(
+            [(0.5, 368, 101325), (0.2, 380, 2e5), (0.9, 350, 5e4)], start=1
+        ):
+            model.props[k].flow_mol.fix(1)
+            model.props[k].temperature.fix(T)
+            model.props[k].pressure.fix(P)
+            model.props[k].mole_frac_comp["benzene"].fix(x)
+            model.props[k].mole_frac_comp["toluene"].fix(1 - x)
+
+        return model
+
+    @staticmethod
+    def _bubble_dew_values(model):
+        names = [
+            "temperature_bubble",
+            "temperature_dew",
+            "pressure_bubble",
+            "pressure_dew",
+            "_mole_frac_tbub",
+            "_mole_frac_tdew",
+            "_mole_frac_pbub",
+            "_mole_frac_pdew",
+        ]
+        return {
+            v.name: v.value
+            for k in model.props
+            for n in names
+            for v in getattr(model.props[k], n).values()
+        }
+
+    @pytest.mark.unit
+    def test_numeric_matches_block_by_block(self, model):
+        pp = ("Vap", "Liq")
+        T_units = pyunits.K
+        for k in model.props:
+            model.props._init_Tbub(model.props[k], T_units)
+            model.props._init_Tdew(model.props[k], T_units)
+            model.props._init_Pbub(model.props[k], T_units)
+            model.props._init_Pdew(model.props[k], T_units)
+        expected = self._bubble_dew_values(model)
+
+        for v in expected:
+            model.find_component(v).value = None
+        done = model.props._init_bubble_dew_numeric()
+        for kind in ["tbub", "tdew", "pbub", "pdew"]:
+            assert done[kind] == {pp}
+
+        for v, val in self._bubble_dew_values(model).items():
+            assert val == pytest.approx(expected[v], rel=1e-8)
+
+        assert value(model.props[1].temperature_bubble[pp]) == pytest.approx(
+            365.35, abs=1e-2
+        )
+        assert value(model.props[1].temperature_dew[pp]) == pytest.approx(
+            372.02, abs=1e-2
+        )
+
+    @pytest.mark.unit
+    def test_numeric_fallback(self, model):
+        # Methods without a numeric kernel are left to the block by block path
+        rpp4 = model.params.benzene.config.pressure_sat_comp
+        try:
+            model.params.benzene.config.pressure_sat_comp = (
+                rpp4.pressure_sat_comp.return_expression
+            )
+            done = model.props._init_bubble_dew_numeric()
+        finally:
+            model.params.benzene.config.pressure_sat_comp = rpp4
+        for kind in ["tbub", "tdew", "pbub", "pdew"]:
+            assert done[kind] == set()
@@ -19,7 +19,9 @@ Retrieved: September 13th, 2019
 
 All parameter indicies and units based on conventions used by the source
 """
-from pyomo.environ import Expression, log, Var, units as pyunits
+import numpy as np
+
+from pyomo.environ import Expression, log, value, Var, units as pyunits
 
 from idaes.core.util.misc import set_param_from_config
 
@@ -214,6 +216,28 @@ class pressure_sat_comp:
         dp_units = units["pressure"] / units["temperature"]
         return pyunits.convert(p_sat_dT, to_units=dp_units)
 
+    @staticmethod
+    def numeric_kernel(b, cobj):
+        # Numpy version of return_expression and dT_expression for arrays of
+        # temperatures in base units, used to initialize bubble and dew points
+        units = b.params.get_metadata().derived_units
+        A = value(cobj.pressure_sat_comp_coeff_A)
+        B = value(pyunits.convert(cobj.pressure_sat_comp_coeff_B, to_units=pyunits.K))
+        C = value(pyunits.convert(cobj.pressure_sat_comp_coeff_C, to_units=pyunits.K))
+        T_to_K = pyunits.convert_value(
+            1, from_units=units["temperature"], to_units=pyunits.K
+        )
+        p_factor = pyunits.convert_value(
+            1, from_units=pyunits.bar, to_units=units["pressure"]
+        )
+
+        def kernel(T):
+            T_K = T * T_to_K + C
+            psat = p_factor * 10 ** (A - B / T_K)
+            return psat, psat * B * np.log(10) * T_to_K / T_K**2
+
+        return kernel
+
 
 # -----------------------------------------------------------------------------
 class NIST(object):
@@ -19,7 +19,9 @@ Reid, Prausnitz and Polling, 1977, McGraw-Hill
 All parameter indicies based on conventions used by the source
 """
 
-from pyomo.environ import exp, log, Var, units as pyunits
+import numpy as np
+
+from pyomo.environ import exp, log, value, Var, units as pyunits
 
 from idaes.core.util.misc import set_param_from_config
 
@@ -203,6 +205,28 @@ class pressure_sat_comp:
             p_sat_dT, to_units=units["pressure"] / units["temperature"]
         )
 
+    @staticmethod
+    def numeric_kernel(b, cobj):
+        # Numpy version of return_expression and dT_expression for arrays of
+        # temperatures in base units, used to initialize bubble and dew points
+        units = b.params.get_metadata().derived_units
+        A = value(cobj.pressure_sat_comp_coeff_A)
+        B = value(pyunits.convert(cobj.pressure_sat_comp_coeff_B, to_units=pyunits.K))
+        C = value(pyunits.convert(cobj.pressure_sat_comp_coeff_C, to_units=pyunits.K))
+        T_to_K = pyunits.convert_value(
+            1, from_units=units["temperature"], to_units=pyunits.K
+        )
+        p_factor = pyunits.convert_value(
+            1, from_units=pyunits.mmHg, to_units=units["pressure"]
+        )
+
+        def kernel(T):
+            T_K = T * T_to_K + C
+            psat = p_factor * np.exp(A - B / T_K)
+            return psat, psat * B * T_to_K / T_K**2
+
+        return kernel
+
 
 # -----------------------------------------------------------------------------
 class RPP3(object):
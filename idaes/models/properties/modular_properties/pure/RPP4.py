@@ -18,7 +18,9 @@ Reid, Prausnitz and Polling, 1987, McGraw-Hill
 
 All parameter indicies and units based on conventions used by the source
 """
-from pyomo.environ import exp, log, Var, units as pyunits
+import numpy as np
+
+from pyomo.environ import exp, log, value, Var, units as pyunits
 
 from idaes.core.util.misc import set_param_from_config
 
@@ -214,6 +216,29 @@ class pressure_sat_comp:
             )
         )
 
+    @staticmethod
+    def numeric_kernel(b, cobj):
+        # Numpy version of return_expression and dT_expression for arrays of
+        # temperatures in base units, used to initialize bubble and dew points
+        units = b.params.get_metadata().derived_units
+        A = value(cobj.pressure_sat_comp_coeff_A)
+        B = value(cobj.pressure_sat_comp_coeff_B)
+        C = value(cobj.pressure_sat_comp_coeff_C)
+        D = value(cobj.pressure_sat_comp_coeff_D)
+        Tc = value(
+            pyunits.convert(cobj.temperature_crit, to_units=units["temperature"])
+        )
+        Pc = value(pyunits.convert(cobj.pressure_crit, to_units=units["pressure"]))
+
+        def kernel(T):
+            x = 1 - T / Tc
+            g = A * x + B * x**1.5 + C * x**3 + D * x**6
+            psat = np.exp(g / (1 - x)) * Pc
+            dg = A + 1.5 * B * x**0.5 + 3 * C * x**2 + 6 * D * x**5
+            return psat, -psat * (dg / T + (Tc / T**2) * g)
+
+        return kernel
+
 
 # -----------------------------------------------------------------------------
 class RPP4(object):
@@ -19,7 +19,9 @@ Reid, Prausnitz and Polling, 2001, McGraw-Hill
 All parameter indicies based on conventions used by the source
 """
 
-from pyomo.environ import log, Var, units as pyunits
+import numpy as np
+
+from pyomo.environ import log, value, Var, units as pyunits
 
 from idaes.core.util.misc import set_param_from_config
 
@@ -216,6 +218,32 @@ class pressure_sat_comp:
         )
         return pyunits.convert(p_sat_dT, to_units=dp_units)
 
+    @staticmethod
+    def numeric_kernel(b, cobj):
+        # Numpy version of return_expression and dT_expression for arrays of
+        # temperatures in base units, used to initialize bubble and dew points
+        base_units = b.params.get_metadata().default_units
+        A = value(cobj.pressure_sat_comp_coeff_A)
+        B = value(pyunits.convert(cobj.pressure_sat_comp_coeff_B, to_units=pyunits.K))
+        C = value(pyunits.convert(cobj.pressure_sat_comp_coeff_C, to_units=pyunits.K))
+        T_to_K = pyunits.convert_value(
+            1, from_units=base_units["temperature"], to_units=pyunits.K
+        )
+        p_factor = pyunits.convert_value(
+            1,
+            from_units=pyunits.bar,
+            to_units=base_units["mass"]
+            * base_units["length"] ** -1
+            * base_units["time"] ** -2,
+        )
+
+        def kernel(T):
+            T_C = T * T_to_K + C - 273.15
+            psat = p_factor * 10 ** (A - B / T_C)
+            return psat, psat * B * np.log(10) * T_to_K / T_C**2
+
+        return kernel
+
 
 # -----------------------------------------------------------------------------
 class RPP5(object):
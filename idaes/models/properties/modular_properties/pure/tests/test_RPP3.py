@@ -24,6 +24,7 @@ Authors: Andrew Lee, Alejandro Garciadiego
 """
 
 import pytest
+import numpy as np
 import types
 
 from pyomo.environ import ConcreteModel, Block, value, Var, units as pyunits
@@ -229,3 +230,30 @@ def test_pressure_sat_comp_dT(frame):
     assert value(expr) == pytest.approx(dPdT, 1e-4)
 
     assert_units_equivalent(expr, pyunits.Pa / pyunits.K)
+
+
+@pytest.mark.unit
+def test_pressure_sat_comp_numeric_kernel(frame):
+    pressure_sat_comp.build_parameters(frame.params)
+    kernel = pressure_sat_comp.numeric_kernel(frame.props[1], frame.params)
+
+    T = [373.15, 400, 500]
+    psat, dpsat_dT = kernel(np.array(T))
+    for i, t in enumerate(T):
+        frame.props[1].temperature.value = t
+        assert psat[i] == pytest.approx(
+            value(
+                pressure_sat_comp.return_expression(
+                    frame.props[1], frame.params, frame.props[1].temperature
+                )
+            ),
+            rel=1e-12,
+        )
+        assert dpsat_dT[i] == pytest.approx(
+            value(
+                pressure_sat_comp.dT_expression(
+                    frame.props[1], frame.params, frame.props[1].temperature
+                )
+            ),
+            rel=1e-12,
+        )
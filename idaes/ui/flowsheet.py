@@ -971,3 +971,46 @@ class FlowsheetDiff:
         new_item["attrs"]["image"]["xlinkHref"] = values["image"]
         new_item["attrs"]["root"]["title"] = values["type"]
         return new_item
+
+
+def flowsheet_patch(old_flowsheet: Dict, new_flowsheet: Dict) -> List[Dict]:
+    """Compute a JSON patch (RFC 6902) that turns one serialized flowsheet into another.
+
+    As the model structure and layout of a flowsheet rarely change while it is
+    being viewed, the patch mostly holds "replace" operations for the stream values
+    and unit positions that changed. Lists that change length are replaced whole.
+
+    Args:
+        old_flowsheet: Flowsheet value the patch applies to
+        new_flowsheet: Flowsheet value after the patch is applied
+
+    Returns:
+        List of patch operations, each a dict with keys "op", "path" and "value"
+        (except for "remove" operations, which have no value).
+    """
+    ops = []
+    _json_patch(old_flowsheet, new_flowsheet, "", ops)
+    return ops
+
+
+def _json_patch(old, new, path: str, ops: List[Dict]):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, new_value in new.items():
+            key_path = f"{path}/{_json_pointer_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": key_path, "value": new_value})
+            else:
+                _json_patch(old[key], new_value, key_path, ops)
+        for key in old:
+            if key not in new:
+                key_path = f"{path}/{_json_pointer_escape(key)}"
+                ops.append({"op": "remove", "path": key_path})
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for i, (old_value, new_value) in enumerate(zip(old, new)):
+            _json_patch(old_value, new_value, f"{path}/{i}", ops)
+    elif type(old) is not type(new) or old != new:
+        ops.append({"op": "replace", "path": path, "value": new})
+
+
+def _json_pointer_escape(key) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
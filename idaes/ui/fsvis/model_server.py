@@ -17,18 +17,25 @@ The main class is `FlowsheetServer`, which is instantiated from the `visualize()
 """
 
 # stdlib
+from collections import OrderedDict
+import contextlib
+import copy
 import http.server
 import json
 from pathlib import Path
 import re
 import socket
 import threading
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 from urllib.parse import urlparse
 
+# third-party
+from pyomo.environ import Block, Param, Var
+from pyomo.network import Arc
+
 # package
 from idaes import logger
-from ..flowsheet import FlowsheetDiff, FlowsheetSerializer
+from ..flowsheet import FlowsheetDiff, FlowsheetSerializer, flowsheet_patch
 from . import persist, errors
 
 _log = logger.getLogger(__name__)
@@ -39,11 +46,87 @@ _static_dir = _this_dir / "static"
 _template_dir = _this_dir / "templates"
 
 
-class FlowsheetServer(http.server.HTTPServer):
+class _FlowsheetState:
+    """Serialization cache and recent merged values for one flowsheet.
+
+    The flowsheet is only serialized again when its model-change counter,
+    `model_version`, is incremented. This happens when the values of its variables
+    or mutable parameters, or its units and arcs, have changed since the last
+    serialization, which is checked by reading them all (see `_model_fingerprint`).
+
+    The merged (served) values of the flowsheet are numbered by `version`. The most
+    recent ones are kept, so clients can ask for a patch from the version they have.
+    """
+
+    #: Number of merged flowsheet versions kept for computing patches
+    history_size = 8
+
+    def __init__(self, flowsheet):
+        self.flowsheet = flowsheet
+        self.lock = threading.RLock()
+        self.fingerprint = None
+        self.model_version = 0
+        self.serialized = None
+        self.serialized_version = None
+        self.version = 0
+        self.history = OrderedDict()
+
+    def update_model_version(self):
+        fingerprint = _model_fingerprint(self.flowsheet)
+        if fingerprint != self.fingerprint:
+            self.fingerprint = fingerprint
+            self.model_version += 1
+
+    def add_merged(self, merged: Dict):
+        """Record the merged flowsheet, as a new version if it changed."""
+        if self.history and self.history[self.version] == merged:
+            return
+        self.version += 1
+        self.history[self.version] = merged
+        while len(self.history) > self.history_size:
+            self.history.popitem(last=False)
+
+    @property
+    def merged(self) -> Dict:
+        return self.history[self.version]
+
+
+def _model_fingerprint(flowsheet):
+    """Values that change whenever the serialized flowsheet would change.
+
+    Pyomo models do not keep a change counter, so this reads the value and fixed flag of
+    every variable and the value of every mutable parameter in the flowsheet. Each
+    request therefore still walks the whole model, but this is much cheaper than
+    serializing the flowsheet and comparing it with the saved one, which is skipped when
+    the fingerprint is unchanged.
+    """
+    try:
+        structure = tuple(
+            obj.getname()
+            for objtype in (Arc, Block)
+            for obj in flowsheet.component_objects(objtype, descend_into=False)
+        )
+        values = tuple(
+            (v.value, v.fixed)
+            for v in flowsheet.component_data_objects(Var, descend_into=True)
+        )
+        params = tuple(
+            p.value
+            for param in flowsheet.component_objects(Param, descend_into=True)
+            if param.mutable
+            for p in param.values()
+        )
+    except (AttributeError, KeyError, TypeError) as err:
+        raise ValueError(f"Error reading flowsheet values: {err}")
+    return structure, values, params
+
+
+class FlowsheetServer(http.server.ThreadingHTTPServer):
     """A simple HTTP server that runs in its own thread.
 
     This server is used for *all* models for a given process, so every request needs to contain
-    the ID of the model that should be used in that transaction.
+    the ID of the model that should be used in that transaction. Each request is handled in its
+    own thread, and requests for the same flowsheet are serialized.
 
     The only methods that the visualization function needs to call are the constructor, `start()` to
      start running the server, and `add_flowsheet()`, to a add a new flowsheet.
@@ -57,6 +140,8 @@ class FlowsheetServer(http.server.HTTPServer):
         super().__init__(("127.0.0.1", self._port), FlowsheetServerHandler)
         self._dsm = persist.DataStoreManager()
         self._flowsheets = {}
+        self._states = {}
+        self._states_lock = threading.Lock()
         self._thr = None
 
     @property
@@ -96,7 +181,7 @@ class FlowsheetServer(http.server.HTTPServer):
         except errors.FlowsheetNotFoundInDatastore:
             _log.debug(f"No existing flowsheet found in {store}: saving new value")
             # If not found in datastore, save new value
-            fs_dict = FlowsheetSerializer(flowsheet, id_).as_dict()
+            fs_dict = self._serialize_flowsheet_cached(id_, flowsheet)
             store.save(fs_dict)
         else:
             _log.debug(f"Existing flowsheet found in {store}: saving merged value")
@@ -126,7 +211,8 @@ class FlowsheetServer(http.server.HTTPServer):
             ProcessingError, if parsing of JSON failed (see :meth:`DataStoreManager.save()`)
         """
         try:
-            self._dsm.save(id_, flowsheet)
+            with self._flowsheet_lock(id_):
+                self._dsm.save(id_, flowsheet)
         except errors.DatastoreError as err:
             raise errors.ProcessingError(f"While saving flowsheet: {err}")
         except KeyError as err:
@@ -148,6 +234,47 @@ class FlowsheetServer(http.server.HTTPServer):
             FlowsheetNotFound (subclass) if the flowsheet id is known, but it can't be retrieved
             ProcessingError for internal errors
         """
+        return self.update_flowsheet_versioned(id_)[0]
+
+    def update_flowsheet_versioned(self, id_: str) -> Tuple[Dict, int]:
+        """Update flowsheet, as :meth:`update_flowsheet`, and also return its version.
+
+        Returns:
+            Tuple of the merged flowsheet and its version number, which increases whenever
+            the merged flowsheet changes.
+        """
+        with self._flowsheet_lock(id_):
+            state = self._update_flowsheet(id_)
+            return copy.deepcopy(state.merged), state.version
+
+    def get_flowsheet_patch(self, id_: str, since: int) -> Dict:
+        """Update flowsheet, and return only the changes from an earlier version.
+
+        Args:
+            id_: Identifier of flowsheet to update.
+            since: Version of the flowsheet the client has, as returned by an earlier call
+                to this method or by :meth:`update_flowsheet_versioned`. The "/fs" route
+                returns it in the "X-Flowsheet-Version" header.
+
+        Returns:
+            Dict with the current "version" of the flowsheet and a JSON "patch" (RFC 6902),
+            from version `since` to the current one. If version `since` is no longer kept,
+            the patch replaces the whole flowsheet.
+
+        Raises:
+            Same as :meth:`update_flowsheet`
+        """
+        with self._flowsheet_lock(id_):
+            state = self._update_flowsheet(id_)
+            if since == state.version:
+                patch = []
+            elif since in state.history:
+                patch = flowsheet_patch(state.history[since], state.merged)
+            else:
+                patch = [{"op": "replace", "path": "", "value": state.merged}]
+            return {"version": state.version, "patch": copy.deepcopy(patch)}
+
+    def _update_flowsheet(self, id_: str) -> _FlowsheetState:
         # Get saved flowsheet from datastore
         try:
             saved = self._load_flowsheet(id_)
@@ -161,7 +288,7 @@ class FlowsheetServer(http.server.HTTPServer):
         except KeyError:
             raise errors.FlowsheetNotFoundInMemory(id_)
         try:
-            obj_dict = self._serialize_flowsheet(id_, obj)
+            obj_dict = self._serialize_flowsheet_cached(id_, obj)
         except ValueError as err:
             raise errors.ProcessingError(f"Cannot serialize flowsheet: {err}")
         # Compare saved and current value
@@ -178,8 +305,9 @@ class FlowsheetServer(http.server.HTTPServer):
                 f"Stored flowsheet and model in memory differ by {num} item{pl}"
             )
             self.save_flowsheet(id_, diff.merged())
-        # Return [a copy of the] merged value
-        return diff.merged(do_copy=True)
+        state = self._get_state(id_)
+        state.add_merged(diff.merged(do_copy=True))
+        return state
 
     # === Internal methods ===
 
@@ -191,6 +319,43 @@ class FlowsheetServer(http.server.HTTPServer):
         """
         return self._flowsheets[id_]
 
+    def _get_state(self, id_) -> _FlowsheetState:
+        """Get the cached state of a flowsheet that was added.
+
+        Raises:
+            KeyError if the flowsheet id is not known
+        """
+        with self._states_lock:
+            state = self._states.get(id_, None)
+            if state is None:
+                state = self._states[id_] = _FlowsheetState(self._flowsheets[id_])
+            return state
+
+    def _flowsheet_lock(self, id_):
+        """Lock that serializes requests for a flowsheet.
+
+        Unknown flowsheets get no state (and no lock); requests for them fail anyway.
+        """
+        try:
+            return self._get_state(id_).lock
+        except KeyError:
+            return contextlib.nullcontext()
+
+    def _serialize_flowsheet_cached(self, id_, flowsheet):
+        """Serialize the flowsheet, unless it did not change since it was last serialized.
+        """
+        state = self._get_state(id_)
+        if state.flowsheet is not flowsheet:
+            # flowsheet object was replaced
+            state.flowsheet, state.fingerprint = flowsheet, None
+        state.update_model_version()
+        if state.serialized_version != state.model_version:
+            state.serialized = self._serialize_flowsheet(id_, flowsheet)
+            state.serialized_version = state.model_version
+        else:
+            _log.debug(f"Flowsheet '{id_}' unchanged: using cached serialization")
+        return copy.deepcopy(state.serialized)
+
     @staticmethod
     def _serialize_flowsheet(id_, flowsheet):
         try:
@@ -228,11 +393,13 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
         Routes:
           * `/app`: Return the web page
           * `/fs`: Retrieve an updated flowsheet.
+          * `/fs/patch`: Retrieve the changes to a flowsheet since the version given
+            by the `since` query parameter, as a JSON patch.
           * `/path/to/file`: Retrieve file stored static directory
         """
         u, id_ = self._parse_flowsheet_url(self.path)
         _log.debug(f"do_GET: path={self.path} id=={id_}")
-        if u.path in ("/app", "/fs") and id_ is None:
+        if u.path in ("/app", "/fs", "/fs/patch") and id_ is None:
             self.send_error(
                 400, message=f"Query parameter 'id' is required for '{u.path}'"
             )
@@ -241,6 +408,8 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
             self._get_app(id_)
         elif u.path == "/fs":
             self._get_fs(id_)
+        elif u.path == "/fs/patch":
+            self._get_fs_patch(id_)
         else:
             # Try to serve a file
             self.directory = _static_dir  # keep here: overwritten if set earlier
@@ -265,7 +434,7 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
             None
         """
         try:
-            merged = self.server.update_flowsheet(id_)
+            merged, version = self.server.update_flowsheet_versioned(id_)
         except errors.FlowsheetUnknown as err:
             # User error: user asked for a flowsheet by an unknown ID
             self.send_error(404, message=str(err))
@@ -275,7 +444,35 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
             self.send_error(500, message=str(err))
             return
         # Return merged flowsheet
-        self._write_json(200, merged)
+        self._write_json(200, merged, headers={"X-Flowsheet-Version": str(version)})
+
+    def _get_fs_patch(self, id_: str):
+        """Get changes to the flowsheet since the version in the `since` query parameter.
+
+        Args:
+            id_: Flowsheet identifier
+
+        Returns:
+            None
+        """
+        since = self._parse_queries(urlparse(self.path)).get("since", None)
+        try:
+            since = int(since)
+        except (TypeError, ValueError):
+            self.send_error(
+                400,
+                message="Integer query parameter 'since' is required for '/fs/patch'",
+            )
+            return
+        try:
+            result = self.server.get_flowsheet_patch(id_, since)
+        except errors.FlowsheetUnknown as err:
+            self.send_error(404, message=str(err))
+            return
+        except (errors.FlowsheetNotFound, errors.ProcessingError) as err:
+            self.send_error(500, message=str(err))
+            return
+        self._write_json(200, result)
 
     # === PUT ===
 
@@ -309,13 +506,15 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
 
     # === Internal methods ===
 
-    def _write_json(self, code, data):
+    def _write_json(self, code, data, headers=None):
         str_json = json.dumps(data)
         value = utf8_encode(str_json)
         self.send_response(code)
         # self.send_header("Access-Control-Allow-Headers", "Content-Type")
         self.send_header("Content-type", "application/json")
         self.send_header("Content-length", str(len(value)))
+        for key, header_value in (headers or {}).items():
+            self.send_header(key, header_value)
         self.end_headers()
         self.wfile.write(value)
 
@@ -328,12 +527,16 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
         self.wfile.write(value)
 
     def _parse_flowsheet_url(self, path):
-        u, id_ = urlparse(self.path), None
-        if u.query:
-            queries = dict([q.split("=") for q in u.query.split("&")])
-            id_ = queries.get("id", None)
+        u = urlparse(self.path)
+        id_ = self._parse_queries(u).get("id", None)
         return u, id_
 
+    @staticmethod
+    def _parse_queries(u) -> Dict:
+        if not u.query:
+            return {}
+        return dict([q.split("=") for q in u.query.split("&")])
+
     # === Logging ===
 
     def log_message(self, fmt, *args):
@@ -14,6 +14,7 @@
 Tests for model_server module
 """
 # stdlib
+import copy
 # ext
 import pytest
 from pyomo.environ import ConcreteModel
@@ -63,10 +64,108 @@ def test_update_flowsheet(flash_model):
 
 
 
+def _apply_patch(doc, patch):
+    """Apply a JSON patch with "add", "remove" and "replace" operations."""
+    for op in patch:
+        if op["path"] == "":
+            doc = copy.deepcopy(op["value"])
+            continue
+        keys = [
+            k.replace("~1", "/").replace("~0", "~") for k in op["path"].split("/")[1:]
+        ]
+        parent = doc
+        for k in keys[:-1]:
+            parent = parent[int(k)] if isinstance(parent, list) else parent[k]
+        last = int(keys[-1]) if isinstance(parent, list) else keys[-1]
+        if op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op["value"])
+    return doc
+
+
+@pytest.mark.unit
+def test_serialization_cache(monkeypatch):
+    m = _build_flash_model()
+    srv = model_server.FlowsheetServer()
+    calls = []
+    serialize = srv._serialize_flowsheet
+
+    def counting_serialize(id_, flowsheet):
+        calls.append(id_)
+        return serialize(id_, flowsheet)
+
+    monkeypatch.setattr(srv, "_serialize_flowsheet", counting_serialize)
+    srv.add_flowsheet("oscar", m.fs, persist.MemoryDataStore())
+    assert len(calls) == 1
+    fs1, version1 = srv.update_flowsheet_versioned("oscar")
+    fs2, version2 = srv.update_flowsheet_versioned("oscar")
+    # unchanged model is not serialized again
+    assert len(calls) == 1
+    assert fs1 == fs2
+    assert version1 == version2
+    # returned values are copies
+    fs1["model"]["id"] = "changed"
+    assert srv.update_flowsheet("oscar")["model"]["id"] == "oscar"
+
+    m.fs.flash.heat_duty.fix(100)
+    fs3, version3 = srv.update_flowsheet_versioned("oscar")
+    assert len(calls) == 2
+    assert version3 == version1 + 1
+    assert fs3 != fs1
+
+
+@pytest.mark.unit
+def test_flowsheet_patch():
+    m = _build_flash_model()
+    srv = model_server.FlowsheetServer()
+    srv.add_flowsheet("oscar", m.fs, persist.MemoryDataStore())
+    old, version = srv.update_flowsheet_versioned("oscar")
+    assert srv.get_flowsheet_patch("oscar", version) == {
+        "version": version,
+        "patch": [],
+    }
+
+    m.fs.flash.heat_duty.fix(100)
+    result = srv.get_flowsheet_patch("oscar", version)
+    assert result["version"] == version + 1
+    patch = result["patch"]
+    assert 0 < len(patch) < 5
+    assert all(op["op"] == "replace" for op in patch)
+    assert all(
+        op["path"].startswith("/model/unit_models/flash/performance_contents/")
+        for op in patch
+    )
+    new = srv.update_flowsheet("oscar")
+    assert _apply_patch(old, patch) == new
+
+    # a moved unit only changes its position
+    new["cells"][0]["position"] = {"x": 500, "y": 300}
+    srv.save_flowsheet("oscar", new)
+    result = srv.get_flowsheet_patch("oscar", version + 1)
+    assert result["version"] == version + 2
+    assert [op["path"] for op in result["patch"]] == [
+        "/cells/0/position/x",
+        "/cells/0/position/y",
+    ]
+
+    # unknown versions get the whole flowsheet
+    result = srv.get_flowsheet_patch("oscar", 0)
+    assert result["patch"] == [{"op": "replace", "path": "", "value": new}]
+    with pytest.raises(errors.FlowsheetUnknown):
+        srv.get_flowsheet_patch("nobody", 0)
+    # no state is kept for unknown flowsheets
+    assert list(srv._states) == ["oscar"]
+
+
 @pytest.fixture(scope="module")
 def flash_model():
     """Flash unit model. Use '.fs' attribute to get the flowsheet.
     """
+    return _build_flash_model()
+
+
+def _build_flash_model():
     m = ConcreteModel()
     m.fs = FlowsheetBlock(default={"dynamic": False})
     # Flash properties
@@ -110,6 +209,18 @@ def test_flowsheet_server_run(flash_model):
     # now /fs should work
     resp = requests.get(f"http://localhost:{srv.port}/fs?id=oscar")
     assert resp.ok
+    version = int(resp.headers["X-Flowsheet-Version"])
+    # patch from the current version is empty
+    resp = requests.get(
+        f"http://localhost:{srv.port}/fs/patch?id=oscar&since={version}"
+    )
+    assert resp.ok
+    assert resp.json() == {"version": version, "patch": []}
+    # 'since' is required
+    resp = requests.get(f"http://localhost:{srv.port}/fs/patch?id=oscar")
+    assert resp.status_code == 400
+    resp = requests.get(f"http://localhost:{srv.port}/fs/patch?id=1234&since=0")
+    assert resp.status_code == 404
     print("Bogus PUT")
     resp = requests.put(f"http://localhost:{srv.port}/fs")
     assert not resp.ok
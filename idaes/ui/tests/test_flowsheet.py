@@ -17,7 +17,12 @@ from pathlib import Path
 
 import pytest
 
-from idaes.ui.flowsheet import FlowsheetSerializer, FlowsheetDiff, validate_flowsheet
+from idaes.ui.flowsheet import (
+    FlowsheetSerializer,
+    FlowsheetDiff,
+    flowsheet_patch,
+    validate_flowsheet,
+)
 from idaes.models.properties.swco2 import SWCO2ParameterBlock
 from idaes.models.unit_models import Heater, PressureChanger, HeatExchanger
 from idaes.models.unit_models.pressure_changer import ThermodynamicAssumption
@@ -275,6 +280,34 @@ def test_merge(models):
                 assert cell["attrs"]["image"]["xlinkHref"] == "changed.svg"
 
 
+@pytest.mark.unit
+def test_flowsheet_patch(models):
+    old = models[2]
+    assert flowsheet_patch(old, copy.deepcopy(old)) == []
+
+    new = copy.deepcopy(old)
+    new["model"]["unit_models"]["U1"]["image"] = "changed.svg"
+    new["model"]["arcs"]["A/1"] = {"source": "U0", "dest": "U1", "label": "a~b"}
+    del new["model"]["unit_models"]["U0"]["type"]
+    new["cells"][0]["position"] = {"x": 1, "y": 2}
+    new["cells"].append({"id": "A/1"})
+    patch = flowsheet_patch(old, new)
+    assert {
+        "op": "replace",
+        "path": "/model/unit_models/U1/image",
+        "value": "changed.svg",
+    } in patch
+    assert {
+        "op": "add",
+        "path": "/model/arcs/A~11",
+        "value": new["model"]["arcs"]["A/1"],
+    } in patch
+    assert {"op": "remove", "path": "/model/unit_models/U0/type"} in patch
+    # lists that change length are replaced whole
+    assert {"op": "replace", "path": "/cells", "value": new["cells"]} in patch
+    assert len(patch) == 4
+
+
 @pytest.mark.unit
 def test_validate_flowsheet(models):
     # these have a type error since they are not iterable at all